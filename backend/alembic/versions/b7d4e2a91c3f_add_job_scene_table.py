@@ -0,0 +1,61 @@
+"""add job_scene table
+
+Revision ID: b7d4e2a91c3f
+Revises: 909a7b0aeb2f
+Create Date: 2025-09-02 09:14:31.118204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d4e2a91c3f"
+down_revision: Union[str, None] = "909a7b0aeb2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create job_scene association table
+    op.create_table(
+        "job_scene",
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("scene_id", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["job.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "scene_id"),
+    )
+    op.create_index(
+        "idx_job_scene_scene_job", "job_scene", ["scene_id", "job_id"], unique=False
+    )
+
+    # Backfill from the scene_ids stored in job metadata
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        op.execute(
+            """
+            INSERT INTO job_scene (job_id, scene_id)
+            SELECT DISTINCT job.id, scene_ids.value
+            FROM job,
+                 json_array_elements_text(job.metadata -> 'scene_ids')
+                     AS scene_ids(value)
+            WHERE json_typeof(job.metadata -> 'scene_ids') = 'array'
+            """
+        )
+    else:
+        op.execute(
+            """
+            INSERT INTO job_scene (job_id, scene_id)
+            SELECT DISTINCT job.id, CAST(scene_ids.value AS TEXT)
+            FROM job, json_each(job.metadata, '$.scene_ids') AS scene_ids
+            WHERE json_type(job.metadata, '$.scene_ids') = 'array'
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_job_scene_scene_job", table_name="job_scene")
+    op.drop_table("job_scene")
@@ -0,0 +1,46 @@
+"""add durable queue fields to job
+
+Revision ID: c3e8a5f27d10
+Revises: b7d4e2a91c3f
+Create Date: 2025-09-03 14:42:08.531920
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8a5f27d10"
+down_revision: Union[str, None] = "b7d4e2a91c3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add queue columns used when jobs are dispatched from the database
+    op.add_column("job", sa.Column("payload", sa.JSON(), nullable=True))
+    op.add_column("job", sa.Column("checkpoint", sa.JSON(), nullable=True))
+    op.add_column("job", sa.Column("lease_owner", sa.String(), nullable=True))
+    op.add_column(
+        "job",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "job",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "idx_job_status_lease", "job", ["status", "lease_expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_job_status_lease", table_name="job")
+    op.drop_column("job", "attempts")
+    op.drop_column("job", "lease_expires_at")
+    op.drop_column("job", "lease_owner")
+    op.drop_column("job", "checkpoint")
+    op.drop_column("job", "payload")
@@ -0,0 +1,48 @@
+"""add ai_response_cache table
+
+Revision ID: d41f6b8e2c57
+Revises: c3e8a5f27d10
+Create Date: 2025-09-05 10:21:47.603118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41f6b8e2c57"
+down_revision: Union[str, None] = "c3e8a5f27d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create table for cached OpenAI responses
+    op.create_table(
+        "ai_response_cache",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False),
+        sa.Column("hits", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_ai_response_cache_last_used_at"),
+        "ai_response_cache",
+        ["last_used_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_ai_response_cache_last_used_at"), table_name="ai_response_cache"
+    )
+    op.drop_table("ai_response_cache")
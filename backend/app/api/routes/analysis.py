@@ -156,6 +156,8 @@ async def _run_synchronous_analysis(
         detect_details=request.options.detect_details,
         detect_video_tags=request.options.detect_video_tags,
         confidence_threshold=request.options.confidence_threshold,
+        combined_ai=request.options.combined_ai,
+        use_ai_cache=request.options.use_ai_cache,
     )
 
     plan = await analysis_service.analyze_scenes(
@@ -1136,6 +1138,9 @@ async def get_plan_costs(
         "completion_tokens": api_usage.get("completion_tokens", 0),
         "cost_breakdown": api_usage.get("cost_breakdown", {}),
         "token_breakdown": api_usage.get("token_breakdown", {}),
+        "prompt_tokens_saved": api_usage.get("prompt_tokens_saved", 0),
+        "cache_hits": api_usage.get("cache_hits", 0),
+        "cache_hit_rate": api_usage.get("cache_hit_rate", 0.0),
         "model": api_usage.get("model"),
         "scenes_analyzed": api_usage.get("scenes_analyzed", 0),
         "average_cost_per_scene": api_usage.get("average_cost_per_scene", 0.0),
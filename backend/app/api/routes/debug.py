@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession as AsyncDBSession
 
 from app.core.dependencies import get_db, get_stash_service
+from app.services.stash_registry import get_stash_registry
 from app.services.stash_service import StashService
 
 router = APIRouter()
@@ -72,9 +73,7 @@ async def debug_pending_scenes(
                 }
 
                 try:
-                    _, count = await stash_service.get_scenes(
-                        page=1, per_page=1, filter=filter_dict
-                    )
+                    count = await stash_service.count_scenes(filter=filter_dict)
                     cast(List[Any], debug_info["test_queries"]).append(
                         {
                             "format_index": idx,
@@ -96,12 +95,11 @@ async def debug_pending_scenes(
                     )
 
     # Get total scene count
-    _, total = await stash_service.get_scenes(page=1, per_page=1)
-    debug_info["all_scenes_count"] = total
+    debug_info["all_scenes_count"] = await stash_service.count_scenes()
 
     # Get 5 most recent scenes
-    recent_scenes, _ = await stash_service.get_scenes(
-        page=1, per_page=5, sort="updated_at"
+    recent_scenes, _ = await stash_service.find_scenes_projected(
+        "summary", page=1, per_page=5, sort="updated_at"
     )
     debug_info["recent_scenes"] = [
         {
@@ -800,3 +798,10 @@ async def get_stash_studio_debug(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch studio from Stash: {str(e)}",
         )
+
+
+@router.get("/stash-services")
+async def get_stash_service_stats() -> Dict[str, Any]:
+    """Get connection pool and cache statistics for the shared Stash services."""
+    services = get_stash_registry().stats()
+    return {"count": len(services), "services": services}
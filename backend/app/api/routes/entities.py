@@ -17,7 +17,7 @@ from app.api.schemas import (
 from app.core.config import Settings
 from app.core.dependencies import get_db, get_settings
 from app.models import Performer, Scene, SceneMarker, Studio, Tag
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 
 router = APIRouter()
 
@@ -399,16 +399,13 @@ async def delete_tag(
 
     # Delete from Stash via GraphQL API
     try:
-        async with StashService(
-            settings.stash.url,
-            settings.stash.api_key if settings.stash.api_key else None,
-        ) as stash:
-            success = await stash.delete_tag(tag_id)
-
-            if not success:
-                raise HTTPException(
-                    status_code=500, detail="Failed to delete tag from Stash"
-                )
+        stash = get_shared_stash_service(settings)
+        success = await stash.delete_tag(tag_id)
+
+        if not success:
+            raise HTTPException(
+                status_code=500, detail="Failed to delete tag from Stash"
+            )
     except HTTPException:
         # Re-raise HTTPException as-is
         raise
@@ -347,20 +347,11 @@ async def list_scenes(
 
     # Handle has_active_jobs filter at database level
     if filters.has_active_jobs is not None:
-        # Get all scene IDs that have active jobs
-        jobs_with_scenes = await job_repository.get_all_active_job_scene_ids(db)
-
+        active_scene_ids = job_repository.active_job_scene_ids_query()
         if filters.has_active_jobs:
-            # Include only scenes that have active jobs
-            if jobs_with_scenes:
-                conditions.append(Scene.id.in_(jobs_with_scenes))
-            else:
-                # No active jobs exist, so return empty result
-                conditions.append(Scene.id.is_(None))  # This will match no scenes
+            conditions.append(Scene.id.in_(active_scene_ids))
         else:
-            # Exclude scenes that have active jobs
-            if jobs_with_scenes:
-                conditions.append(~Scene.id.in_(jobs_with_scenes))
+            conditions.append(~Scene.id.in_(active_scene_ids))
 
     if conditions:
         query = query.where(and_(*conditions))
@@ -2,6 +2,7 @@
 Application settings endpoints.
 """
 
+import logging
 from typing import Any, Optional
 
 import openai
@@ -16,11 +17,26 @@ from app.core.dependencies import (
     get_settings_with_overrides,
     get_stash_service,
 )
+from app.core.settings_loader import load_settings_with_db_overrides
 from app.models import Setting
+from app.services.stash_registry import get_stash_registry
 from app.services.stash_service import StashService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+STASH_CONNECTION_KEYS = ("stash_url", "stash_api_key")
+
+
+async def _reload_stash_services() -> None:
+    """Point the shared Stash services at the newly saved connection settings."""
+    try:
+        settings = await load_settings_with_db_overrides()
+        await get_stash_registry().reload(settings)
+    except Exception as e:
+        logger.warning(f"Failed to reload shared Stash services: {e}")
+
 
 @router.get("", response_model=list[dict[str, Any]])
 async def list_settings(
@@ -295,6 +311,9 @@ async def update_setting(
 
     await db.commit()
 
+    if key in STASH_CONNECTION_KEYS:
+        await _reload_stash_services()
+
     return {
         "success": True,
         "message": f"Setting '{key}' updated successfully",
@@ -372,8 +391,10 @@ async def update_settings(
 
     # Determine if restart is needed
     requires_restart = any(
-        key in ["stash_url", "stash_api_key"] for key in updated_fields + deleted_fields
+        key in STASH_CONNECTION_KEYS for key in updated_fields + deleted_fields
     )
+    if requires_restart:
+        await _reload_stash_services()
 
     return {
         "success": True,
@@ -452,15 +473,15 @@ async def test_openai_connection(
 
         # Create client with optional custom base URL
         if test_base_url:
-            client = openai.OpenAI(
+            client = openai.AsyncOpenAI(
                 api_key=test_key,
                 base_url=test_base_url,
             )
         else:
-            client = openai.OpenAI(api_key=test_key)
+            client = openai.AsyncOpenAI(api_key=test_key)
 
         # List available models
-        models = client.models.list()
+        models = await client.models.list()
         model_ids = [m.id for m in models.data]
 
         # Check if specified model is available
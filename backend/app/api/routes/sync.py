@@ -2,7 +2,7 @@
 Sync management endpoints.
 """
 
-from typing import List
+from typing import Any, Dict, List
 
 from fastapi import APIRouter, Body, Depends, Query
 from sqlalchemy import select
@@ -45,6 +45,7 @@ def _map_job_type(model_job_type: str) -> str:
 @router.post("/all", response_model=JobResponse)
 async def sync_all(
     force: bool = Query(False, description="Force full sync ignoring timestamps"),
+    resume: bool = Query(False, description="Continue the last interrupted full sync"),
     db: AsyncDBSession = Depends(get_db),
     job_service: JobService = Depends(get_job_service),
 ) -> JobResponse:
@@ -55,14 +56,19 @@ async def sync_all(
 
     Args:
         force: Force full sync ignoring timestamps
+        resume: Continue the last interrupted full sync from its checkpoint
         db: Database session
 
     Returns:
         Job information
     """
+    metadata: Dict[str, Any] = {"force": force}
+    if resume:
+        metadata["resume"] = True
+
     # Create job via job service
     job = await job_service.create_job(
-        job_type=ModelJobType.SYNC, db=db, metadata={"force": force}
+        job_type=ModelJobType.SYNC, db=db, metadata=metadata
     )
 
     # Refresh the job object in the current session to ensure all attributes are loaded
@@ -78,7 +84,7 @@ async def sync_all(
         type=APIJobType.SYNC,
         status=APIJobStatus.PENDING,
         progress=0,
-        parameters={"force": force},
+        parameters=metadata,
         created_at=job_created_at,  # type: ignore[arg-type]
         updated_at=job_updated_at,  # type: ignore[arg-type]
         started_at=None,
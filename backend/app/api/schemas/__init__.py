@@ -401,6 +401,14 @@ class AnalysisOptions(BaseSchema):
     confidence_threshold: float = Field(
         0.7, ge=0.0, le=1.0, description="Minimum confidence threshold"
     )
+    combined_ai: bool = Field(
+        False,
+        description="Detect studio, performers and tags with one AI request per scene",
+    )
+    use_ai_cache: bool = Field(
+        True,
+        description="Reuse cached AI responses; disable to force fresh answers",
+    )
 
 
 class AnalysisRequest(BaseSchema):
@@ -97,6 +97,24 @@ class OpenAISettings(BaseSettings):
     max_tokens: int = Field(2000, description="Maximum tokens per request")
     temperature: float = Field(0.7, description="Temperature for generation")
     timeout: int = Field(60, description="API request timeout in seconds")
+    max_concurrent_requests: int = Field(
+        4, description="Maximum concurrent API requests per API key"
+    )
+    requests_per_minute: int = Field(
+        500, description="Requests allowed per minute (0 disables the limit)"
+    )
+    tokens_per_minute: int = Field(
+        200000, description="Tokens allowed per minute (0 disables the limit)"
+    )
+    max_retries: int = Field(
+        5, description="Attempts for rate-limited or transient API failures"
+    )
+    response_cache_ttl_hours: int = Field(
+        720, description="Hours a cached AI response is reused (0 never expires)"
+    )
+    response_cache_max_entries: int = Field(
+        10000, description="Cached AI responses kept (0 disables the cache)"
+    )
 
     model_config = SettingsConfigDict(env_prefix="OPENAI_")
 
@@ -149,11 +167,28 @@ class AnalysisSettings(BaseSettings):
         15, description="Number of scenes per batch for AI analysis"
     )
     max_concurrent: int = Field(3, description="Maximum concurrent analysis batches")
+    scene_workers: int = Field(
+        4, description="Scenes analyzed at once within each analysis batch"
+    )
     confidence_threshold: float = Field(0.7, description="Default confidence threshold")
     enable_ai: bool = Field(True, description="Enable AI-based detection")
     create_missing: bool = Field(
         False, description="Create missing entities during analysis"
     )
+    apply_concurrency: int = Field(
+        4, description="Maximum scene updates sent to Stash at once when applying"
+    )
+    prompt_candidate_limit: int = Field(
+        200,
+        description="Known studios, performers or tags listed in an AI prompt, "
+        "most relevant to the scene first (0 lists all)",
+    )
+    plan_flush_scenes: int = Field(
+        25, description="Analyzed scenes written to the plan per database commit"
+    )
+    plan_flush_interval: float = Field(
+        5.0, description="Maximum seconds analyzed scenes wait to be written"
+    )
 
     # Video AI server settings
     ai_video_server_url: str = Field(
@@ -175,6 +210,19 @@ class AnalysisSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="ANALYSIS_")
 
 
+class SyncSettings(BaseSettings):
+    """Scene sync configuration settings."""
+
+    batch_size: int = Field(100, description="Number of scenes fetched per page")
+    pipeline_depth: int = Field(
+        2,
+        description="Number of scene pages prefetched from Stash while the current "
+        "page is written (0 disables the pipelined sync engine)",
+    )
+
+    model_config = SettingsConfigDict(env_prefix="SYNC_")
+
+
 class QBittorrentSettings(BaseSettings):
     """qBittorrent configuration settings."""
 
@@ -198,6 +246,7 @@ class Settings(BaseSettings):
     cors: CORSSettings = Field(default_factory=lambda: CORSSettings())  # type: ignore[call-arg]
     logging: LoggingSettings = Field(default_factory=lambda: LoggingSettings())  # type: ignore[call-arg]
     analysis: AnalysisSettings = Field(default_factory=lambda: AnalysisSettings())  # type: ignore[call-arg]
+    sync: SyncSettings = Field(default_factory=lambda: SyncSettings())  # type: ignore[call-arg]
     qbittorrent: QBittorrentSettings = Field(default_factory=lambda: QBittorrentSettings())  # type: ignore[call-arg]
 
     # Redis settings (optional, for future use)
@@ -206,6 +255,44 @@ class Settings(BaseSettings):
     # Task queue settings
     max_workers: int = Field(5, description="Maximum number of background workers")
     task_timeout: int = Field(300, description="Task timeout in seconds")
+    interactive_workers: int = Field(
+        1,
+        description="Workers reserved for short interactive jobs such as "
+        "single-scene resyncs (0 runs them with all other jobs)",
+    )
+    task_retention_count: int = Field(
+        1000, description="Finished background tasks kept in memory"
+    )
+    task_retention_seconds: float = Field(
+        3600.0, description="Seconds a finished background task is kept in memory"
+    )
+    job_queue_mode: str = Field(
+        "memory",
+        description="Where queued jobs are kept: 'memory' or 'database' "
+        "(survives restarts and resumes interrupted jobs)",
+    )
+    job_lease_seconds: float = Field(
+        60.0, description="Seconds a worker's claim on a database-queued job lasts"
+    )
+    job_queue_poll_interval: float = Field(
+        2.0, description="Seconds idle workers wait between database queue polls"
+    )
+    job_max_attempts: int = Field(
+        3, description="Times a database-queued job is dispatched before giving up"
+    )
+    job_queue_api_workers: bool = Field(
+        True,
+        description="Run database-queued jobs in the API process as well as "
+        "in separate worker processes",
+    )
+    job_worker_processes: int = Field(
+        2, description="Processes started by the separate job worker entry point"
+    )
+
+    # Monitoring
+    metrics_enabled: bool = Field(
+        True, description="Serve Prometheus metrics at /metrics"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
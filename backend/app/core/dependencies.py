@@ -16,6 +16,7 @@ from app.models import Setting
 from app.services.analysis.analysis_service import AnalysisService
 from app.services.job_service import JobService
 from app.services.openai_client import OpenAIClient
+from app.services.stash_registry import get_shared_stash_service
 from app.services.stash_service import StashService
 from app.services.sync.sync_service import SyncService
 from app.services.websocket_manager import get_websocket_manager  # noqa: F401
@@ -73,6 +74,10 @@ def _get_base_settings_dict(base_settings: Settings) -> dict[str, dict[str, Any]
             "max_tokens": base_settings.openai.max_tokens,
             "temperature": base_settings.openai.temperature,
             "timeout": base_settings.openai.timeout,
+            "max_concurrent_requests": base_settings.openai.max_concurrent_requests,
+            "requests_per_minute": base_settings.openai.requests_per_minute,
+            "tokens_per_minute": base_settings.openai.tokens_per_minute,
+            "max_retries": base_settings.openai.max_retries,
         },
         "analysis": {
             "batch_size": base_settings.analysis.batch_size,
@@ -197,12 +202,7 @@ def get_stash_client(
     Returns:
         StashService: Stash API client
     """
-    return StashService(
-        stash_url=settings.stash.url,
-        api_key=settings.stash.api_key,
-        timeout=settings.stash.timeout,
-        max_retries=settings.stash.max_retries,
-    )
+    return get_shared_stash_service(settings)
 
 
 def get_openai_client(
@@ -227,6 +227,12 @@ def get_openai_client(
         max_tokens=settings.openai.max_tokens,
         temperature=settings.openai.temperature,
         timeout=settings.openai.timeout,
+        max_concurrent=settings.openai.max_concurrent_requests,
+        requests_per_minute=settings.openai.requests_per_minute,
+        tokens_per_minute=settings.openai.tokens_per_minute,
+        max_retries=settings.openai.max_retries,
+        response_cache_ttl_hours=settings.openai.response_cache_ttl_hours,
+        response_cache_max_entries=settings.openai.response_cache_max_entries,
     )
 
 
@@ -300,12 +306,12 @@ def get_stash_service(
     settings: Settings = Depends(get_settings_with_overrides),
 ) -> StashService:
     """
-    Get Stash service instance.
+    Get the shared Stash service instance.
 
     Returns:
-        StashService: Stash service instance
+        StashService: Stash service shared across requests, jobs and daemons
     """
-    return StashService(stash_url=settings.stash.url, api_key=settings.stash.api_key)
+    return get_shared_stash_service(settings)
 
 
 async def get_sync_service(
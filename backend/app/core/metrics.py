@@ -0,0 +1,182 @@
+"""
+Prometheus metrics for the application's hot paths.
+
+Metrics are ``prometheus_client`` collectors in its default registry and are
+served by the ``/metrics`` endpoint. Gauges that describe current state
+(database pool, task queue, jobs) are filled in by collectors that run only
+when the endpoint is scraped.
+"""
+
+import logging
+from typing import Awaitable, Callable, Dict, List
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Latency buckets in seconds, from fast API calls to slow Stash queries
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+# Daemon iterations range from a quick status check to minutes of job setup
+DAEMON_LOOP_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0)
+
+Collector = Callable[[], Awaitable[None]]
+
+# HTTP API
+HTTP_REQUEST_DURATION = Histogram(
+    "stashhog_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=DEFAULT_BUCKETS,
+)
+
+# Stash GraphQL API
+STASH_GRAPHQL_DURATION = Histogram(
+    "stashhog_stash_graphql_duration_seconds",
+    "Latency of Stash GraphQL requests by operation",
+    ["operation"],
+    buckets=DEFAULT_BUCKETS,
+)
+STASH_GRAPHQL_ERRORS = Counter(
+    "stashhog_stash_graphql_errors_total",
+    "Failed Stash GraphQL requests by operation and error",
+    ["operation", "error"],
+)
+
+# Sync
+SYNC_SCENES = Counter(
+    "stashhog_sync_scenes_total",
+    "Scenes processed by syncs, by outcome",
+    ["outcome"],
+)
+
+# AI analysis
+AI_TOKENS = Counter(
+    "stashhog_ai_tokens_total",
+    "Tokens used by AI analysis, by model and kind (prompt or completion)",
+    ["model", "kind"],
+)
+AI_COST = Counter(
+    "stashhog_ai_cost_dollars_total",
+    "Estimated cost of AI analysis in US dollars, by model",
+    ["model"],
+)
+
+# Daemons
+DAEMON_LOOP_DURATION = Histogram(
+    "stashhog_daemon_loop_duration_seconds",
+    "Time daemons spend working between sleeps",
+    ["daemon_type"],
+    buckets=DAEMON_LOOP_BUCKETS,
+)
+
+# State gauges, refreshed by the collectors below
+DB_POOL_CONNECTIONS = Gauge(
+    "stashhog_db_pool_connections",
+    "Database connections in the async engine pool, by state",
+    ["state"],
+)
+DB_POOL_SIZE = Gauge(
+    "stashhog_db_pool_size", "Configured size of the async engine pool"
+)
+TASK_QUEUE_DEPTH = Gauge(
+    "stashhog_task_queue_depth",
+    "Tasks waiting in the in-memory task queue, by lane",
+    ["lane"],
+)
+TASK_QUEUE_RUNNING = Gauge(
+    "stashhog_task_queue_running",
+    "Tasks running in the in-memory task queue, by lane",
+    ["lane"],
+)
+JOBS = Gauge(
+    "stashhog_jobs",
+    "Pending and running jobs by type",
+    ["type", "status"],
+)
+
+
+async def _collect_database_pool() -> None:
+    from app.core.database import async_engine
+
+    pool = async_engine.pool
+    # SQLite uses pools without a fixed size; report what the pool has
+    for state, attribute in (("checked_out", "checkedout"), ("overflow", "overflow")):
+        method = getattr(pool, attribute, None)
+        if method is not None:
+            DB_POOL_CONNECTIONS.labels(state).set(method())
+    size = getattr(pool, "size", None)
+    if size is not None:
+        DB_POOL_SIZE.set(size())
+
+
+async def _collect_task_queue() -> None:
+    from app.core import tasks
+
+    queue = tasks.task_queue
+    if queue is None:
+        return
+    running: Dict[str, int] = {lane: 0 for lane in queue.lanes}
+    for task in queue.get_tasks_by_status(tasks.TaskStatus.RUNNING):
+        running[task.lane] = running.get(task.lane, 0) + 1
+    for lane, lane_queue in queue.lanes.items():
+        TASK_QUEUE_DEPTH.labels(lane).set(lane_queue.qsize())
+        TASK_QUEUE_RUNNING.labels(lane).set(running[lane])
+
+
+async def _collect_jobs() -> None:
+    from sqlalchemy import func, select
+
+    from app.core.database import AsyncSessionLocal
+    from app.models.job import Job, JobStatus
+
+    statuses = [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(Job.type, Job.status, func.count())
+            .where(Job.status.in_(statuses))
+            .group_by(Job.type, Job.status)
+        )
+        counts = rows.all()
+
+    JOBS.clear()
+    for job_type, status, count in counts:
+        JOBS.labels(job_type, status).set(count)
+
+
+COLLECTORS: List[Collector] = [
+    _collect_database_pool,
+    _collect_task_queue,
+    _collect_jobs,
+]
+
+
+async def render() -> bytes:
+    """Refresh the state gauges and render all metrics for a scrape."""
+    for collector in COLLECTORS:
+        try:
+            await collector()
+        except Exception as e:
+            logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+    return generate_latest(REGISTRY)
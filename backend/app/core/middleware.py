@@ -10,6 +10,8 @@ from typing import Awaitable, Callable, List, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.metrics import HTTP_REQUEST_DURATION
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,7 +100,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
 
 class TimingMiddleware(BaseHTTPMiddleware):
-    """Middleware to add request processing time to response headers."""
+    """Middleware to time requests.
+
+    Adds the processing time to response headers and records it in the
+    request latency histogram, labelled by route template (``/api/scenes/{id}``
+    rather than the raw path) so label cardinality stays bounded.
+    """
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
@@ -113,13 +120,20 @@ class TimingMiddleware(BaseHTTPMiddleware):
         Returns:
             Response with X-Process-Time header
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         response = await call_next(request)
 
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         response.headers["X-Process-Time"] = f"{process_time:.3f}"
 
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            request.method,
+            getattr(route, "path", "unmatched"),
+            response.status_code,
+        ).observe(process_time)
+
         return response
 
 
@@ -8,13 +8,23 @@ For production, consider using Celery, RQ, or similar.
 import asyncio
 import logging
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Lane served by the ``max_workers`` pool
+DEFAULT_LANE = "default"
+# Lane for short user-triggered tasks that must not wait behind bulk jobs
+INTERACTIVE_LANE = "interactive"
+
+# Finished tasks kept for lookups; older ones are evicted
+DEFAULT_MAX_FINISHED_TASKS = 1000
+DEFAULT_FINISHED_TASK_TTL = 3600.0
+
 
 class TaskStatus(str, Enum):
     """Task status enumeration."""
@@ -43,25 +53,64 @@ class Task:
     completed_at: Optional[datetime] = None
     progress: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    lane: str = DEFAULT_LANE
     asyncio_task: Optional[asyncio.Task] = field(default=None, init=False)
 
+    @property
+    def is_finished(self) -> bool:
+        """Whether the task has completed, failed or been cancelled."""
+        return self.status in (
+            TaskStatus.COMPLETED,
+            TaskStatus.FAILED,
+            TaskStatus.CANCELLED,
+        )
+
 
 class TaskQueue:
-    """Simple in-memory task queue using asyncio."""
+    """Simple in-memory task queue using asyncio.
+
+    Tasks are submitted to a lane. The default lane is served by
+    ``max_workers`` workers; every lane in ``lane_workers`` gets its own
+    queue and workers, so tasks there never wait behind the default lane.
+    Tasks submitted to a lane without workers run in the default lane.
 
-    def __init__(self, max_workers: int = 5):
+    Finished tasks stay available through ``get_task`` until more than
+    ``max_finished_tasks`` have finished after them or they are older than
+    ``finished_task_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 5,
+        lane_workers: Optional[Dict[str, int]] = None,
+        max_finished_tasks: int = DEFAULT_MAX_FINISHED_TASKS,
+        finished_task_ttl: float = DEFAULT_FINISHED_TASK_TTL,
+    ):
         """
         Initialize task queue.
 
         Args:
-            max_workers: Maximum number of concurrent workers
+            max_workers: Maximum number of concurrent workers in the default lane
+            lane_workers: Worker counts for additional lanes
+            max_finished_tasks: Number of finished tasks kept for lookups
+            finished_task_ttl: Seconds a finished task is kept for lookups
         """
         self.max_workers = max_workers
         self.queue: asyncio.Queue = asyncio.Queue()
+        self.lane_workers = {
+            lane: count for lane, count in (lane_workers or {}).items() if count > 0
+        }
+        self.lanes: Dict[str, asyncio.Queue] = {DEFAULT_LANE: self.queue}
+        for lane in self.lane_workers:
+            self.lanes[lane] = asyncio.Queue()
+        self.max_finished_tasks = max_finished_tasks
+        self.finished_task_ttl = finished_task_ttl
         self.tasks: Dict[str, Task] = {}
         self.workers: List[asyncio.Task] = []
         self._running = False
         self._task_callbacks: Dict[str, List[Callable]] = {}
+        # Finished task IDs, oldest first
+        self._finished: "OrderedDict[str, datetime]" = OrderedDict()
 
     async def start(self) -> None:
         """Start the task queue workers."""
@@ -69,12 +118,23 @@ class TaskQueue:
             return
 
         self._running = True
-        logger.info(f"Starting task queue with {self.max_workers} workers")
+        logger.info(
+            f"Starting task queue with {self.max_workers} workers"
+            + "".join(
+                f", {count} {lane} workers" for lane, count in self.lane_workers.items()
+            )
+        )
 
         # Start worker tasks
         for i in range(self.max_workers):
             worker = asyncio.create_task(self._worker(f"worker-{i}"))
             self.workers.append(worker)
+        for lane, count in self.lane_workers.items():
+            for i in range(count):
+                worker = asyncio.create_task(
+                    self._worker(f"{lane}-worker-{i}", self.lanes[lane])
+                )
+                self.workers.append(worker)
 
     async def stop(self) -> None:
         """Stop the task queue workers."""
@@ -93,24 +153,30 @@ class TaskQueue:
             await asyncio.gather(*self.workers, return_exceptions=True)
         self.workers.clear()
 
-    async def _worker(self, worker_id: str) -> None:
+    async def _worker(
+        self, worker_id: str, queue: Optional[asyncio.Queue] = None
+    ) -> None:
         """
         Worker coroutine that processes tasks from the queue.
 
         Args:
             worker_id: Unique worker identifier
+            queue: Lane queue to serve (defaults to the default lane)
         """
+        lane_queue = queue if queue is not None else self.queue
         logger.info(f"{worker_id} started")
 
         while self._running:
             try:
-                # Get task from queue with timeout
-                task = await asyncio.wait_for(self.queue.get(), timeout=1.0)
+                # Wait for the next task; stop() cancels idle workers
+                task = await lane_queue.get()
+
+                if task.status == TaskStatus.CANCELLED:
+                    # Cancelled while still queued
+                    continue
 
                 await self._execute_task(task, worker_id)
 
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 logger.info(f"{worker_id} cancelled")
                 break
@@ -175,12 +241,38 @@ class TaskQueue:
             logger.error(f"Task {task.id} failed: {e}")
             await self._notify_callbacks(task.id, "failed")
 
+        finally:
+            self._finish_task(task)
+
+    def _finish_task(self, task: Task) -> None:
+        """Record a finished task, drop its callbacks and evict old tasks."""
+        if not task.is_finished:
+            return
+        self._task_callbacks.pop(task.id, None)
+        task.asyncio_task = None
+        self._finished[task.id] = task.completed_at or datetime.utcnow()
+        self._finished.move_to_end(task.id)
+        self._evict_finished_tasks()
+
+    def _evict_finished_tasks(self) -> None:
+        """Forget finished tasks beyond the count and age limits."""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.finished_task_ttl)
+        while self._finished:
+            task_id, finished_at = next(iter(self._finished.items()))
+            if len(self._finished) <= self.max_finished_tasks and finished_at >= cutoff:
+                break
+            del self._finished[task_id]
+            task = self.tasks.get(task_id)
+            if task is not None and task.is_finished:
+                del self.tasks[task_id]
+
     async def submit(
         self,
         func: Callable[..., Any],
         *args: Any,
         name: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        lane: str = DEFAULT_LANE,
         **kwargs: Any,
     ) -> str:
         """
@@ -191,23 +283,29 @@ class TaskQueue:
             *args: Positional arguments for the function
             name: Optional task name
             metadata: Optional task metadata
+            lane: Lane to run the task in (default lane if it has no workers)
             **kwargs: Keyword arguments for the function
 
         Returns:
             Task ID
         """
+        if lane not in self.lanes:
+            lane = DEFAULT_LANE
+
         task = Task(
             name=name or func.__name__,
             func=func,
             args=args,
             kwargs=kwargs,
             metadata=metadata or {},
+            lane=lane,
         )
 
+        self._evict_finished_tasks()
         self.tasks[task.id] = task
-        await self.queue.put(task)
+        await self.lanes[lane].put(task)
 
-        logger.info(f"Task {task.id} submitted: {task.name}")
+        logger.info(f"Task {task.id} submitted to {lane} lane: {task.name}")
         return task.id
 
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -257,6 +355,9 @@ class TaskQueue:
         task.completed_at = datetime.utcnow()
 
         await self._notify_callbacks(task_id, "cancelled")
+        if task.started_at is None:
+            # Queued tasks are skipped by workers, so finish them here
+            self._finish_task(task)
         return True
 
     def add_task_callback(self, task_id: str, callback: Callable[..., Any]) -> None:
@@ -312,7 +413,15 @@ def get_task_queue() -> TaskQueue:
     """Get the global task queue instance."""
     global task_queue
     if task_queue is None:
-        task_queue = TaskQueue()
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        task_queue = TaskQueue(
+            max_workers=settings.max_workers,
+            lane_workers={INTERACTIVE_LANE: settings.interactive_workers},
+            max_finished_tasks=settings.task_retention_count,
+            finished_task_ttl=settings.task_retention_seconds,
+        )
     return task_queue
 
 
@@ -32,6 +32,7 @@ class AutoPlanApplierDaemon(BaseDaemon):
         job_interval_seconds (int): Seconds to sleep between checks (default: 60)
         plan_prefix_filter (list): List of prefixes to filter plans by (default: [])
         auto_approve_all_changes (bool): Whether to approve and apply all changes (default: False)
+        apply_concurrency (int): Scene updates in flight per plan, 0 uses ANALYSIS_APPLY_CONCURRENCY (default: 0)
     """
 
     daemon_type = DaemonType.AUTO_PLAN_APPLIER_DAEMON
@@ -44,11 +45,13 @@ class AutoPlanApplierDaemon(BaseDaemon):
             "job_interval_seconds": 60,
             "plan_prefix_filter": [],
             "auto_approve_all_changes": False,
+            "apply_concurrency": 0,
             "_descriptions": {
                 "heartbeat_interval": "Seconds between heartbeat updates to indicate daemon health",
                 "job_interval_seconds": "Seconds to wait between checking for plans to apply",
                 "plan_prefix_filter": "List of plan name prefixes to filter by (empty means process all plans)",
                 "auto_approve_all_changes": "Whether to automatically approve and apply all changes in plans",
+                "apply_concurrency": "Maximum scene updates sent to Stash at once per plan (0 uses the analysis setting)",
             },
         }
 
@@ -133,7 +136,7 @@ class AutoPlanApplierDaemon(BaseDaemon):
                     f"Stack trace:\n{traceback.format_exc()}",
                 )
                 if self.is_running:
-                    await asyncio.sleep(30)  # Back off on error
+                    await self.sleep(30)  # Back off on error
 
     def _load_config(self) -> dict:
         """Load configuration with defaults."""
@@ -144,6 +147,7 @@ class AutoPlanApplierDaemon(BaseDaemon):
             "auto_approve_all_changes": self.config.get(
                 "auto_approve_all_changes", False
             ),
+            "apply_concurrency": self.config.get("apply_concurrency", 0),
         }
 
     async def _process_plans(self, config: dict) -> int:
@@ -218,7 +222,9 @@ class AutoPlanApplierDaemon(BaseDaemon):
                         f"Applying plan {plan_id}", job_id=None, job_type=None
                     )
                     job_id = await self._create_and_wait_for_job(
-                        plan_id, config["auto_approve_all_changes"]
+                        plan_id,
+                        config["auto_approve_all_changes"],
+                        config.get("apply_concurrency", 0),
                     )
                     if job_id:
                         plans_processed += 1
@@ -281,7 +287,7 @@ class AutoPlanApplierDaemon(BaseDaemon):
         return True
 
     async def _create_and_wait_for_job(
-        self, plan_id: int, auto_approve: bool
+        self, plan_id: int, auto_approve: bool, apply_concurrency: int = 0
     ) -> Optional[str]:
         """Create a job to apply an analysis plan and wait for it to complete."""
         try:
@@ -295,6 +301,8 @@ class AutoPlanApplierDaemon(BaseDaemon):
                 "auto_approve": auto_approve,
                 "created_by": "AUTO_PLAN_APPLIER_DAEMON",
             }
+            if apply_concurrency:
+                job_metadata["apply_concurrency"] = apply_concurrency
 
             # Create job using job service
             async with AsyncSessionLocal() as db:
@@ -426,7 +434,7 @@ class AutoPlanApplierDaemon(BaseDaemon):
         while elapsed < sleep_duration and self.is_running:
             # Sleep for the minimum of remaining time or heartbeat interval
             sleep_time = min(heartbeat_interval, sleep_duration - elapsed)
-            await asyncio.sleep(sleep_time)
+            await self.sleep(sleep_time)
             elapsed += sleep_time
 
             # Update heartbeat if we've slept for the heartbeat interval
@@ -518,4 +526,4 @@ class AutoPlanApplierDaemon(BaseDaemon):
                     break
 
             # Sleep a bit before checking again
-            await asyncio.sleep(2)
+            await self.sleep(2)
@@ -141,7 +141,7 @@ class AutoStashGenerationDaemon(BaseDaemon):
                     f"Stack trace:\n{traceback.format_exc()}",
                 )
                 if self.is_running:
-                    await asyncio.sleep(30)  # Back off on error
+                    await self.sleep(30)  # Back off on error
 
     def _load_config(self) -> dict:
         """Load configuration with defaults."""
@@ -347,7 +347,7 @@ class AutoStashGenerationDaemon(BaseDaemon):
                         # Continue monitoring to wait for cancellation to complete
 
                 # Sleep for 30 seconds before checking again
-                await asyncio.sleep(30)
+                await self.sleep(30)
 
             # Clear current job ID
             self._current_generation_job_id = None
@@ -366,7 +366,7 @@ class AutoStashGenerationDaemon(BaseDaemon):
         while elapsed < sleep_duration and self.is_running:
             # Sleep for the minimum of remaining time or heartbeat interval
             sleep_time = min(heartbeat_interval, sleep_duration - elapsed)
-            await asyncio.sleep(sleep_time)
+            await self.sleep(sleep_time)
             elapsed += sleep_time
 
             # Update heartbeat if we've slept for the heartbeat interval
@@ -11,6 +11,7 @@ from app.core.settings_loader import load_settings_with_db_overrides
 from app.daemons.base import BaseDaemon
 from app.models.daemon import DaemonJobAction, DaemonType, LogLevel
 from app.models.job import Job, JobStatus, JobType
+from app.services.stash_registry import get_shared_stash_service
 from app.services.stash_service import StashService
 from app.services.sync_status_service import SyncStatusService
 
@@ -106,10 +107,10 @@ class AutoStashSyncDaemon(BaseDaemon):
                             await self.update_status(
                                 f"Sleeping for {config['job_interval_seconds']} seconds"
                             )
-                            await asyncio.sleep(config["job_interval_seconds"])
+                            await self.sleep(config["job_interval_seconds"])
                         else:
                             # Job was created, check more frequently
-                            await asyncio.sleep(5)
+                            await self.sleep(5)
                     else:
                         # Wait the remaining time before checking again
                         remaining_time = (
@@ -123,12 +124,12 @@ class AutoStashSyncDaemon(BaseDaemon):
                         await self.update_status(
                             f"Waiting {remaining_time:.0f}s before next sync check"
                         )
-                        await asyncio.sleep(
+                        await self.sleep(
                             min(remaining_time, 30)
                         )  # Check at least every 30s for heartbeat
                 else:
                     # Jobs are being monitored, check status frequently
-                    await asyncio.sleep(5)
+                    await self.sleep(5)
 
             except asyncio.CancelledError:
                 await self.log(
@@ -142,7 +143,7 @@ class AutoStashSyncDaemon(BaseDaemon):
                     f"Stack trace:\n{traceback.format_exc()}",
                 )
                 if self.is_running:
-                    await asyncio.sleep(30)  # Back off on error
+                    await self.sleep(30)  # Back off on error
 
     def _load_config(self) -> dict:
         """Load configuration with defaults."""
@@ -156,9 +157,7 @@ class AutoStashSyncDaemon(BaseDaemon):
         try:
             settings = await load_settings_with_db_overrides()
 
-            self._stash_service = StashService(
-                stash_url=settings.stash.url, api_key=settings.stash.api_key
-            )
+            self._stash_service = get_shared_stash_service(settings)
             self._sync_status_service = SyncStatusService(self._stash_service)
         except Exception as e:
             await self.log(
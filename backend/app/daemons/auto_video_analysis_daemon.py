@@ -132,7 +132,7 @@ class AutoVideoAnalysisDaemon(BaseDaemon):
                             self._waiting_status_set = True
 
                         # Sleep in small increments to remain responsive to shutdown
-                        await asyncio.sleep(min(remaining_sleep, 1))
+                        await self.sleep(min(remaining_sleep, 1))
                 else:
                     # Sleep briefly while monitoring jobs
                     await self.log(
@@ -140,7 +140,7 @@ class AutoVideoAnalysisDaemon(BaseDaemon):
                         f"Monitoring {len(self._monitored_jobs)} active job(s), skipping scene check",
                     )
                     # Status update handled in _check_monitored_jobs
-                    await asyncio.sleep(1)
+                    await self.sleep(1)
 
             except asyncio.CancelledError:
                 await self.log(
@@ -154,7 +154,7 @@ class AutoVideoAnalysisDaemon(BaseDaemon):
                     f"Stack trace:\n{traceback.format_exc()}",
                 )
                 if self.is_running:
-                    await asyncio.sleep(30)  # Back off on error
+                    await self.sleep(30)  # Back off on error
 
     def _load_config(self) -> dict:
         """Load configuration with defaults."""
@@ -1,4 +1,5 @@
 import asyncio
+import time
 import traceback
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
@@ -6,6 +7,7 @@ from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
 from app.core.database import AsyncSessionLocal
+from app.core.metrics import DAEMON_LOOP_DURATION
 from app.models.daemon import (
     Daemon,
     DaemonJobAction,
@@ -62,6 +64,8 @@ class BaseDaemon(ABC):
         self.status = DaemonStatus.STOPPED
         self._task: Optional[asyncio.Task] = None
         self._start_time: Optional[datetime] = None
+        # When the run loop last woke up, for loop duration metrics
+        self._awake_since: Optional[float] = None
 
     async def start(self):
         """Start the daemon."""
@@ -135,6 +139,7 @@ class BaseDaemon(ABC):
 
     async def _run_wrapper(self):
         """Wrapper for the run method that handles errors."""
+        self._awake_since = time.monotonic()
         try:
             await self.run()
         except asyncio.CancelledError:
@@ -266,6 +271,23 @@ class BaseDaemon(ABC):
         # Add artificial delay to prevent rapid status updates
         await asyncio.sleep(1)
 
+    async def sleep(self, seconds: float) -> None:
+        """
+        Sleep between run loop iterations.
+
+        Daemons should use this instead of ``asyncio.sleep`` in their run loop:
+        the time spent working since the previous sleep is recorded as the
+        loop duration metric.
+        """
+        if self._awake_since is not None:
+            DAEMON_LOOP_DURATION.labels(
+                getattr(self.daemon_type, "value", self.daemon_type) or "unknown"
+            ).observe(time.monotonic() - self._awake_since)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self._awake_since = time.monotonic()
+
     async def track_job_action(
         self, job_id: str, action: DaemonJobAction, reason: Optional[str] = None
     ):
@@ -84,7 +84,7 @@ class DownloadProcessorDaemon(BaseDaemon):
 
                 # Process one iteration of the daemon loop
                 sleep_duration = await self._process_iteration(config)
-                await asyncio.sleep(sleep_duration)
+                await self.sleep(sleep_duration)
 
             except asyncio.CancelledError:
                 await self.log(
@@ -98,7 +98,7 @@ class DownloadProcessorDaemon(BaseDaemon):
                     f"Stack trace:\n{traceback.format_exc()}",
                 )
                 if self.is_running:
-                    await asyncio.sleep(30)  # Back off on error
+                    await self.sleep(30)  # Back off on error
 
     async def _process_iteration(self, config: dict) -> int:
         """Process one iteration of the daemon loop.
@@ -79,7 +79,7 @@ class TestDaemon(BaseDaemon):
                 # Error recovery
                 await self.log(LogLevel.ERROR, f"TestDaemon error: {str(e)}")
                 if self.is_running:
-                    await asyncio.sleep(5)  # Back off before retrying
+                    await self.sleep(5)  # Back off before retrying
 
     def _load_config(self) -> dict:
         """Load configuration with defaults."""
@@ -116,7 +116,7 @@ class TestDaemon(BaseDaemon):
         await self._check_monitored_jobs()
 
         # Sleep for the configured interval
-        await asyncio.sleep(config["log_interval"])
+        await self.sleep(config["log_interval"])
 
     async def _perform_logging(self, counter: int):
         """Perform periodic logging at different levels."""
@@ -14,7 +14,7 @@ from app.services.analysis.analysis_service import AnalysisService
 from app.services.analysis.models import AnalysisOptions
 from app.services.job_service import JobService
 from app.services.openai_client import OpenAIClient
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 
 from .analysis_jobs_helpers import calculate_plan_summary
 
@@ -257,12 +257,7 @@ async def _initialize_services(
     logger.debug(f"Scene IDs received in job: {scene_ids}")
 
     settings = await load_settings_with_db_overrides()
-    stash_service = StashService(
-        stash_url=settings.stash.url,
-        api_key=settings.stash.api_key,
-        timeout=settings.stash.timeout,
-        max_retries=settings.stash.max_retries,
-    )
+    stash_service = get_shared_stash_service(settings)
     openai_client = (
         OpenAIClient(
             api_key=settings.openai.api_key,
@@ -271,6 +266,12 @@ async def _initialize_services(
             max_tokens=settings.openai.max_tokens,
             temperature=settings.openai.temperature,
             timeout=settings.openai.timeout,
+            max_concurrent=settings.openai.max_concurrent_requests,
+            requests_per_minute=settings.openai.requests_per_minute,
+            tokens_per_minute=settings.openai.tokens_per_minute,
+            max_retries=settings.openai.max_retries,
+            response_cache_ttl_hours=settings.openai.response_cache_ttl_hours,
+            response_cache_max_entries=settings.openai.response_cache_max_entries,
         )
         if settings.openai.api_key
         else None
@@ -475,12 +476,7 @@ async def _store_cancellation_result(
 async def _create_analysis_service() -> AnalysisService:
     """Create and return an AnalysisService instance."""
     settings = await load_settings_with_db_overrides()
-    stash_service = StashService(
-        stash_url=settings.stash.url,
-        api_key=settings.stash.api_key,
-        timeout=settings.stash.timeout,
-        max_retries=settings.stash.max_retries,
-    )
+    stash_service = get_shared_stash_service(settings)
     openai_client = (
         OpenAIClient(
             api_key=settings.openai.api_key,
@@ -489,6 +485,12 @@ async def _create_analysis_service() -> AnalysisService:
             max_tokens=settings.openai.max_tokens,
             temperature=settings.openai.temperature,
             timeout=settings.openai.timeout,
+            max_concurrent=settings.openai.max_concurrent_requests,
+            requests_per_minute=settings.openai.requests_per_minute,
+            tokens_per_minute=settings.openai.tokens_per_minute,
+            max_retries=settings.openai.max_retries,
+            response_cache_ttl_hours=settings.openai.response_cache_ttl_hours,
+            response_cache_max_entries=settings.openai.response_cache_max_entries,
         )
         if settings.openai.api_key
         else None
@@ -739,12 +741,7 @@ async def apply_analysis_plan_job(
 
         # Create service instances
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url,
-            api_key=settings.stash.api_key,
-            timeout=settings.stash.timeout,
-            max_retries=settings.stash.max_retries,
-        )
+        stash_service = get_shared_stash_service(settings)
         openai_client = (
             OpenAIClient(
                 api_key=settings.openai.api_key,
@@ -753,6 +750,12 @@ async def apply_analysis_plan_job(
                 max_tokens=settings.openai.max_tokens,
                 temperature=settings.openai.temperature,
                 timeout=settings.openai.timeout,
+                max_concurrent=settings.openai.max_concurrent_requests,
+                requests_per_minute=settings.openai.requests_per_minute,
+                tokens_per_minute=settings.openai.tokens_per_minute,
+                max_retries=settings.openai.max_retries,
+                response_cache_ttl_hours=settings.openai.response_cache_ttl_hours,
+                response_cache_max_entries=settings.openai.response_cache_max_entries,
             )
             if settings.openai.api_key
             else None
@@ -771,6 +774,7 @@ async def apply_analysis_plan_job(
             job_id=job_id,
             progress_callback=progress_callback,
             change_ids=change_ids,
+            concurrency=kwargs.get("apply_concurrency"),
         )
 
         # Changes successfully applied - no automatic sync
@@ -834,12 +838,7 @@ async def generate_scene_details_job(
 
     # Create service instances
     settings = await load_settings_with_db_overrides()
-    stash_service = StashService(
-        stash_url=settings.stash.url,
-        api_key=settings.stash.api_key,
-        timeout=settings.stash.timeout,
-        max_retries=settings.stash.max_retries,
-    )
+    stash_service = get_shared_stash_service(settings)
     openai_client = (
         OpenAIClient(
             api_key=settings.openai.api_key,
@@ -848,6 +847,12 @@ async def generate_scene_details_job(
             max_tokens=settings.openai.max_tokens,
             temperature=settings.openai.temperature,
             timeout=settings.openai.timeout,
+            max_concurrent=settings.openai.max_concurrent_requests,
+            requests_per_minute=settings.openai.requests_per_minute,
+            tokens_per_minute=settings.openai.tokens_per_minute,
+            max_retries=settings.openai.max_retries,
+            response_cache_ttl_hours=settings.openai.response_cache_ttl_hours,
+            response_cache_max_entries=settings.openai.response_cache_max_entries,
         )
         if settings.openai.api_key
         else None
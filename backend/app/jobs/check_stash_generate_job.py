@@ -11,6 +11,7 @@ from app.core.settings_loader import load_settings_with_db_overrides
 from app.models import Scene
 from app.models.job import JobType
 from app.services.job_service import JobService
+from app.services.stash_registry import get_shared_stash_service
 from app.services.stash_service import StashService
 
 logger = logging.getLogger(__name__)
@@ -526,9 +527,7 @@ async def check_stash_generate(
 
         # Initialize services
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url, api_key=settings.stash.api_key
-        )
+        stash_service = get_shared_stash_service(settings)
 
         result = await _initialize_result(job_id)
 
@@ -588,10 +587,6 @@ async def check_stash_generate(
         error_msg = f"Check Stash generation job failed: {str(e)}"
         logger.error(error_msg, exc_info=True)
         raise
-    finally:
-        # Clean up service connection
-        if "stash_service" in locals():
-            await stash_service.close()
 
 
 def register_check_stash_generate_jobs(job_service: JobService) -> None:
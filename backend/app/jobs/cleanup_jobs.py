@@ -151,6 +151,18 @@ async def _cleanup_stuck_pending_plans(
         return 0, str(e)
 
 
+def _has_live_lease(job: Job, current_time: datetime) -> bool:
+    """Whether a durable queue worker still holds the job."""
+    if job.lease_owner is None or job.lease_expires_at is None:
+        return False
+    expires_at = job.lease_expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    if current_time.tzinfo is None:
+        current_time = current_time.replace(tzinfo=timezone.utc)
+    return bool(expires_at > current_time)
+
+
 async def _process_stale_job(
     job: Job,
     current_time: datetime,
@@ -185,6 +197,9 @@ async def _process_stale_job(
         if task and task.status == TaskStatus.RUNNING:
             is_actually_running = True
             logger.info(f"Job {job.id} task {task_id} is still running")
+    elif _has_live_lease(job, current_time):
+        is_actually_running = True
+        logger.info(f"Job {job.id} is still leased by {job.lease_owner}")
 
     if is_actually_running:
         return None
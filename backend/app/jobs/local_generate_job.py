@@ -8,6 +8,7 @@ from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 from app.core.settings_loader import load_settings_with_db_overrides
 from app.models.job import JobType
 from app.services.job_service import JobService
+from app.services.stash_registry import get_shared_stash_service
 from app.services.stash_service import StashService
 
 logger = logging.getLogger(__name__)
@@ -434,7 +435,6 @@ async def local_generate_job(
         raise ValueError(error_msg)
 
     logger.info(f"LOCALGENERATE: Processing scene ID: {scene_id}")
-    stash_service = None
 
     try:
         # Initial progress
@@ -444,9 +444,7 @@ async def local_generate_job(
 
         # Load settings and initialize Stash service
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url, api_key=settings.stash.api_key
-        )
+        stash_service = get_shared_stash_service(settings)
 
         await progress_callback(
             10, f"LOCALGENERATE: Querying scene {scene_id} from Stash"
@@ -531,9 +529,6 @@ async def local_generate_job(
         error_msg = f"LOCALGENERATE: Job failed: {str(e)}"
         logger.error(error_msg, exc_info=True)
         raise
-    finally:
-        if stash_service:
-            await stash_service.close()
 
 
 def register_local_generate_jobs(job_service: JobService) -> None:
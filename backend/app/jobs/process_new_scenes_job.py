@@ -20,7 +20,7 @@ from app.core.database import AsyncSessionLocal
 from app.models import Scene
 from app.models.job import JobType
 from app.services.job_service import JobService
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 
 logger = logging.getLogger(__name__)
 
@@ -235,53 +235,40 @@ async def _check_pending_scenes_for_sync() -> int:
         result = await db.execute(stmt)
         last_sync_record = result.scalar_one_or_none()
 
-        # Create stash service to check for pending scenes
-        stash_service = StashService(
-            stash_url=settings.stash.url,
-            api_key=settings.stash.api_key,
-        )
+        # Use the shared stash service to check for pending scenes
+        stash_service = get_shared_stash_service(settings)
 
-        try:
-            if last_sync_record and last_sync_record.completed_at:
-                # Check for scenes updated since last sync
-                # Convert to Pacific timezone with Z suffix for Stash compatibility
-                import pytz
+        if last_sync_record and last_sync_record.completed_at:
+            # Check for scenes updated since last sync
+            # Convert to Pacific timezone with Z suffix for Stash compatibility
+            import pytz
 
-                pacific_tz = pytz.timezone("America/Los_Angeles")
-                completed_at_no_microseconds = last_sync_record.completed_at.replace(
-                    microsecond=0
-                )
-                completed_at_pacific = completed_at_no_microseconds.astimezone(
-                    pacific_tz
-                )
-                formatted_timestamp = completed_at_pacific.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ"
-                )
+            pacific_tz = pytz.timezone("America/Los_Angeles")
+            completed_at_no_microseconds = last_sync_record.completed_at.replace(
+                microsecond=0
+            )
+            completed_at_pacific = completed_at_no_microseconds.astimezone(pacific_tz)
+            formatted_timestamp = completed_at_pacific.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-                filter_dict = {
-                    "updated_at": {
-                        "value": formatted_timestamp,
-                        "modifier": "GREATER_THAN",
-                    }
+            filter_dict = {
+                "updated_at": {
+                    "value": formatted_timestamp,
+                    "modifier": "GREATER_THAN",
                 }
-                logger.info(
-                    f"Checking for scenes updated since {last_sync_record.completed_at} "
-                    f"(formatted as {formatted_timestamp} for Stash API)"
-                )
-            else:
-                # No previous sync, check total scenes
-                filter_dict = None
-                logger.info("No previous sync found, checking total scene count")
-
-            scenes_sample, total_pending = await stash_service.get_scenes(
-                page=1, per_page=1, filter=filter_dict
+            }
+            logger.info(
+                f"Checking for scenes updated since {last_sync_record.completed_at} "
+                f"(formatted as {formatted_timestamp} for Stash API)"
             )
+        else:
+            # No previous sync, check total scenes
+            filter_dict = None
+            logger.info("No previous sync found, checking total scene count")
 
-            logger.info(f"Found {total_pending} scenes pending sync")
-            return total_pending
+        total_pending = await stash_service.count_scenes(filter=filter_dict)
 
-        finally:
-            await stash_service.close()
+        logger.info(f"Found {total_pending} scenes pending sync")
+        return total_pending
 
 
 async def _get_unanalyzed_scenes(batch_size: int = 100) -> List[List[str]]:
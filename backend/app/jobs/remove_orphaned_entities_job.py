@@ -16,6 +16,7 @@ from app.core.settings_loader import load_settings_with_db_overrides
 from app.models import Performer, Scene, Studio, Tag
 from app.models.job import JobType
 from app.services.job_service import JobService
+from app.services.stash_registry import get_shared_stash_service
 from app.services.stash_service import StashService
 
 logger = logging.getLogger(__name__)
@@ -97,9 +98,7 @@ async def remove_orphaned_entities(
 
         # Initialize services
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url, api_key=settings.stash.api_key
-        )
+        stash_service = get_shared_stash_service(settings)
 
         # Execute removal operations
         result = await _execute_removals(
@@ -231,23 +230,19 @@ async def _fetch_stash_scene_ids(
 ) -> set[str]:
     """Fetch all scene IDs from Stash with progress updates."""
     stash_scene_ids: set[str] = set()
-    page = 1
     per_page = 1000
     fetched_count = 0
 
     # First, get the total count
-    _, total_scenes = await stash_service.get_scenes(page=1, per_page=1)
+    total_scenes = await stash_service.count_scenes()
     logger.info(f"Total scenes in Stash: {total_scenes}")
 
-    while True:
+    # Only scene IDs are needed, paged by ID cursor
+    async for scenes in stash_service.iter_scenes(fields="ids", page_size=per_page):
         if cancellation_token and cancellation_token.is_cancelled:
             logger.info("Job cancelled during scene fetch")
             return stash_scene_ids
 
-        scenes, total = await stash_service.get_scenes(page=page, per_page=per_page)
-        if not scenes:
-            break
-
         stash_scene_ids.update(scene["id"] for scene in scenes)
         fetched_count += len(scenes)
 
@@ -261,10 +256,6 @@ async def _fetch_stash_scene_ids(
                 f"Fetching scenes from Stash: {fetched_count}/{total_scenes}",
             )
 
-        if len(scenes) < per_page:
-            break
-        page += 1
-
     return stash_scene_ids
 
 
@@ -425,7 +416,7 @@ async def _remove_orphaned_performers(
     await progress_callback(50, "Fetching performers from Stash...")
 
     # Get all performers from Stash
-    stash_performers = await stash_service.get_all_performers()
+    stash_performers = await stash_service.get_all_performers(use_cache=False)
     stash_performer_ids = {p["id"] for p in stash_performers}
     logger.info(f"Found {len(stash_performer_ids)} performers in Stash")
     await progress_callback(55, f"Found {len(stash_performer_ids)} performers in Stash")
@@ -484,7 +475,7 @@ async def _remove_orphaned_tags(
     await progress_callback(70, "Fetching tags from Stash...")
 
     # Get all tags from Stash
-    stash_tags = await stash_service.get_all_tags()
+    stash_tags = await stash_service.get_all_tags(use_cache=False)
     stash_tag_ids = {t["id"] for t in stash_tags}
     logger.info(f"Found {len(stash_tag_ids)} tags in Stash")
     await progress_callback(75, f"Found {len(stash_tag_ids)} tags in Stash")
@@ -536,7 +527,7 @@ async def _remove_orphaned_studios(
     await progress_callback(85, "Fetching studios from Stash...")
 
     # Get all studios from Stash
-    stash_studios = await stash_service.get_all_studios()
+    stash_studios = await stash_service.get_all_studios(use_cache=False)
     stash_studio_ids = {s["id"] for s in stash_studios}
     logger.info(f"Found {len(stash_studio_ids)} studios in Stash")
     await progress_callback(88, f"Found {len(stash_studio_ids)} studios in Stash")
@@ -7,7 +7,7 @@ from typing import Any, Awaitable, Callable, Dict, Optional
 from app.core.settings_loader import load_settings_with_db_overrides
 from app.models.job import JobType
 from app.services.job_service import JobService
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 
 logger = logging.getLogger(__name__)
 
@@ -206,9 +206,7 @@ async def stash_scan_job(
 
         # Initialize services following the pattern from sync_jobs
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url, api_key=settings.stash.api_key
-        )
+        stash_service = get_shared_stash_service(settings)
 
         # Prepare scan input with provided settings
         scan_input = {
@@ -268,10 +266,6 @@ async def stash_scan_job(
         logger.error(error_msg, exc_info=True)
         # Don't update progress in error handler - let job service handle it
         raise
-    finally:
-        # Close Stash service connection
-        if "stash_service" in locals():
-            await stash_service.close()
 
 
 def register_stash_scan_jobs(job_service: JobService) -> None:
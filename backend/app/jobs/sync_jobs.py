@@ -4,8 +4,9 @@ from typing import Any, Callable, Dict, List, Optional
 from app.core.database import AsyncSessionLocal
 from app.core.settings_loader import load_settings_with_db_overrides
 from app.models.job import JobType
+from app.repositories.job_repository import job_repository
 from app.services.job_service import JobService
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 from app.services.sync.models import SyncStatus
 from app.services.sync.sync_service import SyncService
 
@@ -21,9 +22,16 @@ async def sync_all_job(
     include_performers: bool = True,
     include_tags: bool = True,
     include_studios: bool = True,
+    resume: bool = False,
+    resume_checkpoint: Optional[Dict[str, Any]] = None,
     **kwargs: Any,
 ) -> Dict[str, Any]:
-    """Execute synchronization from Stash as a background job."""
+    """Execute synchronization from Stash as a background job.
+
+    Full scene syncs save a checkpoint after every page. A job re-dispatched
+    by the durable queue gets its own checkpoint as ``resume_checkpoint``;
+    with ``resume`` a new job continues the last interrupted sync instead.
+    """
     logger.info(f"Starting sync job {job_id} with full_resync={full_resync}")
     logger.info(
         f"Entity selection: scenes={include_scenes}, performers={include_performers}, tags={include_tags}, studios={include_studios}"
@@ -33,15 +41,26 @@ async def sync_all_job(
     try:
         # Create services for this job
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url, api_key=settings.stash.api_key
-        )
+        stash_service = get_shared_stash_service(settings)
     except Exception as e:
         logger.error(f"Failed to initialize services: {str(e)}")
         raise  # Re-raise for complete initialization failure
 
     async with AsyncSessionLocal() as db:
         logger.debug(f"Created database session: {type(db)}")
+        if resume and resume_checkpoint is None:
+            resume_checkpoint = await job_repository.get_resumable_checkpoint(
+                JobType.SYNC, db, exclude_job_id=job_id
+            )
+            logger.info(
+                f"Resuming sync from checkpoint: {resume_checkpoint is not None}"
+            )
+
+        async def save_checkpoint(checkpoint: Dict[str, Any]) -> None:
+            from app.services.job_service import job_service
+
+            await job_service.save_checkpoint(job_id, checkpoint)
+
         sync_service = SyncService(stash_service, db)
         logger.debug("Created sync service instance")
 
@@ -56,6 +75,10 @@ async def sync_all_job(
             include_performers=include_performers,
             include_tags=include_tags,
             include_studios=include_studios,
+            batch_size=settings.sync.batch_size,
+            pipeline_depth=settings.sync.pipeline_depth,
+            resume_checkpoint=resume_checkpoint,
+            checkpoint_callback=save_checkpoint,
         )
         logger.debug(f"sync_all completed with status: {result.status}")
 
@@ -74,6 +97,8 @@ async def sync_all_job(
         "success_rate": result.success_rate,
         "errors": [error.to_dict() for error in result.errors] if result.errors else [],
     }
+    if result.metadata.get("pipeline"):
+        job_result["pipeline_timings"] = result.metadata["pipeline"]
 
     # Map sync status to job status hint for the job service
     if result.status == SyncStatus.FAILED:
@@ -97,9 +122,7 @@ async def sync_scenes_job(
     try:
         # Create services for this job
         settings = await load_settings_with_db_overrides()
-        stash_service = StashService(
-            stash_url=settings.stash.url, api_key=settings.stash.api_key
-        )
+        stash_service = get_shared_stash_service(settings)
     except Exception as e:
         logger.error(f"Failed to initialize services: {str(e)}")
         raise  # Re-raise for complete initialization failure
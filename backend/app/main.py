@@ -10,7 +10,7 @@ from typing import Any, AsyncGenerator, Dict
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from app.api import api_router
@@ -19,6 +19,8 @@ from app.core.config import get_settings
 from app.core.database import close_db
 from app.core.job_context import setup_job_logging
 from app.core.logging import configure_logging
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.metrics import render as render_metrics
 from app.core.middleware import (
     ErrorHandlingMiddleware,
     LoggingMiddleware,
@@ -29,7 +31,10 @@ from app.core.migrations import run_migrations_async
 from app.core.tasks import get_task_queue
 from app.jobs import register_all_jobs
 from app.services.daemon_service import daemon_service
+from app.services.job_queue import get_job_queue
 from app.services.job_service import job_service
+from app.services.job_update_relay import get_job_update_relay
+from app.services.stash_registry import get_stash_registry
 
 # Suppress passlib's crypt deprecation warning in Python 3.11+
 warnings.filterwarnings(
@@ -75,6 +80,19 @@ async def _run_migrations_with_retry(max_attempts: int = 3) -> None:
                 await asyncio.sleep(5)
 
 
+async def _init_stash_services() -> None:
+    """Create the shared Stash service for the configured server."""
+    from app.core.settings_loader import load_settings_with_db_overrides
+
+    logger.info("Initializing shared Stash service...")
+    try:
+        stash_settings = await load_settings_with_db_overrides()
+    except Exception as e:
+        logger.warning(f"Could not load settings overrides for Stash: {e}")
+        stash_settings = settings
+    get_stash_registry().for_settings(stash_settings)
+
+
 async def _startup_tasks() -> None:
     """Run all startup tasks."""
     # Skip migrations in test environment
@@ -92,10 +110,22 @@ async def _startup_tasks() -> None:
     else:
         logger.info("Skipping background workers in test environment")
 
+    # Create the shared Stash service used by routes, jobs and daemons
+    if not os.getenv("PYTEST_CURRENT_TEST"):
+        await _init_stash_services()
+
     # Register job handlers
     logger.info("Registering job handlers...")
     register_all_jobs(job_service)
 
+    # Dispatch jobs from the job table when the durable queue is enabled, and
+    # relay progress of jobs run by separate worker processes (app.worker)
+    if settings.job_queue_mode == "database" and not os.getenv("PYTEST_CURRENT_TEST"):
+        if settings.job_queue_api_workers:
+            logger.info("Starting database job queue...")
+            await get_job_queue().start(job_service)
+        await get_job_update_relay().start()
+
     # Start scheduler
     if not os.getenv("PYTEST_CURRENT_TEST"):
         logger.info("Starting scheduler...")
@@ -151,6 +181,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.info("Stopping background workers...")
             task_queue = get_task_queue()
             await task_queue.stop()
+            await get_job_queue().stop()
+            await get_job_update_relay().stop()
 
             # Stop scheduler
             logger.info("Stopping scheduler...")
@@ -164,6 +196,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         else:
             logger.info("Skipping worker shutdown in test environment")
 
+        # Close shared Stash connection pools
+        logger.info("Closing Stash connections...")
+        await get_stash_registry().close_all()
+
         # Close database connections
         logger.info("Closing database connections...")
         await close_db()
@@ -252,6 +288,15 @@ async def ready_check(request: Request) -> JSONResponse:
     )
 
 
+# Prometheus metrics endpoint (outside of API prefix for scrapers)
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose application metrics in the Prometheus text format."""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(content=await render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 # Version endpoint
 @app.get("/version", include_in_schema=False)
 async def version_info() -> Dict[str, Any]:
@@ -5,6 +5,7 @@ This module imports and exports all database models to ensure they are
 registered with SQLAlchemy when the application starts.
 """
 
+from app.models.ai_response_cache import AIResponseCacheEntry
 from app.models.analysis_plan import AnalysisPlan, PlanStatus
 
 # Import association tables (must be imported before models that use them)
@@ -25,6 +26,7 @@ from app.models.daemon import (
 )
 from app.models.handled_download import HandledDownload
 from app.models.job import Job, JobStatus, JobType
+from app.models.job_scene import JobScene
 from app.models.performer import Performer
 from app.models.plan_change import ChangeAction, PlanChange
 
@@ -57,6 +59,8 @@ __all__ = [
     "AnalysisPlan",
     "PlanChange",
     "Job",
+    "JobScene",
+    "AIResponseCacheEntry",
     "Setting",
     "ScheduledTask",
     "SyncHistory",
@@ -0,0 +1,24 @@
+"""Cached OpenAI responses keyed by request fingerprint."""
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.core.database import Base
+
+
+class AIResponseCacheEntry(Base):
+    """One completion, reused when the same request is sent again.
+
+    ``key`` is a SHA-256 fingerprint of the model, temperature, response
+    format and messages. ``last_used_at`` orders entries for LRU eviction.
+    """
+
+    __tablename__ = "ai_response_cache"
+
+    key = Column(String(64), primary_key=True)
+    model = Column(String, nullable=False)
+    content = Column(Text, nullable=False)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    hits = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False)
+    last_used_at = Column(DateTime, nullable=False, index=True)
@@ -124,11 +124,19 @@ class Job(BaseModel):
     started_at = Column(DateTime(timezone=True), nullable=True, index=True)
     completed_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
+    # Durable queue state (JOB_QUEUE_MODE=database)
+    payload = Column(JSON, nullable=True)  # Handler arguments at creation
+    checkpoint = Column(JSON, nullable=True)  # Last saved resume point
+    lease_owner = Column(String, nullable=True)  # Worker running the job
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+
     # Indexes for common queries
     __table_args__ = (
         Index("idx_job_type_status", "type", "status"),
         Index("idx_job_status_created", "status", "created_at"),
         Index("idx_job_completed", "completed_at"),
+        Index("idx_job_status_lease", "status", "lease_expires_at"),
     )
 
     def update_progress(
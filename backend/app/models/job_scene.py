@@ -0,0 +1,21 @@
+"""Association between jobs and the scenes they operate on."""
+
+from sqlalchemy import Column, ForeignKey, Index, String
+
+from app.core.database import Base
+
+
+class JobScene(Base):
+    """One row per scene listed in a job's ``scene_ids`` metadata.
+
+    Lets scene listings find active and recent jobs with an indexed join
+    instead of scanning job metadata. Scenes are not a foreign key because
+    jobs may reference scenes that have not been synced yet.
+    """
+
+    __tablename__ = "job_scene"
+
+    job_id = Column(String, ForeignKey("job.id", ondelete="CASCADE"), primary_key=True)
+    scene_id = Column(String, primary_key=True)
+
+    __table_args__ = (Index("idx_job_scene_scene_job", "scene_id", "job_id"),)
@@ -1,15 +1,31 @@
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Collection, Dict, List, Optional, Union
 
-from sqlalchemy import String, and_, desc, func, select
+from sqlalchemy import Select, and_, desc, exists, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 
 from app.models.job import Job, JobStatus, JobType
+from app.models.job_scene import JobScene
 
 logger = logging.getLogger(__name__)
 
+ACTIVE_JOB_STATUSES = [
+    JobStatus.PENDING.value,
+    JobStatus.RUNNING.value,
+    JobStatus.CANCELLING.value,
+]
+
+
+def _scene_ids_from_metadata(metadata: Optional[Dict[str, Any]]) -> List[str]:
+    """Distinct scene IDs listed under ``scene_ids`` in job metadata."""
+    scene_ids = (metadata or {}).get("scene_ids")
+    if not isinstance(scene_ids, list):
+        return []
+    return list(dict.fromkeys(str(scene_id) for scene_id in scene_ids))
+
 
 class JobRepository:
     """Repository for job persistence and retrieval."""
@@ -30,6 +46,11 @@ class JobRepository:
             job_metadata=metadata or {},
         )
         db.add(job)
+        # Index the job's scenes so scene listings can join instead of scanning
+        db.add_all(
+            JobScene(job_id=job_id, scene_id=scene_id)
+            for scene_id in _scene_ids_from_metadata(metadata)
+        )
         if isinstance(db, AsyncSession):
             await db.commit()
             await db.refresh(job)
@@ -263,7 +284,6 @@ class JobRepository:
         self, db: Union[Session, AsyncSession], days: int = 30
     ) -> int:
         """Clean up completed jobs older than specified days."""
-        from datetime import timedelta
 
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
@@ -301,75 +321,186 @@ class JobRepository:
             db.commit()
         return deleted_count
 
-    async def get_all_active_job_scene_ids(self, db: AsyncSession) -> List[str]:
-        """Get all scene IDs that have active jobs."""
-        # Query for jobs that are active and have scene_ids in their metadata
-        query = select(Job).filter(
+    def _claimable_condition(self, now: datetime) -> Any:
+        """Jobs that are queued, or whose worker stopped renewing its lease."""
+        return or_(
+            and_(Job.status == JobStatus.PENDING.value, Job.lease_owner.is_(None)),
             and_(
-                Job.status.in_(
-                    [
-                        JobStatus.PENDING.value,
-                        JobStatus.RUNNING.value,
-                        JobStatus.CANCELLING.value,
-                    ]
+                Job.status.in_([JobStatus.PENDING.value, JobStatus.RUNNING.value]),
+                Job.lease_expires_at < now,
+            ),
+        )
+
+    def _type_free_condition(self, now: datetime) -> Any:
+        """No other job of the same type holds a live lease."""
+        holder = aliased(Job)
+        return ~exists().where(
+            holder.type == Job.type,
+            holder.id != Job.id,
+            holder.lease_owner.is_not(None),
+            holder.lease_expires_at >= now,
+        )
+
+    async def claim_next_job(
+        self,
+        db: AsyncSession,
+        worker_id: str,
+        lease_seconds: float,
+        job_types: List[str],
+        max_attempts: int,
+        exclusive_types: Collection[str] = (),
+    ) -> Optional[Job]:
+        """Lease the oldest claimable job to ``worker_id``.
+
+        On PostgreSQL the candidate row is locked with FOR UPDATE SKIP LOCKED
+        so concurrent workers pick different jobs. Other databases rely on
+        the conditional update alone: a worker that loses the race updates
+        no rows and gets None.
+
+        A job of one of ``exclusive_types`` is only claimed while no other
+        job of its type holds a live lease, so such jobs run one at a time
+        across all worker processes. On PostgreSQL, claims of an exclusive
+        type are serialized with a transaction-level advisory lock, so two
+        workers cannot both see the type as free. SQLite serializes writes
+        itself.
+        """
+        now = datetime.utcnow()
+        claimable = self._claimable_condition(now)
+        if exclusive_types:
+            claimable = and_(
+                claimable,
+                or_(
+                    Job.type.not_in(list(exclusive_types)),
+                    self._type_free_condition(now),
                 ),
-                # Cast JSON to text and check if it contains "scene_ids"
-                func.cast(Job.job_metadata, String).contains('"scene_ids"'),
             )
+        candidate = (
+            select(Job.id, Job.type)
+            .filter(claimable, Job.type.in_(job_types), Job.attempts < max_attempts)
+            .order_by(Job.created_at)
+            .limit(1)
         )
+        postgres = db.get_bind().dialect.name == "postgresql"
+        if postgres:
+            candidate = candidate.with_for_update(of=Job, skip_locked=True)
 
-        result = await db.execute(query)
-        jobs = result.scalars().all()
-
-        # Collect all unique scene IDs from active jobs
-        all_scene_ids = set()
-        for job in jobs:
-            if job.job_metadata and "scene_ids" in job.job_metadata:
-                job_scene_ids = job.job_metadata.get("scene_ids", [])
-                if isinstance(job_scene_ids, list):
-                    all_scene_ids.update(job_scene_ids)
+        row = (await db.execute(candidate)).first()
+        if row is None:
+            return None
+        job_id, job_type = row
+        job_type = job_type.value if isinstance(job_type, JobType) else job_type
+        if postgres and job_type in exclusive_types:
+            # Re-checked by the update below, which sees claims committed
+            # before the lock was granted
+            await db.execute(
+                select(func.pg_advisory_xact_lock(zlib.crc32(job_type.encode())))
+            )
 
-        return list(all_scene_ids)
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job_id, claimable)
+            .values(
+                lease_owner=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=Job.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if result.rowcount != 1:  # type: ignore[attr-defined]
+            return None
+        return await self.get_job(job_id, db)
+
+    async def renew_job_lease(
+        self, job_id: str, worker_id: str, lease_seconds: float, db: AsyncSession
+    ) -> Optional[str]:
+        """Extend a held lease; returns the job status, or None if it was lost."""
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.lease_owner == worker_id)
+            .values(
+                lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds)
+            )
+            .returning(Job.status)
+        )
+        status = result.scalar_one_or_none()
+        await db.commit()
+        return status.value if isinstance(status, JobStatus) else status
 
-    async def get_active_jobs_for_scenes(
-        self, scene_ids: List[str], db: AsyncSession
-    ) -> Dict[str, List[Job]]:
-        """Get active jobs (pending/running/cancelling) for multiple scenes."""
-        if not scene_ids:
-            return {}
+    async def release_job_lease(
+        self, job_id: str, worker_id: str, db: AsyncSession
+    ) -> None:
+        """Clear a lease once its worker has finished the job."""
+        await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.lease_owner == worker_id)
+            .values(lease_owner=None, lease_expires_at=None)
+        )
+        await db.commit()
 
-        # Query for jobs that are active and have scene_ids in their metadata
-        # Use JSON cast to check if metadata contains scene_ids key
-        query = select(Job).filter(
-            and_(
+    async def save_checkpoint(
+        self, job_id: str, checkpoint: Dict[str, Any], db: AsyncSession
+    ) -> None:
+        """Store the point a resumable job can continue from."""
+        await db.execute(
+            update(Job).where(Job.id == job_id).values(checkpoint=checkpoint)
+        )
+        await db.commit()
+
+    async def get_resumable_checkpoint(
+        self, job_type: JobType, db: AsyncSession, exclude_job_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint of the latest finished job of a type if it did not complete.
+
+        Only the most recent finished job counts: once a later run completed,
+        older interrupted runs have nothing left to resume.
+        """
+        query = (
+            select(Job)
+            .where(
+                Job.type == job_type.value,
                 Job.status.in_(
                     [
-                        JobStatus.PENDING.value,
-                        JobStatus.RUNNING.value,
-                        JobStatus.CANCELLING.value,
+                        JobStatus.COMPLETED.value,
+                        JobStatus.FAILED.value,
+                        JobStatus.CANCELLED.value,
                     ]
                 ),
-                # Cast JSON to text and check if it contains "scene_ids"
-                func.cast(Job.job_metadata, String).contains('"scene_ids"'),
             )
+            .order_by(desc(Job.created_at))
+            .limit(1)
+        )
+        if exclude_job_id:
+            query = query.where(Job.id != exclude_job_id)
+        job = (await db.execute(query)).scalar_one_or_none()
+        if job is None or job.status == JobStatus.COMPLETED.value:
+            return None
+        return job.checkpoint  # type: ignore[return-value]
+
+    def active_job_scene_ids_query(self) -> Select:
+        """Select the IDs of scenes that have active jobs, for use as a subquery."""
+        return (
+            select(JobScene.scene_id)
+            .join(Job, Job.id == JobScene.job_id)
+            .filter(Job.status.in_(ACTIVE_JOB_STATUSES))
+            .distinct()
         )
 
-        result = await db.execute(query)
-        jobs = result.scalars().all()
+    async def get_all_active_job_scene_ids(self, db: AsyncSession) -> List[str]:
+        """Get all scene IDs that have active jobs."""
+        result = await db.execute(self.active_job_scene_ids_query())
+        return list(result.scalars().all())
 
-        # Group jobs by scene_id
-        scene_jobs: Dict[str, List[Job]] = {}
-        for job in jobs:
-            if job.job_metadata and "scene_ids" in job.job_metadata:
-                job_scene_ids = job.job_metadata.get("scene_ids", [])
-                if isinstance(job_scene_ids, list):
-                    for scene_id in job_scene_ids:
-                        if scene_id in scene_ids:
-                            if scene_id not in scene_jobs:
-                                scene_jobs[scene_id] = []
-                            scene_jobs[scene_id].append(job)
+    async def get_active_jobs_for_scenes(
+        self, scene_ids: List[str], db: AsyncSession
+    ) -> Dict[str, List[Job]]:
+        """Get active jobs (pending/running/cancelling) for multiple scenes."""
+        if not scene_ids:
+            return {}
 
-        return scene_jobs
+        return await self._get_jobs_for_scenes(
+            scene_ids, db, Job.status.in_(ACTIVE_JOB_STATUSES)
+        )
 
     async def get_recent_jobs_for_scenes(
         self, scene_ids: List[str], db: AsyncSession, hours: int = 24
@@ -378,35 +509,32 @@ class JobRepository:
         if not scene_ids:
             return {}
 
-        from datetime import timedelta
-
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
-        # Query for completed jobs within the time window
-        query = select(Job).filter(
+        return await self._get_jobs_for_scenes(
+            scene_ids,
+            db,
             and_(
                 Job.status == JobStatus.COMPLETED.value,
                 Job.completed_at >= cutoff_time,
-                # Cast JSON to text and check if it contains "scene_ids"
-                func.cast(Job.job_metadata, String).contains('"scene_ids"'),
-            )
+            ),
         )
 
+    async def _get_jobs_for_scenes(
+        self, scene_ids: List[str], db: AsyncSession, condition: Any
+    ) -> Dict[str, List[Job]]:
+        """Group jobs matching ``condition`` by the requested scene IDs."""
+        query = (
+            select(JobScene.scene_id, Job)
+            .join(Job, Job.id == JobScene.job_id)
+            .filter(JobScene.scene_id.in_(scene_ids), condition)
+            .order_by(Job.created_at)
+        )
         result = await db.execute(query)
-        jobs = result.scalars().all()
 
-        # Group jobs by scene_id
         scene_jobs: Dict[str, List[Job]] = {}
-        for job in jobs:
-            if job.job_metadata and "scene_ids" in job.job_metadata:
-                job_scene_ids = job.job_metadata.get("scene_ids", [])
-                if isinstance(job_scene_ids, list):
-                    for scene_id in job_scene_ids:
-                        if scene_id in scene_ids:
-                            if scene_id not in scene_jobs:
-                                scene_jobs[scene_id] = []
-                            scene_jobs[scene_id].append(job)
-
+        for scene_id, job in result.all():
+            scene_jobs.setdefault(scene_id, []).append(job)
         return scene_jobs
 
 
@@ -0,0 +1,147 @@
+"""Persistent cache of OpenAI responses."""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ai_response_cache import AIResponseCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A completion served from the cache."""
+
+    content: str
+    prompt_tokens: int
+    completion_tokens: int
+
+
+def request_fingerprint(
+    model: str,
+    temperature: float,
+    response_format: Optional[dict[str, Any]],
+    messages: list[Any],
+) -> str:
+    """SHA-256 of everything that determines a completion's content."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "response_format": response_format,
+            "messages": messages,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """OpenAI responses stored in the ``ai_response_cache`` table.
+
+    Entries older than ``ttl_hours`` are misses. Once the table holds more
+    than ``max_entries`` rows, the least recently used ones are deleted.
+    Errors are logged and treated as misses, so a cache problem never fails
+    the request behind it.
+    """
+
+    def __init__(
+        self,
+        ttl_hours: int = 720,
+        max_entries: int = 10000,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.ttl = timedelta(hours=ttl_hours) if ttl_hours > 0 else None
+        self.max_entries = max_entries
+        self._session_factory = session_factory
+
+    def _session(self) -> AsyncSession:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.core.database import AsyncSessionLocal
+
+        return AsyncSessionLocal()
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a response and mark it as recently used."""
+        now = datetime.utcnow()
+        query = select(AIResponseCacheEntry).where(AIResponseCacheEntry.key == key)
+        if self.ttl:
+            query = query.where(AIResponseCacheEntry.created_at >= now - self.ttl)
+        try:
+            async with self._session() as db:
+                entry = (await db.execute(query)).scalar_one_or_none()
+                if entry is None:
+                    return None
+                cached = CachedResponse(
+                    content=str(entry.content),
+                    prompt_tokens=int(entry.prompt_tokens),
+                    completion_tokens=int(entry.completion_tokens),
+                )
+                await db.execute(
+                    update(AIResponseCacheEntry)
+                    .where(AIResponseCacheEntry.key == key)
+                    .values(
+                        last_used_at=now,
+                        hits=AIResponseCacheEntry.hits + 1,
+                    )
+                )
+                await db.commit()
+                return cached
+        except Exception as e:
+            logger.warning(f"AI response cache lookup failed: {e}")
+            return None
+
+    async def set(
+        self, key: str, model: str, content: str, usage: dict[str, int]
+    ) -> None:
+        """Store a response, then evict expired and least recently used ones."""
+        now = datetime.utcnow()
+        try:
+            async with self._session() as db:
+                await db.merge(
+                    AIResponseCacheEntry(
+                        key=key,
+                        model=model,
+                        content=content,
+                        prompt_tokens=usage.get("prompt_tokens", 0),
+                        completion_tokens=usage.get("completion_tokens", 0),
+                        hits=0,
+                        created_at=now,
+                        last_used_at=now,
+                    )
+                )
+                await db.flush()
+                await self._evict(db, now)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"AI response cache write failed: {e}")
+
+    async def _evict(self, db: AsyncSession, now: datetime) -> None:
+        if self.ttl:
+            await db.execute(
+                delete(AIResponseCacheEntry).where(
+                    AIResponseCacheEntry.created_at < now - self.ttl
+                )
+            )
+        count = (
+            await db.execute(select(func.count()).select_from(AIResponseCacheEntry))
+        ).scalar_one()
+        excess = count - self.max_entries
+        if excess > 0:
+            oldest = (
+                select(AIResponseCacheEntry.key)
+                .order_by(AIResponseCacheEntry.last_used_at)
+                .limit(excess)
+            )
+            await db.execute(
+                delete(AIResponseCacheEntry).where(AIResponseCacheEntry.key.in_(oldest))
+            )
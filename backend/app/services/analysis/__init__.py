@@ -13,6 +13,7 @@ from .models import (
 )
 from .performer_detector import PerformerDetector
 from .plan_manager import PlanManager
+from .plan_writer import PlanWriter
 from .studio_detector import StudioDetector
 from .tag_detector import TagDetector
 
@@ -24,6 +25,7 @@ __all__ = [
     "ApplyResult",
     "AnalysisService",
     "PlanManager",
+    "PlanWriter",
     "AIClient",
     "BatchProcessor",
     "StudioDetector",
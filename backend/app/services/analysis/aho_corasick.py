@@ -0,0 +1,81 @@
+"""Aho-Corasick automaton for finding many literal strings in one pass."""
+
+from collections import deque
+from typing import Dict, Generic, Hashable, List, Set, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class AhoCorasick(Generic[T]):
+    """Match a fixed set of keywords against text in a single scan.
+
+    Each keyword carries a payload; ``find_all`` returns the payloads of
+    every keyword occurring anywhere in the text. Keywords are matched
+    exactly, so callers normalize case on both sides. Usage::
+
+        automaton = AhoCorasick()
+        automaton.add("sean cody", "Sean Cody")
+        automaton.build()
+        automaton.find_all("/videos/sean cody/scene.mp4")  # {"Sean Cody"}
+    """
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[T]] = [[]]
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def add(self, keyword: str, payload: T) -> None:
+        """Add a keyword; ``build()`` must run before the next search."""
+        if not keyword:
+            raise ValueError("Keywords must not be empty")
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(payload)
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links breadth-first."""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Inherit matches ending here through the failure link
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+        self._built = True
+
+    def find_all(self, text: str) -> Set[T]:
+        """Payloads of all keywords that occur in ``text``."""
+        if not self._built:
+            raise RuntimeError("AhoCorasick.build() must be called after add()")
+        hits: Set[T] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
@@ -91,6 +91,7 @@ class AIClient:
         scene_data: Dict[str, Any],
         response_format: Optional[Type[T]] = None,
         temperature: float = 0.3,
+        use_cache: bool = True,
     ) -> Tuple[T, Dict[str, Any]]:
         """Call OpenAI with structured output and return cost information.
 
@@ -99,6 +100,7 @@ class AIClient:
             scene_data: Scene data to fill in prompt
             response_format: Pydantic model for structured output
             temperature: Temperature for generation
+            use_cache: Whether a cached response to the same prompt may be used
 
         Returns:
             Tuple of (parsed response, cost information)
@@ -115,9 +117,10 @@ class AIClient:
                 messages=[{"role": "user", "content": final_prompt}],
                 response_format={"type": "json_object"} if response_format else None,
                 temperature=temperature,
+                use_cache=use_cache,
             )
 
-            # Calculate cost
+            # Calculate cost (zero for cached responses, which use no tokens)
             cost_info = self.estimate_cost(
                 usage["prompt_tokens"], usage["completion_tokens"], self.model
             )
@@ -143,6 +146,7 @@ class AIClient:
                 "usage": usage,
                 "model": self.model,
                 "cost_breakdown": cost_info,
+                "cached": bool(usage.get("cached")),
             }
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
@@ -282,6 +286,9 @@ class AIClient:
                 f"- {tag}" for tag in scene_data["available_tags"]
             )
 
+        if "requested_fields" in scene_data:
+            prompt_data["requested_fields"] = ", ".join(scene_data["requested_fields"])
+
         # Fill the template
         try:
             return template.format(**prompt_data)
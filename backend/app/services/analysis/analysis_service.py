@@ -4,30 +4,39 @@ import asyncio
 import logging
 import time
 from datetime import datetime
+from functools import partial
 from typing import Any, Optional, Union
 
-from sqlalchemy import select, update
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
 from app.models.analysis_plan import AnalysisPlan, PlanStatus
 from app.models.job import JobStatus
 from app.models.scene import Scene
+from app.services.entity_index import get_entity_index
 from app.services.openai_client import OpenAIClient
 from app.services.stash_service import StashService
 
 from .ai_client import AIClient
 from .batch_processor import BatchProcessor
+from .candidate_index import CandidateIndex, prompt_line_length
 from .cost_tracker import AnalysisCostTracker
 from .details_generator import DetailsGenerator
 from .models import (
     AnalysisOptions,
     ApplyResult,
+    CombinedAnalysisResponse,
+    DetectionResult,
+    EntitySuggestion,
     ProposedChange,
     SceneChanges,
+    TagSuggestion,
 )
 from .performer_detector import PerformerDetector
 from .plan_manager import PlanManager
+from .plan_writer import PlanWriter
+from .prompts import COMBINED_ANALYSIS_PROMPT
 from .studio_detector import StudioDetector
 from .tag_detector import TagDetector
 from .video_tag_detector import VideoTagDetector
@@ -64,8 +73,11 @@ class AnalysisService:
         self.details_generator = DetailsGenerator()
         self.video_tag_detector = VideoTagDetector(settings=settings)
 
+        # Shared in-memory index of studios, performers and tags
+        self.entity_index = get_entity_index()
+
         # Initialize managers
-        self.plan_manager = PlanManager()
+        self.plan_manager = PlanManager(entity_index=self.entity_index)
         self.batch_processor = BatchProcessor(
             batch_size=settings.analysis.batch_size,
             max_concurrent=settings.analysis.max_concurrent,
@@ -78,6 +90,10 @@ class AnalysisService:
             "tags": [],
             "last_refresh": None,
         }
+        # Indexes for shortlisting the known entities listed in AI prompts
+        self._candidate_indexes: dict[str, CandidateIndex] = {
+            kind: CandidateIndex() for kind in ("studios", "performers", "tags")
+        }
 
         # Progress tracking for current analysis
         self._current_job_id: Optional[str] = None
@@ -87,9 +103,8 @@ class AnalysisService:
         self._current_batch_index: int = 0
         self._total_batches: int = 0
         self._current_plan_id: Optional[int] = None
-
-        # Lock to prevent concurrent plan creation
-        self._plan_creation_lock = asyncio.Lock()
+        # Owns the database session and writes plan changes in bulk
+        self._plan_writer: Optional[PlanWriter] = None
 
     async def analyze_scenes(
         self,
@@ -228,18 +243,22 @@ class AnalysisService:
     ) -> list[SceneChanges]:
         """Process scenes with non-AI detection methods only."""
         scenes_for_processing: list[Union[Scene, dict[str, Any], Any]] = scenes  # type: ignore[assignment]
-        return await self.batch_processor.process_scenes(
-            scenes=scenes_for_processing,
-            analyzer=lambda batch: self._analyze_batch_non_ai(
-                batch, options, db, job_id, cancellation_token
-            ),
-            progress_callback=lambda c, t, p, s: (
-                self._on_progress(job_id or "", c, t, p, s, progress_callback)
-                if job_id or progress_callback
-                else None
-            ),
-            cancellation_token=cancellation_token,
-        )
+        self._plan_writer = None
+        try:
+            return await self.batch_processor.process_scenes(
+                scenes=scenes_for_processing,
+                analyzer=lambda batch: self._analyze_batch_non_ai(
+                    batch, options, db, job_id, cancellation_token
+                ),
+                progress_callback=lambda c, t, p, s: (
+                    self._on_progress(job_id or "", c, t, p, s, progress_callback)
+                    if job_id or progress_callback
+                    else None
+                ),
+                cancellation_token=cancellation_token,
+            )
+        finally:
+            await self._flush_plan_writer()
 
     async def _analyze_batch_non_ai(
         self,
@@ -286,21 +305,10 @@ class AnalysisService:
                 changes=changes,
             )
 
-            # Use lock for all database operations to prevent concurrent session usage
-            # This ensures each scene's DB operations complete atomically before the next scene starts
-            async with self._plan_creation_lock:
-                # Update plan if needed
-                await self._update_plan_if_needed(scene_changes, db, job_id)
-
-                # DO NOT mark scene as analyzed for non-AI analysis
-                # We specifically skip this step
-
-                # Commit after each scene to make the plan visible incrementally
-                if db:
-                    await db.commit()
-                    logger.info(
-                        f"Committed scene {scene.id} non-AI changes to database"
-                    )
+            # Hand the results to the writer, which commits them in bulk.
+            # DO NOT mark scene as analyzed for non-AI analysis
+            if db:
+                self._get_plan_writer(db, job_id, {}).submit(scene_changes)
 
             # Update progress after each scene
             self._scenes_processed_in_current_batch += 1
@@ -322,18 +330,6 @@ class AnalysisService:
                 f"Error in non-AI analysis for scene {scene_data.get('id')}: {e}",
                 exc_info=True,
             )
-            # Roll back the transaction to prevent "Can't reconnect until invalid transaction is rolled back" errors
-            if db:
-                try:
-                    await db.rollback()
-                    logger.debug(
-                        f"Rolled back transaction for scene {scene_data.get('id')} after error"
-                    )
-                except Exception as rollback_error:
-                    logger.warning(
-                        f"Error during rollback for scene {scene_data.get('id')}: {rollback_error}",
-                        exc_info=True,
-                    )
             return self._create_error_scene_changes(scene_data, e)
 
     async def _perform_non_ai_analysis(
@@ -564,18 +560,23 @@ class AnalysisService:
     ) -> list[SceneChanges]:
         """Process scenes in batches with incremental plan updates."""
         scenes_for_processing: list[Union[Scene, dict[str, Any], Any]] = scenes  # type: ignore[assignment]
-        return await self.batch_processor.process_scenes(
-            scenes=scenes_for_processing,
-            analyzer=lambda batch: self._analyze_batch_with_plan(
-                batch, options, db, job_id, cancellation_token
-            ),
-            progress_callback=lambda c, t, p, s: (
-                self._on_progress(job_id or "", c, t, p, s, progress_callback)
-                if job_id or progress_callback
-                else None
-            ),
-            cancellation_token=cancellation_token,
-        )
+        self._plan_writer = None
+        try:
+            return await self.batch_processor.process_scenes(
+                scenes=scenes_for_processing,
+                analyzer=lambda batch: self._analyze_batch_with_plan(
+                    batch, options, db, job_id, cancellation_token
+                ),
+                progress_callback=lambda c, t, p, s: (
+                    self._on_progress(job_id or "", c, t, p, s, progress_callback)
+                    if job_id or progress_callback
+                    else None
+                ),
+                cancellation_token=cancellation_token,
+            )
+        finally:
+            # Write what was buffered, also when cancelled or failed
+            await self._flush_plan_writer()
 
     async def _finalize_analysis(
         self,
@@ -685,6 +686,7 @@ class AnalysisService:
         self._current_progress_callback = None
         self._current_plan_id = None
         self._current_plan_name = ""
+        self._plan_writer = None
         self._scenes_processed_in_current_batch = 0
         self._total_scenes_in_all_batches = 0
         self._current_batch_index = 0
@@ -736,20 +738,24 @@ class AnalysisService:
         """
         changes = []
 
-        # Detect studio
-        if options.detect_studios:
-            studio_changes = await self._detect_studio(scene_data, options)
-            changes.extend(studio_changes)
+        if options.combined_ai and self.ai_client:
+            # Studio, performers and tags from a single AI request
+            changes.extend(await self._detect_combined(scene_data, options))
+        else:
+            # Detect studio
+            if options.detect_studios:
+                studio_changes = await self._detect_studio(scene_data, options)
+                changes.extend(studio_changes)
 
-        # Detect performers
-        if options.detect_performers:
-            performer_changes = await self._detect_performers(scene_data, options)
-            changes.extend(performer_changes)
+            # Detect performers
+            if options.detect_performers:
+                performer_changes = await self._detect_performers(scene_data, options)
+                changes.extend(performer_changes)
 
-        # Detect tags
-        if options.detect_tags:
-            tag_changes = await self._detect_tags(scene_data, options)
-            changes.extend(tag_changes)
+            # Detect tags
+            if options.detect_tags:
+                tag_changes = await self._detect_tags(scene_data, options)
+                changes.extend(tag_changes)
 
         # Generate/enhance title (using detect_details option for now)
         if options.detect_details:
@@ -923,22 +929,31 @@ class AnalysisService:
             job_id: Job ID for linking to plan
 
         Returns:
-            List of scene changes
+            List of scene changes, in batch order
         """
-        results = []
-
-        for scene_data in batch_data:
-            # Check for cancellation before processing each scene
-            if cancellation_token and hasattr(cancellation_token, "check_cancellation"):
-                await cancellation_token.check_cancellation()
-
-            # Analyze the scene
-            scene_changes = await self._analyze_single_scene_with_plan(
-                scene_data, options, db, job_id
-            )
-            results.append(scene_changes)
+        # Scenes are analyzed concurrently; only the plan writer task uses db
+        workers = asyncio.Semaphore(max(1, self.settings.analysis.scene_workers))
+
+        async def analyze(scene_data: dict) -> SceneChanges:
+            async with workers:
+                # Check for cancellation before processing each scene
+                if cancellation_token and hasattr(
+                    cancellation_token, "check_cancellation"
+                ):
+                    await cancellation_token.check_cancellation()
+
+                return await self._analyze_single_scene_with_plan(
+                    scene_data, options, db, job_id
+                )
 
-        return results
+        tasks = [asyncio.create_task(analyze(scene_data)) for scene_data in batch_data]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Stop the batch's other scenes, e.g. when the job is cancelled
+            for task in tasks:
+                task.cancel()
+            raise
 
     async def _analyze_single_scene_with_plan(
         self,
@@ -971,21 +986,15 @@ class AnalysisService:
                 changes=changes,
             )
 
-            # Use lock for all database operations to prevent concurrent session usage
-            # This ensures each scene's DB operations complete atomically before the next scene starts
-            async with self._plan_creation_lock:
-                # Update plan if needed
-                await self._update_plan_if_needed(scene_changes, db, job_id)
-
-                # Mark scene as analyzed
-                if db:
-                    await self._mark_single_scene_analyzed(scene.id, db, options)
-
-                    # Commit after each scene to make the plan visible incrementally
-                    await db.commit()
-                    logger.info(f"Committed scene {scene.id} changes to database")
+            # Hand the changes and analyzed flags to the writer, the only
+            # user of the shared session, which commits them in bulk
+            if db:
+                writer = self._get_plan_writer(
+                    db, job_id, self._analyzed_flags(options)
+                )
+                writer.submit(scene_changes)
 
-            # Update progress after each scene (outside the lock since it doesn't use the shared db session)
+            # Update progress after each scene
             self._scenes_processed_in_current_batch += 1
             if self._current_progress_callback:
                 progress = int(
@@ -1004,18 +1013,6 @@ class AnalysisService:
             logger.error(
                 f"Error analyzing scene {scene_data.get('id')}: {e}", exc_info=True
             )
-            # Roll back the transaction to prevent "Can't reconnect until invalid transaction is rolled back" errors
-            if db:
-                try:
-                    await db.rollback()
-                    logger.debug(
-                        f"Rolled back transaction for scene {scene_data.get('id')} after error"
-                    )
-                except Exception as rollback_error:
-                    logger.warning(
-                        f"Error during rollback for scene {scene_data.get('id')}: {rollback_error}",
-                        exc_info=True,
-                    )
             return self._create_error_scene_changes(scene_data, e)
 
     def _create_scene_like(self, scene_data: dict) -> Any:
@@ -1070,53 +1067,48 @@ class AnalysisService:
 
         return SceneLike(scene_data)
 
-    async def _update_plan_if_needed(
+    def _get_plan_writer(
         self,
-        scene_changes: SceneChanges,
-        db: Optional[AsyncSession],
+        db: AsyncSession,
         job_id: Optional[str],
-    ) -> None:
-        """Update plan with scene changes if needed.
+        analyzed_flags: dict[str, bool],
+    ) -> PlanWriter:
+        """Get the plan writer for the current analysis, creating it if needed.
 
-        Note: This method assumes the caller holds the _plan_creation_lock to prevent
-        concurrent database operations on the shared session.
+        Args:
+            db: Database session the writer commits
+            job_id: Job ID for plan creation
+            analyzed_flags: Scene flags to set on every analyzed scene
+
+        Returns:
+            Plan writer
         """
-        if db and scene_changes.has_changes():
-            # Note: Lock removed here as it's now held by the caller (_analyze_single_scene_with_plan)
-            # This prevents nested locking and ensures all DB operations for a scene are atomic
-            if not self._current_plan_id:
-                # Create new plan
-                logger.info(
-                    f"Creating new plan for job {job_id} with name: {self._current_plan_name}"
-                )
-                plan = await self.plan_manager.create_or_update_plan(
-                    name=self._current_plan_name,
-                    scene_changes=scene_changes,
-                    metadata=self._plan_metadata,
-                    db=db,
-                    job_id=job_id,
-                )
-                plan_id: int = plan.id  # type: ignore[assignment]
-                self._current_plan_id = plan_id
-                logger.info(f"Created plan {plan_id} for job {job_id}")
+        if self._plan_writer is None or self._plan_writer.db is not db:
+            self._plan_writer = PlanWriter(
+                self.plan_manager,
+                db,
+                name=self._current_plan_name,
+                metadata=self._plan_metadata,
+                job_id=job_id,
+                analyzed_flags=analyzed_flags,
+                flush_scenes=self.settings.analysis.plan_flush_scenes,
+                flush_interval=self.settings.analysis.plan_flush_interval,
+                on_plan_created=lambda plan_id: self._on_plan_created(plan_id, job_id),
+            )
+            # Continue a plan that was already created
+            self._plan_writer.plan_id = self._current_plan_id
+        return self._plan_writer
 
-                # Update job metadata with plan_id
-                if job_id and self._current_job_id:
-                    await self._update_job_with_plan_id(job_id, plan_id)
-            else:
-                # Add to existing plan
-                logger.info(f"Adding changes to existing plan {self._current_plan_id}")
-                await self.plan_manager.add_changes_to_plan(
-                    self._current_plan_id,
-                    scene_changes,
-                    db,
-                )
-                logger.info(
-                    f"Added changes for scene {scene_changes.scene_id} to plan {self._current_plan_id}"
-                )
+    async def _on_plan_created(self, plan_id: int, job_id: Optional[str]) -> None:
+        """Remember a newly written plan and link it to the job."""
+        self._current_plan_id = plan_id
+        if job_id and self._current_job_id:
+            await self._update_job_with_plan_id(job_id, plan_id)
 
-                # Don't update job metadata here - it was already done when plan was created
-                # This avoids race conditions with progress updates
+    async def _flush_plan_writer(self) -> None:
+        """Write the results still buffered at the end of an analysis."""
+        if self._plan_writer is not None:
+            await self._plan_writer.close()
 
     def _create_error_scene_changes(
         self, scene_data: dict, error: Exception
@@ -1130,20 +1122,14 @@ class AnalysisService:
             error=str(error),
         )
 
-    async def _mark_single_scene_analyzed(
-        self,
-        scene_id: str,
-        db: AsyncSession,
-        options: AnalysisOptions,
-    ) -> None:
-        """Mark a single scene as analyzed.
-
-        This is safe for concurrent access as it uses a simple UPDATE.
+    def _analyzed_flags(self, options: AnalysisOptions) -> dict[str, bool]:
+        """Scene flags to set once a scene has been analyzed with ``options``.
 
         Args:
-            scene_id: Scene ID to mark
-            db: Database session
             options: Analysis options to determine which flags to set
+
+        Returns:
+            Column values for the scene update
         """
         update_values = {}
 
@@ -1160,12 +1146,7 @@ class AnalysisService:
         if options.detect_video_tags:
             update_values["video_analyzed"] = True
 
-        if update_values:
-            await db.execute(
-                update(Scene).where(Scene.id == scene_id).values(**update_values)
-            )
-            # Use flush instead of commit to keep it within the same transaction
-            await db.flush()
+        return update_values
 
     async def _detect_studio(
         self, scene_data: dict, options: AnalysisOptions
@@ -1179,12 +1160,11 @@ class AnalysisService:
         Returns:
             List of proposed changes
         """
-        changes: list[ProposedChange] = []
         current_studio = scene_data.get("studio")
 
         # Skip if already has studio
         if current_studio:
-            return changes
+            return []
 
         # First try local detection
         result = await self.studio_detector.detect(
@@ -1209,21 +1189,33 @@ class AnalysisService:
                 ),
                 ai_client=self.ai_client,
                 use_ai=True,
+                # Shortlisted only if the path match is not confident enough
+                ai_candidates=partial(
+                    self._prompt_candidates, "studios", "studio_detection", scene_data
+                ),
             )
 
-        if result and result.confidence >= options.confidence_threshold:
-            changes.append(
-                ProposedChange(
-                    field="studio",
-                    action="set",
-                    current_value=current_studio,
-                    proposed_value=result.value,
-                    confidence=result.confidence,
-                    reason=f"Detected from {result.source}",
-                )
-            )
+        return self._studio_changes(current_studio, result, options)
 
-        return changes
+    def _studio_changes(
+        self,
+        current_studio: Any,
+        result: Optional[DetectionResult],
+        options: AnalysisOptions,
+    ) -> list[ProposedChange]:
+        """Turn a studio detection into a proposed change if confident enough."""
+        if not result or result.confidence < options.confidence_threshold:
+            return []
+        return [
+            ProposedChange(
+                field="studio",
+                action="set",
+                current_value=current_studio,
+                proposed_value=result.value,
+                confidence=result.confidence,
+                reason=f"Detected from {result.source}",
+            )
+        ]
 
     async def _detect_performers(
         self, scene_data: dict, options: AnalysisOptions
@@ -1237,7 +1229,6 @@ class AnalysisService:
         Returns:
             List of proposed changes
         """
-        changes = []
         current_performers = scene_data.get("performers", [])
         current_names = [
             p.get("name", "") for p in current_performers if isinstance(p, dict)
@@ -1257,13 +1248,17 @@ class AnalysisService:
         # Only detect with AI if ai_client is available
         ai_results: list[Any] = []
         if self.ai_client:
+            candidates = self._prompt_candidates(
+                "performers", "performer_detection", scene_data
+            )
             # Use tracked version if cost tracker is available
             if hasattr(self, "cost_tracker"):
                 ai_results, cost_info = (
                     await self.performer_detector.detect_with_ai_tracked(
                         scene_data=scene_data,
                         ai_client=self.ai_client,
-                        known_performers=self._cache["performers"],
+                        known_performers=candidates,
+                        use_cache=options.use_ai_cache,
                     )
                 )
                 if cost_info:
@@ -1273,17 +1268,31 @@ class AnalysisService:
                         cost_info["usage"]["prompt_tokens"],
                         cost_info["usage"]["completion_tokens"],
                         cost_info["model"],
+                        cached=cost_info.get("cached", False),
                     )
             else:
                 ai_results = await self.performer_detector.detect_with_ai(
                     scene_data=scene_data,
                     ai_client=self.ai_client,
-                    known_performers=self._cache["performers"],
+                    known_performers=candidates,
                 )
 
+        return self._performer_changes(
+            current_names, path_results + ai_results, options
+        )
+
+    def _performer_changes(
+        self,
+        current_names: list[str],
+        results: list[DetectionResult],
+        options: AnalysisOptions,
+    ) -> list[ProposedChange]:
+        """Deduplicate performer detections into one change per new performer."""
+        changes = []
+
         # Combine and deduplicate results
         all_results: dict[str, Any] = {}
-        for result in path_results + ai_results:
+        for result in results:
             if result.confidence >= options.confidence_threshold:
                 name = result.value
                 if name not in current_names:
@@ -1320,7 +1329,6 @@ class AnalysisService:
         Returns:
             List of proposed changes
         """
-        changes = []
         current_tags = scene_data.get("tags", [])
         current_names = [t.get("name", "") for t in current_tags if isinstance(t, dict)]
 
@@ -1332,13 +1340,15 @@ class AnalysisService:
         # Only detect with AI if ai_client is available
         ai_results: list[Any] = []
         if self.ai_client:
+            candidates = self._prompt_candidates("tags", "tag_detection", scene_data)
             # Use tracked version if cost tracker is available
             if hasattr(self, "cost_tracker"):
                 ai_results, cost_info = await self.tag_detector.detect_with_ai_tracked(
                     scene_data=scene_data,
                     ai_client=self.ai_client,
                     existing_tags=current_names,
-                    available_tags=self._cache["tags"],
+                    available_tags=candidates,
+                    use_cache=options.use_ai_cache,
                 )
                 if cost_info:
                     self.cost_tracker.track_operation(
@@ -1347,21 +1357,33 @@ class AnalysisService:
                         cost_info["usage"]["prompt_tokens"],
                         cost_info["usage"]["completion_tokens"],
                         cost_info["model"],
+                        cached=cost_info.get("cached", False),
                     )
             else:
                 ai_results = await self.tag_detector.detect_with_ai(
                     scene_data=scene_data,
                     ai_client=self.ai_client,
                     existing_tags=current_names,
-                    available_tags=self._cache["tags"],
+                    available_tags=candidates,
                 )
 
+        return self._tag_changes(current_names, tech_results + ai_results, options)
+
+    def _tag_changes(
+        self,
+        current_names: list[str],
+        results: list[DetectionResult],
+        options: AnalysisOptions,
+    ) -> list[ProposedChange]:
+        """Keep tag detections that exist in the database, one change per tag."""
+        changes = []
+
         # Combine results and filter to only existing tags
         all_results: dict[str, Any] = {}
         available_tags = self._cache.get("tags", [])
         available_tags_map = {t.lower(): t for t in available_tags}
 
-        for result in tech_results + ai_results:
+        for result in results:
             if result.confidence >= options.confidence_threshold:
                 tag = result.value
                 tag_lower = tag.lower()
@@ -1394,6 +1416,231 @@ class AnalysisService:
 
         return changes
 
+    async def _detect_combined(
+        self, scene_data: dict, options: AnalysisOptions
+    ) -> list[ProposedChange]:
+        """Detect studio, performers and tags with one AI request.
+
+        Local detection runs first as in the separate detectors, and the
+        studio is only asked for when no confident local match was found.
+
+        Args:
+            scene_data: Scene data
+            options: Analysis options
+
+        Returns:
+            List of proposed changes
+        """
+        current_studio = scene_data.get("studio")
+        performer_names = [
+            p.get("name", "")
+            for p in scene_data.get("performers", [])
+            if isinstance(p, dict)
+        ]
+        tag_names = [
+            t.get("name", "") for t in scene_data.get("tags", []) if isinstance(t, dict)
+        ]
+
+        local = await self._detect_combined_local(scene_data, options, tag_names)
+        requested = list(local)
+        studio_result = local.get("studio")
+        if studio_result and studio_result.confidence >= options.confidence_threshold:
+            requested.remove("studio")
+        ai_results = await self._request_combined_analysis(
+            scene_data, requested, tag_names, options.use_ai_cache
+        )
+
+        changes = []
+        if "studio" in requested:
+            studio_result = next(iter(ai_results["studio"]), None)
+        if "studio" in local:
+            changes.extend(self._studio_changes(current_studio, studio_result, options))
+        if "performers" in local:
+            changes.extend(
+                self._performer_changes(
+                    performer_names,
+                    local["performers"] + ai_results["performers"],
+                    options,
+                )
+            )
+        if "tags" in local:
+            changes.extend(
+                self._tag_changes(
+                    tag_names, local["tags"] + ai_results["tags"], options
+                )
+            )
+        return changes
+
+    async def _detect_combined_local(
+        self, scene_data: dict, options: AnalysisOptions, tag_names: list[str]
+    ) -> dict[str, Any]:
+        """Run the local detectors for the fields combined mode covers.
+
+        Returns:
+            Local results keyed by the field names to request from AI
+        """
+        local: dict[str, Any] = {}
+        if options.detect_studios and not scene_data.get("studio"):
+            local["studio"] = await self.studio_detector.detect(
+                scene_data=scene_data,
+                known_studios=(
+                    self._cache["studios"]
+                    if isinstance(self._cache["studios"], list)
+                    else []
+                ),
+                ai_client=None,
+                use_ai=False,
+            )
+        if options.detect_performers:
+            local["performers"] = await self.performer_detector.detect_from_path(
+                file_path=scene_data.get("file_path", ""),
+                known_performers=(
+                    self._cache["performers"]
+                    if isinstance(self._cache["performers"], list)
+                    else []
+                ),
+                title=scene_data.get("title", ""),
+            )
+        if options.detect_tags:
+            local["tags"] = self.tag_detector.detect_technical_tags(
+                scene_data=scene_data, existing_tags=tag_names
+            )
+        return local
+
+    async def _request_combined_analysis(
+        self,
+        scene_data: dict,
+        requested: list[str],
+        existing_tags: list[str],
+        use_cache: bool = True,
+    ) -> dict[str, list[DetectionResult]]:
+        """Ask AI for the requested fields in one structured-output call.
+
+        Args:
+            scene_data: Scene data
+            requested: Fields to detect ("studio", "performers", "tags")
+            existing_tags: Tags already assigned to the scene
+            use_cache: Whether a cached AI response may be used
+
+        Returns:
+            AI detections per field, empty if the request failed
+        """
+        results: dict[str, list[DetectionResult]] = {
+            "studio": [],
+            "performers": [],
+            "tags": [],
+        }
+        if not requested or not self.ai_client:
+            return results
+
+        prompt_data = scene_data.copy()
+        prompt_data["requested_fields"] = requested
+        for kind, field in (
+            ("studios", "studio"),
+            ("performers", "performers"),
+            ("tags", "tags"),
+        ):
+            prompt_data[f"available_{kind}"] = (
+                self._prompt_candidates(kind, "combined_detection", scene_data)
+                if field in requested
+                else []
+            )
+
+        try:
+            response: Any
+            if hasattr(self, "cost_tracker"):
+                response, cost_info = await self.ai_client.analyze_scene_with_cost(
+                    prompt=COMBINED_ANALYSIS_PROMPT,
+                    scene_data=prompt_data,
+                    response_format=CombinedAnalysisResponse,
+                    temperature=0.3,
+                    use_cache=use_cache,
+                )
+                self.cost_tracker.track_operation(
+                    "combined_detection",
+                    cost_info["cost"],
+                    cost_info["usage"]["prompt_tokens"],
+                    cost_info["usage"]["completion_tokens"],
+                    cost_info["model"],
+                    cached=cost_info.get("cached", False),
+                )
+            else:
+                response = await self.ai_client.analyze_scene(
+                    prompt=COMBINED_ANALYSIS_PROMPT,
+                    scene_data=prompt_data,
+                    response_format=CombinedAnalysisResponse,
+                    temperature=0.3,
+                )
+        except Exception as e:
+            logger.error(f"AI combined detection error: {e}", exc_info=True)
+            return results
+
+        if not isinstance(response, CombinedAnalysisResponse):
+            logger.error(f"Unexpected response type: {type(response)}")
+            return results
+
+        def detection(suggestion: Union[EntitySuggestion, TagSuggestion]) -> Any:
+            name = suggestion.name.strip()
+            if not name or name.lower() == "unknown":
+                return None
+            return DetectionResult(
+                value=name,
+                confidence=suggestion.confidence,
+                source="ai",
+                metadata={"model": self.ai_client.model if self.ai_client else None},
+            )
+
+        existing = {tag.lower() for tag in existing_tags}
+        studio = detection(response.studio) if response.studio else None
+        results["studio"] = [studio] if studio else []
+        results["performers"] = [
+            r for r in map(detection, response.performers) if r is not None
+        ]
+        results["tags"] = self.tag_detector._filter_redundant_results(
+            [
+                r
+                for r in map(detection, response.tags)
+                if r is not None and r.value.lower() not in existing
+            ],
+            existing_tags,
+        )
+        return results
+
+    def _prompt_candidates(
+        self, kind: str, operation: str, scene_data: dict
+    ) -> list[Any]:
+        """Shortlist the known entities of ``kind`` to list in an AI prompt.
+
+        Args:
+            kind: Entity type ("studios", "performers" or "tags")
+            operation: Cost tracker operation the prompt belongs to
+            scene_data: Scene data whose path, title and details are matched
+
+        Returns:
+            Entities most relevant to the scene, or all of them if few enough
+        """
+        entities = self._cache[kind] if isinstance(self._cache[kind], list) else []
+        limit = self.settings.analysis.prompt_candidate_limit
+        if limit <= 0 or len(entities) <= limit:
+            return entities
+
+        index = self._candidate_indexes[kind]
+        if not index.is_built_from(entities):
+            index.build(entities)
+        text = " ".join(
+            str(scene_data.get(field) or "")
+            for field in ("file_path", "title", "details")
+        )
+        candidates = index.shortlist(text, limit)
+
+        if hasattr(self, "cost_tracker"):
+            sent_chars = sum(prompt_line_length(entity) for entity in candidates)
+            self.cost_tracker.track_prompt_savings(
+                operation,
+                (index.prompt_chars - sent_chars) // AIClient.AVG_CHARS_PER_TOKEN,
+            )
+        return candidates
+
     async def _detect_details(
         self, scene_data: dict, options: AnalysisOptions
     ) -> list[ProposedChange]:
@@ -1507,40 +1754,24 @@ class AnalysisService:
         raise RuntimeError("Failed to get database session")
 
     async def _refresh_cache(self) -> None:
-        """Refresh cached entities from local database."""
-        from sqlalchemy import select
-
-        from app.core.database import AsyncSessionLocal
-        from app.models import Performer, Studio, Tag
-
+        """Refresh cached entities from the shared entity index."""
         try:
-            async with AsyncSessionLocal() as db:
-                # Get all studios from local database
-                studios_result = await db.execute(select(Studio))
-                studios = studios_result.scalars().all()
-                self._cache["studios"] = [s.name for s in studios if s.name]
-
-                # Get all performers with aliases from local database
-                performers_result = await db.execute(select(Performer))
-                performers = performers_result.scalars().all()
-                self._cache["performers"] = [
-                    {"name": p.name, "aliases": p.aliases or []}
-                    for p in performers
-                    if p.name
-                ]
-
-                # Get all tags from local database
-                tags_result = await db.execute(select(Tag))
-                tags = tags_result.scalars().all()
-                self._cache["tags"] = [t.name for t in tags if t.name]
-
-                self._cache["last_refresh"] = datetime.utcnow()
+            await self.entity_index.refresh()
 
-                logger.info(
-                    f"Cache refreshed from local database: {len(self._cache['studios']) if isinstance(self._cache['studios'], list) else 0} studios, "
-                    f"{len(self._cache['performers']) if isinstance(self._cache['performers'], list) else 0} performers, "
-                    f"{len(self._cache['tags']) if isinstance(self._cache['tags'], list) else 0} tags"
-                )
+            self._cache["studios"] = self.entity_index.names("studios")
+            self._cache["performers"] = self.entity_index.performer_aliases()
+            self._cache["tags"] = self.entity_index.names("tags")
+            # Unchanged lists are the same objects, so these are no-ops then
+            self.studio_detector.update_known_studios(self._cache["studios"])
+            self.performer_detector.update_index(self._cache["performers"])
+            self._cache["last_refresh"] = datetime.utcnow()
+
+            logger.info(
+                f"Cache refreshed from entity index: "
+                f"{len(self._cache['studios'])} studios, "
+                f"{len(self._cache['performers'])} performers, "
+                f"{len(self._cache['tags'])} tags"
+            )
 
         except Exception as e:
             logger.error(f"Failed to refresh cache from database: {e}")
@@ -2448,6 +2679,7 @@ class AnalysisService:
         job_id: Optional[str] = None,
         progress_callback: Optional[Any] = None,
         change_ids: Optional[list[int]] = None,
+        concurrency: Optional[int] = None,
     ) -> ApplyResult:
         """Apply an analysis plan to update scene metadata in Stash.
 
@@ -2457,6 +2689,7 @@ class AnalysisService:
             job_id: Associated job ID for progress tracking
             progress_callback: Optional callback for progress updates
             change_ids: Optional list of specific change IDs to apply
+            concurrency: Maximum scene updates in flight (default from settings)
 
         Returns:
             Result of applying the plan
@@ -2512,6 +2745,7 @@ class AnalysisService:
                     apply_filters=None,  # Apply all changes
                     change_ids=change_ids,
                     progress_callback=progress_callback,
+                    concurrency=concurrency or self.settings.analysis.apply_concurrency,
                 )
 
                 # Commit the transaction after plan is applied
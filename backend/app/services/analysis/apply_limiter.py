@@ -0,0 +1,116 @@
+"""Adaptive concurrency control for applying plan changes to Stash."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, TypeVar
+
+from app.services.stash import StashConnectionError, StashRateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors that mean Stash is overloaded rather than the change being invalid
+BACKOFF_ERRORS = (StashRateLimitError, StashConnectionError)
+
+
+class AdaptiveApplyLimiter:
+    """Bound in-flight Stash mutations and back off when Stash pushes back.
+
+    Concurrency follows additive-increase/multiplicative-decrease: every
+    rate-limit or connection error halves the number of mutations allowed in
+    flight and pauses all workers for a growing delay, and each run of
+    successful mutations lets one more through again, up to
+    ``max_concurrency``. Usage::
+
+        result = await limiter.call(lambda: stash_service.update_scene(...))
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_attempts: int = 3,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max(1, max_attempts)
+        self.delay = 0.0
+        self.backoffs = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Run one Stash mutation, retrying it after backing off if needed."""
+        attempt = 1
+        while True:
+            try:
+                async with self._slot():
+                    result = await func()
+            except BACKOFF_ERRORS as e:
+                self._record_backoff(e)
+                if attempt >= self.max_attempts:
+                    raise
+                attempt += 1
+                continue
+            await self._record_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the current limit and backoff counters."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "limit": self.limit,
+            "peak_in_flight": self.peak_in_flight,
+            "backoffs": self.backoffs,
+            "delay": self.delay,
+        }
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._in_flight < self.limit)
+                pause = self._resume_at - time.monotonic()
+                if pause <= 0:
+                    self._in_flight += 1
+                    self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+                    break
+            await asyncio.sleep(pause)
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _record_backoff(self, error: Exception) -> None:
+        self.backoffs += 1
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+        self.delay = min(self.max_delay, max(self.base_delay, self.delay * 2))
+        self._resume_at = max(self._resume_at, time.monotonic() + self.delay)
+        logger.warning(
+            f"Stash pushed back ({error}); limiting plan apply to "
+            f"{self.limit} concurrent update(s) and pausing {self.delay:.1f}s"
+        )
+
+    async def _record_success(self) -> None:
+        self._successes += 1
+        if self._successes < self.limit:
+            return
+        self._successes = 0
+        self.delay = self.delay / 2 if self.delay > self.base_delay else 0.0
+        if self.limit < self.max_concurrency:
+            async with self._condition:
+                self.limit += 1
+                self._condition.notify_all()
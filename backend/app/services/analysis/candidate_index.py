@@ -0,0 +1,132 @@
+"""Lexical index for shortlisting the entities embedded in AI prompts."""
+
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_PART = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+# Adjacent words joined into one term, so "Jane Doe" matches "JaneDoe"
+_MAX_JOINED_WORDS = 3
+
+
+def _words(text: str) -> List[str]:
+    """Lowercased words of ``text``; camelCase runs are also split."""
+    words: List[str] = []
+    for run in _WORD.findall(text):
+        parts = _CAMEL_PART.findall(run)
+        if len(parts) > 1:
+            words.extend(part.lower() for part in parts)
+        words.append(run.lower())
+    return words
+
+
+def _entity_terms(names: Sequence[str]) -> Set[str]:
+    terms: Set[str] = set()
+    for name in names:
+        words = [word.lower() for word in _WORD.findall(name)]
+        terms.update(word for word in words if len(word) > 1)
+        if len(words) > 1:
+            terms.add("".join(words))
+    return terms
+
+
+def _query_terms(text: str) -> Set[str]:
+    words = _words(text)
+    terms = {word for word in words if len(word) > 1}
+    for size in range(2, _MAX_JOINED_WORDS + 1):
+        for i in range(len(words) - size + 1):
+            terms.add("".join(words[i : i + size]))
+    return terms
+
+
+def entity_names(entity: Any) -> List[str]:
+    """The name and aliases of a studio/tag name or a performer dict."""
+    if isinstance(entity, dict):
+        return [entity.get("name", "")] + list(entity.get("aliases") or [])
+    return [str(entity)]
+
+
+def prompt_line_length(entity: Any) -> int:
+    """Characters ``AIClient.build_prompt`` uses to list ``entity``."""
+    names = entity_names(entity)
+    length = len("- \n") + len(names[0])
+    if len(names) > 1:
+        length += len(" (aliases: )") + len(", ".join(names[1:]))
+    return length
+
+
+class CandidateIndex:
+    """Ranks known entities by word overlap with a scene's text.
+
+    Every name and alias is split into words, plus the words joined together
+    so glued path segments such as ``JaneDoe`` still match. A scene's path,
+    title and details are split the same way (also joining adjacent words),
+    and entities score the IDF weight of every term they share with it, so a
+    rare word counts for more than a common one.
+
+    ``shortlist()`` returns the best ``limit`` entities, followed by
+    unmatched ones in catalog order when fewer match. This keeps a prompt's
+    entity list bounded however large the catalog grows.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Sequence[Any] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._source: Optional[Sequence[Any]] = None
+        self._source_size = 0
+        self.prompt_chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def is_built_from(self, entities: Sequence[Any]) -> bool:
+        """Whether the index reflects this exact list (checked by identity)."""
+        return entities is self._source and len(entities) == self._source_size
+
+    def build(self, entities: Sequence[Any]) -> None:
+        """Index a list of studio/tag names or performer dicts."""
+        postings: Dict[str, List[int]] = {}
+        prompt_chars = 0
+        for position, entity in enumerate(entities):
+            for term in _entity_terms(entity_names(entity)):
+                postings.setdefault(term, []).append(position)
+            prompt_chars += prompt_line_length(entity)
+        self._entities = entities
+        self._postings = postings
+        self._source = entities
+        self._source_size = len(entities)
+        # Size of the whole catalog as a prompt list, for savings reporting
+        self.prompt_chars = prompt_chars
+        logger.debug(
+            f"Candidate index built: {len(entities)} entities, {len(postings)} terms"
+        )
+
+    def shortlist(self, text: str, limit: int) -> List[Any]:
+        """The ``limit`` entities most relevant to ``text``."""
+        total = len(self._entities)
+        if total <= limit:
+            return list(self._entities)
+
+        scores: Dict[int, float] = {}
+        for term in _query_terms(text):
+            positions = self._postings.get(term)
+            if not positions:
+                continue
+            weight = math.log(1 + total / len(positions))
+            for position in positions:
+                scores[position] = scores.get(position, 0.0) + weight
+
+        ranked = sorted(scores, key=lambda position: (-scores[position], position))
+        selected = ranked[:limit]
+        if len(selected) < limit:
+            matched = set(selected)
+            for position in range(total):
+                if position not in matched:
+                    selected.append(position)
+                    if len(selected) == limit:
+                        break
+        return [self._entities[position] for position in selected]
@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, Optional
 
+from app.core.metrics import AI_COST, AI_TOKENS
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,12 +18,25 @@ class AnalysisCostTracker:
             "performer_detection": 0.0,
             "tag_detection": 0.0,
             "details_generation": 0.0,
+            "combined_detection": 0.0,
         }
         self.token_usage: Dict[str, Dict[str, int]] = {
             "studio_detection": {"prompt": 0, "completion": 0, "total": 0},
             "performer_detection": {"prompt": 0, "completion": 0, "total": 0},
             "tag_detection": {"prompt": 0, "completion": 0, "total": 0},
             "details_generation": {"prompt": 0, "completion": 0, "total": 0},
+            "combined_detection": {"prompt": 0, "completion": 0, "total": 0},
+        }
+        # Estimated prompt tokens avoided by shortlisting entity lists
+        self.prompt_tokens_saved: Dict[str, int] = {
+            operation: 0 for operation in self.operation_costs
+        }
+        # AI requests per operation, and how many the response cache answered
+        self.ai_requests: Dict[str, int] = {
+            operation: 0 for operation in self.operation_costs
+        }
+        self.cache_hits: Dict[str, int] = {
+            operation: 0 for operation in self.operation_costs
         }
         self.scenes_analyzed: int = 0
         self.model_used: Optional[str] = None
@@ -33,6 +48,7 @@ class AnalysisCostTracker:
         prompt_tokens: int,
         completion_tokens: int,
         model: Optional[str] = None,
+        cached: bool = False,
     ) -> None:
         """Track cost for a specific operation.
 
@@ -42,8 +58,14 @@ class AnalysisCostTracker:
             prompt_tokens: Number of prompt tokens used
             completion_tokens: Number of completion tokens used
             model: Model used for the operation
+            cached: Whether the response came from the response cache
         """
         if operation in self.operation_costs:
+            self.ai_requests[operation] += 1
+            if cached:
+                # Served without an API call, so it adds no cost or tokens
+                self.cache_hits[operation] += 1
+                cost, prompt_tokens, completion_tokens = 0.0, 0, 0
             self.operation_costs[operation] += cost
             self.token_usage[operation]["prompt"] += prompt_tokens
             self.token_usage[operation]["completion"] += completion_tokens
@@ -52,6 +74,11 @@ class AnalysisCostTracker:
             if model and not self.model_used:
                 self.model_used = model
 
+            model_label = model or self.model_used or "unknown"
+            AI_TOKENS.labels(model_label, "prompt").inc(prompt_tokens)
+            AI_TOKENS.labels(model_label, "completion").inc(completion_tokens)
+            AI_COST.labels(model_label).inc(cost)
+
             logger.debug(
                 f"Tracked {operation}: ${cost:.4f} "
                 f"({prompt_tokens} + {completion_tokens} tokens)"
@@ -59,6 +86,18 @@ class AnalysisCostTracker:
         else:
             logger.warning(f"Unknown operation type: {operation}")
 
+    def track_prompt_savings(self, operation: str, tokens_saved: int) -> None:
+        """Record prompt tokens saved by sending a shortlist of known entities.
+
+        Args:
+            operation: Type of operation (studio_detection, etc.)
+            tokens_saved: Estimated tokens of the entities left out
+        """
+        if operation in self.prompt_tokens_saved:
+            self.prompt_tokens_saved[operation] += tokens_saved
+        else:
+            logger.warning(f"Unknown operation type: {operation}")
+
     def increment_scenes(self) -> None:
         """Increment the count of scenes analyzed."""
         self.scenes_analyzed += 1
@@ -84,6 +123,13 @@ class AnalysisCostTracker:
             return 0.0
         return self.get_total_cost() / self.scenes_analyzed
 
+    def get_cache_hit_rate(self) -> float:
+        """Get the share of AI requests answered by the response cache."""
+        requests = sum(self.ai_requests.values())
+        if requests == 0:
+            return 0.0
+        return sum(self.cache_hits.values()) / requests
+
     def get_summary(self) -> Dict[str, Any]:
         """Get complete cost summary."""
         total_tokens = self.get_total_tokens()
@@ -95,6 +141,12 @@ class AnalysisCostTracker:
             "completion_tokens": total_tokens["completion"],
             "cost_breakdown": self.operation_costs.copy(),
             "token_breakdown": self.token_usage.copy(),
+            "prompt_tokens_saved": sum(self.prompt_tokens_saved.values()),
+            "savings_breakdown": self.prompt_tokens_saved.copy(),
+            "ai_requests": sum(self.ai_requests.values()),
+            "cache_hits": sum(self.cache_hits.values()),
+            "cache_hit_rate": self.get_cache_hit_rate(),
+            "cache_hit_breakdown": self.cache_hits.copy(),
             "scenes_analyzed": self.scenes_analyzed,
             "average_cost_per_scene": self.get_average_cost_per_scene(),
             "model": self.model_used,
@@ -106,6 +158,11 @@ class AnalysisCostTracker:
             self.operation_costs[key] = 0.0
         for key in self.token_usage:
             self.token_usage[key] = {"prompt": 0, "completion": 0, "total": 0}
+        for key in self.prompt_tokens_saved:
+            self.prompt_tokens_saved[key] = 0
+        for key in self.ai_requests:
+            self.ai_requests[key] = 0
+            self.cache_hits[key] = 0
         self.scenes_analyzed = 0
         self.model_used = None
 
@@ -18,6 +18,10 @@ class AnalysisOptions:
     detect_video_tags: bool = False
     confidence_threshold: float = 0.7
     batch_size: int = 15
+    # Detect studio, performers and tags with one AI request per scene
+    combined_ai: bool = False
+    # Allow AI answers from the response cache; False forces fresh requests
+    use_ai_cache: bool = True
 
 
 @dataclass
@@ -148,6 +152,29 @@ class TagSuggestionsResponse(BaseModel):
     )
 
 
+class EntitySuggestion(BaseModel):
+    """A studio or performer suggested by AI."""
+
+    name: str = Field(description="The entity name")
+    confidence: float = Field(
+        default=0.8, ge=0.0, le=1.0, description="Confidence score"
+    )
+
+
+class CombinedAnalysisResponse(BaseModel):
+    """Response format for detecting studio, performers and tags at once."""
+
+    studio: Optional[EntitySuggestion] = Field(
+        default=None, description="Production studio, if identified"
+    )
+    performers: List[EntitySuggestion] = Field(
+        default_factory=list, description="Performers in the scene"
+    )
+    tags: List[TagSuggestion] = Field(
+        default_factory=list, description="List of suggested tags"
+    )
+
+
 class DetailsResponse(BaseModel):
     """Response format for scene details generation."""
 
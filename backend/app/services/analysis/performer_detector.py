@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .ai_client import AIClient
 from .models import DetectionResult
+from .performer_index import PerformerIndex
 from .prompts import PERFORMER_DETECTION_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -68,6 +69,21 @@ class PerformerDetector:
     def __init__(self) -> None:
         """Initialize performer detector."""
         self._performer_cache: Dict[str, List[DetectionResult]] = {}
+        self._index = PerformerIndex()
+
+    def update_index(self, known_performers: List[Dict[str, Any]]) -> None:
+        """Rebuild the performer index for a refreshed performer list.
+
+        Only performers added since the last update are tokenized. Lists
+        passed to ``find_full_name`` that the index was not built from are
+        indexed on first use.
+        """
+        self._get_index(known_performers)
+
+    def _get_index(self, known_performers: List[Dict[str, str]]) -> PerformerIndex:
+        if not self._index.is_built_from(known_performers):
+            self._index.update(known_performers)
+        return self._index
 
     async def detect_from_path(
         self,
@@ -317,7 +333,11 @@ class PerformerDetector:
             return []
 
     async def detect_with_ai_tracked(
-        self, scene_data: Dict, ai_client: AIClient, known_performers: List[Dict]
+        self,
+        scene_data: Dict,
+        ai_client: AIClient,
+        known_performers: List[Dict],
+        use_cache: bool = True,
     ) -> Tuple[List[DetectionResult], Optional[Dict]]:
         """Use AI to detect performers and return cost information.
 
@@ -325,6 +345,7 @@ class PerformerDetector:
             scene_data: Scene information
             ai_client: AI client for analysis
             known_performers: List of known performers with their aliases
+            use_cache: Whether a cached AI response may be used
 
         Returns:
             Tuple of (list of detection results, cost information)
@@ -339,6 +360,7 @@ class PerformerDetector:
                 prompt=PERFORMER_DETECTION_PROMPT,
                 scene_data=scene_data_with_performers,
                 temperature=0.3,
+                use_cache=use_cache,
             )
 
             results = []
@@ -410,57 +432,15 @@ class PerformerDetector:
             Tuple of (full_name, confidence) or None
         """
         partial_lower = partial.lower().strip()
+        index = self._get_index(known_performers)
 
         # Check for exact matches first
-        exact_match = self._find_exact_match(partial_lower, known_performers)
+        exact_match = index.find_exact(partial_lower)
         if exact_match:
             return exact_match
 
-        # Check for partial matches
-        return self._find_partial_match(partial, partial_lower, known_performers)
-
-    def _find_exact_match(
-        self, partial_lower: str, known_performers: List[Dict[str, str]]
-    ) -> Optional[Tuple[str, float]]:
-        """Find exact name or alias match."""
-        for performer in known_performers:
-            name = performer.get("name", "")
-            name_lower = name.lower()
-
-            # Exact match
-            if partial_lower == name_lower:
-                return (name, 1.0)
-
-            # Check aliases
-            aliases: Union[str, List[str]] = performer.get("aliases", [])
-            if isinstance(aliases, str):
-                aliases = [a.strip() for a in aliases.split(",") if a.strip()]
-
-            for alias in aliases:
-                if partial_lower == alias.lower():
-                    return (name, 0.95)
-
-        return None
-
-    def _find_partial_match(
-        self, partial: str, partial_lower: str, known_performers: List[Dict[str, str]]
-    ) -> Optional[Tuple[str, float]]:
-        """Find partial name match with scoring."""
-        best_match = None
-        best_score = 0.0
-
-        for performer in known_performers:
-            name = performer.get("name", "")
-            score = self._score_name_match(partial, partial_lower, name)
-
-            if score > best_score and score >= 0.6:
-                best_score = score
-                best_match = name
-
-        if best_match:
-            return (best_match, best_score)
-
-        return None
+        # Check for partial matches through the index
+        return index.find_partial(partial, partial_lower, self._score_name_match)
 
     def _score_name_match(self, partial: str, partial_lower: str, name: str) -> float:
         """Calculate match score between partial and full name."""
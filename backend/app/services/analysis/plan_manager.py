@@ -1,28 +1,189 @@
 """Plan management for analysis operations."""
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import func, insert, inspect, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstanceState
 
 from app.models import AnalysisPlan, ChangeAction, PlanChange, PlanStatus, Scene
 from app.models.plan_change import ChangeStatus
+from app.services.entity_index import EntityIndex
 from app.services.stash_service import StashService
 
+from .apply_limiter import AdaptiveApplyLimiter
 from .models import ApplyResult, SceneChanges
 
 logger = logging.getLogger(__name__)
 
+# Scenes per bulkSceneUpdate when several scenes get the same additions
+BULK_UPDATE_CHUNK_SIZE = 200
+
+# Update keys for scene relations, mapped to the scene field they replace
+RELATION_FIELDS = {"tag_ids": "tags", "performer_ids": "performers"}
+
+# Plan changes marked applied per UPDATE statement
+STATUS_UPDATE_CHUNK_SIZE = 500
+
+# Minimum seconds between apply progress callbacks
+PROGRESS_INTERVAL_SECONDS = 1.0
+
+
+@dataclass
+class ApplyOutcome:
+    """Running totals for one plan application."""
+
+    total_changes: int
+    applied_changes: int = 0
+    failed_changes: int = 0
+    skipped_changes: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    modified_scene_ids: set[str] = field(default_factory=set)
+    # Persisted changes to mark applied in one batched UPDATE
+    applied: list[PlanChange] = field(default_factory=list)
+    last_progress: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.applied_changes + self.failed_changes + self.skipped_changes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_changes": self.total_changes,
+            "applied_changes": self.applied_changes,
+            "failed_changes": self.failed_changes,
+            "skipped_changes": self.skipped_changes,
+            "errors": self.errors,
+            "modified_scene_ids": list(self.modified_scene_ids),
+        }
+
+
+@dataclass
+class SceneApplyPlan:
+    """The approved changes for one scene, merged into a single update.
+
+    ``scene`` is a working copy that reflects every change merged so far, so
+    later changes (e.g. a tag removal after a tag addition) build on earlier
+    ones exactly as if they had been applied one at a time.
+    """
+
+    scene_id: str
+    scene: dict[str, Any]
+    update: dict[str, Any] = field(default_factory=dict)
+    # Changes waiting on the scene mutation
+    merged: list[PlanChange] = field(default_factory=list)
+    # Changes already applied without a scene mutation (markers)
+    applied: list[PlanChange] = field(default_factory=list)
+    failed: list[PlanChange] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    # Relation IDs added by ADD changes, used for bulk updates
+    added: dict[str, list[str]] = field(
+        default_factory=lambda: {key: [] for key in RELATION_FIELDS}
+    )
+    additive_only: bool = True
+
+    def __post_init__(self) -> None:
+        self._original = {key: self.relation_ids(key) for key in RELATION_FIELDS}
+
+    def relation_ids(self, key: str) -> list[str]:
+        """Current IDs of a relation, including changes merged so far."""
+        return [item["id"] for item in self.scene.get(RELATION_FIELDS[key]) or []]
+
+    def merge(self, change: PlanChange, update_data: dict[str, Any]) -> None:
+        """Fold one change's update data into the scene update."""
+        additive = (
+            change.field in ("tags", "performers") and change.action == ChangeAction.ADD
+        )
+        if not additive:
+            self.additive_only = False
+
+        for key, value in update_data.items():
+            if key in RELATION_FIELDS:
+                previous = self.relation_ids(key)
+                if additive:
+                    self.added[key].extend(
+                        i
+                        for i in value
+                        if i not in previous and i not in self.added[key]
+                    )
+                self._set_relation(key, value)
+            else:
+                self.update[key] = value
+        self.merged.append(change)
+
+    def _set_relation(self, key: str, ids: list[str]) -> None:
+        scene_field = RELATION_FIELDS[key]
+        names = {
+            item["id"]: item.get("name", "")
+            for item in self.scene.get(scene_field) or []
+        }
+        self.scene[scene_field] = [{"id": i, "name": names.get(i, "")} for i in ids]
+        self.update[key] = list(ids)
+
+    def pending_update(self) -> dict[str, Any]:
+        """The sceneUpdate fields that actually differ from Stash."""
+        return {
+            key: value
+            for key, value in self.update.items()
+            if key not in RELATION_FIELDS or value != self._original[key]
+        }
+
+    def bulk_key(self) -> Optional[tuple]:
+        """Key shared by scenes that only need the same additions, else None."""
+        if not self.additive_only or not self.pending_update():
+            return None
+        return tuple(tuple(sorted(self.added[key])) for key in RELATION_FIELDS)
+
+    def fail_merged(
+        self, error: Exception, error_record: Callable[[PlanChange, Exception], dict]
+    ) -> None:
+        """Mark every change waiting on the scene mutation as failed."""
+        for change in self.merged:
+            self.failed.append(change)
+            self.errors.append(error_record(change, error))
+        self.merged = []
+
 
 class PlanManager:
     """Manage analysis plans and their execution."""
 
-    def __init__(self) -> None:
-        """Initialize plan manager."""
-        pass
+    def __init__(self, entity_index: Optional[EntityIndex] = None) -> None:
+        """Initialize plan manager.
+
+        Args:
+            entity_index: Optional local entity index used to map studio,
+                performer and tag names to the names stored in Stash
+        """
+        self.entity_index = entity_index
+
+    async def _find_entity(
+        self, kind: str, name: str, stash_service: StashService
+    ) -> Optional[dict[str, Any]]:
+        """Find an existing studio, performer or tag in Stash.
+
+        The entity index is only a hint: an indexed entity is confirmed by
+        looking up its stored name in Stash, so a stale index never supplies
+        the ID, and the requested name is searched when it is gone.
+        """
+        finders = {
+            "studios": stash_service.find_studio,
+            "performers": stash_service.find_performer,
+            "tags": stash_service.find_tag,
+        }
+        find = finders[kind]
+        if self.entity_index is not None and self.entity_index.is_loaded(kind):
+            hint = self.entity_index.find_by_name(kind, name)
+            if hint is not None and hint.name != name:
+                entity = await find(hint.name, use_cache=False)
+                if entity:
+                    return entity
+        return await find(name, use_cache=False)
 
     async def create_plan(
         self,
@@ -255,6 +416,39 @@ class PlanManager:
             )
             db.add(plan_change)
 
+    async def insert_scene_changes(
+        self,
+        plan_id: int,
+        scene_changes: list[SceneChanges],
+        db: AsyncSession,
+    ) -> int:
+        """Insert the changes of several scenes with one bulk INSERT.
+
+        Args:
+            plan_id: Plan ID
+            scene_changes: Changes for each scene
+            db: Database session
+
+        Returns:
+            Number of changes inserted
+        """
+        rows = [
+            {
+                "plan_id": plan_id,
+                "scene_id": changes.scene_id,
+                "field": change.field,
+                "action": self._map_action(change.action),
+                "current_value": self._serialize_value(change.current_value),
+                "proposed_value": self._serialize_value(change.proposed_value),
+                "confidence": change.confidence,
+            }
+            for changes in scene_changes
+            for change in changes.changes
+        ]
+        if rows:
+            await db.execute(insert(PlanChange), rows)
+        return len(rows)
+
     async def finalize_plan(
         self,
         plan_id: int,
@@ -365,6 +559,7 @@ class PlanManager:
         apply_filters: Optional[dict[str, bool]] = None,
         change_ids: Optional[list[int]] = None,
         progress_callback: Optional[Any] = None,
+        concurrency: int = 1,
     ) -> ApplyResult:
         """Apply changes from a plan to Stash.
 
@@ -375,6 +570,7 @@ class PlanManager:
             apply_filters: Optional filters for what to apply
             change_ids: Optional list of specific change IDs to apply
             progress_callback: Optional callback for progress updates
+            concurrency: Maximum scene updates in flight at once
 
         Returns:
             Result of applying the plan
@@ -392,7 +588,13 @@ class PlanManager:
         # Get changes and apply them
         changes = await self._get_plan_changes(plan_id, db)
         result_data = await self._process_plan_changes(
-            changes, apply_filters, db, stash_service, change_ids, progress_callback
+            changes,
+            apply_filters,
+            db,
+            stash_service,
+            change_ids,
+            progress_callback,
+            concurrency=concurrency,
         )
 
         # Finalize plan application
@@ -455,61 +657,322 @@ class PlanManager:
         stash_service: StashService,
         change_ids: Optional[list[int]] = None,
         progress_callback: Optional[Any] = None,
+        concurrency: int = 1,
     ) -> dict[str, Any]:
-        """Process all changes in a plan."""
-        total_changes = 0
-        applied_changes = 0
-        failed_changes = 0
-        skipped_changes = 0  # Track scenes that were skipped (deleted scenes)
-        errors = []
-        modified_scene_ids = set()
-
-        # Count changes to apply first
+        """Process all changes in a plan.
+
+        Changes are grouped by scene: affected scenes are fetched in batches,
+        all field changes for a scene are merged into one sceneUpdate, and
+        scenes receiving identical tag/performer additions share a
+        bulkSceneUpdate. Up to ``concurrency`` of those mutations run at once;
+        each scene is part of exactly one mutation, so changes to the same
+        scene are never applied out of order.
+        """
         changes_to_apply = [
             change
             for change in changes
             if self._should_apply_change(change, apply_filters, change_ids)
         ]
-        total_changes = len(changes_to_apply)
+        outcome = ApplyOutcome(total_changes=len(changes_to_apply))
 
         # Report initial progress
-        if progress_callback and total_changes > 0:
-            await progress_callback(10, f"Applied 0/{total_changes} changes")
+        if progress_callback and outcome.total_changes > 0:
+            await progress_callback(10, f"Applied 0/{outcome.total_changes} changes")
+
+        groups: dict[str, list[PlanChange]] = {}
+        for change in changes_to_apply:
+            groups.setdefault(str(change.scene_id), []).append(change)
+
+        scenes = await stash_service.get_scenes_by_ids(list(groups), use_cache=False)
+
+        scene_plans = []
+        for scene_id, scene_changes in groups.items():
+            scene = scenes.get(scene_id)
+            if scene is None:
+                self._skip_missing_scene(scene_id, scene_changes, outcome)
+                continue
+            scene_plans.append(
+                await self._merge_scene_changes(
+                    scene_id, scene, scene_changes, stash_service
+                )
+            )
+
+        try:
+            await self._send_scene_updates(
+                scene_plans,
+                stash_service,
+                outcome,
+                progress_callback,
+                AdaptiveApplyLimiter(max_concurrency=concurrency),
+            )
+        except BaseException:
+            await self._save_partial_apply(outcome, db)
+            raise
+        await self._write_applied_statuses(outcome.applied, db)
+        await self._report_apply_progress(outcome, progress_callback, force=True)
+
+        return outcome.to_dict()
+
+    async def _save_partial_apply(
+        self, outcome: "ApplyOutcome", db: AsyncSession
+    ) -> None:
+        """Persist changes that reached Stash before the apply failed.
+
+        The caller rolls the session back on failure, so these are committed
+        here; otherwise a retry would send them again.
+        """
+        if not outcome.applied:
+            return
+        try:
+            await self._write_applied_statuses(outcome.applied, db)
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to record changes applied before failure: {e}")
+
+    def _skip_missing_scene(
+        self, scene_id: str, changes: list[PlanChange], outcome: "ApplyOutcome"
+    ) -> None:
+        """Mark changes for a scene deleted from Stash as applied."""
+        logger.info(
+            f"Scene {scene_id} not found (likely deleted) - "
+            f"marking {len(changes)} change(s) as applied"
+        )
+        for change in changes:
+            # There is nothing more we can do; this lets the plan complete
+            self._queue_change_applied(change, outcome)
+        outcome.skipped_changes += len(changes)
+
+    async def _merge_scene_changes(
+        self,
+        scene_id: str,
+        scene: dict[str, Any],
+        changes: list[PlanChange],
+        stash_service: StashService,
+    ) -> "SceneApplyPlan":
+        """Merge all changes for one scene into a single pending update."""
+        scene_plan = SceneApplyPlan(scene_id=scene_id, scene=dict(scene))
 
-        for i, change in enumerate(changes_to_apply):
+        for change in changes:
             try:
-                result = await self.apply_single_change(change, db, stash_service)
-                if result == "applied":
-                    applied_changes += 1
-                    # Track the scene ID that was modified
-                    modified_scene_ids.add(str(change.scene_id))
-                elif result == "skipped":
-                    skipped_changes += 1
-                    logger.info(
-                        f"Skipped change {change.id} for missing scene {change.scene_id}"
+                # Markers are created directly, not via scene update
+                if change.field == "markers":
+                    await self._prepare_markers_update(
+                        change, scene_plan.scene, stash_service
                     )
+                    scene_plan.applied.append(change)
+                    continue
+
+                update_data = await self._prepare_update_data(
+                    change, scene_plan.scene, stash_service
+                )
+                if update_data:
+                    scene_plan.merge(change, update_data)
                 else:
-                    failed_changes += 1
+                    logger.warning(f"No update data for change {change.id}")
+                    scene_plan.failed.append(change)
             except Exception as e:
-                failed_changes += 1
-                errors.append(self._create_error_record(change, e))
                 logger.error(f"Failed to apply change {change.id}: {e}")
+                scene_plan.failed.append(change)
+                scene_plan.errors.append(self._create_error_record(change, e))
+
+        return scene_plan
 
-            # Report progress after each change
-            if progress_callback and total_changes > 0:
-                progress = 10 + int((i + 1) / total_changes * 85)  # 10-95%
-                await progress_callback(
-                    progress, f"Applied {i + 1}/{total_changes} changes"
+    async def _send_scene_updates(
+        self,
+        scene_plans: list["SceneApplyPlan"],
+        stash_service: StashService,
+        outcome: "ApplyOutcome",
+        progress_callback: Optional[Any],
+        limiter: Optional[AdaptiveApplyLimiter] = None,
+    ) -> None:
+        """Send merged scene updates, sharing bulk updates where possible."""
+        limiter = limiter or AdaptiveApplyLimiter()
+        bulk_groups: dict[tuple, list[SceneApplyPlan]] = {}
+        singles = []
+        for scene_plan in scene_plans:
+            key = scene_plan.bulk_key()
+            if key is None:
+                singles.append(scene_plan)
+            else:
+                bulk_groups.setdefault(key, []).append(scene_plan)
+
+        units: list[tuple[list[SceneApplyPlan], Callable[[], Awaitable[None]]]] = []
+        for group in bulk_groups.values():
+            if len(group) == 1:
+                singles.extend(group)
+                continue
+            for start in range(0, len(group), BULK_UPDATE_CHUNK_SIZE):
+                chunk = group[start : start + BULK_UPDATE_CHUNK_SIZE]
+                units.append(
+                    (chunk, self._bulk_update_unit(chunk, stash_service, limiter))
                 )
+        for scene_plan in singles:
+            units.append(
+                (
+                    [scene_plan],
+                    self._scene_update_unit(scene_plan, stash_service, limiter),
+                )
+            )
 
-        return {
-            "total_changes": total_changes,
-            "applied_changes": applied_changes,
-            "failed_changes": failed_changes,
-            "skipped_changes": skipped_changes,
-            "errors": errors,
-            "modified_scene_ids": list(modified_scene_ids),
-        }
+        await self._run_update_units(units, limiter, outcome, progress_callback)
+        if limiter.backoffs:
+            logger.info(f"Plan apply backed off from Stash: {limiter.stats()}")
+
+    async def _run_update_units(
+        self,
+        units: list[tuple[list["SceneApplyPlan"], Callable[[], Awaitable[None]]]],
+        limiter: AdaptiveApplyLimiter,
+        outcome: "ApplyOutcome",
+        progress_callback: Optional[Any],
+    ) -> None:
+        """Run update units on a worker pool bounded by the limiter.
+
+        If a worker fails, the others are cancelled so no mutations are sent
+        after the apply has failed. Units that finished are in ``outcome``.
+        """
+        pending = iter(units)
+
+        async def worker() -> None:
+            for scene_plans, send in pending:
+                await send()
+                for scene_plan in scene_plans:
+                    self._record_scene_outcome(scene_plan, outcome)
+                await self._report_apply_progress(outcome, progress_callback)
+
+        workers = min(limiter.max_concurrency, len(units))
+        tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _scene_update_unit(
+        self,
+        scene_plan: "SceneApplyPlan",
+        stash_service: StashService,
+        limiter: AdaptiveApplyLimiter,
+    ) -> Callable[[], Awaitable[None]]:
+        async def send() -> None:
+            await self._apply_scene_update(scene_plan, stash_service, limiter)
+
+        return send
+
+    def _bulk_update_unit(
+        self,
+        scene_plans: list["SceneApplyPlan"],
+        stash_service: StashService,
+        limiter: AdaptiveApplyLimiter,
+    ) -> Callable[[], Awaitable[None]]:
+        async def send() -> None:
+            await self._apply_bulk_update(scene_plans, stash_service, limiter)
+
+        return send
+
+    async def _apply_scene_update(
+        self,
+        scene_plan: "SceneApplyPlan",
+        stash_service: StashService,
+        limiter: Optional[AdaptiveApplyLimiter] = None,
+    ) -> None:
+        """Send one scene's merged changes as a single sceneUpdate."""
+        update = scene_plan.pending_update()
+        if not update:
+            # Every change was already reflected in Stash
+            return
+        limiter = limiter or AdaptiveApplyLimiter()
+        try:
+            await limiter.call(
+                lambda: stash_service.update_scene(scene_plan.scene_id, update)
+            )
+        except Exception as e:
+            logger.error(f"Failed to update scene {scene_plan.scene_id}: {e}")
+            scene_plan.fail_merged(e, self._create_error_record)
+
+    async def _apply_bulk_update(
+        self,
+        scene_plans: list["SceneApplyPlan"],
+        stash_service: StashService,
+        limiter: Optional[AdaptiveApplyLimiter] = None,
+    ) -> None:
+        """Add the same tags/performers to several scenes in one mutation."""
+        added = scene_plans[0].added
+        limiter = limiter or AdaptiveApplyLimiter()
+        try:
+            await limiter.call(
+                lambda: stash_service.bulk_add_scene_relations(
+                    [scene_plan.scene_id for scene_plan in scene_plans],
+                    tag_ids=added["tag_ids"] or None,
+                    performer_ids=added["performer_ids"] or None,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Bulk update of {len(scene_plans)} scenes failed: {e}")
+            for scene_plan in scene_plans:
+                scene_plan.fail_merged(e, self._create_error_record)
+
+    def _record_scene_outcome(
+        self, scene_plan: "SceneApplyPlan", outcome: "ApplyOutcome"
+    ) -> None:
+        """Mark a scene's changes and add them to the apply totals."""
+        succeeded = scene_plan.applied + scene_plan.merged
+        for change in succeeded:
+            self._queue_change_applied(change, outcome)
+        if succeeded:
+            outcome.modified_scene_ids.add(scene_plan.scene_id)
+
+        outcome.applied_changes += len(succeeded)
+        outcome.failed_changes += len(scene_plan.failed)
+        outcome.errors.extend(scene_plan.errors)
+
+    def _queue_change_applied(
+        self, change: PlanChange, outcome: "ApplyOutcome"
+    ) -> None:
+        """Defer persisted changes to the batched status UPDATE."""
+        state: Optional[InstanceState[PlanChange]] = inspect(change, raiseerr=False)
+        if state is not None and state.persistent:
+            outcome.applied.append(change)
+        else:
+            self._mark_change_applied(change)
+
+    async def _write_applied_statuses(
+        self, changes: list[PlanChange], db: AsyncSession
+    ) -> None:
+        """Mark changes applied with one UPDATE per chunk instead of per row."""
+        applied_at = datetime.utcnow()
+        ids = [change.id for change in changes]
+        for start in range(0, len(ids), STATUS_UPDATE_CHUNK_SIZE):
+            # Session objects are kept in sync by the ORM-enabled UPDATE
+            await db.execute(
+                update(PlanChange)
+                .where(PlanChange.id.in_(ids[start : start + STATUS_UPDATE_CHUNK_SIZE]))
+                .values(status=ChangeStatus.APPLIED, applied_at=applied_at)
+                .execution_options(synchronize_session="evaluate")
+            )
+
+    def _mark_change_applied(self, change: PlanChange) -> None:
+        change.status = ChangeStatus.APPLIED  # type: ignore[assignment]
+        change.applied_at = datetime.utcnow()  # type: ignore[assignment]
+
+    async def _report_apply_progress(
+        self,
+        outcome: "ApplyOutcome",
+        progress_callback: Optional[Any],
+        force: bool = False,
+    ) -> None:
+        """Report apply progress, at most once per PROGRESS_INTERVAL_SECONDS."""
+        if not progress_callback or outcome.total_changes == 0:
+            return
+        now = time.monotonic()
+        if not force and now - outcome.last_progress < PROGRESS_INTERVAL_SECONDS:
+            return
+        outcome.last_progress = now
+        progress = 10 + int(outcome.processed / outcome.total_changes * 85)
+        await progress_callback(
+            progress, f"Applied {outcome.processed}/{outcome.total_changes} changes"
+        )
 
     def _should_apply_change(
         self,
@@ -643,7 +1106,7 @@ class PlanManager:
             scene_id = change.scene_id
 
             # Get current scene data
-            scene = await stash_service.get_scene(str(change.scene_id))
+            scene = await stash_service.get_scene(str(change.scene_id), use_cache=False)
             if not scene:
                 logger.info(
                     f"Scene {scene_id} not found (likely deleted) - marking change as applied"
@@ -719,7 +1182,7 @@ class PlanManager:
 
         if studio_name:
             # Try to find existing studio first
-            studio = await stash_service.find_studio(str(studio_name))
+            studio = await self._find_entity("studios", str(studio_name), stash_service)
             if not studio:
                 # Create new studio
                 studio = await stash_service.create_studio(str(studio_name))
@@ -759,7 +1222,9 @@ class PlanManager:
 
             if performer_name:
                 # Try to find existing performer first
-                performer = await stash_service.find_performer(performer_name)
+                performer = await self._find_entity(
+                    "performers", performer_name, stash_service
+                )
                 if not performer:
                     # Create new performer
                     performer = await stash_service.create_performer(performer_name)
@@ -819,7 +1284,7 @@ class PlanManager:
 
             if tag_name:
                 # Try to find existing tag first
-                tag = await stash_service.find_tag(tag_name)
+                tag = await self._find_entity("tags", tag_name, stash_service)
                 if not tag:
                     # Create new tag
                     tag = await stash_service.create_tag(tag_name)
@@ -852,7 +1317,7 @@ class PlanManager:
                     break
             else:
                 # If not in current tags, try to find it via stash service
-                found_tag = await stash_service.find_tag(tag_name)
+                found_tag = await stash_service.find_tag(tag_name, use_cache=False)
                 if found_tag:
                     remove_ids.append(found_tag["id"])
 
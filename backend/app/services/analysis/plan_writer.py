@@ -0,0 +1,215 @@
+"""Buffered writes of analysis results to an incrementally built plan."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Scene
+
+from .models import SceneChanges
+from .plan_manager import PlanManager
+
+logger = logging.getLogger(__name__)
+
+
+class PlanWriter:
+    """Collect scene results and write them to the job's plan in bulk.
+
+    Scene results are buffered and flushed every ``flush_scenes`` scenes or
+    ``flush_interval`` seconds, whichever comes first. A flush inserts the
+    buffered changes with one bulk INSERT, sets the analyzed flags of the
+    buffered scenes with one UPDATE and commits, so the plan still grows
+    visibly while analysis runs. The plan's ``total_changes`` is kept as a
+    counter rather than recounted from ``plan_change``.
+
+    The plan is created by the first flush that has changes. The writer
+    owns ``db`` while analysis runs. Concurrent producers ``submit()``
+    results to a queue drained by a single writer task, so the session is
+    only ever used by that task; ``close()`` drains the queue and writes
+    what is left. ``add()`` and ``flush()`` write directly and must not be
+    mixed with ``submit()``.
+    """
+
+    def __init__(
+        self,
+        plan_manager: PlanManager,
+        db: AsyncSession,
+        name: str,
+        metadata: dict[str, Any],
+        job_id: Optional[str] = None,
+        analyzed_flags: Optional[dict[str, bool]] = None,
+        flush_scenes: int = 25,
+        flush_interval: float = 5.0,
+        on_plan_created: Optional[Callable[[int], Awaitable[None]]] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            plan_manager: Plan manager used to create the plan and insert changes
+            db: Database session the writer commits
+            name: Name of the plan to create
+            metadata: Initial plan metadata
+            job_id: Job that the plan belongs to
+            analyzed_flags: Scene columns set on every analyzed scene
+            flush_scenes: Buffered scenes that trigger a flush
+            flush_interval: Seconds after which buffered scenes are flushed
+            on_plan_created: Called with the plan ID once the plan is committed
+        """
+        self.plan_manager = plan_manager
+        self.db = db
+        self.name = name
+        self.metadata = metadata
+        self.job_id = job_id
+        self.analyzed_flags = analyzed_flags or {}
+        self.flush_scenes = max(1, flush_scenes)
+        self.flush_interval = flush_interval
+        self.on_plan_created = on_plan_created
+
+        self.plan_id: Optional[int] = None
+        self.total_changes = 0
+        self.scenes_written = 0
+        self._pending: list[SceneChanges] = []
+        self._last_flush = time.monotonic()
+        self._queue: Optional[asyncio.Queue[Optional[SceneChanges]]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of scenes waiting to be written."""
+        return len(self._pending)
+
+    async def add(self, scene_changes: SceneChanges) -> None:
+        """Buffer one scene's results, flushing if a threshold is reached."""
+        self._pending.append(scene_changes)
+        if (
+            len(self._pending) >= self.flush_scenes
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            await self.flush()
+
+    def submit(self, scene_changes: SceneChanges) -> None:
+        """Queue one scene's results for the writer task, starting it if needed."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(self._queue))
+        self._queue.put_nowait(scene_changes)
+
+    async def close(self) -> None:
+        """Wait for the writer task to write everything submitted so far."""
+        queue, task = self._queue, self._task
+        self._queue = self._task = None
+        if queue is not None and task is not None:
+            queue.put_nowait(None)
+            await task
+
+    async def _run(self, queue: "asyncio.Queue[Optional[SceneChanges]]") -> None:
+        """Write queued results until ``close()`` sends the end marker."""
+        while True:
+            timeout = None
+            if self._pending:
+                elapsed = time.monotonic() - self._last_flush
+                timeout = max(0.0, self.flush_interval - elapsed)
+            try:
+                scene_changes = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await self._write(self.flush)
+                continue
+            if scene_changes is None:
+                await self._write(self.flush)
+                return
+            await self._write(self.add, scene_changes)
+
+    async def _write(self, method: Callable[..., Awaitable[None]], *args: Any) -> None:
+        # A failed write is logged and rolled back; later results still go in
+        try:
+            await method(*args)
+        except Exception as e:
+            logger.error(f"Error writing analysis results: {e}", exc_info=True)
+
+    async def flush(self) -> None:
+        """Write and commit all buffered scene results.
+
+        On failure the transaction is rolled back, the buffered results are
+        dropped and the error is raised.
+        """
+        pending, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        created = False
+        try:
+            with_changes = [sc for sc in pending if sc.has_changes()]
+            if with_changes and self.plan_id is None:
+                await self._create_plan(with_changes.pop(0))
+                created = True
+            if with_changes and self.plan_id is not None:
+                self.total_changes += await self.plan_manager.insert_scene_changes(
+                    self.plan_id, with_changes, self.db
+                )
+
+            if self.analyzed_flags:
+                await self.db.execute(
+                    update(Scene)
+                    .where(Scene.id.in_([sc.scene_id for sc in pending]))
+                    .values(**self.analyzed_flags)
+                )
+
+            self.scenes_written += len(pending)
+            if self.plan_id is not None:
+                await self._update_plan_metadata()
+
+            await self.db.commit()
+        except Exception:
+            logger.error(
+                f"Failed to write analysis results for {len(pending)} scenes: "
+                f"{[sc.scene_id for sc in pending]}"
+            )
+            if created:
+                self.plan_id = None
+                self.total_changes = 0
+            await self._rollback()
+            raise
+
+        logger.info(
+            f"Wrote {len(pending)} analyzed scenes to plan {self.plan_id} "
+            f"({self.total_changes} changes so far)"
+        )
+        if created and self.on_plan_created and self.plan_id is not None:
+            await self.on_plan_created(self.plan_id)
+
+    async def _create_plan(self, first: SceneChanges) -> None:
+        plan = await self.plan_manager.create_or_update_plan(
+            name=self.name,
+            scene_changes=first,
+            metadata=self.metadata,
+            db=self.db,
+            job_id=self.job_id,
+        )
+        plan_id: int = plan.id  # type: ignore[assignment]
+        self.plan_id = plan_id
+        self.total_changes += len(first.changes)
+        logger.info(f"Created plan {plan_id} for job {self.job_id}")
+
+    async def _update_plan_metadata(self) -> None:
+        plan = await self.plan_manager.get_plan(self.plan_id, self.db)  # type: ignore[arg-type]
+        if not plan:
+            return
+        # Assign a new dict so the JSON column is marked as modified
+        plan.plan_metadata = {  # type: ignore[assignment]
+            **(plan.plan_metadata or {}),
+            "total_changes": self.total_changes,
+            "scenes_analyzed": self.scenes_written,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+
+    async def _rollback(self) -> None:
+        try:
+            await self.db.rollback()
+        except Exception as e:
+            logger.warning(f"Error during rollback of plan writes: {e}")
@@ -112,3 +112,58 @@ Return a JSON list of suggested tags with confidence:
   ]
 }}
 """
+
+# Combined studio, performer and tag prompt (one request per scene)
+COMBINED_ANALYSIS_PROMPT = """
+Analyze the following adult content scene information and identify its studio,
+performers and tags in one pass.
+
+File path: {file_path}
+Title: {title}
+Details: {details}
+Current studio: {studio}
+Current performers: {performers}
+Current tags: {tags}
+Duration: {duration} seconds
+Resolution: {resolution}
+
+Requested fields: {requested_fields}
+
+Available Studios:
+{available_studios}
+
+Available Performers:
+{available_performers}
+
+Available Tags:
+{available_tags}
+
+Only fill in the requested fields; leave the others empty.
+
+studio: the PRODUCTION COMPANY that created this content. You MUST only select
+a studio from the "Available Studios" list. Match abbreviations, domains or
+partial names in the path and title. Use null if no studio matches confidently.
+
+performers: all performers (actors/models) in the scene, matched against the
+"Available Performers" list, which gives names and their aliases in the format
+"Name (aliases: alias1, alias2)". Check the file path, EACH WORD of the title
+and the details. Names may be joined by "and", "&", "_" or "-", and single word
+names are valid. Use the official performer name, not the detected variation.
+
+tags: content tags for the scene based on its path, title, details, studio,
+duration and resolution. You MUST only suggest tags from the "Available Tags"
+list, and none already in "Current tags".
+
+Give every studio, performer and tag its own confidence between 0 and 1.
+
+Format your response as JSON:
+{{
+  "studio": {{"name": "Studio Name", "confidence": 0.9}},
+  "performers": [
+    {{"name": "Performer Name 1", "confidence": 0.95}}
+  ],
+  "tags": [
+    {{"name": "tag1", "confidence": 0.9}}
+  ]
+}}
+"""
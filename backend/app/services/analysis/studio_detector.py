@@ -3,14 +3,107 @@
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
+from .aho_corasick import AhoCorasick
 from .ai_client import AIClient
 from .models import DetectionResult
 from .prompts import STUDIO_DETECTION_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Automaton payloads: ("pattern", studio) or ("known", index in known_studios)
+_ScanHit = Tuple[str, Any]
+
+# Escapes matching a character class or a position rather than a literal
+_CLASS_ESCAPES = frozenset("dwsDWSbBAZ")
+
+
+def _read_atom(pattern: str, i: int) -> Optional[Tuple[Optional[str], int]]:
+    """Read one regex atom at ``i``.
+
+    Returns the literal character it matches (None for classes, class
+    escapes like ``\\d`` and anchors) and the index after it, or None if the
+    atom is not understood. Other alphanumeric escapes (``\\x41``, ``\\u0041``,
+    ``\\N{...}``, octals and backreferences) are not understood.
+    """
+    char = pattern[i]
+    if char == "\\":
+        escaped = pattern[i + 1 : i + 2]
+        if not escaped:
+            return None
+        if not escaped.isalnum():
+            return escaped, i + 2
+        if escaped in _CLASS_ESCAPES:
+            return None, i + 2
+        return None
+    if char == "[":
+        # A "]" right after "[" or "[^" is a member, not the end of the class
+        start = i + 2 if pattern[i + 1 : i + 2] == "^" else i + 1
+        end = pattern.find("]", start + 1)
+        if end == -1 or pattern[end - 1] == "\\":
+            return None
+        return None, end + 1
+    if char in ".^$":
+        return None, i + 1
+    if char in "()?*+{":
+        return None
+    return char, i + 1
+
+
+def _read_quantifier(pattern: str, i: int) -> Optional[Tuple[str, int]]:
+    """Read an optional quantifier at ``i`` as "" (none), "+" or "*"."""
+    quantifier = pattern[i : i + 1]
+    if quantifier == "{":
+        end = pattern.find("}", i)
+        if end == -1:
+            return None
+        minimum = pattern[i + 1 : end].split(",")[0]
+        quantifier = "+" if minimum.isdigit() and int(minimum) > 0 else "*"
+        i = end + 1
+    elif quantifier in ("?", "*", "+"):
+        quantifier = "*" if quantifier == "?" else quantifier
+        i += 1
+    else:
+        return "", i
+    if pattern[i : i + 1] == "?":
+        i += 1  # Lazy quantifier
+    return quantifier, i
+
+
+def _required_literals(pattern: str) -> Optional[List[str]]:
+    """Lowercased literals of which any match of ``pattern`` contains one.
+
+    Returns the longest fixed substring of each top-level alternative, or
+    None when the pattern is too complex to analyse (e.g. groups) or an
+    alternative has no fixed substring; such regexes always have to run.
+    """
+    literals: List[str] = []
+    for alternative in pattern.split("|"):
+        runs = [""]
+        i = 0
+        while i < len(alternative):
+            atom = _read_atom(alternative, i)
+            if atom is None:
+                return None
+            literal, i = atom
+            quantified = _read_quantifier(alternative, i)
+            if quantified is None:
+                return None
+            quantifier, i = quantified
+
+            if literal is not None and quantifier != "*":
+                runs[-1] += literal
+            if literal is None or quantifier:
+                # Not exactly one fixed character, so the run ends here
+                runs.append("")
+
+        longest = max(runs, key=len)
+        if not longest:
+            return None
+        literals.append(longest.lower())
+    return literals
+
 
 class StudioDetector:
     """Detect studios from file paths and scene metadata."""
@@ -19,6 +112,82 @@ class StudioDetector:
         """Initialize studio detector with patterns."""
         self.patterns: Dict[str, re.Pattern] = self._load_patterns()
         self._studio_cache: Dict[str, Optional[DetectionResult]] = {}
+        self._scanner: Optional[AhoCorasick[_ScanHit]] = None
+        self._scanner_patterns: Tuple[Tuple[str, re.Pattern], ...] = ()
+        self._scanner_studios: Optional[Sequence[str]] = None
+        self._scanner_studio_count = 0
+        # Studios whose pattern has no required literal; always run the regex
+        self._unscannable: Set[str] = set()
+        self._empty_studio_index: Optional[int] = None
+
+    def update_known_studios(self, known_studios: Sequence[str]) -> None:
+        """Rebuild the path scanner for a refreshed list of known studios."""
+        self._get_scanner(known_studios)
+
+    def _get_scanner(self, known_studios: Sequence[str]) -> AhoCorasick[_ScanHit]:
+        if (
+            self._scanner is None
+            or known_studios is not self._scanner_studios
+            or len(known_studios) != self._scanner_studio_count
+            or tuple(self.patterns.items()) != self._scanner_patterns
+        ):
+            self._build_scanner(known_studios)
+        assert self._scanner is not None
+        return self._scanner
+
+    def _build_scanner(self, known_studios: Sequence[str]) -> None:
+        """Build one automaton over pattern literals and known studio names."""
+        scanner: AhoCorasick[_ScanHit] = AhoCorasick()
+        self._unscannable = set()
+        for studio, pattern in self.patterns.items():
+            literals = _required_literals(pattern.pattern)
+            if literals is None:
+                self._unscannable.add(studio)
+                continue
+            for literal in literals:
+                scanner.add(literal, ("pattern", studio))
+
+        self._empty_studio_index = None
+        seen: Set[str] = set()
+        for index, studio in enumerate(known_studios):
+            studio_lower = studio.lower()
+            if studio_lower in seen:
+                continue
+            seen.add(studio_lower)
+            if studio_lower:
+                scanner.add(studio_lower, ("known", index))
+            else:
+                # An empty name is contained in every path
+                self._empty_studio_index = index
+
+        scanner.build()
+        self._scanner = scanner
+        self._scanner_patterns = tuple(self.patterns.items())
+        self._scanner_studios = known_studios
+        self._scanner_studio_count = len(known_studios)
+
+    def _scan_path(
+        self, file_path: str, known_studios: Sequence[str]
+    ) -> Tuple[Set[str], Optional[int]]:
+        """Find candidate pattern studios and the first known studio in a path.
+
+        Returns the studios whose regex may match and the index of the first
+        known studio (in list order) whose name occurs in the path.
+        """
+        hits = self._get_scanner(known_studios).find_all(file_path.lower())
+        candidates = set(self._unscannable)
+        known_index = None
+        for kind, value in hits:
+            if kind == "pattern":
+                candidates.add(value)
+            elif known_index is None or value < known_index:
+                known_index = value
+
+        if self._empty_studio_index is not None and (
+            known_index is None or self._empty_studio_index < known_index
+        ):
+            known_index = self._empty_studio_index
+        return candidates, known_index
 
     def _load_patterns(self) -> Dict[str, re.Pattern]:
         """Load regex patterns for studio detection.
@@ -89,9 +258,13 @@ class StudioDetector:
         path = Path(file_path)
         path_parts = path.parts
         filename = path.stem
+        candidates, known_index = self._scan_path(file_path, known_studios)
 
-        # Check against known patterns
+        # Check against known patterns whose literals occur in the path
         for studio, pattern in self.patterns.items():
+            if studio not in candidates:
+                continue
+
             # Check filename
             if pattern.search(filename):
                 confidence = 0.9 if studio in known_studios else 0.8
@@ -117,26 +290,26 @@ class StudioDetector:
                     )
 
         # Check for exact studio name matches in path
-        path_lower = file_path.lower()
-        for studio in known_studios:
-            studio_lower = studio.lower()
-            if studio_lower in path_lower:
-                # Calculate confidence based on match quality
-                if f"/{studio_lower}/" in path_lower:  # Exact directory match
-                    confidence = 0.95
-                elif studio_lower in filename.lower():  # In filename
-                    confidence = 0.85
-                else:  # Somewhere in path
-                    confidence = 0.75
+        if known_index is None:
+            return None
 
-                return DetectionResult(
-                    value=studio,
-                    confidence=confidence,
-                    source="path",
-                    metadata={"match_type": "exact"},
-                )
-
-        return None
+        studio = known_studios[known_index]
+        studio_lower = studio.lower()
+        path_lower = file_path.lower()
+        # Calculate confidence based on match quality
+        if f"/{studio_lower}/" in path_lower:  # Exact directory match
+            confidence = 0.95
+        elif studio_lower in filename.lower():  # In filename
+            confidence = 0.85
+        else:  # Somewhere in path
+            confidence = 0.75
+
+        return DetectionResult(
+            value=studio,
+            confidence=confidence,
+            source="path",
+            metadata={"match_type": "exact"},
+        )
 
     async def detect_with_ai(
         self, scene_data: Dict, ai_client: AIClient, known_studios: List[str]
@@ -182,7 +355,11 @@ class StudioDetector:
         return None
 
     async def detect_with_ai_tracked(
-        self, scene_data: Dict, ai_client: AIClient, known_studios: List[str]
+        self,
+        scene_data: Dict,
+        ai_client: AIClient,
+        known_studios: List[str],
+        use_cache: bool = True,
     ) -> Tuple[Optional[DetectionResult], Optional[Dict]]:
         """Use AI to detect studio and return cost information.
 
@@ -190,6 +367,7 @@ class StudioDetector:
             scene_data: Scene information including path, title, etc.
             ai_client: AI client for analysis
             known_studios: List of known studios in the database
+            use_cache: Whether a cached AI response may be used
 
         Returns:
             Tuple of (detection result, cost information)
@@ -205,6 +383,7 @@ class StudioDetector:
                 prompt=STUDIO_DETECTION_PROMPT,
                 scene_data=scene_data_with_studios,
                 temperature=0.3,
+                use_cache=use_cache,
             )
 
             # Parse response
@@ -232,6 +411,7 @@ class StudioDetector:
         known_studios: List[str],
         ai_client: Optional[AIClient] = None,
         use_ai: bool = True,
+        ai_candidates: Optional[Callable[[], List[str]]] = None,
     ) -> Optional[DetectionResult]:
         """Detect studio using all available methods.
 
@@ -240,6 +420,8 @@ class StudioDetector:
             known_studios: List of known studios
             ai_client: Optional AI client
             use_ai: Whether to use AI detection
+            ai_candidates: Returns the studios to list in the AI prompt
+                (default: known_studios); only called when the AI is asked
 
         Returns:
             Best detection result
@@ -255,7 +437,11 @@ class StudioDetector:
 
         # Try AI detection if enabled
         if use_ai and ai_client:
-            ai_result = await self.detect_with_ai(scene_data, ai_client, known_studios)
+            ai_result = await self.detect_with_ai(
+                scene_data,
+                ai_client,
+                known_studios if ai_candidates is None else ai_candidates(),
+            )
 
             # Compare results and use the one with higher confidence
             if ai_result:
@@ -274,6 +460,7 @@ class StudioDetector:
         try:
             compiled: re.Pattern = re.compile(pattern, re.IGNORECASE)
             self.patterns[studio] = compiled
+            self._scanner = None
             logger.info(f"Added custom pattern for studio: {studio}")
         except re.error as e:
             logger.error(f"Invalid regex pattern for {studio}: {e}")
@@ -139,6 +139,7 @@ class TagDetector:
         ai_client: AIClient,
         existing_tags: list[str],
         available_tags: list[str],
+        use_cache: bool = True,
     ) -> Tuple[list[DetectionResult], Optional[dict]]:
         """Use AI to suggest tags and return cost information.
 
@@ -147,6 +148,7 @@ class TagDetector:
             ai_client: AI client for analysis
             existing_tags: Tags already assigned to the scene
             available_tags: All available tags in the database
+            use_cache: Whether a cached AI response may be used
 
         Returns:
             Tuple of (list of suggested tags, cost information)
@@ -164,6 +166,7 @@ class TagDetector:
                 scene_data=scene_data_with_tags,
                 response_format=TagSuggestionsResponse,
                 temperature=0.3,
+                use_cache=use_cache,
             )
 
             # Ensure response is the expected type
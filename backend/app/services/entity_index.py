@@ -0,0 +1,255 @@
+"""In-process index of studios, performers and tags from the local database."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Performer, Studio, Tag
+from app.models.base import BaseModel
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+ENTITY_MODELS: Dict[str, Type[BaseModel]] = {
+    "studios": Studio,
+    "performers": Performer,
+    "tags": Tag,
+}
+
+# Seconds before an unchanged entity type is checked against the database again
+DEFAULT_MIN_REFRESH_INTERVAL = 30.0
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an entity name for lookups."""
+    return " ".join(name.split()).lower()
+
+
+def _parse_aliases(aliases: Any) -> Tuple[str, ...]:
+    if isinstance(aliases, str):
+        return tuple(a.strip() for a in aliases.split(",") if a.strip())
+    if isinstance(aliases, list):
+        return tuple(str(a) for a in aliases if a)
+    return ()
+
+
+@dataclass(frozen=True)
+class IndexedEntity:
+    """The fields of an entity needed for matching."""
+
+    id: str
+    name: str
+    aliases: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"id": self.id, "name": self.name}
+
+
+@dataclass
+class _EntityTable:
+    """Index state for one entity type."""
+
+    records: Dict[str, IndexedEntity] = field(default_factory=dict)
+    by_name: Dict[str, List[str]] = field(default_factory=dict)
+    by_alias: Dict[str, List[str]] = field(default_factory=dict)
+    watermark: Optional[datetime] = None
+    version: int = 0
+    loaded: bool = False
+    dirty: bool = True
+    checked_at: float = 0.0
+    views: Dict[str, Tuple[int, Any]] = field(default_factory=dict)
+
+    def upsert(self, entity: IndexedEntity) -> bool:
+        """Insert or replace a record; returns whether anything changed."""
+        previous = self.records.get(entity.id)
+        if previous == entity:
+            return False
+        if previous is not None:
+            self._unlink(previous)
+        self.records[entity.id] = entity
+        self.by_name.setdefault(normalize_name(entity.name), []).append(entity.id)
+        for alias in entity.aliases:
+            self.by_alias.setdefault(normalize_name(alias), []).append(entity.id)
+        return True
+
+    def retain(self, ids: Iterable[str]) -> bool:
+        """Drop records whose IDs are no longer in the database."""
+        keep = set(ids)
+        removed = [entity_id for entity_id in self.records if entity_id not in keep]
+        for entity_id in removed:
+            self._unlink(self.records.pop(entity_id))
+        return bool(removed)
+
+    def _unlink(self, entity: IndexedEntity) -> None:
+        keys = [(self.by_name, entity.name)]
+        keys.extend((self.by_alias, alias) for alias in entity.aliases)
+        for mapping, name in keys:
+            ids = mapping.get(normalize_name(name))
+            if ids and entity.id in ids:
+                ids.remove(entity.id)
+                if not ids:
+                    del mapping[normalize_name(name)]
+
+
+class EntityIndex:
+    """Studios, performers and tags held in memory for analysis and apply.
+
+    Loading uses column-only queries (no ORM objects or relationship
+    loaders). Later refreshes only read rows whose ``updated_at`` is at or
+    after the newest one already seen, plus a row count to detect
+    deletions. Sync calls ``mark_changed()`` so the next refresh picks up
+    its writes immediately; otherwise each type is re-checked at most every
+    ``min_refresh_interval`` seconds.
+
+    List views such as ``names()`` return the same list object until the
+    entity type changes, so detectors can keep indexes built from them.
+    """
+
+    def __init__(self, min_refresh_interval: float = DEFAULT_MIN_REFRESH_INTERVAL):
+        self.min_refresh_interval = min_refresh_interval
+        self._tables: Dict[str, _EntityTable] = {
+            kind: _EntityTable() for kind in ENTITY_MODELS
+        }
+        self._lock = asyncio.Lock()
+
+    def mark_changed(self, *kinds: str) -> None:
+        """Have the next refresh re-check these entity types (default: all)."""
+        for kind in kinds or tuple(self._tables):
+            self._tables[kind].dirty = True
+
+    def version(self, kind: str) -> int:
+        """Counter that changes whenever an entity type's contents change."""
+        return self._tables[kind].version
+
+    def is_loaded(self, kind: str) -> bool:
+        return self._tables[kind].loaded
+
+    async def refresh(
+        self, db: Optional[AsyncSession] = None, force: bool = False
+    ) -> Dict[str, int]:
+        """Bring stale entity types up to date; returns rows read per type."""
+        async with self._lock:
+            if db is not None:
+                return await self._refresh_all(db, force)
+
+            from app.core.database import AsyncSessionLocal
+
+            async with AsyncSessionLocal() as session:
+                return await self._refresh_all(session, force)
+
+    async def _refresh_all(self, db: AsyncSession, force: bool) -> Dict[str, int]:
+        now = time.monotonic()
+        rows_read = {}
+        for kind, table in self._tables.items():
+            stale = now - table.checked_at >= self.min_refresh_interval
+            if force or table.dirty or stale or not table.loaded:
+                rows_read[kind] = await self._refresh_table(db, kind, table)
+                table.checked_at = now
+        return rows_read
+
+    async def _refresh_table(
+        self, db: AsyncSession, kind: str, table: _EntityTable
+    ) -> int:
+        model: Any = ENTITY_MODELS[kind]
+        # Clear first so sync writes during the query are not missed
+        table.dirty = False
+
+        query = select(model.id, model.name, model.aliases, model.updated_at)
+        if table.watermark is not None:
+            # >= so rows sharing the newest timestamp are not skipped
+            query = query.where(model.updated_at >= table.watermark)
+        rows = (await db.execute(query)).all()
+
+        changed = False
+        for row in rows:
+            if row.name:
+                entity = IndexedEntity(
+                    str(row.id), row.name, _parse_aliases(row.aliases)
+                )
+                changed = table.upsert(entity) or changed
+            if row.updated_at and (
+                table.watermark is None or row.updated_at > table.watermark
+            ):
+                table.watermark = row.updated_at
+
+        count = (await db.execute(select(func.count()).select_from(model))).scalar()
+        if table.loaded and count != len(table.records):
+            ids = (await db.execute(select(model.id))).scalars().all()
+            changed = table.retain(str(i) for i in ids) or changed
+
+        if changed or not table.loaded:
+            table.version += 1
+            table.loaded = True
+            logger.debug(
+                f"Entity index {kind}: {len(table.records)} entities "
+                f"(version {table.version}, {len(rows)} rows read)"
+            )
+        return len(rows)
+
+    def get(self, kind: str, entity_id: str) -> Optional[IndexedEntity]:
+        """Look up an entity by ID."""
+        return self._tables[kind].records.get(str(entity_id))
+
+    def find_by_name(
+        self, kind: str, name: str, include_aliases: bool = False
+    ) -> Optional[IndexedEntity]:
+        """Look up an entity by normalized name, optionally falling back to aliases."""
+        table = self._tables[kind]
+        key = normalize_name(name)
+        ids = table.by_name.get(key)
+        if not ids and include_aliases:
+            ids = table.by_alias.get(key)
+        return table.records[ids[0]] if ids else None
+
+    def names(self, kind: str) -> List[str]:
+        """All entity names of a type, as one list shared until it changes."""
+        return self._view(kind, "names", lambda t: [e.name for e in t.records.values()])
+
+    def performer_aliases(self) -> List[Dict[str, Any]]:
+        """Performers as ``{"name", "aliases"}`` dicts for the detectors."""
+        return self._view(
+            "performers",
+            "aliases",
+            lambda t: [
+                {"name": e.name, "aliases": list(e.aliases)} for e in t.records.values()
+            ],
+        )
+
+    def _view(self, kind: str, view: str, build: Callable[[_EntityTable], V]) -> V:
+        table = self._tables[kind]
+        cached = table.views.get(view)
+        if cached is None or cached[0] != table.version:
+            cached = (table.version, build(table))
+            table.views[view] = cached
+        result: V = cached[1]
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get entity counts, versions and watermarks per type."""
+        return {
+            kind: {
+                "entities": len(table.records),
+                "version": table.version,
+                "loaded": table.loaded,
+                "watermark": table.watermark.isoformat() if table.watermark else None,
+            }
+            for kind, table in self._tables.items()
+        }
+
+
+entity_index: Optional[EntityIndex] = None
+
+
+def get_entity_index() -> EntityIndex:
+    """Get the process-wide entity index."""
+    global entity_index
+    if entity_index is None:
+        entity_index = EntityIndex()
+    return entity_index
@@ -0,0 +1,121 @@
+"""Coalesced progress reporting for running jobs."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between progress writes that do not change the percentage
+PROGRESS_FLUSH_INTERVAL_SECONDS = 1.0
+
+ProgressWriter = Callable[[Optional[int], Optional[str]], Awaitable[None]]
+
+
+class JobProgressReporter:
+    """Progress callback for one running job that batches database writes.
+
+    Handlers report progress as often as once per scene. The reporter keeps
+    the latest progress and message in memory and only writes when the
+    percentage changes or ``flush_interval`` seconds have passed since the
+    last write; a report held back in between is written once the interval
+    is up, or by ``close()``. Reports made after the job's cancellation
+    token fires are dropped, so reporting never has to read the job back.
+
+    Pass ``report`` to handlers as their ``progress_callback`` and call
+    ``close()`` before writing the job's final status.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        write: ProgressWriter,
+        cancellation_token: Optional[CancellationToken] = None,
+        flush_interval: float = PROGRESS_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.job_id = job_id
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._write = write
+        self._token = cancellation_token
+        self._pending: Optional[Tuple[Optional[int], Optional[str]]] = None
+        self._last_progress: Optional[int] = None
+        self._last_write = float("-inf")
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self.reports = 0
+        self.writes = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._token is not None and self._token.is_cancelled
+
+    async def report(
+        self, progress: Optional[int], message: Optional[str] = None
+    ) -> None:
+        """Record the job's latest progress, writing it if it is due."""
+        if self.cancelled:
+            logger.debug(f"Job {self.job_id} is cancelling, skipping progress update")
+            return
+
+        self.reports += 1
+        if self._pending is not None:
+            pending_progress, pending_message = self._pending
+            if progress is None:
+                progress = pending_progress
+            if message is None:
+                message = pending_message
+        self._pending = (progress, message)
+
+        percentage_changed = progress is not None and progress != self._last_progress
+        if percentage_changed or self._seconds_until_due() <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write the pending progress now, if there is any."""
+        async with self._lock:
+            if self._pending is None or self.cancelled:
+                self._pending = None
+                return
+            progress, message = self._pending
+            self._pending = None
+            self._last_write = self._clock()
+            if progress is not None:
+                self._last_progress = progress
+            self.writes += 1
+            await self._write(progress, message)
+
+    async def close(self) -> None:
+        """Stop the flush timer and write whatever is still pending."""
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            await asyncio.gather(timer, return_exceptions=True)
+        await self.flush()
+        if self.reports:
+            logger.debug(
+                f"Job {self.job_id}: {self.reports} progress reports, "
+                f"{self.writes} writes"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Get report and write counts."""
+        return {"reports": self.reports, "writes": self.writes}
+
+    def _seconds_until_due(self) -> float:
+        return self._last_write + self.flush_interval - self._clock()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(max(self._seconds_until_due(), 0.0))
+        self._timer = None
+        try:
+            # Shielded so close() cancelling the timer cannot abort a write
+            await asyncio.shield(self.flush())
+        except Exception as e:
+            logger.warning(f"Failed to write progress for job {self.job_id}: {e}")
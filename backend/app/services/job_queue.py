@@ -0,0 +1,238 @@
+"""Durable job queue that dispatches jobs from the job table."""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from app.core.cancellation import cancellation_manager
+from app.models.job import Job, JobStatus
+from app.repositories.job_repository import job_repository
+
+if TYPE_CHECKING:
+    from app.services.job_service import JobService
+
+logger = logging.getLogger(__name__)
+
+# Longest gap between lease renewals; it also bounds how long a job keeps
+# running after another process cancelled it
+HEARTBEAT_MAX_INTERVAL_SECONDS = 5.0
+
+
+class DatabaseJobQueue:
+    """Runs jobs claimed from the ``job`` table so queued work survives restarts.
+
+    ``JobService.create_job`` only inserts the job row in this mode. Workers
+    lease the oldest pending job, renew the lease while the handler runs and
+    clear it when it finishes. A job whose lease expires (its process died
+    or was redeployed) is claimed again by the next free worker, up to
+    ``max_attempts`` times, and resumes from its last checkpoint. Jobs
+    interrupted by ``stop`` keep their status and lease for the same reason.
+
+    Several processes can run a queue against the same database (see
+    ``app.worker``). Jobs of the job service's ``sync_job_types`` are not
+    claimed while another job of the same type holds a live lease, so they
+    run one at a time across all processes. The heartbeat also picks up
+    cancellations made by other processes: a CANCELLING job has its
+    cancellation token fired, and a job cancelled while still waiting for its
+    job type lock is stopped.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 5,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 2.0,
+        max_attempts: int = 3,
+        worker_id: Optional[str] = None,
+    ):
+        self.max_workers = max_workers
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.workers: List[asyncio.Task] = []
+        self._job_service: Optional["JobService"] = None
+        self._running_jobs: Dict[str, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._stopping = False
+
+    @property
+    def running_job_ids(self) -> List[str]:
+        return list(self._running_jobs)
+
+    async def start(self, job_service: "JobService") -> None:
+        """Start claiming jobs for the handlers registered on ``job_service``."""
+        if self._running:
+            return
+
+        self._job_service = job_service
+        self._job_service.shutting_down = False
+        self._running = True
+        self._stopping = False
+        logger.info(
+            f"Starting database job queue {self.worker_id} with "
+            f"{self.max_workers} workers"
+        )
+        for i in range(self.max_workers):
+            self.workers.append(asyncio.create_task(self._worker(f"db-worker-{i}")))
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished jobs are re-claimed once leases expire."""
+        if not self._running:
+            return
+
+        logger.info("Stopping database job queue")
+        self._running = False
+        self._stopping = True
+        if self._job_service is not None:
+            self._job_service.shutting_down = True
+        runs = list(self._running_jobs.values())
+        for worker in self.workers:
+            worker.cancel()
+        if self.workers:
+            await asyncio.gather(*self.workers, *runs, return_exceptions=True)
+        self.workers.clear()
+
+    def notify(self) -> None:
+        """Wake idle workers after a job was queued in this process."""
+        self._wakeup.set()
+
+    def cancel(self, job_id: str) -> bool:
+        """Stop a job running in this process."""
+        run = self._running_jobs.get(job_id)
+        if run is None or run.done():
+            return False
+        run.cancel()
+        return True
+
+    async def _worker(self, name: str) -> None:
+        logger.info(f"{name} started")
+        while self._running:
+            try:
+                job = await self.claim_next()
+                if job is None:
+                    await self._wait_for_work()
+                    continue
+                await self.run(job)
+            except asyncio.CancelledError:
+                logger.info(f"{name} cancelled")
+                break
+            except Exception as e:
+                logger.exception(f"{name} error: {e}")
+                await asyncio.sleep(self.poll_interval)
+        logger.info(f"{name} stopped")
+
+    async def _wait_for_work(self) -> None:
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def claim_next(self) -> Optional[Job]:
+        """Lease the next job this process has a handler for."""
+        from app.core.database import AsyncSessionLocal
+
+        assert self._job_service is not None
+        job_types = [job_type.value for job_type in self._job_service.job_handlers]
+        if not job_types:
+            return None
+        exclusive_types = {
+            job_type.value for job_type in self._job_service.sync_job_types
+        }
+        async with AsyncSessionLocal() as db:
+            job = await job_repository.claim_next_job(
+                db,
+                self.worker_id,
+                self.lease_seconds,
+                job_types,
+                self.max_attempts,
+                exclusive_types=exclusive_types,
+            )
+        if job is not None:
+            logger.info(f"Claimed job {job.id} ({job.type}), attempt {job.attempts}")
+        return job
+
+    async def run(self, job: Job) -> None:
+        """Run a claimed job while keeping its lease alive."""
+        assert self._job_service is not None
+        job_id = str(job.id)
+        run = asyncio.create_task(self._job_service.run_queued_job(job))
+        self._running_jobs[job_id] = run
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, run))
+        try:
+            await run
+        except asyncio.CancelledError:
+            if not run.cancelled():
+                raise
+            logger.info(f"Job {job_id} was stopped")
+        except Exception as e:
+            # The job service already recorded the failure
+            logger.debug(f"Job {job_id} raised {e}")
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            self._running_jobs.pop(job_id, None)
+            if not self._stopping:
+                # Jobs interrupted by stop() keep their lease until it expires
+                await self._release(job_id)
+
+    async def _heartbeat(self, job_id: str, run: asyncio.Task) -> None:
+        from app.core.database import AsyncSessionLocal
+
+        interval = min(self.lease_seconds / 3, HEARTBEAT_MAX_INTERVAL_SECONDS)
+        while not run.done():
+            await asyncio.sleep(interval)
+            try:
+                async with AsyncSessionLocal() as db:
+                    status = await job_repository.renew_job_lease(
+                        job_id, self.worker_id, self.lease_seconds, db
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to renew lease for job {job_id}: {e}")
+                continue
+
+            if status is None:
+                logger.error(f"Lost lease for job {job_id}; stopping it")
+                cancellation_manager.cancel_job(job_id)
+                return
+            if status == JobStatus.CANCELLING.value:
+                cancellation_manager.cancel_job(job_id)
+            elif status == JobStatus.CANCELLED.value:
+                run.cancel()
+                return
+
+    async def _release(self, job_id: str) -> None:
+        from app.core.database import AsyncSessionLocal
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await job_repository.release_job_lease(job_id, self.worker_id, db)
+        except Exception as e:
+            logger.error(f"Failed to release lease for job {job_id}: {e}")
+
+
+# Global durable queue instance
+job_queue: Optional[DatabaseJobQueue] = None
+
+
+def get_job_queue() -> DatabaseJobQueue:
+    """Get the global durable job queue."""
+    global job_queue
+    if job_queue is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        job_queue = DatabaseJobQueue(
+            max_workers=settings.max_workers,
+            lease_seconds=settings.job_lease_seconds,
+            poll_interval=settings.job_queue_poll_interval,
+            max_attempts=settings.job_max_attempts,
+        )
+    return job_queue
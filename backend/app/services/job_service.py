@@ -2,6 +2,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable, Dict, Optional, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,20 +10,27 @@ from sqlalchemy.orm import Session
 
 from app.core.cancellation import cancellation_manager
 from app.core.job_context import job_logging_context
-from app.core.tasks import TaskStatus, get_task_queue
+from app.core.tasks import DEFAULT_LANE, INTERACTIVE_LANE, TaskStatus, get_task_queue
 from app.models.job import Job, JobStatus, JobType
 from app.repositories.job_repository import job_repository
+from app.services.job_progress import JobProgressReporter
+from app.services.job_queue import get_job_queue
 from app.services.websocket_manager import websocket_manager
 
 logger = logging.getLogger(__name__)
 
+# Scene syncs for at most this many scenes run in the interactive lane
+INTERACTIVE_SCENE_LIMIT = 10
+
 
 class JobService:
     """Service to manage jobs and coordinate with task queue."""
 
     def __init__(self) -> None:
         self.job_handlers: dict[JobType, Callable] = {}
-        # Locks for each job type to prevent concurrent execution
+        # Locks for each job type to prevent concurrent execution. They only
+        # cover this process; the durable queue also keeps other processes
+        # from claiming a job of a type that is already running.
         self.job_type_locks: dict[JobType, asyncio.Lock] = {}
         # Track which jobs should use mutual exclusion
         self.sync_job_types = {
@@ -33,6 +41,11 @@ class JobService:
             JobType.GENERATE_DETAILS,
             JobType.PROCESS_NEW_SCENES,
         }
+        # Short user-triggered jobs that skip the queue of long-running jobs
+        self.interactive_job_types = {JobType.LOCAL_GENERATE}
+        # Set while the durable queue stops; jobs cancelled by the shutdown
+        # stay RUNNING so another worker re-claims them
+        self.shutting_down = False
 
     def register_handler(self, job_type: JobType, handler: Callable) -> None:
         """Register a handler function for a specific job type."""
@@ -49,9 +62,12 @@ class JobService:
         """Create a new job and queue it for execution."""
         # Generate job ID
         job_id = str(uuid.uuid4())
+        durable = self._durable_queue_enabled()
 
-        # Create cancellation token for this job
-        cancellation_manager.create_token(job_id)
+        # Create cancellation token for this job; durable jobs get theirs
+        # from the worker that claims them
+        if not durable:
+            cancellation_manager.create_token(job_id)
 
         # Create job in database
         job = await job_repository.create_job(
@@ -69,49 +85,24 @@ class JobService:
             )
             raise ValueError(f"No handler registered for job type: {job_type.value}")
 
-        # Get or create lock for this job type if it's a sync job
-        job_lock = None
-        if job_type in self.sync_job_types:
-            if job_type not in self.job_type_locks:
-                self.job_type_locks[job_type] = asyncio.Lock()
-            job_lock = self.job_type_locks[job_type]
+        if durable:
+            # Workers claim the job from the database, in this or another process
+            job.payload = {**kwargs, **(metadata or {})}  # type: ignore[assignment]
+            await db.commit()  # type: ignore[misc]
+            get_job_queue().notify()
+            logger.info(f"Queued job {job_id} of type {job_type.value} in the database")
+            return job
 
         # Create task wrapper with progress callback
         async def task_wrapper() -> str:
-            from app.core.database import AsyncSessionLocal
-
-            # Acquire lock if this is a sync job
-            if job_lock:
-                logger.info(f"Job {job_id} ({job_type.value}) waiting for lock...")
-
-                # Check if lock is already held
-                if job_lock.locked():
-                    # Update job status to indicate waiting
-                    async with AsyncSessionLocal() as wait_db:
-                        await self._update_job_status_with_session(
-                            job_id=job_id,
-                            status=JobStatus.PENDING,
-                            message=f"Waiting for another {job_type.value} job to complete",
-                            db=wait_db,
-                        )
-                        await wait_db.commit()
-
-                async with job_lock:
-                    logger.info(f"Job {job_id} ({job_type.value}) acquired lock")
-                    return await self._execute_job_with_lock(
-                        job_id, job_type, handler, metadata, kwargs
-                    )
-            else:
-                # Non-sync jobs don't need locks
-                return await self._execute_job_with_lock(
-                    job_id, job_type, handler, metadata, kwargs
-                )
+            return await self._run_job(job_id, job_type, handler, metadata, kwargs)
 
         # Queue the task
         task_queue = get_task_queue()
         task_id = await task_queue.submit(
             func=task_wrapper,
             name=f"{job_type.value}_{job_id}",
+            lane=self._task_lane(job_type, metadata),
         )
 
         # Store task ID in job metadata
@@ -123,6 +114,125 @@ class JobService:
         logger.info(f"Created job {job_id} of type {job_type.value}")
         return job
 
+    def _durable_queue_enabled(self) -> bool:
+        """Whether jobs are dispatched from the job table instead of memory."""
+        from app.core.config import get_settings
+
+        return bool(get_settings().job_queue_mode == "database")
+
+    def _get_job_type_lock(
+        self, job_type: JobType, metadata: Optional[dict[str, Any]]
+    ) -> Optional[asyncio.Lock]:
+        """Get or create the lock serializing jobs of a sync job type."""
+        if job_type not in self.sync_job_types:
+            return None
+        if self._is_small_scene_sync(job_type, metadata):
+            # Only upserts the scenes it names, so it need not wait for a
+            # running sync, and it never holds up an interactive worker
+            return None
+        if job_type not in self.job_type_locks:
+            self.job_type_locks[job_type] = asyncio.Lock()
+        return self.job_type_locks[job_type]
+
+    async def _run_job(
+        self,
+        job_id: str,
+        job_type: JobType,
+        handler: Callable,
+        metadata: Optional[dict[str, Any]],
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Run a job's handler, waiting for its job type lock if it has one."""
+        from app.core.database import AsyncSessionLocal
+
+        job_lock = self._get_job_type_lock(job_type, metadata)
+
+        # Acquire lock if this is a sync job
+        if job_lock:
+            logger.info(f"Job {job_id} ({job_type.value}) waiting for lock...")
+
+            # Check if lock is already held
+            if job_lock.locked():
+                # Update job status to indicate waiting
+                async with AsyncSessionLocal() as wait_db:
+                    await self._update_job_status_with_session(
+                        job_id=job_id,
+                        status=JobStatus.PENDING,
+                        message=f"Waiting for another {job_type.value} job to complete",
+                        db=wait_db,
+                    )
+                    await wait_db.commit()
+
+            async with job_lock:
+                logger.info(f"Job {job_id} ({job_type.value}) acquired lock")
+                return await self._execute_job_with_lock(
+                    job_id, job_type, handler, metadata, kwargs
+                )
+        else:
+            # Non-sync jobs don't need locks
+            return await self._execute_job_with_lock(
+                job_id, job_type, handler, metadata, kwargs
+            )
+
+    async def run_queued_job(self, job: Job) -> str:
+        """Run a job claimed from the durable queue.
+
+        Handler arguments come from the payload stored at creation. A job
+        re-dispatched after its worker died also gets its last checkpoint
+        as ``resume_checkpoint``.
+        """
+        job_type = job.type if isinstance(job.type, JobType) else JobType(job.type)
+        job_id = str(job.id)
+        handler = self.job_handlers.get(job_type)
+        if not handler:
+            await self._update_job_status(
+                job_id,
+                JobStatus.FAILED,
+                error=f"No handler registered for job type: {job_type.value}",
+            )
+            return ""
+
+        payload = job.payload if job.payload is not None else job.job_metadata
+        metadata: dict[str, Any] = dict(payload or {})
+        kwargs: dict[str, Any] = {}
+        if job.checkpoint:
+            logger.info(f"Resuming job {job_id} from checkpoint {job.checkpoint}")
+            kwargs["resume_checkpoint"] = job.checkpoint
+
+        if cancellation_manager.get_token(job_id) is None:
+            cancellation_manager.create_token(job_id)
+        return await self._run_job(job_id, job_type, handler, metadata, kwargs)
+
+    async def save_checkpoint(self, job_id: str, checkpoint: dict[str, Any]) -> None:
+        """Store where a resumable job can continue if it is re-dispatched."""
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            await job_repository.save_checkpoint(job_id, checkpoint, db)
+
+    def _is_small_scene_sync(
+        self, job_type: JobType, metadata: Optional[dict[str, Any]]
+    ) -> bool:
+        """Whether a job resyncs only a few scenes, such as a single-scene resync."""
+        scene_ids = (metadata or {}).get("scene_ids")
+        return (
+            job_type == JobType.SYNC_SCENES
+            and isinstance(scene_ids, list)
+            and len(scene_ids) <= INTERACTIVE_SCENE_LIMIT
+        )
+
+    def _task_lane(self, job_type: JobType, metadata: Optional[dict[str, Any]]) -> str:
+        """Pick the task queue lane for a job.
+
+        Small scene syncs skip the SYNC_SCENES lock, so no job in the
+        interactive lane waits on a job type lock.
+        """
+        if job_type in self.interactive_job_types or self._is_small_scene_sync(
+            job_type, metadata
+        ):
+            return INTERACTIVE_LANE
+        return DEFAULT_LANE
+
     async def _execute_job_with_lock(  # noqa: C901
         self,
         job_id: str,
@@ -163,39 +273,24 @@ class JobService:
                 # Get cancellation token
                 cancellation_token = cancellation_manager.get_token(job_id)
 
-                # Create an async progress callback that uses its own session
-                async def async_progress_callback(
-                    progress: Optional[int], message: Optional[str] = None
-                ) -> None:
-                    # Check if job is being cancelled before updating progress
-                    async with AsyncSessionLocal() as check_db:
-                        job = await self.get_job(job_id, check_db)
-                        if job and job.status == JobStatus.CANCELLING.value:
-                            logger.debug(
-                                f"Job {job_id} is cancelling, skipping progress callback"
-                            )
-                            return
-
-                    # Use _update_job_progress which parses the message for counts
-                    if progress is not None:
-                        await self._update_job_progress(job_id, progress, message)
-                    elif message:
-                        # Just update the message without changing progress
-                        async with AsyncSessionLocal() as db:
-                            job = await self.get_job(job_id, db)
-                            if job and job.job_metadata:
-                                metadata = job.job_metadata
-                                metadata["message"] = message
-                                job.job_metadata = metadata
-                                await db.commit()
+                # Coalesce progress reports; cancellation is read from the token
+                progress_reporter = JobProgressReporter(
+                    job_id,
+                    partial(self._write_job_progress, job_id),
+                    cancellation_token,
+                )
 
                 # Execute handler with job context
-                result = await handler(
-                    job_id=job_id,
-                    progress_callback=async_progress_callback,
-                    cancellation_token=cancellation_token,
-                    **handler_kwargs,
-                )
+                try:
+                    result = await handler(
+                        job_id=job_id,
+                        progress_callback=progress_reporter.report,
+                        cancellation_token=cancellation_token,
+                        **handler_kwargs,
+                    )
+                finally:
+                    # Write held-back progress before the final status
+                    await progress_reporter.close()
 
                 # Update job status based on result
                 async with AsyncSessionLocal() as final_db:
@@ -253,6 +348,12 @@ class JobService:
                 return str(result) if result is not None else ""
 
             except asyncio.CancelledError:
+                if self.shutting_down:
+                    logger.info(
+                        f"Job {job_id} interrupted by shutdown; "
+                        "leaving it to be re-claimed"
+                    )
+                    raise
                 logger.info(f"Job {job_id} was cancelled")
                 # Update status in a new session for cancellation
                 async with AsyncSessionLocal() as cancel_db:
@@ -334,6 +435,10 @@ class JobService:
                 task_id = str(job.job_metadata["task_id"])
                 task_queue = get_task_queue()
                 await task_queue.cancel_task(task_id)
+            elif job.lease_owner is not None:
+                # Claimed from the durable queue and waiting for its type lock;
+                # other processes stop it on their next lease renewal
+                get_job_queue().cancel(job_id)
 
             logger.info(f"Cancelled pending job {job_id}")
             return True
@@ -471,6 +576,25 @@ class JobService:
                 message=message,
             )
 
+    async def _write_job_progress(
+        self, job_id: str, progress: Optional[int], message: Optional[str] = None
+    ) -> None:
+        """Write coalesced progress from a job's progress reporter."""
+        if progress is not None:
+            # Use _update_job_progress which parses the message for counts
+            await self._update_job_progress(job_id, progress, message)
+        elif message:
+            # Just update the message without changing progress
+            from app.core.database import AsyncSessionLocal
+
+            async with AsyncSessionLocal() as db:
+                job = await self.get_job(job_id, db)
+                if job and job.job_metadata:
+                    metadata = job.job_metadata
+                    metadata["message"] = message
+                    job.job_metadata = metadata
+                    await db.commit()
+
     async def _update_job_progress(
         self, job_id: str, progress: int, message: Optional[str] = None
     ) -> None:
@@ -488,17 +612,8 @@ class JobService:
                 processed_items = int(match.group(1))
                 total_items = int(match.group(2))
 
-        # Check current job status first - don't override CANCELLING status
-        from app.core.database import AsyncSessionLocal
-
-        async with AsyncSessionLocal() as db:
-            job = await self.get_job(job_id, db)
-            if job and job.status == JobStatus.CANCELLING.value:
-                # Don't change status back to RUNNING if job is being cancelled
-                logger.info(f"Job {job_id} is cancelling, skipping progress update")
-                return
-
-        # Update job with progress and counts
+        # Update job with progress and counts; this skips jobs that are
+        # already CANCELLING, so no separate status read is needed first
         await self._update_job_status_with_counts(
             job_id=job_id,
             status=JobStatus.RUNNING,
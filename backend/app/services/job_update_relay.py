@@ -0,0 +1,154 @@
+"""Relays progress of jobs run by other processes to WebSocket clients."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Seconds between polls of the job table
+RELAY_POLL_INTERVAL_SECONDS = 1.0
+
+# Rows are re-read this far behind the newest update seen, so a transaction
+# that commits after a later one has been relayed is not missed
+RELAY_OVERLAP_SECONDS = 5.0
+
+
+class JobUpdateRelay:
+    """Broadcasts job changes written by separate worker processes.
+
+    Worker processes write progress and status to the ``job`` table but have
+    no WebSocket clients. The API process polls for jobs whose ``updated_at``
+    moved since the last poll and sends each change through
+    ``WebSocketManager`` once. Jobs leased by this process's own queue are
+    skipped because ``JobService`` already broadcasts those directly.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = RELAY_POLL_INTERVAL_SECONDS,
+        overlap_seconds: float = RELAY_OVERLAP_SECONDS,
+        local_worker_id: Optional[str] = None,
+    ):
+        self.poll_interval = poll_interval
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.local_worker_id = local_worker_id
+        self._started = False
+        self._watermark: Optional[datetime] = None
+        self._seen: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.relayed = 0
+
+    async def start(self) -> None:
+        """Start polling in the background."""
+        if self._task is None:
+            logger.info("Starting job update relay")
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job update relay poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def poll(self) -> int:
+        """Broadcast jobs changed since the previous poll.
+
+        The first poll only records where to start, so restarting the API
+        does not replay old updates.
+
+        Returns:
+            Number of job updates broadcast
+        """
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            if not self._started:
+                self._watermark = await db.scalar(select(func.max(Job.updated_at)))
+
+            query = select(Job).order_by(Job.updated_at)
+            since = None
+            if self._watermark is not None:
+                since = self._watermark - self.overlap
+                query = query.where(Job.updated_at >= since)
+            jobs = list((await db.execute(query)).scalars().all())
+
+        changed = self._changed_jobs(jobs)
+        if not self._started:
+            self._started = True
+            return 0
+        for job in changed:
+            await self._broadcast(job)
+        if since is not None:
+            self._prune(since)
+        return len(changed)
+
+    def _changed_jobs(self, jobs: List[Job]) -> List[Job]:
+        changed = []
+        for job in jobs:
+            job_id = str(job.id)
+            updated_at = job.updated_at
+            if updated_at is None or self._seen.get(job_id) == updated_at:
+                continue
+            self._seen[job_id] = updated_at  # type: ignore[assignment]
+            if self._watermark is None or updated_at > self._watermark:
+                self._watermark = updated_at  # type: ignore[assignment]
+            if self.local_worker_id and job.lease_owner == self.local_worker_id:
+                continue
+            changed.append(job)
+        return changed
+
+    def _prune(self, since: datetime) -> None:
+        # Rows older than the overlap window are never read again
+        for job_id in [job_id for job_id, seen in self._seen.items() if seen < since]:
+            del self._seen[job_id]
+
+    async def _broadcast(self, job: Job) -> None:
+        from app.services.job_service import job_service
+
+        metadata: Dict[str, Any] = (
+            job.job_metadata if isinstance(job.job_metadata, dict) else {}
+        )
+        try:
+            await job_service._send_job_update(
+                str(job.id),
+                {
+                    "message": metadata.get("message"),
+                    "error": job.error,
+                    "result": job.result,
+                },
+                job=job,
+            )
+            self.relayed += 1
+        except Exception as e:
+            logger.warning(f"Failed to relay update for job {job.id}: {e}")
+
+
+# Global relay instance
+job_update_relay: Optional[JobUpdateRelay] = None
+
+
+def get_job_update_relay() -> JobUpdateRelay:
+    """Get the global job update relay."""
+    global job_update_relay
+    if job_update_relay is None:
+        from app.services.job_queue import get_job_queue
+
+        job_update_relay = JobUpdateRelay(local_worker_id=get_job_queue().worker_id)
+    return job_update_relay
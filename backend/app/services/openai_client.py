@@ -2,15 +2,47 @@
 OpenAI API client service.
 """
 
+import json
+import logging
 from typing import Any, Optional, cast
 
 import openai
-from openai.types.chat import ChatCompletionMessageParam
+from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 from openai.types.chat.completion_create_params import ResponseFormat
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.services.ai_response_cache import AIResponseCache, request_fingerprint
+from app.services.openai_rate_limiter import OpenAIRateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: 429s, timeouts, dropped connections and 5xx
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
 
 
 class OpenAIClient:
-    """Client for interacting with OpenAI API."""
+    """Client for interacting with OpenAI API.
+
+    Requests go through ``AsyncOpenAI`` so they never block the event loop.
+    Every client for the same API key shares one ``OpenAIRateLimiter``,
+    which bounds concurrent requests and requests/tokens per minute. With
+    ``response_cache_max_entries`` set, ``generate_completion_with_usage``
+    reuses stored responses to identical requests.
+    """
+
+    # Characters per token used to estimate prompt size for the rate limiter
+    AVG_CHARS_PER_TOKEN = 4
 
     def __init__(
         self,
@@ -20,6 +52,12 @@ class OpenAIClient:
         max_tokens: int = 2000,
         temperature: float = 0.7,
         timeout: int = 60,
+        max_concurrent: int = 4,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_retries: int = 5,
+        response_cache_ttl_hours: int = 720,
+        response_cache_max_entries: int = 0,
     ):
         """
         Initialize OpenAI client.
@@ -31,6 +69,12 @@ class OpenAIClient:
             max_tokens: Maximum tokens per request
             temperature: Temperature for generation
             timeout: Request timeout in seconds
+            max_concurrent: Maximum concurrent requests for this API key
+            requests_per_minute: Request budget per minute (0 disables)
+            tokens_per_minute: Token budget per minute (0 disables)
+            max_retries: Attempts for rate-limited or transient failures
+            response_cache_ttl_hours: Age after which cached responses expire
+            response_cache_max_entries: Cached responses kept (0 disables)
         """
         self.api_key = api_key
         self.model = model
@@ -38,29 +82,126 @@ class OpenAIClient:
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.retry_wait = wait_exponential(multiplier=1, min=1, max=30)
+        self.response_cache = (
+            AIResponseCache(response_cache_ttl_hours, response_cache_max_entries)
+            if response_cache_max_entries > 0
+            else None
+        )
 
-        # Initialize OpenAI client with optional custom base URL
+        # Retries are handled here so they also respect the rate limiter
         if base_url:
-            self.client = openai.OpenAI(
+            self.client = openai.AsyncOpenAI(
                 api_key=api_key,
                 base_url=base_url,
                 timeout=float(timeout),
+                max_retries=0,
             )
         else:
-            self.client = openai.OpenAI(
+            self.client = openai.AsyncOpenAI(
                 api_key=api_key,
                 timeout=float(timeout),
+                max_retries=0,
             )
 
+    @property
+    def rate_limiter(self) -> OpenAIRateLimiter:
+        """Limiter shared by all clients using this API key."""
+        return get_rate_limiter(
+            self.api_key,
+            self.base_url,
+            max_concurrent=self.max_concurrent,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+
     async def test_connection(self) -> bool:
         """Test connection to OpenAI API."""
         try:
             # Try to list models as a connection test
-            models = self.client.models.list()
+            models = await self.client.models.list()
             return len(models.data) > 0
         except Exception:
             return False
 
+    def _estimate_tokens(self, messages: list[ChatCompletionMessageParam]) -> int:
+        """Estimate prompt plus completion tokens for the rate limiter."""
+        chars = sum(len(str(message.get("content") or "")) for message in messages)
+        return chars // self.AVG_CHARS_PER_TOKEN + self.max_tokens
+
+    def _pause_for_rate_limit(self, error: openai.RateLimitError) -> None:
+        """Hold back other requests for as long as the API asked us to."""
+        retry_after = error.response.headers.get("retry-after")
+        try:
+            seconds = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            seconds = 0.0
+        if seconds > 0:
+            self.rate_limiter.pause(seconds)
+
+    async def _request_completion(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        temperature: float,
+        response_format: Optional[dict[str, Any]],
+    ) -> ChatCompletion:
+        """Send one chat completion request inside the rate limiter."""
+        kwargs: dict[str, Any] = {}
+        if response_format:
+            # Convert dict to ResponseFormat type
+            kwargs["response_format"] = cast(ResponseFormat, response_format)
+
+        limiter = self.rate_limiter
+        async with limiter.acquire(self._estimate_tokens(messages)) as reservation:
+            try:
+                response: ChatCompletion = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=temperature,
+                    **kwargs,
+                )
+            except openai.RateLimitError as e:
+                self._pause_for_rate_limit(e)
+                raise
+
+            if response.usage:
+                reservation.record_usage(response.usage.total_tokens)
+            return response
+
+    async def _create_completion(
+        self,
+        prompt: Optional[str],
+        messages: Optional[list[ChatCompletionMessageParam]],
+        response_format: Optional[dict[str, Any]],
+        temperature: Optional[float],
+    ) -> ChatCompletion:
+        """Create a completion, retrying rate limits and transient errors."""
+        # Use provided temperature or default
+        temp = temperature if temperature is not None else self.temperature
+
+        # Build messages list
+        if messages is None:
+            if prompt:
+                messages = [{"role": "user", "content": prompt}]
+            else:
+                raise ValueError("Either prompt or messages must be provided")
+
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(max(1, self.max_retries)),
+            wait=self.retry_wait,
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        ):
+            with attempt:
+                return await self._request_completion(messages, temp, response_format)
+        raise AssertionError("unreachable")  # pragma: no cover
+
     async def generate_completion(
         self,
         prompt: Optional[str] = None,
@@ -70,35 +211,9 @@ class OpenAIClient:
     ) -> str:
         """Generate completion from OpenAI."""
         try:
-            # Use provided temperature or default
-            temp = temperature if temperature is not None else self.temperature
-
-            # Build messages list
-            if messages is None:
-                if prompt:
-                    messages = [{"role": "user", "content": prompt}]
-                else:
-                    raise ValueError("Either prompt or messages must be provided")
-
-            # Create completion
-            if response_format:
-                # Convert dict to ResponseFormat type
-                formatted_response_format = cast(ResponseFormat, response_format)
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=self.max_tokens,
-                    temperature=temp,
-                    response_format=formatted_response_format,
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=self.max_tokens,
-                    temperature=temp,
-                )
-
+            response = await self._create_completion(
+                prompt, messages, response_format, temperature
+            )
             content = response.choices[0].message.content
             return cast(str, content) if content is not None else ""
         except Exception as e:
@@ -110,45 +225,46 @@ class OpenAIClient:
         messages: Optional[list[ChatCompletionMessageParam]] = None,
         response_format: Optional[dict[str, Any]] = None,
         temperature: Optional[float] = None,
+        use_cache: bool = True,
     ) -> tuple[str, dict[str, int]]:
         """Generate completion from OpenAI and return content with usage stats.
 
+        Args:
+            use_cache: Whether the response cache may answer this request
+
         Returns:
             Tuple of (content, usage_dict) where usage_dict contains:
             - prompt_tokens: Number of tokens in the prompt
             - completion_tokens: Number of tokens in the completion
             - total_tokens: Total tokens used
+            - cached: Set to 1 when served from the response cache
         """
-        try:
-            # Use provided temperature or default
-            temp = temperature if temperature is not None else self.temperature
-
-            # Build messages list
-            if messages is None:
-                if prompt:
-                    messages = [{"role": "user", "content": prompt}]
-                else:
-                    raise ValueError("Either prompt or messages must be provided")
-
-            # Create completion
-            if response_format:
-                # Convert dict to ResponseFormat type
-                formatted_response_format = cast(ResponseFormat, response_format)
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=self.max_tokens,
-                    temperature=temp,
-                    response_format=formatted_response_format,
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=self.max_tokens,
-                    temperature=temp,
-                )
+        cache = self.response_cache if use_cache else None
+        cache_key = None
+        if cache:
+            key_messages: list[Any] = (
+                list(messages) if messages else [{"role": "user", "content": prompt}]
+            )
+            cache_key = request_fingerprint(
+                self.model,
+                temperature if temperature is not None else self.temperature,
+                response_format,
+                key_messages,
+            )
+            cached = await cache.get(cache_key)
+            if cached:
+                logger.debug(f"AI response cache hit for {cache_key[:12]}")
+                return cached.content, {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                    "cached": 1,
+                }
 
+        try:
+            response = await self._create_completion(
+                prompt, messages, response_format, temperature
+            )
             content = response.choices[0].message.content or ""
 
             # Extract usage information
@@ -159,7 +275,21 @@ class OpenAIClient:
                 ),
                 "total_tokens": response.usage.total_tokens if response.usage else 0,
             }
-
-            return content, usage
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}") from e
+
+        if cache and cache_key and self._is_cacheable(content, response_format):
+            await cache.set(cache_key, self.model, content, usage)
+        return content, usage
+
+    @staticmethod
+    def _is_cacheable(content: str, response_format: Optional[dict[str, Any]]) -> bool:
+        """Only keep complete responses; JSON requests must have returned JSON."""
+        if not content:
+            return False
+        if response_format and response_format.get("type") == "json_object":
+            try:
+                json.loads(content)
+            except ValueError:
+                return False
+        return True
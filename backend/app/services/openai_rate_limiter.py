@@ -0,0 +1,147 @@
+"""Concurrency and rate limiting for OpenAI API requests."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60.0
+
+
+class RateLimitReservation:
+    """Tokens reserved for one request, corrected once real usage is known."""
+
+    def __init__(self, entry: List[float]):
+        self._entry = entry
+
+    @property
+    def tokens(self) -> int:
+        return int(self._entry[1])
+
+    def record_usage(self, total_tokens: int) -> None:
+        """Replace the estimated token count with what the API reported."""
+        if total_tokens > 0:
+            self._entry[1] = float(total_tokens)
+
+
+class OpenAIRateLimiter:
+    """Bound concurrent requests and requests/tokens per minute.
+
+    Requests and tokens are tracked over a sliding one-minute window. A
+    limit of 0 disables that check. Usage::
+
+        async with limiter.acquire(estimated_tokens) as reservation:
+            response = await client.chat.completions.create(...)
+            reservation.record_usage(response.usage.total_tokens)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._lock = asyncio.Lock()
+        # Each entry is [timestamp, tokens]; lists so usage can be corrected
+        self._window: Deque[List[float]] = deque()
+        self._paused_until = 0.0
+
+    @asynccontextmanager
+    async def acquire(self, tokens: int = 0) -> AsyncIterator[RateLimitReservation]:
+        """Wait for a concurrency slot and room in the per-minute budget."""
+        async with self._semaphore:
+            entry = await self._reserve(tokens)
+            yield RateLimitReservation(entry)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new requests, e.g. after the API answered with a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the current one-minute usage."""
+        self._prune(time.monotonic())
+        return {
+            "requests_last_minute": len(self._window),
+            "tokens_last_minute": int(sum(e[1] for e in self._window)),
+            "max_concurrent": self.max_concurrent,
+        }
+
+    async def _reserve(self, tokens: int) -> List[float]:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                delay = self._wait_time(now, tokens)
+                if delay <= 0:
+                    entry = [now, float(tokens)]
+                    self._window.append(entry)
+                    return entry
+                logger.debug(f"OpenAI rate limit reached, waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        self._prune(now)
+        if not self._window:
+            return 0.0
+
+        oldest_expiry = self._window[0][0] + WINDOW_SECONDS - now
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            return oldest_expiry
+
+        if self.tokens_per_minute:
+            used = sum(e[1] for e in self._window)
+            if used + tokens > self.tokens_per_minute:
+                return oldest_expiry
+        return 0.0
+
+    def _prune(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            self._window.popleft()
+
+
+_LimiterKey = Tuple[str, Optional[str]]
+_limiters: Dict[_LimiterKey, Tuple[OpenAIRateLimiter, asyncio.AbstractEventLoop]] = {}
+
+
+def get_rate_limiter(
+    api_key: str,
+    base_url: Optional[str] = None,
+    max_concurrent: int = 4,
+    requests_per_minute: int = 0,
+    tokens_per_minute: int = 0,
+) -> OpenAIRateLimiter:
+    """Get the limiter shared by every client using the same API account.
+
+    Limits apply per API key, so clients created by different jobs draw
+    from one budget instead of each assuming it has the whole quota.
+    """
+    key = (api_key, base_url)
+    loop = asyncio.get_running_loop()
+    existing = _limiters.get(key)
+    if existing is not None:
+        limiter, limiter_loop = existing
+        if (
+            limiter_loop is loop
+            and limiter.max_concurrent == max(1, max_concurrent)
+            and limiter.requests_per_minute == requests_per_minute
+            and limiter.tokens_per_minute == tokens_per_minute
+        ):
+            return limiter
+
+    limiter = OpenAIRateLimiter(
+        max_concurrent=max_concurrent,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+    )
+    _limiters[key] = (limiter, loop)
+    return limiter
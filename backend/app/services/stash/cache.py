@@ -21,21 +21,26 @@ class StashCache:
         self.default_ttl = default_ttl
         self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
         with self._lock:
             if key not in self._cache:
+                self.misses += 1
                 return None
 
             entry = self._cache[key]
             if time.time() > entry["expires_at"]:
                 # Entry expired, remove it
                 del self._cache[key]
+                self.misses += 1
                 return None
 
             # Move to end to maintain LRU order
             self._cache.move_to_end(key)
+            self.hits += 1
             return entry["value"]
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -71,6 +76,18 @@ class StashCache:
         with self._lock:
             return len(self._cache)
 
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
 
 class StashEntityCache:
     """Specialized cache for Stash entities (performers, tags, studios)."""
@@ -1,5 +1,7 @@
 """GraphQL query definitions for Stash API."""
 
+from functools import lru_cache
+
 # Scene fragment with all fields
 SCENE_FRAGMENT = """
 fragment SceneData on Scene {
@@ -209,6 +211,39 @@ query FindScenes($filter: FindFilterType, $scene_filter: SceneFilterType, $scene
     + SCENE_FRAGMENT
 )
 
+# Scene selection sets for projected findScenes queries, from cheapest to
+# most expensive. "count" selects no scenes at all.
+SCENE_PROJECTIONS = {
+    "count": "",
+    "ids": "scenes { id }",
+    "summary": "scenes { id title created_at updated_at }",
+    "full": "scenes { ...SceneData }",
+}
+
+FIND_SCENES_PROJECTION = """
+query FindScenesProjection($filter: FindFilterType, $scene_filter: SceneFilterType) {
+    findScenes(filter: $filter, scene_filter: $scene_filter) {
+        count
+        %s
+    }
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def scene_projection_query(projection: str) -> str:
+    """Build (once) the findScenes query for a projection in SCENE_PROJECTIONS"""
+    if projection not in SCENE_PROJECTIONS:
+        raise ValueError(
+            f"Unknown scene projection '{projection}', "
+            f"expected one of {sorted(SCENE_PROJECTIONS)}"
+        )
+    query = FIND_SCENES_PROJECTION % SCENE_PROJECTIONS[projection]
+    if projection == "full":
+        query += SCENE_FRAGMENT
+    return query
+
+
 # Get stats
 GET_STATS = """
 query Stats {
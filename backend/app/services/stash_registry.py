@@ -0,0 +1,276 @@
+"""Process-wide registry of shared Stash API services."""
+
+import asyncio
+import concurrent.futures
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from app.core.config import Settings
+from app.services.stash_service import StashService
+
+logger = logging.getLogger(__name__)
+
+RegistryKey = Tuple[str, Optional[str]]
+PendingClose = Union[asyncio.Task, concurrent.futures.Future]
+
+# Seconds a retired service must sit idle before its client is closed
+RETIRED_SERVICE_GRACE_SECONDS = 300.0
+
+
+@dataclass
+class _RegistryEntry:
+    """A shared StashService and the event loop its HTTP pool belongs to."""
+
+    service: StashService
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    timeout: int = 30
+    max_retries: int = 3
+    requests: int = field(default=0)
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class StashServiceRegistry:
+    """Hand out one StashService per (url, api_key) for the whole process.
+
+    Sharing the service means routes, jobs and daemons reuse a single
+    ``httpx`` connection pool and a single entity/scene cache instead of
+    paying connection setup and cold caches on every request or job.
+
+    Services handed out by the registry are owned by it: callers must not
+    ``close()`` them. The lifespan calls ``close_all()`` on shutdown.
+
+    Because the service is shared, its scene and entity caches span jobs and
+    requests. Callers that write to Stash or must see its current state pass
+    ``use_cache=False`` to the lookups they depend on.
+
+    Services replaced by ``reload()`` are closed once no request has been in
+    flight on them for ``retire_grace`` seconds.
+    """
+
+    def __init__(self, retire_grace: float = RETIRED_SERVICE_GRACE_SECONDS) -> None:
+        self.retire_grace = retire_grace
+        self._entries: Dict[RegistryKey, _RegistryEntry] = {}
+        self._retired: List[_RegistryEntry] = []
+        self._closing: Set[asyncio.Task] = set()
+        self._pending_closes: Set[PendingClose] = set()
+
+    @staticmethod
+    def _key(url: str, api_key: Optional[str]) -> RegistryKey:
+        return (url.rstrip("/"), api_key or None)
+
+    def get(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+    ) -> StashService:
+        """Return the shared service for a Stash server, creating it if needed."""
+        key = self._key(url, api_key)
+        loop = _current_loop()
+        entry = self._entries.get(key)
+
+        if entry is not None and not self._is_usable(entry, loop):
+            # The pool is bound to a closed client or another event loop
+            self._retire(self._entries.pop(key))
+            entry = None
+        elif entry is not None and (
+            entry.timeout != timeout or entry.max_retries != max_retries
+        ):
+            self._retire(self._entries.pop(key))
+            entry = None
+
+        if entry is None:
+            logger.info(f"Creating shared Stash service for {key[0]}")
+            entry = _RegistryEntry(
+                service=StashService(
+                    stash_url=url,
+                    api_key=api_key,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                ),
+                loop=loop,
+                timeout=timeout,
+                max_retries=max_retries,
+            )
+            self._entries[key] = entry
+
+        entry.requests += 1
+        return entry.service
+
+    def for_settings(self, settings: Settings) -> StashService:
+        """Return the shared service for the Stash server in ``settings``."""
+        return self.get(
+            settings.stash.url,
+            settings.stash.api_key,
+            timeout=settings.stash.timeout,
+            max_retries=settings.stash.max_retries,
+        )
+
+    async def reload(self, settings: Settings) -> StashService:
+        """Switch to the Stash server in ``settings`` after a settings change.
+
+        Services for other servers are retired rather than closed, so jobs
+        still holding them can finish; they are closed once they go idle.
+        """
+        keep = self._key(settings.stash.url, settings.stash.api_key)
+        for key in [k for k in self._entries if k != keep]:
+            logger.info(f"Retiring shared Stash service for {key[0]}")
+            self._retire(self._entries.pop(key))
+        return self.for_settings(settings)
+
+    async def close_all(self) -> None:
+        """Close every service owned by the registry.
+
+        Services bound to another running event loop are closed on that loop.
+        """
+        for pending in list(self._pending_closes):
+            pending.cancel()
+        self._pending_closes.clear()
+
+        entries = list(self._entries.values())
+        entries.extend(self._retired)
+        self._entries.clear()
+        self._retired = []
+
+        loop = _current_loop()
+        for entry in entries:
+            try:
+                if entry.loop is None or entry.loop is loop:
+                    await entry.service.close()
+                elif not entry.loop.is_closed():
+                    await asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(
+                            entry.service.close(), entry.loop
+                        )
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to close Stash service: {e}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get connection pool and cache statistics for each shared service."""
+        return [
+            {
+                "url": key[0],
+                "authenticated": key[1] is not None,
+                "requests": entry.requests,
+                "pool": self._pool_stats(entry.service),
+                "cache": entry.service._cache.stats(),
+            }
+            for key, entry in self._entries.items()
+        ]
+
+    def _retire(self, entry: _RegistryEntry) -> None:
+        """Stop handing out a service without leaking its client.
+
+        Services whose event loop is still alive may have in-flight users, so
+        they are closed on that loop once idle, or by ``close_all()`` if no
+        loop is running. A client bound to a closed loop can have no users
+        left and is closed right away.
+        """
+        if entry.service._client.is_closed:
+            return
+        if entry.loop is None or not entry.loop.is_closed():
+            self._retired.append(entry)
+            self._schedule_idle_close(entry)
+            return
+
+        loop = _current_loop()
+        if loop is None:
+            logger.warning("Dropping Stash service of a closed event loop unclosed")
+            return
+        task = loop.create_task(self._close_quietly(entry.service))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _schedule_idle_close(self, entry: _RegistryEntry) -> None:
+        loop = _current_loop()
+        pending: PendingClose
+        if entry.loop is None or entry.loop is loop:
+            if loop is None:
+                return
+            pending = loop.create_task(self._close_when_idle(entry))
+        else:
+            pending = asyncio.run_coroutine_threadsafe(
+                self._close_when_idle(entry), entry.loop
+            )
+        self._pending_closes.add(pending)
+        pending.add_done_callback(self._pending_closes.discard)
+
+    async def _close_when_idle(self, entry: _RegistryEntry) -> None:
+        service = entry.service
+        # Two idle checks in a row, so a job pausing between requests is kept
+        idle_checks = 0
+        while idle_checks < 2:
+            await asyncio.sleep(self.retire_grace / 2)
+            idle_checks = idle_checks + 1 if service.active_requests == 0 else 0
+
+        if entry in self._retired:
+            self._retired.remove(entry)
+        logger.info(f"Closing retired Stash service for {service.base_url}")
+        try:
+            await service.close()
+        except Exception as e:
+            logger.warning(f"Failed to close retired Stash service: {e}")
+
+    @staticmethod
+    async def _close_quietly(service: StashService) -> None:
+        try:
+            await service.close()
+        except Exception as e:
+            # Connections of a closed loop cannot always be shut down cleanly
+            logger.debug(f"Error closing Stash service of a closed event loop: {e}")
+
+    @staticmethod
+    def _is_usable(
+        entry: _RegistryEntry, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> bool:
+        if entry.service._client.is_closed:
+            return False
+        if entry.loop is not None and entry.loop.is_closed():
+            return False
+        return entry.loop is None or loop is None or entry.loop is loop
+
+    @staticmethod
+    def _pool_stats(service: StashService) -> Dict[str, Any]:
+        client = service._client
+        stats: Dict[str, Any] = {"closed": client.is_closed}
+
+        # httpx does not expose pool state publicly; read it defensively
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if pool is not None and connections is not None:
+            stats.update(
+                {
+                    "max_connections": getattr(pool, "_max_connections", None),
+                    "max_keepalive_connections": getattr(
+                        pool, "_max_keepalive_connections", None
+                    ),
+                    "connections": len(connections),
+                    "idle_connections": sum(1 for c in connections if c.is_idle()),
+                }
+            )
+        return stats
+
+
+stash_registry: Optional[StashServiceRegistry] = None
+
+
+def get_stash_registry() -> StashServiceRegistry:
+    """Get the process-wide Stash service registry."""
+    global stash_registry
+    if stash_registry is None:
+        stash_registry = StashServiceRegistry()
+    return stash_registry
+
+
+def get_shared_stash_service(settings: Settings) -> StashService:
+    """Get the shared StashService for the Stash server in ``settings``."""
+    return get_stash_registry().for_settings(settings)
@@ -1,8 +1,11 @@
 """Stash API service with GraphQL support."""
 
 import logging
+import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import httpx
 from tenacity import (
@@ -13,6 +16,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from app.core.metrics import STASH_GRAPHQL_DURATION, STASH_GRAPHQL_ERRORS
+
 from .stash import (
     StashAuthenticationError,
     StashCache,
@@ -27,6 +32,20 @@ from .stash import (
 
 logger = logging.getLogger(__name__)
 
+_OPERATION_PATTERN = re.compile(r"\b(?:query|mutation|subscription)\s+(\w+)")
+_FIRST_FIELD_PATTERN = re.compile(r"\{\s*(\w+)")
+
+
+@lru_cache(maxsize=256)
+def graphql_operation_name(query: str) -> str:
+    """Name of a GraphQL operation, for metrics labels.
+
+    Uses the declared operation name, or the first selected field of an
+    anonymous operation.
+    """
+    match = _OPERATION_PATTERN.search(query) or _FIRST_FIELD_PATTERN.search(query)
+    return match.group(1) if match else "anonymous"
+
 
 class StashService:
     """Service for interacting with Stash GraphQL API."""
@@ -64,6 +83,9 @@ class StashService:
         self._cache = StashCache(max_size=5000, default_ttl=300)
         self._entity_cache = StashEntityCache(self._cache)
 
+        # GraphQL requests currently waiting on the HTTP client
+        self.active_requests = 0
+
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers."""
         headers = {"Content-Type": "application/json", "Accept": "application/json"}
@@ -120,6 +142,24 @@ class StashService:
             StashAuthenticationError: Authentication failed
             StashGraphQLError: GraphQL query failed
         """
+        operation = graphql_operation_name(query)
+        start_time = time.perf_counter()
+        self.active_requests += 1
+        try:
+            return await self._post_graphql(query, variables, timeout)
+        except Exception as e:
+            STASH_GRAPHQL_ERRORS.labels(operation, type(e).__name__).inc()
+            raise
+        finally:
+            self.active_requests -= 1
+            STASH_GRAPHQL_DURATION.labels(operation).observe(
+                time.perf_counter() - start_time
+            )
+
+    async def _post_graphql(
+        self, query: str, variables: Optional[Dict], timeout: Optional[int]
+    ) -> Dict:
+        """Send one GraphQL request and unwrap its data or errors"""
         payload = {"query": query, "variables": variables or {}}
 
         # Debug logging for troubleshooting
@@ -190,6 +230,7 @@ class StashService:
         per_page: int = 100,
         filter: Optional[Dict] = None,
         sort: Optional[str] = None,
+        direction: str = "DESC",
     ) -> Tuple[List[Dict], int]:
         """
         Fetch scenes with pagination.
@@ -199,6 +240,7 @@ class StashService:
             per_page: Number of scenes per page
             filter: Optional filter criteria
             sort: Optional sort field
+            direction: Sort direction when sort is given
 
         Returns:
             Tuple of (scenes list, total count)
@@ -211,7 +253,7 @@ class StashService:
 
         if sort:
             find_filter["sort"] = sort
-            find_filter["direction"] = "DESC"
+            find_filter["direction"] = direction
 
         variables = {
             "filter": find_filter,
@@ -261,19 +303,130 @@ class StashService:
 
         return scenes, total_count
 
-    async def get_scene(self, scene_id: str) -> Optional[Dict]:
+    async def find_scenes_projected(
+        self,
+        projection: str = "ids",
+        filter: Optional[Dict] = None,
+        page: int = 1,
+        per_page: int = 100,
+        sort: Optional[str] = None,
+        direction: str = "DESC",
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch scenes with only the fields of a projection.
+
+        Args:
+            projection: One of ``count``, ``ids``, ``summary`` or ``full``
+                (see ``queries.SCENE_PROJECTIONS``)
+            filter: Optional scene filter criteria
+            page: Page number (1-based)
+            per_page: Number of scenes per page
+            sort: Optional sort field
+            direction: Sort direction when sort is given
+
+        Returns:
+            Tuple of (scenes list, total count). Scenes are transformed only for
+            the ``full`` projection and always empty for ``count``.
+        """
+        find_filter: Dict[str, Union[int, str]] = {"page": page, "per_page": per_page}
+        if sort:
+            find_filter["sort"] = sort
+            find_filter["direction"] = direction
+
+        result = await self.execute_graphql(
+            queries.scene_projection_query(projection),
+            {"filter": find_filter, "scene_filter": filter or {}},
+        )
+        scenes_data = result.get("findScenes", {})
+        scenes = scenes_data.get("scenes") or []
+        if projection == "full":
+            scenes = [transformers.transform_scene(s) for s in scenes]
+
+        return scenes, scenes_data.get("count", 0)
+
+    async def count_scenes(self, filter: Optional[Dict] = None) -> int:
+        """
+        Count scenes matching a filter without fetching any scene data.
+
+        Args:
+            filter: Optional scene filter criteria
+
+        Returns:
+            Number of matching scenes
+        """
+        _, count = await self.find_scenes_projected("count", filter=filter, per_page=1)
+        return count
+
+    async def iter_scenes(
+        self,
+        filter: Optional[Dict] = None,
+        fields: str = "full",
+        page_size: int = 100,
+        after_id: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all matching scenes in ID order, one page at a time.
+
+        Pages are fetched with a keyset cursor (``id > last seen id``) instead
+        of page offsets, so deep pages cost the same as the first one and
+        scenes added or removed mid-iteration do not shift later pages.
+
+        Args:
+            filter: Optional scene filter criteria
+            fields: Scene projection to fetch (``ids``, ``summary`` or
+                ``full``). Full scenes are transformed as from get_scenes.
+            page_size: Number of scenes per page
+            after_id: Only return scenes with a higher ID, to continue an
+                earlier iteration
+
+        Yields:
+            Lists of scenes, in ascending ID order
+        """
+        last_id: Optional[int] = after_id
+        while True:
+            scene_filter = dict(filter or {})
+            if last_id is not None:
+                scene_filter["id"] = {"value": last_id, "modifier": "GREATER_THAN"}
+
+            if fields == "full":
+                scenes, _ = await self.get_scenes(
+                    page=1,
+                    per_page=page_size,
+                    filter=scene_filter,
+                    sort="id",
+                    direction="ASC",
+                )
+            else:
+                scenes, _ = await self.find_scenes_projected(
+                    fields,
+                    filter=scene_filter,
+                    per_page=page_size,
+                    sort="id",
+                    direction="ASC",
+                )
+
+            if not scenes:
+                return
+            yield scenes
+            if len(scenes) < page_size:
+                return
+            last_id = int(scenes[-1]["id"])
+
+    async def get_scene(self, scene_id: str, use_cache: bool = True) -> Optional[Dict]:
         """
         Get single scene by ID.
 
         Args:
             scene_id: Stash scene ID
+            use_cache: Serve a recently fetched scene from the cache; pass
+                False when the current state in Stash is needed
 
         Returns:
             Scene data or None if not found
         """
         # Check cache first
         cache_key = f"scene:{scene_id}"
-        cached = self._cache.get(cache_key)
+        cached = self._cache.get(cache_key) if use_cache else None
         if cached:
             return cached  # type: ignore[no-any-return]
 
@@ -293,6 +446,46 @@ class StashService:
 
         return scene
 
+    async def get_scenes_by_ids(
+        self, scene_ids: List[str], batch_size: int = 100, use_cache: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        Get several scenes by ID with one findScenes request per batch.
+
+        Args:
+            scene_ids: Stash scene IDs
+            batch_size: Maximum scene IDs per request
+            use_cache: Serve recently fetched scenes from the cache; pass
+                False to check that the scenes still exist
+
+        Returns:
+            Scenes keyed by ID; IDs that no longer exist in Stash are absent
+        """
+        scenes: Dict[str, Dict] = {}
+        missing = []
+        for scene_id in dict.fromkeys(str(i) for i in scene_ids):
+            cached = self._cache.get(f"scene:{scene_id}") if use_cache else None
+            if cached:
+                scenes[scene_id] = cached
+            else:
+                missing.append(scene_id)
+
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start : start + batch_size]
+            result = await self.execute_graphql(
+                queries.FIND_SCENES,
+                {
+                    "filter": {"per_page": len(chunk)},
+                    "scene_ids": [int(scene_id) for scene_id in chunk],
+                },
+            )
+            for raw_scene in result.get("findScenes", {}).get("scenes", []):
+                scene = transformers.transform_scene(raw_scene)
+                scenes[str(scene["id"])] = scene
+                self._cache.set(f"scene:{scene['id']}", scene, ttl=600)
+
+        return scenes
+
     async def get_scene_raw(self, scene_id: str) -> Optional[Dict[str, Any]]:
         """
         Get single scene by ID without transformation.
@@ -433,6 +626,43 @@ class StashService:
             transformers.transform_scene(s) for s in result.get("bulkSceneUpdate", [])
         ]
 
+    async def bulk_add_scene_relations(
+        self,
+        scene_ids: List[str],
+        tag_ids: Optional[List[str]] = None,
+        performer_ids: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Add the same tags and/or performers to many scenes in one mutation.
+
+        Uses bulkSceneUpdate in ADD mode, so existing relations are kept.
+
+        Args:
+            scene_ids: Stash scene IDs to update
+            tag_ids: Tag IDs to add to every scene
+            performer_ids: Performer IDs to add to every scene
+
+        Returns:
+            List of updated scenes
+        """
+        bulk_input: Dict[str, Any] = {"ids": scene_ids}
+        if tag_ids:
+            bulk_input["tag_ids"] = {"ids": tag_ids, "mode": "ADD"}
+        if performer_ids:
+            bulk_input["performer_ids"] = {"ids": performer_ids, "mode": "ADD"}
+
+        result = await self.execute_graphql(
+            mutations.BULK_UPDATE_SCENES, {"input": bulk_input}
+        )
+
+        # Invalidate cache for updated scenes
+        for scene_id in scene_ids:
+            self._cache.delete(f"scene:{scene_id}")
+
+        return [
+            transformers.transform_scene(s) for s in result.get("bulkSceneUpdate", [])
+        ]
+
     async def batch_update_scenes(
         self, scene_ids: List[str], update_data: Dict[str, Any]
     ) -> List[Dict]:
@@ -451,10 +681,10 @@ class StashService:
 
     # Entity Operations - Performers
 
-    async def get_all_performers(self) -> List[Dict]:
-        """Fetch all performers."""
+    async def get_all_performers(self, use_cache: bool = True) -> List[Dict]:
+        """Fetch all performers; pass use_cache=False to diff against Stash."""
         # Check cache first
-        cached = self._entity_cache.get_performers()
+        cached = self._entity_cache.get_performers() if use_cache else None
         if cached:
             logger.debug(f"Returning {len(cached)} cached performers")
             return cached
@@ -502,10 +732,10 @@ class StashService:
 
         return transformers.transform_performer(result.get("performerCreate", {}))
 
-    async def find_performer(self, name: str) -> Optional[Dict]:
-        """Find performer by name."""
+    async def find_performer(self, name: str, use_cache: bool = True) -> Optional[Dict]:
+        """Find performer by name; pass use_cache=False before writing its ID."""
         # Check cache first
-        cached = self._entity_cache.get_performer_by_name(name)
+        cached = self._entity_cache.get_performer_by_name(name) if use_cache else None
         if cached:
             return cached
 
@@ -555,10 +785,10 @@ class StashService:
 
     # Entity Operations - Tags
 
-    async def get_all_tags(self) -> List[Dict]:
-        """Fetch all tags."""
+    async def get_all_tags(self, use_cache: bool = True) -> List[Dict]:
+        """Fetch all tags; pass use_cache=False to diff against Stash."""
         # Check cache first
-        cached = self._entity_cache.get_tags()
+        cached = self._entity_cache.get_tags() if use_cache else None
         if cached:
             logger.debug(f"Returning {len(cached)} cached tags")
             return cached
@@ -604,10 +834,10 @@ class StashService:
 
         return transformers.transform_tag(result.get("tagCreate", {}))
 
-    async def find_tag(self, name: str) -> Optional[Dict]:
-        """Find tag by name."""
+    async def find_tag(self, name: str, use_cache: bool = True) -> Optional[Dict]:
+        """Find tag by name; pass use_cache=False before writing its ID."""
         # Check cache first
-        cached = self._entity_cache.get_tag_by_name(name)
+        cached = self._entity_cache.get_tag_by_name(name) if use_cache else None
         if cached:
             return cached
 
@@ -675,7 +905,7 @@ class StashService:
                 return str(local_tag.id)
 
         # If not found locally, check Stash
-        existing_tag = await self.find_tag(name)
+        existing_tag = await self.find_tag(name, use_cache=False)
         if existing_tag:
             tag_id = existing_tag.get("id")
 
@@ -708,10 +938,10 @@ class StashService:
 
     # Entity Operations - Studios
 
-    async def get_all_studios(self) -> List[Dict]:
-        """Fetch all studios."""
+    async def get_all_studios(self, use_cache: bool = True) -> List[Dict]:
+        """Fetch all studios; pass use_cache=False to diff against Stash."""
         # Check cache first
-        cached = self._entity_cache.get_studios()
+        cached = self._entity_cache.get_studios() if use_cache else None
         if cached:
             logger.debug(f"Returning {len(cached)} cached studios")
             return cached
@@ -759,10 +989,10 @@ class StashService:
 
         return transformers.transform_studio(result.get("studioCreate", {}))
 
-    async def find_studio(self, name: str) -> Optional[Dict]:
-        """Find studio by name."""
+    async def find_studio(self, name: str, use_cache: bool = True) -> Optional[Dict]:
+        """Find studio by name; pass use_cache=False before writing its ID."""
         # Check cache first
-        cached = self._entity_cache.get_studio_by_name(name)
+        cached = self._entity_cache.get_studio_by_name(name) if use_cache else None
         if cached:
             return cached
 
@@ -0,0 +1,123 @@
+"""Resume points for full scene syncs."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, MutableSet, Optional
+
+from .models import SyncResult
+from .scene_ids import SceneIdSet, _as_number
+
+# SyncResult counters restored when a sync resumes
+_RESULT_COUNTERS = (
+    "processed_items",
+    "created_items",
+    "updated_items",
+    "skipped_items",
+    "failed_items",
+)
+_STATS_COUNTERS = (
+    "scenes_processed",
+    "scenes_created",
+    "scenes_updated",
+    "scenes_skipped",
+    "scenes_failed",
+)
+
+
+@dataclass
+class SceneSyncCheckpoint:
+    """Progress of a full scene sync, saved after every page.
+
+    Stash returns scenes in ascending ID order, so ``scene_cursor`` (the last
+    scene ID of the last finished page) is enough to continue fetching. The
+    IDs synced so far are kept for orphan detection at the end of the sync,
+    stored as ``[first, last]`` runs of consecutive IDs: a library of
+    150,000 scenes with few deletions fits in a handful of runs. Runs are
+    extended page by page, so saving does not re-sort the whole set.
+    """
+
+    scene_cursor: Optional[int] = None
+    sync_history_id: Optional[int] = None
+    synced_ranges: List[List[int]] = field(default_factory=list)
+    other_ids: List[str] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(
+        cls, data: Optional[Dict[str, Any]]
+    ) -> Optional["SceneSyncCheckpoint"]:
+        """Load a checkpoint saved by ``to_dict``; None if it is not one."""
+        if not data or data.get("stage") != "scenes":
+            return None
+        return cls(
+            scene_cursor=data.get("scene_cursor"),
+            sync_history_id=data.get("sync_history_id"),
+            synced_ranges=[list(run) for run in data.get("synced_ranges", [])],
+            other_ids=list(data.get("other_ids", [])),
+            counters=dict(data.get("counters", {})),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return {
+            "stage": "scenes",
+            "scene_cursor": self.scene_cursor,
+            "sync_history_id": self.sync_history_id,
+            "synced_ranges": self.synced_ranges,
+            "other_ids": self.other_ids,
+            "counters": self.counters,
+        }
+
+    def synced_scene_ids(self) -> SceneIdSet:
+        """Expand the stored runs back into scene IDs"""
+        ids = SceneIdSet()
+        self.restore_ids(ids)
+        return ids
+
+    def restore_ids(self, synced_scene_ids: MutableSet[str]) -> None:
+        """Add the scene IDs synced before the interruption"""
+        for first, last in self.synced_ranges:
+            if isinstance(synced_scene_ids, SceneIdSet):
+                synced_scene_ids.add_range(first, last)
+            else:
+                for number in range(first, last + 1):
+                    synced_scene_ids.add(str(number))
+        for scene_id in self.other_ids:
+            synced_scene_ids.add(scene_id)
+
+    def restore(self, result: SyncResult) -> None:
+        """Carry the interrupted sync's counters over to ``result``"""
+        for name in _RESULT_COUNTERS:
+            setattr(result, name, self.counters.get(name, 0))
+        for name in _STATS_COUNTERS:
+            setattr(result.stats, name, self.counters.get(name, 0))
+
+    def advance(
+        self,
+        page_ids: Iterable[str],
+        synced_scene_ids: MutableSet[str],
+        result: SyncResult,
+    ) -> None:
+        """Record a finished page of scenes"""
+        numeric: List[int] = []
+        for scene_id in page_ids:
+            number = _as_number(scene_id)
+            if number is not None:
+                self.scene_cursor = max(self.scene_cursor or 0, number)
+            if scene_id not in synced_scene_ids:
+                continue
+            if number is not None:
+                numeric.append(number)
+            else:
+                self.other_ids.append(scene_id)
+
+        for number in sorted(numeric):
+            if self.synced_ranges and number <= self.synced_ranges[-1][1] + 1:
+                last = self.synced_ranges[-1]
+                last[1] = max(last[1], number)
+            else:
+                self.synced_ranges.append([number, number])
+
+        self.counters = {name: getattr(result, name) for name in _RESULT_COUNTERS}
+        self.counters.update(
+            {name: getattr(result.stats, name) for name in _STATS_COUNTERS}
+        )
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import Performer, Studio, Tag
+from app.services.entity_index import get_entity_index
 from app.services.stash_service import StashService
 
 from .strategies import SyncStrategy
@@ -23,6 +24,11 @@ class EntitySyncHandler:
         self.stash_service = stash_service
         self.strategy = strategy
 
+    def _report_changes(self, kind: str, stats: Dict[str, int]) -> None:
+        """Tell the entity index that a sync wrote entities of this type."""
+        if stats["created"] or stats["updated"]:
+            get_entity_index().mark_changed(kind)
+
     async def sync_performers(
         self,
         stash_performers: List[Dict[str, Any]],
@@ -48,6 +54,7 @@ class EntitySyncHandler:
                 )
                 stats["failed"] += 1
 
+        self._report_changes("performers", stats)
         return stats
 
     async def sync_performers_incremental(
@@ -83,6 +90,7 @@ class EntitySyncHandler:
                 logger.error(f"Failed to sync tag {tag_data.get('id')}: {str(e)}")
                 stats["failed"] += 1
 
+        self._report_changes("tags", stats)
         return stats
 
     async def sync_tags_incremental(
@@ -118,6 +126,7 @@ class EntitySyncHandler:
                 logger.error(f"Failed to sync studio {studio_data.get('id')}: {str(e)}")
                 stats["failed"] += 1
 
+        self._report_changes("studios", stats)
         return stats
 
     async def sync_studios_incremental(
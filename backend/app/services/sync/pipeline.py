@@ -0,0 +1,127 @@
+"""Pipelined scene page fetching for the batch sync engine."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineTimings:
+    """Per-stage timing for a pipelined scene sync.
+
+    ``fetch_seconds`` is time spent inside Stash requests, which overlaps with
+    the write stages. ``fetch_wait_seconds`` is the time the writer sat idle
+    waiting for the next page; when it stays near zero, the pipeline is
+    bound by the database and a deeper pipeline will not help.
+    """
+
+    pipeline_depth: int = 0
+    pages: int = 0
+    scenes: int = 0
+    fetch_seconds: float = 0.0
+    fetch_wait_seconds: float = 0.0
+    apply_seconds: float = 0.0
+    commit_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return {
+            "pipeline_depth": self.pipeline_depth,
+            "pages": self.pages,
+            "scenes": self.scenes,
+            "fetch_seconds": round(self.fetch_seconds, 3),
+            "fetch_wait_seconds": round(self.fetch_wait_seconds, 3),
+            "apply_seconds": round(self.apply_seconds, 3),
+            "commit_seconds": round(self.commit_seconds, 3),
+        }
+
+
+class ScenePagePrefetcher:
+    """Fetch scene pages from Stash ahead of the consumer.
+
+    A producer task keeps up to ``depth`` pages buffered while the consumer
+    writes the current page, so Stash round-trips overlap with database work.
+    The producer only talks to Stash and never touches a database session.
+
+    Usage::
+
+        async with ScenePagePrefetcher(
+            stash_service.iter_scenes(page_size=100), depth
+        ) as pages:
+            async for page_number, scenes in pages:
+                ...
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        pages: AsyncIterator[List[Dict[str, Any]]],
+        depth: int,
+        timings: Optional[PipelineTimings] = None,
+    ):
+        if depth < 1:
+            raise ValueError("Pipeline depth must be at least 1")
+        self.pages = pages
+        self.depth = depth
+        self.timings = timings or PipelineTimings(pipeline_depth=depth)
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=depth)
+        self._producer: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "ScenePagePrefetcher":
+        self._producer = asyncio.create_task(self._produce())
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._producer and not self._producer.done():
+            self._producer.cancel()
+            try:
+                await self._producer
+            except asyncio.CancelledError:
+                pass
+
+        # Release the underlying Stash page iterator
+        aclose = getattr(self.pages, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def __aiter__(self) -> "ScenePagePrefetcher":
+        return self
+
+    async def __anext__(self) -> Tuple[int, List[Dict[str, Any]]]:
+        wait_start = time.perf_counter()
+        item = await self._queue.get()
+        self.timings.fetch_wait_seconds += time.perf_counter() - wait_start
+
+        if item is self._DONE:
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            raise item
+        return item  # type: ignore[no-any-return]
+
+    async def _produce(self) -> None:
+        """Fetch pages until Stash runs out of scenes"""
+        page = 0
+        try:
+            while True:
+                fetch_start = time.perf_counter()
+                try:
+                    scenes = await self.pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                self.timings.fetch_seconds += time.perf_counter() - fetch_start
+                page += 1
+                logger.debug(f"Prefetched page {page} ({len(scenes)} scenes)")
+                await self._queue.put((page, scenes))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Scene page prefetch failed on page {page + 1}: {e}")
+            await self._queue.put(e)
+            return
+
+        await self._queue.put(self._DONE)
@@ -2,14 +2,14 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Union
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
 from app.models import Performer, Scene, SceneFile, SceneMarker, Studio, Tag
 from app.services.stash_service import StashService
 
-from .strategies import SyncStrategy
+from .strategies import SyncStrategy, calculate_scene_digest
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +126,8 @@ class SceneSyncHandler:
             logger.error(f"Scene object is None after merge for scene_id {scene_id}")
             raise ValueError(f"Failed to sync scene {scene_id}")
 
+        # Record the digest used by the unchanged-scene fast path
+        scene.content_checksum = calculate_scene_digest(stash_scene)  # type: ignore[assignment]
         return scene
 
     async def _sync_relationships_with_logging(
@@ -162,13 +164,24 @@ class SceneSyncHandler:
         logger.debug(f"Scene {scene_id} flushed to database successfully")
 
     async def sync_scene_batch(
-        self, stash_scenes: List[Dict[str, Any]], db: Union[Session, AsyncSession]
+        self,
+        stash_scenes: List[Dict[str, Any]],
+        db: Union[Session, AsyncSession],
+        existing_scenes: Optional[Dict[str, Scene]] = None,
     ) -> List[Scene]:
-        """Efficiently sync multiple scenes"""
+        """Efficiently sync multiple scenes
+
+        Args:
+            stash_scenes: Scene data from Stash
+            db: Database session
+            existing_scenes: Optional pre-fetched map of scene ID to Scene. When
+                omitted, existing scenes are fetched with a single query.
+        """
         synced_scenes: List[Scene] = []
 
         # Pre-fetch existing scenes
-        existing_scenes = await self._fetch_existing_scenes(stash_scenes, db)
+        if existing_scenes is None:
+            existing_scenes = await self._fetch_existing_scenes(stash_scenes, db)
 
         # Collect and pre-fetch all related entities
         entity_maps = await self._prefetch_all_entities(stash_scenes, db)
@@ -199,30 +212,135 @@ class SceneSyncHandler:
             scenes = result.scalars().all()
         return {str(s.id): s for s in scenes}
 
+    async def find_unchanged_scenes(
+        self, stash_scenes: List[Dict[str, Any]], db: Union[Session, AsyncSession]
+    ) -> Set[str]:
+        """Return IDs of scenes whose stored digest matches the Stash payload.
+
+        All stored checksums for the page are read with a single SELECT, without
+        loading Scene objects or their relationships.
+        """
+        digests = {
+            str(s["id"]): calculate_scene_digest(s) for s in stash_scenes if s.get("id")
+        }
+        if not digests:
+            return set()
+
+        stmt = select(Scene.id, Scene.content_checksum).where(
+            Scene.id.in_(list(digests))
+        )
+        if isinstance(db, AsyncSession):
+            result = await db.execute(stmt)
+        else:
+            result = db.execute(stmt)
+
+        return {
+            str(scene_id)
+            for scene_id, checksum in result.all()
+            if checksum and checksum == digests.get(str(scene_id))
+        }
+
+    async def mark_unchanged_scenes_synced(
+        self,
+        stash_scenes: List[Dict[str, Any]],
+        scene_ids: Set[str],
+        db: Union[Session, AsyncSession],
+    ) -> None:
+        """Refresh last_synced and stash_updated_at of unchanged scenes.
+
+        Written with one bulk UPDATE in the caller's transaction, so later
+        incremental syncs compare against current Stash timestamps.
+        """
+        now = datetime.utcnow()
+        rows = []
+        for stash_scene in stash_scenes:
+            scene_id = str(stash_scene.get("id") or "")
+            if scene_id not in scene_ids:
+                continue
+            row: Dict[str, Any] = {"id": scene_id, "last_synced": now}
+            updated_at = self._parse_datetime(stash_scene.get("updated_at"))
+            if updated_at:
+                row["stash_updated_at"] = updated_at
+            rows.append(row)
+        if not rows:
+            return
+
+        if isinstance(db, AsyncSession):
+            await db.execute(update(Scene), rows)
+        else:
+            db.execute(update(Scene), rows)
+
     async def _prefetch_all_entities(
         self, stash_scenes: List[Dict[str, Any]], db: Union[Session, AsyncSession]
     ) -> Dict[str, Dict[str, Any]]:
         """Collect and pre-fetch all related entities"""
-        # Collect all entity IDs
-        all_performer_ids: Set[str] = set()
-        all_tag_ids: Set[str] = set()
-        all_studio_ids: Set[str] = set()
+        # Collect all entity IDs along with their Stash data
+        all_performers: Dict[str, Dict[str, Any]] = {}
+        all_tags: Dict[str, Dict[str, Any]] = {}
+        all_studios: Dict[str, Dict[str, Any]] = {}
 
         for scene_data in stash_scenes:
-            all_performer_ids.update(p["id"] for p in scene_data.get("performers", []))
-            all_tag_ids.update(t["id"] for t in scene_data.get("tags", []))
-            if scene_data.get("studio", {}).get("id"):
-                all_studio_ids.add(scene_data["studio"]["id"])
+            all_performers.update(
+                (p["id"], p) for p in scene_data.get("performers", []) if p.get("id")
+            )
+            all_tags.update(
+                (t["id"], t) for t in scene_data.get("tags", []) if t.get("id")
+            )
+            for marker_data in scene_data.get("scene_markers", []):
+                marker_tags = [marker_data.get("primary_tag") or {}]
+                marker_tags.extend(marker_data.get("tags", []))
+                all_tags.update((t["id"], t) for t in marker_tags if t.get("id"))
+            studio_data = scene_data.get("studio") or {}
+            if studio_data.get("id"):
+                all_studios[studio_data["id"]] = studio_data
 
         # Pre-fetch all entities
-        performers_map = await self._fetch_entities_map(
-            db, Performer, all_performer_ids
+        performers_map = dict(
+            await self._fetch_entities_map(db, Performer, set(all_performers))
+        )
+        tags_map = dict(await self._fetch_entities_map(db, Tag, set(all_tags)))
+        studios_map = dict(await self._fetch_entities_map(db, Studio, set(all_studios)))
+
+        # Create minimal entities for anything not synced yet, matching the
+        # per-scene path - full sync will happen in entity sync
+        created = self._add_missing_entities(
+            db, Performer, performers_map, all_performers, "Unknown Performer"
         )
-        tags_map = await self._fetch_entities_map(db, Tag, all_tag_ids)
-        studios_map = await self._fetch_entities_map(db, Studio, all_studio_ids)
+        created += self._add_missing_entities(
+            db, Tag, tags_map, all_tags, "Unknown Tag"
+        )
+        created += self._add_missing_entities(
+            db, Studio, studios_map, all_studios, "Unknown Studio"
+        )
+        if created:
+            # Flush so marker tag lookups see the new rows
+            await self._flush_database(db)
 
         return {"performers": performers_map, "tags": tags_map, "studios": studios_map}
 
+    def _add_missing_entities(
+        self,
+        db: Union[Session, AsyncSession],
+        model_class: type,
+        entity_map: Dict[str, Any],
+        entity_data: Dict[str, Dict[str, Any]],
+        default_name: str,
+    ) -> int:
+        """Create minimal entities for IDs missing from a pre-fetched map"""
+        created = 0
+        for entity_id, data in entity_data.items():
+            if entity_id in entity_map:
+                continue
+            entity = model_class(
+                id=entity_id,
+                name=data.get("name") or default_name,
+                last_synced=datetime.utcnow(),
+            )
+            db.add(entity)
+            entity_map[entity_id] = entity
+            created += 1
+        return created
+
     async def _process_batch_scene(
         self,
         scene_data: Dict[str, Any],
@@ -252,6 +370,10 @@ class SceneSyncHandler:
                 logger.error(f"Failed to merge scene data for {scene_id}")
                 return None
 
+            # Set before relationship sync, which may flush the new scene
+            scene.last_synced = datetime.utcnow()  # type: ignore[assignment]
+            scene.content_checksum = calculate_scene_digest(scene_data)  # type: ignore[assignment]
+
             # Sync relationships using pre-fetched entities
             await self._sync_scene_relationships_batch(
                 scene,
@@ -262,7 +384,6 @@ class SceneSyncHandler:
                 entity_maps["studios"],
             )
 
-            scene.last_synced = datetime.utcnow()  # type: ignore[assignment]
             return scene
 
         except Exception as e:
@@ -323,6 +444,9 @@ class SceneSyncHandler:
             if studio:
                 scene.studio = studio
                 scene.studio_id = studio.id
+        else:
+            scene.studio = None
+            scene.studio_id = None  # type: ignore[assignment]
 
         # Sync performers
         scene.performers.clear()
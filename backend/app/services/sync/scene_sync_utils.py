@@ -41,7 +41,9 @@ class SceneSyncUtils:
         for scene_id in scene_ids:
             try:
                 # Fetch scene data from Stash
-                stash_scene = await self.stash_service.get_scene(scene_id)
+                stash_scene = await self.stash_service.get_scene(
+                    scene_id, use_cache=False
+                )
                 if not stash_scene:
                     logger.warning(f"Scene {scene_id} not found in Stash")
                     continue
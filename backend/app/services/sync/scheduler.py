@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import Job, JobStatus, JobType, ScheduledTask
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 
 from .sync_service import SyncService
 
@@ -209,9 +209,7 @@ class SyncScheduler:
 
                 # Run sync
                 settings = get_settings()
-                stash_service = StashService(
-                    stash_url=settings.stash.url, api_key=settings.stash.api_key
-                )
+                stash_service = get_shared_stash_service(settings)
                 sync_service = SyncService(stash_service, db)
 
                 result = await sync_service.sync_all(job_id=job_id, force=force)
@@ -258,9 +256,7 @@ class SyncScheduler:
 
                 # Run sync
                 settings = get_settings()
-                stash_service = StashService(
-                    stash_url=settings.stash.url, api_key=settings.stash.api_key
-                )
+                stash_service = get_shared_stash_service(settings)
                 sync_service = SyncService(stash_service, db)
 
                 # Run incremental sync for all entities
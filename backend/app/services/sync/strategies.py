@@ -2,10 +2,97 @@ import hashlib
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from app.models import Performer, Scene, Studio, Tag
 
+# Scene fields that are compared as-is when computing the content digest
+SCENE_DIGEST_FIELDS = (
+    "title",
+    "details",
+    "url",
+    "urls",
+    "date",
+    "rating",
+    "rating100",
+    "organized",
+    "paths",
+)
+
+# File fields that identify the file contents Stashhog stores
+FILE_DIGEST_FIELDS = (
+    "id",
+    "path",
+    "size",
+    "mod_time",
+    "format",
+    "duration",
+    "video_codec",
+    "audio_codec",
+    "width",
+    "height",
+    "frame_rate",
+    "bit_rate",
+)
+
+
+def _ids(items: Optional[List[Dict[str, Any]]]) -> List[str]:
+    return sorted(str(item["id"]) for item in items or [] if item and item.get("id"))
+
+
+def _normalize_file(file_data: Dict[str, Any]) -> Dict[str, Any]:
+    normalized = {k: file_data.get(k) for k in FILE_DIGEST_FIELDS}
+    normalized["fingerprints"] = sorted(
+        (str(fp.get("type")), str(fp.get("value")))
+        for fp in file_data.get("fingerprints") or []
+    )
+    return normalized
+
+
+def _normalize_marker(marker_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": marker_data.get("id"),
+        "title": marker_data.get("title"),
+        "seconds": marker_data.get("seconds"),
+        "end_seconds": marker_data.get("end_seconds"),
+        "primary_tag": (marker_data.get("primary_tag") or {}).get("id"),
+        "tags": _ids(marker_data.get("tags")),
+    }
+
+
+def calculate_scene_digest(data: Dict[str, Any]) -> str:
+    """Calculate a stable digest of the scene content Stashhog stores.
+
+    Relationships are reduced to their IDs and files to their properties and
+    fingerprints, so the digest only changes when a sync would change the
+    local scene. Stash timestamps are left out on purpose.
+    """
+    payload: Dict[str, Any] = {
+        k: data[k] for k in SCENE_DIGEST_FIELDS if data.get(k) is not None
+    }
+
+    studio = data.get("studio")
+    if studio and studio.get("id"):
+        payload["studio"] = str(studio["id"])
+    if data.get("performers"):
+        payload["performers"] = _ids(data["performers"])
+    if data.get("tags"):
+        payload["tags"] = _ids(data["tags"])
+    if data.get("scene_markers"):
+        payload["markers"] = sorted(
+            (_normalize_marker(m) for m in data["scene_markers"]),
+            key=lambda m: str(m["id"]),
+        )
+
+    files = data.get("files") or ([data["file"]] if data.get("file") else [])
+    if files:
+        payload["files"] = sorted(
+            (_normalize_file(f) for f in files), key=lambda f: str(f["id"])
+        )
+
+    json_str = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(json_str.encode()).hexdigest()
+
 
 class SyncStrategy(ABC):
     """Base class for sync strategies"""
@@ -246,26 +333,4 @@ class SmartSyncStrategy(SyncStrategy):
 
     def _calculate_checksum(self, data: Dict[str, Any]) -> str:
         """Calculate a checksum for the important fields of an entity"""
-        # Select fields that matter for comparison
-        important_fields = {
-            "title",
-            "details",
-            "url",
-            "date",
-            "rating",
-            "organized",
-            "file",
-            "performers",
-            "tags",
-            "studio",
-        }
-
-        checksum_data = {
-            k: v for k, v in data.items() if k in important_fields and v is not None
-        }
-
-        # Convert to stable JSON string
-        json_str = json.dumps(checksum_data, sort_keys=True, default=str)
-
-        # Calculate SHA256 hash
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        return calculate_scene_digest(data)
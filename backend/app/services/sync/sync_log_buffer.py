@@ -0,0 +1,72 @@
+"""Buffered writer for per-entity sync log rows."""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+
+from app.models import SyncLog
+
+logger = logging.getLogger(__name__)
+
+
+class SyncLogBuffer:
+    """Collect SyncLog rows in memory and write them in bulk.
+
+    Rows are flushed with a single multi-row INSERT once ``max_rows`` are
+    buffered or ``flush_interval`` seconds have passed since the last flush.
+    Callers must call ``flush()`` when the sync finishes.
+
+    IMPORTANT: Each flush uses its own database session, like
+    ``SyncService._create_sync_log`` did, to prevent greenlet errors.
+    See: /plans/greenlet_error.md and /plans/greenlet_error2.md
+    """
+
+    def __init__(self, max_rows: int = 500, flush_interval: float = 5.0):
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self._rows: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    async def add(self, **values: Any) -> None:
+        """Buffer one sync log row, flushing if a threshold is reached"""
+        # Stamp the row now so created_at reflects when the entity was synced,
+        # not when the batch happened to be written
+        values.setdefault("created_at", datetime.now(timezone.utc))
+        self._rows.append(values)
+
+        if (
+            len(self._rows) >= self.max_rows
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write all buffered rows and return how many were written"""
+        self._last_flush = time.monotonic()
+        if not self._rows:
+            return 0
+
+        rows, self._rows = self._rows, []
+
+        # Create a new session for this operation to avoid greenlet errors
+        from app.core.database import AsyncSessionLocal
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(SyncLog), rows)
+                await db.commit()
+        except Exception as e:
+            # Sync logs are an audit trail; losing a batch must not fail the sync
+            logger.error(f"Failed to write {len(rows)} sync log entries: {e}")
+            return 0
+
+        self.rows_written += len(rows)
+        logger.debug(f"Wrote {len(rows)} sync log entries")
+        return len(rows)
@@ -1,23 +1,59 @@
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    MutableSet,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 from uuid import uuid4
 
+from sqlalchemy import Column, MetaData, String, Table
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.metrics import SYNC_SCENES
 from app.models import JobStatus, Scene, SyncLog
 from app.services.stash_service import StashService
 
+from .checkpoint import SceneSyncCheckpoint
 from .conflicts import ConflictResolver
 from .entity_sync import EntitySyncHandler
 from .models import SyncResult, SyncStatus
+from .pipeline import PipelineTimings, ScenePagePrefetcher
 from .progress import SyncProgress
+from .scene_ids import SceneIdSet
 from .scene_sync import SceneSyncHandler
-from .strategies import SmartSyncStrategy, SyncStrategy
+from .strategies import FullSyncStrategy, SmartSyncStrategy, SyncStrategy
+from .sync_log_buffer import SyncLogBuffer
 
 logger = logging.getLogger(__name__)
 
+CheckpointCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Scene IDs seen in Stash during a full sync, anti-joined against the scene
+# table to find orphans
+_SYNCED_SCENE_IDS = Table(
+    "tmp_synced_scene_ids",
+    MetaData(),
+    Column("id", String, primary_key=True),
+    prefixes=["TEMPORARY"],
+)
+
+# Synced scene IDs inserted per statement when looking for orphans
+ORPHAN_ID_CHUNK_SIZE = 5000
+
+# Orphaned scenes looked up in Stash per findScenes request
+ORPHAN_VERIFY_BATCH_SIZE = 100
+
 
 class ProgressTracker:
     """Simple progress tracker for compatibility with tests"""
@@ -94,6 +130,13 @@ class SceneSyncerWrapper:
 
 
 class SyncService:
+    # Outcome recorded for scenes skipped by the content digest fast path
+    _UNCHANGED_OUTCOME: Dict[str, Any] = {
+        "had_changes": False,
+        "change_type": "skipped",
+        "error_message": None,
+    }
+
     def __init__(
         self,
         stash_service: StashService,
@@ -107,6 +150,9 @@ class SyncService:
         self.entity_handler = EntitySyncHandler(stash_service, self.strategy)
         self.conflict_resolver = ConflictResolver()
         self._progress: Optional[SyncProgress] = None
+        self._sync_log_buffer: Optional[SyncLogBuffer] = None
+        self._checkpoint: Optional[SceneSyncCheckpoint] = None
+        self._checkpoint_callback: Optional[CheckpointCallback] = None
 
         # Add attributes expected by tests
         self.scene_syncer = SceneSyncerWrapper(
@@ -125,17 +171,33 @@ class SyncService:
         include_performers: bool = True,
         include_tags: bool = True,
         include_studios: bool = True,
+        pipeline_depth: int = 0,
+        resume_checkpoint: Optional[Dict[str, Any]] = None,
+        checkpoint_callback: Optional[CheckpointCallback] = None,
     ) -> SyncResult:
-        """Full sync of all entities from Stash"""
+        """Full sync of all entities from Stash
+
+        When ``pipeline_depth`` is greater than zero, scenes are synced with the
+        pipelined engine, prefetching up to that many pages from Stash while
+        the current page is written.
+
+        Full scene syncs pass a checkpoint to ``checkpoint_callback`` after
+        every page. Given one of those as ``resume_checkpoint``, the sync
+        skips the entities (they were synced before the scenes) and
+        continues with the scenes after the checkpoint's cursor.
+        """
         job_id = job_id or str(uuid4())
         logger.debug(
             f"sync_all started - job_id: {job_id}, force: {force}, batch_size: {batch_size}"
         )
         result = SyncResult(job_id=job_id, started_at=datetime.utcnow())
+        resuming = SceneSyncCheckpoint.from_dict(resume_checkpoint) is not None
 
         try:
             # Update job status if job_id provided
             sync_type = "full sync" if force else "sync"
+            if resuming:
+                sync_type = f"resumed {sync_type}"
             await self._update_job_status(
                 job_id, JobStatus.RUNNING, f"Starting {sync_type}"
             )
@@ -145,15 +207,9 @@ class SyncService:
                 await progress_callback(0, f"Starting {sync_type}")
 
             # Sync entities first (performers, tags, studios)
-            if include_performers or include_tags or include_studios:
-                logger.info("Syncing entities...")
-                logger.debug(f"About to call _sync_entities with force={force}")
-                entity_result = await self._sync_entities(
-                    force, include_performers, include_tags, include_studios
-                )
-            else:
-                logger.info("Skipping entity sync - all entities excluded")
-                entity_result = {}
+            entity_result = await self._sync_selected_entities(
+                force, resuming, include_performers, include_tags, include_studios
+            )
             logger.debug(f"_sync_entities returned: {entity_result}")
             result.stats.performers_processed = entity_result.get("performers", {}).get(
                 "processed", 0
@@ -191,7 +247,9 @@ class SyncService:
                 logger.info(f"Force parameter: {force}")
 
                 last_sync_time = (
-                    None if force else await self._get_last_sync_time("scene")
+                    None
+                    if force or resuming
+                    else await self._get_last_sync_time("scene")
                 )
 
                 logger.info(f"Last sync time retrieved: {last_sync_time}")
@@ -215,6 +273,9 @@ class SyncService:
                     batch_size=batch_size,
                     progress_callback=progress_callback,
                     cancellation_token=cancellation_token,
+                    pipeline_depth=pipeline_depth,
+                    resume_checkpoint=resume_checkpoint,
+                    checkpoint_callback=checkpoint_callback,
                 )
                 logger.info(
                     f"📊 Scene sync returned - total: {scene_result.total_items}, processed: {scene_result.processed_items}, status: {scene_result.status}"
@@ -241,6 +302,7 @@ class SyncService:
                 result.stats.scenes_updated = scene_result.stats.scenes_updated
                 result.stats.scenes_skipped = scene_result.stats.scenes_skipped
                 result.stats.scenes_failed = scene_result.stats.scenes_failed
+                result.metadata.update(scene_result.metadata)
             else:
                 logger.info("Skipping scene sync - scenes excluded")
 
@@ -291,6 +353,27 @@ class SyncService:
 
         return result
 
+    async def _sync_selected_entities(
+        self,
+        force: bool,
+        resuming: bool,
+        include_performers: bool,
+        include_tags: bool,
+        include_studios: bool,
+    ) -> Dict[str, Any]:
+        """Sync the entity types selected for a full sync"""
+        if resuming:
+            logger.info("Skipping entity sync - resuming scene sync")
+            return {}
+        if not (include_performers or include_tags or include_studios):
+            logger.info("Skipping entity sync - all entities excluded")
+            return {}
+        logger.info("Syncing entities...")
+        logger.debug(f"About to call _sync_entities with force={force}")
+        return await self._sync_entities(
+            force, include_performers, include_tags, include_studios
+        )
+
     async def sync_scenes(
         self,
         since: Optional[datetime] = None,
@@ -303,6 +386,9 @@ class SyncService:
         filters: Optional[Dict[str, Any]] = None,
         full_sync: bool = False,
         cancellation_token: Optional[Any] = None,
+        pipeline_depth: int = 0,
+        resume_checkpoint: Optional[Dict[str, Any]] = None,
+        checkpoint_callback: Optional[CheckpointCallback] = None,
     ) -> SyncResult:
         """Sync scenes with optional incremental mode"""
         job_id = job_id or str(uuid4())
@@ -334,7 +420,15 @@ class SyncService:
         # Standard batch sync
         logger.debug("Using standard batch sync mode")
         return await self._batch_sync_scenes(
-            since, job_id, batch_size, progress_callback, result, cancellation_token
+            since,
+            job_id,
+            batch_size,
+            progress_callback,
+            result,
+            cancellation_token,
+            pipeline_depth=pipeline_depth,
+            resume_checkpoint=resume_checkpoint,
+            checkpoint_callback=checkpoint_callback,
         )
 
     async def _sync_with_filters(
@@ -400,6 +494,9 @@ class SyncService:
             # even if subsequent operations fail
             await self.db.commit()
 
+            # Per-scene sync logs are buffered and written in bulk
+            self._sync_log_buffer = SyncLogBuffer()
+
             # Process each scene ID
             for idx, scene_id in enumerate(scene_ids):
                 await self._check_cancellation(cancellation_token)
@@ -444,6 +541,8 @@ class SyncService:
             result.add_error("sync", "scenes", str(e))
             result.complete(SyncStatus.FAILED)
             raise
+        finally:
+            await self._flush_sync_logs()
 
         return result
 
@@ -535,6 +634,7 @@ class SyncService:
             )
 
         result.complete()
+        await self._flush_sync_logs()
         if self._progress:
             await self._progress.complete(result)
 
@@ -546,14 +646,26 @@ class SyncService:
         progress_callback: Optional[Any],
         result: SyncResult,
         cancellation_token: Optional[Any] = None,
+        pipeline_depth: int = 0,
+        resume_checkpoint: Optional[Dict[str, Any]] = None,
+        checkpoint_callback: Optional[CheckpointCallback] = None,
     ) -> SyncResult:
-        """Sync scenes in batches"""
+        """Sync scenes in batches
+
+        Full syncs save a ``SceneSyncCheckpoint`` through
+        ``checkpoint_callback`` after every page and can continue from
+        ``resume_checkpoint``; orphan detection then also counts the scenes
+        synced before the interruption.
+        """
         logger.debug(
             f"_batch_sync_scenes started - since: {since}, job_id: {job_id}, batch_size: {batch_size}"
         )
         sync_history_id = None  # Track sync history ID for sync logs
         sync_type = "incremental" if since else "full"
-        synced_scene_ids: Set[str] = set()  # Track which scenes we've synced
+        # Track which scenes we've synced, for orphan detection
+        synced_scene_ids = SceneIdSet()
+        self._checkpoint = None
+        self._checkpoint_callback = None
 
         try:
             # Initialize sync state
@@ -565,30 +677,12 @@ class SyncService:
                 logger.info(f"Getting count of scenes updated since {since}")
                 logger.info(f"Filter will use: updated_at > {since.isoformat()} (UTC)")
 
-                # Get first page to determine actual count
-                # Format timestamp the same way as pending scenes detection
-                # Convert to Pacific timezone with Z suffix for Stash compatibility
-                import pytz
-
-                pacific_tz = pytz.timezone("America/Los_Angeles")
-                since_no_microseconds = since.replace(microsecond=0)
-                since_pacific = since_no_microseconds.astimezone(pacific_tz)
-                formatted_timestamp = since_pacific.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-                filter_dict = {
-                    "updated_at": {
-                        "value": formatted_timestamp,
-                        "modifier": "GREATER_THAN",
-                    }
-                }
-                logger.debug(f"Filter dict for incremental sync: {filter_dict}")
-
-                scenes_sample, total_to_sync = await self.stash_service.get_scenes(
-                    page=1, per_page=1, filter=filter_dict
+                # Count only - no scene data is needed to size the sync
+                filter_dict = self._build_scene_filter(since)
+                total_to_sync = await self.stash_service.count_scenes(
+                    filter=filter_dict
                 )
                 logger.info(f"✓ Found {total_to_sync} scenes updated since {since}")
-                logger.info("  (Out of total scenes in Stash)")
-                logger.info(f"  Sample query returned {len(scenes_sample)} scenes")
 
                 # IMPORTANT: If the filter returns 0 scenes, we should not proceed
                 if total_to_sync == 0:
@@ -609,53 +703,57 @@ class SyncService:
                 logger.info(f"Total scenes to sync (full sync): {total_scenes}")
                 result.total_items = total_scenes
                 self._progress = SyncProgress(job_id, total_scenes)
+                sync_history_id = self._start_scene_checkpoint(
+                    resume_checkpoint, checkpoint_callback, result, synced_scene_ids
+                )
 
-            # Create sync history record first so we can track individual scene syncs
-            # We'll update it later with final stats
-            from app.models.sync_history import SyncHistory
+            # Create sync history record first so we can track individual scene
+            # syncs; a resumed sync keeps adding to the interrupted one's record
+            if sync_history_id is None:
+                sync_history_id = await self._create_scene_sync_history(job_id, result)
+                if self._checkpoint is not None:
+                    self._checkpoint.sync_history_id = sync_history_id
 
-            sync_record = SyncHistory(
-                entity_type="scene",
-                job_id=job_id,
-                started_at=result.started_at,
-                status="running",
-                items_synced=0,
-                items_created=0,
-                items_updated=0,
-                items_failed=0,
-            )
-            self.db.add(sync_record)
-            await self.db.flush()  # Flush to get the ID
-            sync_history_id = int(sync_record.id) if sync_record.id is not None else None  # type: ignore[arg-type]
-
-            # Commit the sync_history record immediately to ensure it persists
-            # even if subsequent operations fail
-            await self.db.commit()
+            # Per-scene sync logs are buffered and written in bulk
+            self._sync_log_buffer = SyncLogBuffer()
+            after_id = self._checkpoint.scene_cursor if self._checkpoint else None
 
             # Process batches
-            offset = 0
-            batch_num = 0
-            while True:
-                batch_num += 1
-                logger.debug(
-                    f"Processing batch {batch_num} - offset: {offset}, batch_size: {batch_size}"
-                )
-                batch_complete = await self._process_scene_batch(
+            if pipeline_depth > 0:
+                await self._pipelined_sync_scenes(
                     since,
                     batch_size,
-                    offset,
+                    pipeline_depth,
                     result,
                     progress_callback,
                     cancellation_token,
                     sync_history_id,
                     sync_type,
                     synced_scene_ids,
+                    after_id=after_id,
                 )
-                logger.debug(f"Batch {batch_num} complete: {batch_complete}")
-                if batch_complete:
-                    logger.debug(f"All batches processed, total batches: {batch_num}")
-                    break
-                offset += batch_size
+            else:
+                batch_num = 0
+                async for batch_scenes in self._iter_scene_pages(
+                    since, batch_size, after_id=after_id
+                ):
+                    batch_num += 1
+                    logger.debug(
+                        f"Processing batch {batch_num} ({len(batch_scenes)} scenes)"
+                    )
+                    await self._process_scene_batch(
+                        batch_scenes,
+                        result,
+                        progress_callback,
+                        cancellation_token,
+                        sync_history_id,
+                        sync_type,
+                        synced_scene_ids,
+                    )
+                    await self._save_scene_checkpoint(
+                        batch_scenes, result, synced_scene_ids
+                    )
+                logger.debug(f"All batches processed, total batches: {batch_num}")
 
             # For full sync, process orphaned scenes
             if sync_type == "full" and synced_scene_ids:
@@ -676,6 +774,7 @@ class SyncService:
                 )
 
             result.complete()
+            await self._flush_sync_logs()
 
             # Update the sync history record with final stats
             # Need to refetch the record since we committed earlier
@@ -721,43 +820,108 @@ class SyncService:
             result.add_error("sync", "scenes", str(e))
             result.complete(SyncStatus.FAILED)
             raise
+        finally:
+            await self._flush_sync_logs()
+            self._checkpoint = None
+            self._checkpoint_callback = None
 
         return result
 
+    async def _create_scene_sync_history(
+        self, job_id: str, result: SyncResult
+    ) -> Optional[int]:
+        """Create the running SyncHistory record for a scene sync"""
+        from app.models.sync_history import SyncHistory
+
+        sync_record = SyncHistory(
+            entity_type="scene",
+            job_id=job_id,
+            started_at=result.started_at,
+            status="running",
+            items_synced=0,
+            items_created=0,
+            items_updated=0,
+            items_failed=0,
+        )
+        self.db.add(sync_record)
+        await self.db.flush()  # Flush to get the ID
+        sync_history_id = int(sync_record.id) if sync_record.id is not None else None  # type: ignore[arg-type]
+
+        # Commit the sync_history record immediately to ensure it persists
+        # even if subsequent operations fail
+        await self.db.commit()
+        return sync_history_id
+
+    def _start_scene_checkpoint(
+        self,
+        resume_checkpoint: Optional[Dict[str, Any]],
+        checkpoint_callback: Optional[CheckpointCallback],
+        result: SyncResult,
+        synced_scene_ids: MutableSet[str],
+    ) -> Optional[int]:
+        """Set up checkpointing for a full sync, restoring a resumed one.
+
+        Returns:
+            The resumed sync's SyncHistory ID, if there is one
+        """
+        checkpoint = SceneSyncCheckpoint.from_dict(resume_checkpoint)
+        if checkpoint is None:
+            if checkpoint_callback is None:
+                return None
+            checkpoint = SceneSyncCheckpoint()
+        else:
+            checkpoint.restore(result)
+            checkpoint.restore_ids(synced_scene_ids)
+            logger.info(
+                f"Resuming full scene sync after scene {checkpoint.scene_cursor} "
+                f"with {len(synced_scene_ids)} scenes already synced"
+            )
+        self._checkpoint = checkpoint
+        self._checkpoint_callback = checkpoint_callback
+        return checkpoint.sync_history_id
+
+    async def _save_scene_checkpoint(
+        self,
+        batch_scenes: List[Dict[str, Any]],
+        result: SyncResult,
+        synced_scene_ids: Optional[MutableSet[str]],
+    ) -> None:
+        """Record a finished page so the sync can resume after it"""
+        if self._checkpoint is None or synced_scene_ids is None:
+            return
+
+        self._checkpoint.advance(
+            [str(scene.get("id")) for scene in batch_scenes],
+            synced_scene_ids,
+            result,
+        )
+        if self._checkpoint_callback is None:
+            return
+
+        # Sync logs up to the checkpoint must not be lost with the process
+        if self._sync_log_buffer is not None:
+            await self._sync_log_buffer.flush()
+        try:
+            await self._checkpoint_callback(self._checkpoint.to_dict())
+        except Exception as e:
+            logger.warning(f"Failed to save scene sync checkpoint: {e}")
+
     async def _process_scene_batch(
         self,
-        since: Optional[datetime],
-        batch_size: int,
-        offset: int,
+        batch_scenes: List[Dict[str, Any]],
         result: SyncResult,
         progress_callback: Optional[Any],
         cancellation_token: Optional[Any] = None,
         sync_history_id: Optional[int] = None,
         sync_type: str = "full",
-        synced_scene_ids: Optional[Set[str]] = None,
-    ) -> bool:
-        """Process a single batch of scenes. Returns True if done."""
-        # Fetch batch
-        logger.info(f"Fetching scenes batch: offset={offset}, limit={batch_size}")
-        logger.debug(
-            f"_process_scene_batch - since: {since}, batch_size: {batch_size}, offset: {offset}"
-        )
-        scenes_data = await self._fetch_scene_batch(since, batch_size, offset)
-        logger.debug(
-            f"Fetched scenes_data keys: {scenes_data.keys() if scenes_data else 'None'}"
-        )
-        logger.debug(
-            f"Number of scenes in batch: {len(scenes_data.get('scenes', [])) if scenes_data else 0}"
-        )
-
-        if not scenes_data or not scenes_data.get("scenes"):
-            logger.debug(
-                "No scenes data or empty scenes list, batch processing complete"
-            )
-            return True
-
-        batch_scenes = scenes_data["scenes"]
+        synced_scene_ids: Optional[MutableSet[str]] = None,
+    ) -> None:
+        """Process a single batch of scenes one scene at a time"""
         logger.info(f"Processing {len(batch_scenes)} scenes")
+        unchanged_ids = await self._find_unchanged_scenes(batch_scenes)
+        if unchanged_ids:
+            # Scenes below commit one at a time and roll back on failure
+            await self.db.commit()
 
         # Process each scene
         for idx, scene_data in enumerate(batch_scenes):
@@ -769,6 +933,18 @@ class SyncService:
             logger.debug(
                 f"Processing scene {idx + 1}/{len(batch_scenes)} - id: {scene_id}"
             )
+            if scene_id in unchanged_ids:
+                self._count_scene_outcome("skipped", result)
+                await self._record_scene_outcome(
+                    scene_id,
+                    self._UNCHANGED_OUTCOME,
+                    result,
+                    sync_history_id,
+                    sync_type,
+                    synced_scene_ids,
+                )
+                await self._report_scene_progress(result, progress_callback)
+                continue
             await self._process_single_scene(
                 scene_data,
                 result,
@@ -778,62 +954,52 @@ class SyncService:
                 synced_scene_ids,
             )
 
-        # Check if done
-        return (
-            offset + batch_size >= result.total_items or len(batch_scenes) < batch_size
-        )
+    def _build_scene_filter(self, since: Optional[datetime]) -> Optional[Dict]:
+        """Build the Stash scene filter for a full or incremental sync"""
+        if not since:
+            logger.info("📋 Fetching scenes with NO filter (FULL SYNC)")
+            return None
 
-    async def _fetch_scene_batch(
-        self, since: Optional[datetime], batch_size: int, offset: int
-    ) -> Dict[str, Any]:
-        """Fetch a batch of scenes from Stash"""
-        logger.debug(
-            f"_fetch_scene_batch - since: {since}, batch_size: {batch_size}, offset: {offset}"
-        )
-        filter_dict = None
-        if since:
-            # Format timestamp the same way as pending scenes detection
-            # Convert to Pacific timezone with Z suffix for Stash compatibility
-            import pytz
-
-            pacific_tz = pytz.timezone("America/Los_Angeles")
-            since_no_microseconds = since.replace(microsecond=0)
-            since_pacific = since_no_microseconds.astimezone(pacific_tz)
-            formatted_timestamp = since_pacific.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            filter_dict = {
-                "updated_at": {
-                    "value": formatted_timestamp,
-                    "modifier": "GREATER_THAN",
-                }
+        # Format timestamp the same way as pending scenes detection
+        # Convert to Pacific timezone with Z suffix for Stash compatibility
+        import pytz
+
+        pacific_tz = pytz.timezone("America/Los_Angeles")
+        since_no_microseconds = since.replace(microsecond=0)
+        since_pacific = since_no_microseconds.astimezone(pacific_tz)
+        formatted_timestamp = since_pacific.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        filter_dict = {
+            "updated_at": {
+                "value": formatted_timestamp,
+                "modifier": "GREATER_THAN",
             }
-            logger.info(
-                f"📋 Fetching batch with INCREMENTAL filter: updated_at > {formatted_timestamp} (converted from {since.isoformat()})"
-            )
-            logger.debug(f"Full filter dict: {filter_dict}")
-        else:
-            logger.info("📋 Fetching batch with NO filter (FULL SYNC)")
+        }
+        logger.info(
+            f"📋 Fetching scenes with INCREMENTAL filter: updated_at > {formatted_timestamp} (converted from {since.isoformat()})"
+        )
+        logger.debug(f"Full filter dict: {filter_dict}")
+        return filter_dict
 
-        # Use get_scenes which returns (scenes, total_count)
-        page = offset // batch_size + 1
-        logger.debug(f"Fetching page {page} with per_page={batch_size}")
+    async def _iter_scene_pages(
+        self,
+        since: Optional[datetime],
+        batch_size: int,
+        after_id: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over pages of scenes to sync using Stash's ID cursor"""
+        filter_dict = self._build_scene_filter(since)
         try:
-            scenes, total_count = await self.stash_service.get_scenes(
-                page=page,
-                per_page=batch_size,
-                filter=filter_dict,
-            )
-            logger.info(
-                f"✓ Fetched batch: {len(scenes)} scenes, total_count: {total_count}"
-            )
-            if since and len(scenes) > 0:
-                # Log the first scene's updated_at to verify filter is working
-                first_scene = scenes[0]
-                if "updated_at" in first_scene:
+            async for scenes in self.stash_service.iter_scenes(
+                filter=filter_dict, page_size=batch_size, after_id=after_id
+            ):
+                logger.info(f"✓ Fetched batch: {len(scenes)} scenes")
+                if since and "updated_at" in scenes[0]:
+                    # Log the first scene's updated_at to verify filter is working
                     logger.debug(
-                        f"  First scene in batch updated_at: {first_scene['updated_at']}"
+                        f"  First scene in batch updated_at: {scenes[0]['updated_at']}"
                     )
-            return {"scenes": scenes}
+                yield scenes
         except Exception as e:
             logger.error(f"Error fetching scene batch: {e}")
             logger.debug(f"Fetch error type: {type(e).__name__}, value: {repr(e)}")
@@ -846,7 +1012,7 @@ class SyncService:
         progress_callback: Optional[Any],
         sync_history_id: Optional[int] = None,
         sync_type: str = "full",
-        synced_scene_ids: Optional[Set[str]] = None,
+        synced_scene_ids: Optional[MutableSet[str]] = None,
     ) -> None:
         """Process a single scene"""
         scene_id = scene_data.get("id", "unknown")
@@ -855,36 +1021,15 @@ class SyncService:
             logger.debug(f"About to sync single scene {scene_id}")
             outcome = await self._sync_single_scene(scene_data, result)
             logger.debug(f"Successfully synced scene {scene_id}, outcome: {outcome}")
-            result.processed_items += 1
-            result.stats.scenes_processed += 1
-
-            # Track this scene as synced
-            if synced_scene_ids is not None:
-                synced_scene_ids.add(scene_id)
-
-            # Create sync log entry if we have a sync_history_id
-            if sync_history_id:
-                await self._create_sync_log(
-                    sync_history_id=sync_history_id,
-                    entity_type="scene",
-                    entity_id=scene_id,
-                    sync_type=sync_type,
-                    had_changes=outcome["had_changes"],
-                    change_type=outcome["change_type"],
-                    error_message=outcome["error_message"],
-                )
-
-            # Update progress
-            if self._progress:
-                await self._progress.update(result.processed_items)
-
-            # Report progress
-            if progress_callback and result.total_items > 0:
-                progress = int((result.processed_items / result.total_items) * 80) + 20
-                await progress_callback(
-                    progress,
-                    f"Synced {result.processed_items}/{result.total_items} scenes",
-                )
+            await self._record_scene_outcome(
+                scene_id,
+                outcome,
+                result,
+                sync_history_id,
+                sync_type,
+                synced_scene_ids,
+            )
+            await self._report_scene_progress(result, progress_callback)
 
         except Exception as e:
             logger.error(f"Failed to sync scene {scene_data.get('id')}: {str(e)}")
@@ -910,6 +1055,235 @@ class SyncService:
             logger.debug(f"Scene sync traceback:\n{traceback.format_exc()}")
             result.add_error("scene", scene_data.get("id", "unknown"), str(e))
 
+    async def _record_scene_outcome(
+        self,
+        scene_id: str,
+        outcome: Dict[str, Any],
+        result: SyncResult,
+        sync_history_id: Optional[int],
+        sync_type: str,
+        synced_scene_ids: Optional[MutableSet[str]],
+    ) -> None:
+        """Count a synced scene, track it and write its sync log entry"""
+        result.processed_items += 1
+        result.stats.scenes_processed += 1
+        SYNC_SCENES.labels(outcome["change_type"] or "unknown").inc()
+
+        # Track this scene as synced
+        if synced_scene_ids is not None:
+            synced_scene_ids.add(scene_id)
+
+        # Create sync log entry if we have a sync_history_id
+        if sync_history_id:
+            await self._create_sync_log(
+                sync_history_id=sync_history_id,
+                entity_type="scene",
+                entity_id=scene_id,
+                sync_type=sync_type,
+                had_changes=outcome["had_changes"],
+                change_type=outcome["change_type"],
+                error_message=outcome["error_message"],
+            )
+
+    async def _report_scene_progress(
+        self, result: SyncResult, progress_callback: Optional[Any]
+    ) -> None:
+        """Report scene sync progress (scenes occupy the 20-100% range)"""
+        # Update progress
+        if self._progress:
+            await self._progress.update(result.processed_items)
+
+        # Report progress
+        if progress_callback and result.total_items > 0:
+            progress = int((result.processed_items / result.total_items) * 80) + 20
+            await progress_callback(
+                progress,
+                f"Synced {result.processed_items}/{result.total_items} scenes",
+            )
+
+    async def _pipelined_sync_scenes(
+        self,
+        since: Optional[datetime],
+        batch_size: int,
+        pipeline_depth: int,
+        result: SyncResult,
+        progress_callback: Optional[Any],
+        cancellation_token: Optional[Any] = None,
+        sync_history_id: Optional[int] = None,
+        sync_type: str = "full",
+        synced_scene_ids: Optional[MutableSet[str]] = None,
+        after_id: Optional[int] = None,
+    ) -> None:
+        """Sync scenes with Stash fetches overlapping database writes.
+
+        Up to ``pipeline_depth`` pages are fetched ahead while the current page
+        is applied through ``SceneSyncHandler.sync_scene_batch`` and committed
+        in a single transaction. Per-stage timings are stored in
+        ``result.metadata["pipeline"]``.
+        """
+        timings = PipelineTimings(pipeline_depth=pipeline_depth)
+        logger.info(
+            f"Starting pipelined scene sync - page size: {batch_size}, depth: {pipeline_depth}"
+        )
+
+        async with ScenePagePrefetcher(
+            self._iter_scene_pages(since, batch_size, after_id=after_id),
+            pipeline_depth,
+            timings,
+        ) as pages:
+            async for page_number, batch_scenes in pages:
+                await self._check_cancellation(cancellation_token)
+                logger.debug(
+                    f"Applying page {page_number} ({len(batch_scenes)} scenes)"
+                )
+                await self._apply_scene_page(
+                    batch_scenes,
+                    result,
+                    progress_callback,
+                    timings,
+                    sync_history_id,
+                    sync_type,
+                    synced_scene_ids,
+                )
+                await self._save_scene_checkpoint(
+                    batch_scenes, result, synced_scene_ids
+                )
+
+        result.metadata["pipeline"] = timings.to_dict()
+        logger.info(f"Pipelined scene sync timings: {timings.to_dict()}")
+
+    async def _apply_scene_page(
+        self,
+        batch_scenes: List[Dict[str, Any]],
+        result: SyncResult,
+        progress_callback: Optional[Any],
+        timings: PipelineTimings,
+        sync_history_id: Optional[int] = None,
+        sync_type: str = "full",
+        synced_scene_ids: Optional[MutableSet[str]] = None,
+    ) -> None:
+        """Apply one page of scenes in a single transaction.
+
+        If the page fails as a whole, it is rolled back and retried scene by
+        scene so a single bad scene is reported without failing its page.
+        """
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        apply_start = time.perf_counter()
+        try:
+            unchanged_ids = await self._find_unchanged_scenes(batch_scenes)
+            changed_scenes = [
+                s for s in batch_scenes if str(s.get("id")) not in unchanged_ids
+            ]
+            existing_scenes = (
+                await self.scene_handler._fetch_existing_scenes(changed_scenes, self.db)
+                if changed_scenes
+                else {}
+            )
+
+            scenes_to_sync = []
+            for scene_data in batch_scenes:
+                scene_id = str(scene_data.get("id") or "")
+                if not scene_id:
+                    raise ValueError("Scene ID is required")
+                if scene_id in unchanged_ids:
+                    outcomes[scene_id] = self._UNCHANGED_OUTCOME
+                    continue
+                existing_scene = existing_scenes.get(scene_id)
+                if not await self.strategy.should_sync(scene_data, existing_scene):
+                    change_type = "skipped"
+                else:
+                    scenes_to_sync.append(scene_data)
+                    change_type = "updated" if existing_scene else "created"
+                outcomes[scene_id] = {
+                    "had_changes": change_type != "skipped",
+                    "change_type": change_type,
+                    "error_message": None,
+                }
+
+            if scenes_to_sync:
+                await self.scene_handler.sync_scene_batch(
+                    scenes_to_sync, self.db, existing_scenes=existing_scenes
+                )
+            timings.apply_seconds += time.perf_counter() - apply_start
+
+            commit_start = time.perf_counter()
+            await self.db.commit()
+            timings.commit_seconds += time.perf_counter() - commit_start
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(
+                f"Page of {len(batch_scenes)} scenes failed to apply ({e}), "
+                "retrying scene by scene"
+            )
+            for scene_data in batch_scenes:
+                await self._process_single_scene(
+                    scene_data,
+                    result,
+                    None,
+                    sync_history_id,
+                    sync_type,
+                    synced_scene_ids,
+                )
+            timings.pages += 1
+            timings.scenes += len(batch_scenes)
+            await self._report_scene_progress(result, progress_callback)
+            return
+
+        for scene_id, outcome in outcomes.items():
+            self._count_scene_outcome(outcome["change_type"], result)
+            await self._record_scene_outcome(
+                scene_id,
+                outcome,
+                result,
+                sync_history_id,
+                sync_type,
+                synced_scene_ids,
+            )
+
+        timings.pages += 1
+        timings.scenes += len(batch_scenes)
+        await self._report_scene_progress(result, progress_callback)
+
+    async def _find_unchanged_scenes(
+        self, batch_scenes: List[Dict[str, Any]]
+    ) -> Set[str]:
+        """Find scenes in a page whose content digest matches the database.
+
+        These scenes skip the ORM merge entirely; only their last_synced and
+        stash_updated_at are refreshed. Forced full syncs (FullSyncStrategy)
+        always merge every scene.
+        """
+        if isinstance(self.strategy, FullSyncStrategy):
+            return set()
+        try:
+            unchanged = await self.scene_handler.find_unchanged_scenes(
+                batch_scenes, self.db
+            )
+            if unchanged:
+                await self.scene_handler.mark_unchanged_scenes_synced(
+                    batch_scenes, unchanged, self.db
+                )
+        except Exception as e:
+            logger.warning(f"Unchanged scene check failed, syncing page fully: {e}")
+            return set()
+        if unchanged:
+            logger.debug(
+                f"{len(unchanged)}/{len(batch_scenes)} scenes unchanged, skipping merge"
+            )
+        return unchanged
+
+    def _count_scene_outcome(self, change_type: str, result: SyncResult) -> None:
+        """Count a created, updated or skipped scene"""
+        if change_type == "skipped":
+            result.skipped_items += 1
+            result.stats.scenes_skipped += 1
+        elif change_type == "updated":
+            result.updated_items += 1
+            result.stats.scenes_updated += 1
+        else:
+            result.created_items += 1
+            result.stats.scenes_created += 1
+
     async def sync_performers(
         self,
         job_id: Optional[str] = None,
@@ -933,7 +1307,9 @@ class SyncService:
 
             # Sync performers using entity handler
             # Get performers data from Stash
-            stash_performers = await self.stash_service.get_all_performers()
+            stash_performers = await self.stash_service.get_all_performers(
+                use_cache=False
+            )
             entity_result = await self.entity_handler.sync_performers(
                 stash_performers, self.db, force=force
             )
@@ -977,7 +1353,7 @@ class SyncService:
 
             # Sync tags using entity handler
             # Get tags data from Stash
-            stash_tags = await self.stash_service.get_all_tags()
+            stash_tags = await self.stash_service.get_all_tags(use_cache=False)
             entity_result = await self.entity_handler.sync_tags(
                 stash_tags, self.db, force=force
             )
@@ -1138,7 +1514,7 @@ class SyncService:
 
             # Sync studios using entity handler
             # Get studios data from Stash
-            stash_studios = await self.stash_service.get_all_studios()
+            stash_studios = await self.stash_service.get_all_studios(use_cache=False)
             entity_result = await self.entity_handler.sync_studios(
                 stash_studios, self.db, force=force
             )
@@ -1163,7 +1539,7 @@ class SyncService:
 
     async def _process_orphaned_scenes(
         self,
-        synced_scene_ids: Set[str],
+        synced_scene_ids: MutableSet[str],
         result: SyncResult,
         progress_callback: Optional[Any],
         sync_history_id: Optional[int] = None,
@@ -1192,69 +1568,85 @@ class SyncService:
                 progress, f"Processing {len(orphaned_scene_ids)} orphaned scenes..."
             )
 
-        # Process each orphaned scene
-        for idx, scene_id in enumerate(orphaned_scene_ids):
-            # Check for cancellation
-            if cancellation_token and hasattr(cancellation_token, "check_cancellation"):
-                await cancellation_token.check_cancellation()
-
-            await self._process_single_orphaned_scene(
-                scene_id,
-                idx,
-                len(orphaned_scene_ids),
+        # Verify orphans against Stash in batches rather than one lookup each
+        for start in range(0, len(orphaned_scene_ids), ORPHAN_VERIFY_BATCH_SIZE):
+            await self._check_cancellation(cancellation_token)
+            await self._process_orphaned_scene_batch(
+                orphaned_scene_ids[start : start + ORPHAN_VERIFY_BATCH_SIZE],
                 result,
                 progress_callback,
                 sync_history_id,
             )
 
-    async def _get_orphaned_scene_ids(self, synced_scene_ids: Set[str]) -> Set[str]:
-        """Get IDs of scenes that exist in DB but were not synced from Stash"""
-        from sqlalchemy import select
+    async def _get_orphaned_scene_ids(
+        self, synced_scene_ids: MutableSet[str]
+    ) -> List[str]:
+        """Get IDs of scenes that exist in DB but were not synced from Stash
 
-        stmt = select(Scene.id)
-        db_result = await self.db.execute(stmt)
+        The synced IDs are streamed into a temporary table and the orphans
+        found with one anti-join, so the scene table is never loaded into
+        memory.
+        """
+        from sqlalchemy import delete, exists, insert, select
 
-        # Handle both real result and mock result
+        table = _SYNCED_SCENE_IDS
+        connection = await self.db.connection()
+        await connection.run_sync(table.create, checkfirst=True)
         try:
-            all_db_scene_ids = {row[0] for row in db_result}
-        except TypeError:
-            # For mocks, db_result might not be iterable
-            all_db_scene_ids = set()
-
-        return all_db_scene_ids - synced_scene_ids
+            await self.db.execute(delete(table))
+            chunk: List[Dict[str, str]] = []
+            for scene_id in synced_scene_ids:
+                chunk.append({"id": scene_id})
+                if len(chunk) >= ORPHAN_ID_CHUNK_SIZE:
+                    await self.db.execute(insert(table), chunk)
+                    chunk = []
+            if chunk:
+                await self.db.execute(insert(table), chunk)
 
-    async def _process_single_orphaned_scene(
+            stmt = (
+                select(Scene.id)
+                .where(~exists().where(table.c.id == Scene.id))
+                .order_by(Scene.id)
+            )
+            db_result = await self.db.execute(stmt)
+            # Handle both real result and mock result
+            try:
+                return [str(scene_id) for scene_id in db_result.scalars()]
+            except TypeError:
+                # For mocks, db_result might not be iterable
+                return []
+        finally:
+            await connection.run_sync(table.drop, checkfirst=True)
+
+    async def _process_orphaned_scene_batch(
         self,
-        scene_id: str,
-        idx: int,
-        total_orphaned: int,
+        scene_ids: List[str],
         result: SyncResult,
         progress_callback: Optional[Any],
         sync_history_id: Optional[int],
     ) -> None:
-        """Process a single orphaned scene"""
-        logger.debug(
-            f"Processing orphaned scene {idx + 1}/{total_orphaned}: {scene_id}"
-        )
-
+        """Re-sync orphaned scenes still in Stash and log the missing ones"""
         try:
-            # Try to fetch the scene from Stash
-            scene_data = await self.stash_service.get_scene_raw(scene_id)
-
-            if scene_data:
-                # Scene still exists in Stash, sync it
-                logger.info(f"Orphaned scene {scene_id} found in Stash, syncing...")
-                await self._process_single_scene(
-                    scene_data, result, progress_callback, sync_history_id, "full"
-                )
-            else:
-                # Scene no longer exists in Stash
-                await self._handle_missing_scene(scene_id, result, sync_history_id)
-
-        except Exception as e:
-            await self._handle_orphaned_scene_error(
-                scene_id, str(e), result, sync_history_id
+            found = await self.stash_service.get_scenes_by_ids(
+                scene_ids, batch_size=len(scene_ids), use_cache=False
             )
+        except Exception as e:
+            for scene_id in scene_ids:
+                await self._handle_orphaned_scene_error(
+                    scene_id, str(e), result, sync_history_id
+                )
+        else:
+            for scene_id in scene_ids:
+                scene_data = found.get(scene_id)
+                if scene_data:
+                    # Scene still exists in Stash, sync it
+                    logger.info(f"Orphaned scene {scene_id} found in Stash, syncing...")
+                    await self._process_single_scene(
+                        scene_data, result, None, sync_history_id, "full"
+                    )
+                else:
+                    # Scene no longer exists in Stash
+                    await self._handle_missing_scene(scene_id, result, sync_history_id)
 
         # Update progress
         if progress_callback:
@@ -1313,7 +1705,7 @@ class SyncService:
 
         try:
             # Fetch scene from Stash
-            scene_data = await self.stash_service.get_scene(scene_id)
+            scene_data = await self.stash_service.get_scene(scene_id, use_cache=False)
             if not scene_data:
                 raise ValueError(f"Scene {scene_id} not found in Stash")
 
@@ -1421,7 +1813,7 @@ class SyncService:
             )
 
             if force or not last_sync_time:
-                entity_data = await get_all_func()
+                entity_data = await get_all_func(use_cache=False)
                 logger.debug(
                     f"Full sync: Retrieved {len(entity_data)} {entity_type}s from Stash"
                 )
@@ -1738,6 +2130,9 @@ class SyncService:
     ) -> None:
         """Create a sync log entry for tracking individual entity syncs.
 
+        While a scene sync is running the entry is buffered and written in
+        bulk by SyncLogBuffer; otherwise it is written immediately.
+
         IMPORTANT: This method creates its own database session to prevent greenlet errors.
         DO NOT modify to use self.db without understanding the greenlet error documentation.
         See: /plans/greenlet_error.md and /plans/greenlet_error2.md
@@ -1747,6 +2142,18 @@ class SyncService:
             logger.warning("Skipping sync log creation - no sync_history_id available")
             return
 
+        if self._sync_log_buffer is not None:
+            await self._sync_log_buffer.add(
+                sync_history_id=sync_history_id,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                sync_type=sync_type,
+                had_changes=had_changes,
+                change_type=change_type,
+                error_message=error_message,
+            )
+            return
+
         # Create a new session for this operation to avoid greenlet errors
         from app.core.database import AsyncSessionLocal
 
@@ -1764,6 +2171,13 @@ class SyncService:
             # Commit immediately to avoid batching issues with foreign key constraints
             await db.commit()
 
+    async def _flush_sync_logs(self) -> None:
+        """Write any buffered sync logs and stop buffering"""
+        buffer, self._sync_log_buffer = self._sync_log_buffer, None
+        if buffer is not None:
+            await buffer.flush()
+            logger.debug(f"Sync log buffer wrote {buffer.rows_written} entries")
+
     async def _update_job_status(
         self, job_id: str, status: JobStatus, message: str
     ) -> None:
@@ -1789,7 +2203,7 @@ class SyncService:
         """Sync a single scene by ID - compatibility method for tests"""
         try:
             # Get scene data from stash
-            scene_data = await self.stash_service.get_scene(scene_id)
+            scene_data = await self.stash_service.get_scene(scene_id, use_cache=False)
             if not scene_data:
                 return False
 
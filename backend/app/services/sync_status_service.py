@@ -96,12 +96,7 @@ class SyncStatusService:
                     "No previous scene sync found, counting all scenes as pending"
                 )
 
-            scenes, total_count = await self.stash_service.get_scenes(
-                page=1,
-                per_page=1,
-                filter=filter_dict,
-            )
-            return total_count
+            return await self.stash_service.count_scenes(filter=filter_dict)
 
         except Exception as e:
             logger.error(f"Error getting pending scenes count: {str(e)}", exc_info=True)
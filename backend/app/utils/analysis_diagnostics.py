@@ -12,7 +12,7 @@ from app.core.database import AsyncSessionLocal
 from app.models import AnalysisPlan, Job, PlanChange, Scene
 from app.models.job import JobType
 from app.services.openai_client import OpenAIClient
-from app.services.stash_service import StashService
+from app.services.stash_registry import get_shared_stash_service
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +22,7 @@ class AnalysisDiagnostics:
 
     def __init__(self):
         self.settings = get_settings()
-        self.stash_service = StashService(
-            stash_url=self.settings.stash.url,
-            api_key=self.settings.stash.api_key,
-            timeout=self.settings.stash.timeout,
-            max_retries=self.settings.stash.max_retries,
-        )
+        self.stash_service = get_shared_stash_service(self.settings)
 
     async def diagnose_job(self, job_id: str) -> Dict[str, Any]:
         """Run comprehensive diagnostics on a failed analysis job.
@@ -0,0 +1,163 @@
+"""
+Standalone job worker processes.
+
+Runs jobs from the database queue outside the API process so analysis and
+sync are not limited to the API's event loop::
+
+    JOB_QUEUE_MODE=database python -m app.worker --processes 4
+
+Each process claims jobs from the ``job`` table independently. Progress is
+written to the job rows and relayed to WebSocket clients by the API process,
+and cancellations made through the API are picked up by the job's lease
+heartbeat.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional
+
+from app.core.config import get_settings
+from app.core.job_context import setup_job_logging
+from app.core.logging import configure_logging
+
+logger = logging.getLogger("app.worker")
+
+# Seconds to wait before replacing a worker process that exited unexpectedly
+RESTART_DELAY_SECONDS = 5.0
+
+
+async def _init_stash_services() -> None:
+    from app.core.settings_loader import load_settings_with_db_overrides
+    from app.services.stash_registry import get_stash_registry
+
+    try:
+        stash_settings = await load_settings_with_db_overrides()
+    except Exception as e:
+        logger.warning(f"Could not load settings overrides for Stash: {e}")
+        stash_settings = get_settings()
+    get_stash_registry().for_settings(stash_settings)
+
+
+async def run_worker(stop: Optional[asyncio.Event] = None) -> None:
+    """Run the database job queue in this process until ``stop`` is set."""
+    from app.core.database import close_db
+    from app.jobs import register_all_jobs
+    from app.services.job_queue import get_job_queue
+    from app.services.job_service import job_service
+    from app.services.stash_registry import get_stash_registry
+
+    if stop is None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+    await _init_stash_services()
+    register_all_jobs(job_service)
+    queue = get_job_queue()
+    await queue.start(job_service)
+    try:
+        await stop.wait()
+    finally:
+        logger.info(f"Stopping worker {queue.worker_id}")
+        await queue.stop()
+        await get_stash_registry().close_all()
+        await close_db()
+
+
+def _process_main() -> None:
+    setup_job_logging()
+    configure_logging()
+    asyncio.run(run_worker())
+
+
+class WorkerPool:
+    """Starts worker processes and replaces any that exit unexpectedly."""
+
+    def __init__(self, processes: int):
+        self.processes = processes
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[multiprocessing.process.BaseProcess] = []
+        self._stopping = False
+
+    def _spawn(self, index: int) -> multiprocessing.process.BaseProcess:
+        process = self._context.Process(
+            target=_process_main, name=f"stashhog-worker-{index}"
+        )
+        process.start()
+        logger.info(f"Started {process.name} (pid {process.pid})")
+        return process
+
+    def stop(self, *_: object) -> None:
+        """Ask every worker process to stop its queue and exit.
+
+        Jobs the processes were running keep their RUNNING status and lease,
+        so they are re-claimed once the lease expires.
+        """
+        self._stopping = True
+        for process in self._workers:
+            if process.is_alive():
+                process.terminate()
+
+    def run(self) -> int:
+        """Run the pool until it is stopped; returns the exit code."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        self._workers = [self._spawn(i) for i in range(self.processes)]
+
+        while not self._stopping:
+            wait([process.sentinel for process in self._workers])
+            for index, process in enumerate(self._workers):
+                if process.is_alive() or self._stopping:
+                    continue
+                logger.error(
+                    f"{process.name} exited with code {process.exitcode}; "
+                    f"restarting in {RESTART_DELAY_SECONDS}s"
+                )
+                time.sleep(RESTART_DELAY_SECONDS)
+                if not self._stopping:
+                    self._workers[index] = self._spawn(index)
+
+        for process in self._workers:
+            process.join()
+        exit_codes: Dict[str, Optional[int]] = {
+            process.name: process.exitcode for process in self._workers
+        }
+        logger.info(f"Worker processes stopped: {exit_codes}")
+        return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for ``python -m app.worker``."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run StashHog job workers")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.job_worker_processes,
+        help="Number of worker processes (default: JOB_WORKER_PROCESSES)",
+    )
+    args = parser.parse_args(argv)
+
+    setup_job_logging()
+    configure_logging()
+    if settings.job_queue_mode != "database":
+        logger.error("Job workers need JOB_QUEUE_MODE=database")
+        return 2
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+
+    if args.processes == 1:
+        asyncio.run(run_worker())
+        return 0
+    return WorkerPool(args.processes).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -49,6 +49,8 @@ def mock_settings():
     settings.openai.max_tokens = 500
     settings.openai.temperature = 0.7
     settings.openai.timeout = 60
+    settings.openai.response_cache_ttl_hours = 720
+    settings.openai.response_cache_max_entries = 10000
 
     # Analysis settings
     settings.analysis = MagicMock()
@@ -0,0 +1,132 @@
+"""Tests for the Prometheus metrics and their collectors."""
+
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import metrics
+from app.core.tasks import INTERACTIVE_LANE, TaskQueue, TaskStatus
+from app.daemons import test_daemon
+from app.models.daemon import DaemonType
+from app.models.job import Job, JobStatus, JobType
+from app.services.analysis.cost_tracker import AnalysisCostTracker
+from app.services.stash_service import graphql_operation_name
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRender:
+    """Test rendering metrics for a scrape."""
+
+    @pytest.mark.asyncio
+    async def test_collectors_run_at_render(self):
+        """Test that collectors refresh gauges and failures are contained."""
+
+        async def collect():
+            metrics.TASK_QUEUE_DEPTH.labels("render-test").set(7)
+
+        collectors = [AsyncMock(side_effect=RuntimeError("down")), collect]
+        with patch.object(metrics, "COLLECTORS", collectors):
+            text = (await metrics.render()).decode()
+
+        assert 'stashhog_task_queue_depth{lane="render-test"} 7.0' in text
+        assert "# TYPE stashhog_http_request_duration_seconds histogram" in text
+
+
+class TestInstrumentation:
+    """Test the application's metrics and collectors."""
+
+    def test_graphql_operation_name(self):
+        """Test operation names used as GraphQL metric labels."""
+        query = "fragment F on Scene { id }\nquery FindScenes { findScenes { count } }"
+        assert graphql_operation_name(query) == "FindScenes"
+        assert graphql_operation_name("{ version { version } }") == "version"
+        assert graphql_operation_name("") == "anonymous"
+
+    def test_cost_tracker_counts_tokens_and_cost(self):
+        """Test that tracked AI usage feeds the token and cost counters."""
+
+        def tokens():
+            return _sample(
+                "stashhog_ai_tokens_total", model="test-model", kind="prompt"
+            )
+
+        def cost():
+            return _sample("stashhog_ai_cost_dollars_total", model="test-model")
+
+        tokens_before, cost_before = tokens(), cost()
+
+        AnalysisCostTracker().track_operation(
+            "tag_detection", 0.25, 100, 20, "test-model"
+        )
+
+        assert tokens() - tokens_before == 100
+        assert cost() - cost_before == pytest.approx(0.25)
+
+    @pytest.mark.asyncio
+    async def test_daemon_sleep_records_loop_duration(self):
+        """Test that only time spent awake between sleeps is recorded."""
+        daemon = test_daemon.TestDaemon(uuid4())
+        loops = {"daemon_type": DaemonType.TEST_DAEMON.value}
+        before = _sample("stashhog_daemon_loop_duration_seconds_count", **loops)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await daemon.sleep(5)  # Not started, so there is no loop to record
+            await daemon.sleep(5)
+
+        assert sleep.await_count == 2
+        after = _sample("stashhog_daemon_loop_duration_seconds_count", **loops)
+        assert after - before == 1
+
+    @pytest.mark.asyncio
+    async def test_task_queue_collector(self):
+        """Test task queue depth and running counts per lane."""
+        queue = TaskQueue(max_workers=1, lane_workers={INTERACTIVE_LANE: 1})
+        await queue.submit(AsyncMock(), name="queued")
+        running = await queue.submit(AsyncMock(), name="running")
+        queue.tasks[running].status = TaskStatus.RUNNING
+
+        with patch("app.core.tasks.task_queue", queue):
+            await metrics._collect_task_queue()
+
+        assert _sample("stashhog_task_queue_depth", lane="default") == 2
+        assert _sample("stashhog_task_queue_running", lane="default") == 1
+        assert _sample("stashhog_task_queue_depth", lane=INTERACTIVE_LANE) == 0
+
+    @pytest.mark.asyncio
+    async def test_jobs_collector(self, test_async_engine, test_async_session):
+        """Test pending and running job counts per type."""
+        test_async_session.add_all(
+            [
+                Job(id="1", type=JobType.SYNC.value, status=JobStatus.RUNNING.value),
+                Job(id="2", type=JobType.SYNC.value, status=JobStatus.PENDING.value),
+                Job(id="3", type=JobType.SYNC.value, status=JobStatus.PENDING.value),
+                Job(
+                    id="4",
+                    type=JobType.ANALYSIS.value,
+                    status=JobStatus.COMPLETED.value,
+                ),
+            ]
+        )
+        await test_async_session.commit()
+        factory = async_sessionmaker(
+            test_async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            await metrics._collect_jobs()
+
+        sync = JobType.SYNC.value
+        assert _sample("stashhog_jobs", type=sync, status=JobStatus.RUNNING.value) == 1
+        assert _sample("stashhog_jobs", type=sync, status=JobStatus.PENDING.value) == 2
+        job_types = {
+            sample.labels["type"]
+            for family in metrics.JOBS.collect()
+            for sample in family.samples
+        }
+        assert JobType.ANALYSIS.value not in job_types
@@ -444,3 +444,98 @@ class TestJobRepository:
                 db=test_async_session, job_type=job_type, limit=100
             )
             assert any(j.id == f"job-type-{job_type.value}" for j in jobs)
+
+
+class TestJobSceneLookups:
+    """Test scene-to-job lookups through the job_scene table."""
+
+    @pytest.fixture
+    async def jobs(self, test_async_session: AsyncSession) -> AsyncSession:
+        db = test_async_session
+        await job_repository.create_job(
+            "active", JobType.ANALYSIS, db, metadata={"scene_ids": ["s1", "s2", "s1"]}
+        )
+        await job_repository.create_job(
+            "done", JobType.ANALYSIS, db, metadata={"scene_ids": ["s2"]}
+        )
+        await job_repository.create_job(
+            "old", JobType.ANALYSIS, db, metadata={"scene_ids": ["s3"]}
+        )
+        await job_repository.create_job("no-scenes", JobType.SYNC, db)
+        await job_repository.update_job_status("done", JobStatus.COMPLETED, db)
+        old = await job_repository.update_job_status("old", JobStatus.COMPLETED, db)
+        old.completed_at = datetime.utcnow() - timedelta(days=3)
+        await db.commit()
+        return db
+
+    @pytest.mark.asyncio
+    async def test_create_job_links_scenes(self, jobs: AsyncSession) -> None:
+        """Test that each distinct scene ID gets one link row."""
+        from sqlalchemy import select
+
+        from app.models.job_scene import JobScene
+
+        rows = (await jobs.execute(select(JobScene.job_id, JobScene.scene_id))).all()
+
+        assert sorted(rows) == [
+            ("active", "s1"),
+            ("active", "s2"),
+            ("done", "s2"),
+            ("old", "s3"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_active_and_recent_jobs_for_scenes(self, jobs: AsyncSession) -> None:
+        """Test grouping of active and recently completed jobs by scene."""
+        active = await job_repository.get_active_jobs_for_scenes(
+            ["s1", "s2", "s3"], jobs
+        )
+        recent = await job_repository.get_recent_jobs_for_scenes(
+            ["s1", "s2", "s3"], jobs
+        )
+
+        assert {k: [j.id for j in v] for k, v in active.items()} == {
+            "s1": ["active"],
+            "s2": ["active"],
+        }
+        assert {k: [j.id for j in v] for k, v in recent.items()} == {"s2": ["done"]}
+
+    @pytest.mark.asyncio
+    async def test_active_scene_ids_follow_status(self, jobs: AsyncSession) -> None:
+        """Test that finished jobs drop out of the active scene IDs."""
+        assert sorted(await job_repository.get_all_active_job_scene_ids(jobs)) == [
+            "s1",
+            "s2",
+        ]
+
+        await job_repository.update_job_status("active", JobStatus.CANCELLED, jobs)
+
+        assert await job_repository.get_all_active_job_scene_ids(jobs) == []
+
+
+class TestResumableCheckpoint:
+    """Test finding the checkpoint an interrupted job left behind."""
+
+    async def _finished_job(
+        self, db: AsyncSession, job_id: str, status: JobStatus, minutes: int
+    ) -> None:
+        await job_repository.create_job(job_id, JobType.SYNC, db)
+        job = await job_repository.update_job_status(job_id, status, db)
+        job.created_at = datetime.utcnow() + timedelta(minutes=minutes)
+        job.checkpoint = {"stage": "scenes", "scene_cursor": minutes}
+        await db.commit()
+
+    @pytest.mark.asyncio
+    async def test_latest_interrupted_job_is_resumed(
+        self, test_async_session: AsyncSession
+    ) -> None:
+        """Test that only the most recent finished job's checkpoint counts."""
+        db = test_async_session
+        await self._finished_job(db, "first", JobStatus.FAILED, 1)
+        await self._finished_job(db, "second", JobStatus.CANCELLED, 2)
+
+        checkpoint = await job_repository.get_resumable_checkpoint(JobType.SYNC, db)
+        assert checkpoint["scene_cursor"] == 2
+
+        await self._finished_job(db, "third", JobStatus.COMPLETED, 3)
+        assert await job_repository.get_resumable_checkpoint(JobType.SYNC, db) is None
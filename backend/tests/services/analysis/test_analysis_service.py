@@ -34,6 +34,10 @@ class TestAnalysisServiceInit:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         service = AnalysisService(openai_client, stash_service, settings)
 
@@ -58,6 +62,10 @@ class TestAnalysisServiceInit:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         service = AnalysisService(openai_client, stash_service, settings)
 
@@ -82,6 +90,10 @@ class TestAnalysisServiceCacheManagement:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         # Mock stash service responses
         stash_service.get_all_studios = AsyncMock(
@@ -121,6 +133,10 @@ class TestAnalysisServiceCacheManagement:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         service = AnalysisService(openai_client, stash_service, settings)
 
@@ -151,6 +167,10 @@ class TestAnalysisServiceSceneAnalysis:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
         settings.analysis.confidence_threshold = 0.8
 
         service = AnalysisService(openai_client, stash_service, settings)
@@ -376,6 +396,10 @@ class TestAnalysisServicePlanApplication:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         service = AnalysisService(openai_client, stash_service, settings)
         return service
@@ -500,6 +524,10 @@ class TestAnalysisServiceHelpers:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         service = AnalysisService(openai_client, stash_service, settings)
         return service
@@ -678,6 +706,10 @@ class TestAnalysisServiceBatchProcessing:
         settings.analysis = Mock()
         settings.analysis.batch_size = 2
         settings.analysis.max_concurrent = 1
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
         settings.analysis.confidence_threshold = 0.8
 
         service = AnalysisService(openai_client, stash_service, settings)
@@ -759,6 +791,10 @@ class TestAnalysisServiceBatchOperations:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
         settings.analysis.confidence_threshold = 0.8
 
         service = AnalysisService(openai_client, stash_service, settings)
@@ -1257,6 +1293,10 @@ class TestAnalysisServiceEdgeCases:
         settings.analysis = Mock()
         settings.analysis.batch_size = 10
         settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
 
         service = AnalysisService(openai_client, stash_service, settings)
         return service
@@ -1368,3 +1408,43 @@ class TestAnalysisServiceEdgeCases:
             ],
         )
         assert with_changes.has_changes() is True
+
+
+class TestAIResponseCacheOption:
+    """Test passing the AI response cache opt-out to the OpenAI client."""
+
+    @pytest.fixture
+    def service(self):
+        openai_client = Mock(spec=OpenAIClient)
+        openai_client.model = "gpt-4o-mini"
+        openai_client.generate_completion_with_usage = AsyncMock(
+            return_value=("{}", {"prompt_tokens": 10, "completion_tokens": 5})
+        )
+        settings = Mock(spec=Settings)
+        settings.analysis = Mock()
+        settings.analysis.batch_size = 10
+        settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
+        service = AnalysisService(openai_client, Mock(spec=StashService), settings)
+        service.cost_tracker = Mock()
+        return service
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_ai_cache", [True, False])
+    async def test_option_reaches_openai_client(self, service, use_ai_cache):
+        """Test that every tracked AI detection honours use_ai_cache."""
+        scene = {"id": "1", "title": "Scene", "file_path": "/media/scene.mp4"}
+        options = AnalysisOptions(use_ai_cache=use_ai_cache)
+
+        await service._detect_performers(scene, options)
+        await service._detect_tags(scene, options)
+        await service._request_combined_analysis(
+            scene, ["studio", "tags"], [], options.use_ai_cache
+        )
+
+        calls = service.ai_client.client.generate_completion_with_usage.await_args_list
+        assert len(calls) == 3
+        assert [c.kwargs["use_cache"] for c in calls] == [use_ai_cache] * 3
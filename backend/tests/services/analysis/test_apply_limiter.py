@@ -0,0 +1,61 @@
+"""Tests for the adaptive plan apply limiter."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.analysis.apply_limiter import AdaptiveApplyLimiter
+from app.services.stash import StashConnectionError, StashValidationError
+
+
+class TestAdaptiveApplyLimiter:
+    """Test concurrency adaptation and retries."""
+
+    @pytest.mark.asyncio
+    async def test_backoff_halves_limit_and_retries(self):
+        """Test that a connection error halves the limit before retrying."""
+        limiter = AdaptiveApplyLimiter(max_concurrency=8, base_delay=0.01)
+        func = AsyncMock(side_effect=[StashConnectionError("down"), "ok"])
+
+        assert await limiter.call(func) == "ok"
+        assert func.call_count == 2
+        assert limiter.limit == 4
+        assert limiter.backoffs == 1
+        assert limiter.delay == 0.01
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test that the error is raised once every attempt backed off."""
+        limiter = AdaptiveApplyLimiter(
+            max_concurrency=2, base_delay=0.01, max_attempts=2
+        )
+        func = AsyncMock(side_effect=StashConnectionError("down"))
+
+        with pytest.raises(StashConnectionError):
+            await limiter.call(func)
+        assert func.call_count == 2
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self):
+        """Test that invalid changes fail immediately without backing off."""
+        limiter = AdaptiveApplyLimiter(max_concurrency=2)
+        func = AsyncMock(side_effect=StashValidationError("bad"))
+
+        with pytest.raises(StashValidationError):
+            await limiter.call(func)
+        assert func.call_count == 1
+        assert limiter.backoffs == 0
+
+    @pytest.mark.asyncio
+    async def test_successes_restore_limit(self):
+        """Test that successful calls raise the limit back to the maximum."""
+        limiter = AdaptiveApplyLimiter(max_concurrency=4, base_delay=0.01)
+        await limiter.call(AsyncMock(side_effect=[StashConnectionError("x"), None]))
+        assert limiter.limit == 2
+
+        for _ in range(10):
+            await limiter.call(AsyncMock(return_value=None))
+
+        assert limiter.limit == 4
+        assert limiter.delay == 0.0
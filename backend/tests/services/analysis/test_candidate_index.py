@@ -0,0 +1,128 @@
+"""Tests for shortlisting the known entities listed in AI prompts."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.core.config import Settings
+from app.services.analysis.analysis_service import AnalysisService
+from app.services.analysis.candidate_index import CandidateIndex, prompt_line_length
+from app.services.analysis.cost_tracker import AnalysisCostTracker
+from app.services.analysis.models import AnalysisOptions
+from app.services.openai_client import OpenAIClient
+from app.services.stash_service import StashService
+
+PERFORMERS = [
+    {"name": "Alice Smith", "aliases": []},
+    {"name": "Jane Doe", "aliases": ["Janie D"]},
+    {"name": "Bob Jones", "aliases": []},
+    {"name": "Jane Roe", "aliases": []},
+    {"name": "Carla Ray", "aliases": ["Crystal"]},
+]
+
+
+class TestCandidateIndex:
+    """Test ranking entities by word overlap with scene text."""
+
+    def test_ranks_by_overlap(self):
+        """Test that full names outrank shared first names, glued or not."""
+        index = CandidateIndex()
+        index.build(PERFORMERS)
+
+        shortlist = index.shortlist("/videos/JaneDoe/Jane Doe - Scene 1.mp4", 2)
+
+        assert [p["name"] for p in shortlist] == ["Jane Doe", "Jane Roe"]
+        aliases = index.shortlist("Crystal in the garden", 1)
+        assert aliases[0]["name"] == "Carla Ray"
+
+    def test_pads_with_catalog_order_and_keeps_small_lists(self):
+        """Test filling unmatched slots and returning small catalogs whole."""
+        index = CandidateIndex()
+        tags = ["Outdoor", "Indoor", "Kitchen", "Pool"]
+        index.build(tags)
+
+        assert index.shortlist("Pool party", 3) == ["Pool", "Outdoor", "Indoor"]
+        assert index.shortlist("anything", 4) == tags
+
+    def test_tracks_source_list(self):
+        """Test that the index is rebuilt only for a different list."""
+        index = CandidateIndex()
+        index.build(PERFORMERS)
+
+        assert index.is_built_from(PERFORMERS)
+        assert not index.is_built_from(list(PERFORMERS))
+        assert index.prompt_chars == sum(prompt_line_length(p) for p in PERFORMERS)
+        assert prompt_line_length(PERFORMERS[1]) == len(
+            "- Jane Doe (aliases: Janie D)\n"
+        )
+
+
+class TestPromptCandidates:
+    """Test the analysis service sending shortlists to the AI detectors."""
+
+    @pytest.fixture
+    def service(self):
+        openai_client = Mock(spec=OpenAIClient)
+        openai_client.model = "gpt-4o-mini"
+        settings = Mock(spec=Settings)
+        settings.analysis = Mock()
+        settings.analysis.batch_size = 10
+        settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 2
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
+        service = AnalysisService(openai_client, Mock(spec=StashService), settings)
+        service.cost_tracker = AnalysisCostTracker()
+        service._cache["performers"] = PERFORMERS
+        return service
+
+    @pytest.mark.asyncio
+    async def test_performer_prompt_gets_shortlist(self, service):
+        """Test that the AI sees only the top candidates and savings are counted."""
+        detector = service.performer_detector
+        detector.detect_from_path = AsyncMock(return_value=[])
+        detector.detect_with_ai_tracked = AsyncMock(return_value=([], None))
+        scene = {"file_path": "/media/Bob Jones - Beach.mp4", "title": "", "id": "1"}
+
+        await service._detect_performers(scene, AnalysisOptions())
+
+        candidates = detector.detect_with_ai_tracked.await_args.kwargs[
+            "known_performers"
+        ]
+        assert [p["name"] for p in candidates] == ["Bob Jones", "Alice Smith"]
+        left_out = sum(prompt_line_length(PERFORMERS[i]) for i in (1, 3, 4))
+        saved = service.cost_tracker.prompt_tokens_saved["performer_detection"]
+        assert saved == left_out // 4
+
+    def test_limit_zero_lists_everything(self, service):
+        """Test that a limit of 0 disables shortlisting."""
+        service.settings.analysis.prompt_candidate_limit = 0
+
+        candidates = service._prompt_candidates(
+            "performers", "performer_detection", {"title": "Bob Jones"}
+        )
+
+        assert candidates is PERFORMERS
+        assert service.cost_tracker.get_summary()["prompt_tokens_saved"] == 0
+
+    @pytest.mark.asyncio
+    async def test_studio_shortlist_only_built_for_ai_prompt(self, service):
+        """Test that a confident path match skips shortlisting studios."""
+        service._cache["studios"] = ["Acme", "Falcon", "Raging Stallion", "Titan"]
+        detector = service.studio_detector
+        detector.detect_with_ai = AsyncMock(return_value=None)
+        options = AnalysisOptions(confidence_threshold=0.9)
+
+        await service._detect_studio({"file_path": "/data/x/Acme clip.mp4"}, options)
+
+        detector.detect_with_ai.assert_not_awaited()
+        assert service.cost_tracker.prompt_tokens_saved["studio_detection"] == 0
+
+        scene = {"file_path": "/data/misc/clip.mp4", "title": "Titan special"}
+        await service._detect_studio(scene, options)
+
+        candidates = detector.detect_with_ai.await_args.args[2]
+        assert candidates[0] == "Titan"
+        assert len(candidates) == 2
+        assert service.cost_tracker.prompt_tokens_saved["studio_detection"] > 0
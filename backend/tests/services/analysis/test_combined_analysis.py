@@ -0,0 +1,127 @@
+"""Tests for detecting studio, performers and tags with one AI request."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.core.config import Settings
+from app.services.analysis.analysis_service import AnalysisService
+from app.services.analysis.cost_tracker import AnalysisCostTracker
+from app.services.analysis.models import (
+    AnalysisOptions,
+    CombinedAnalysisResponse,
+    EntitySuggestion,
+    TagSuggestion,
+)
+from app.services.openai_client import OpenAIClient
+from app.services.stash_service import StashService
+
+OPTIONS = {
+    "detect_studios": True,
+    "detect_performers": True,
+    "detect_tags": True,
+    "combined_ai": True,
+}
+COST_INFO = {
+    "cost": 0.002,
+    "usage": {"prompt_tokens": 900, "completion_tokens": 60},
+    "model": "gpt-4o-mini",
+}
+
+
+class TestCombinedAnalysis:
+    """Test the single-call combined detector mode."""
+
+    @pytest.fixture
+    def service(self):
+        openai_client = Mock(spec=OpenAIClient)
+        openai_client.model = "gpt-4o-mini"
+        settings = Mock(spec=Settings)
+        settings.analysis = Mock()
+        settings.analysis.batch_size = 10
+        settings.analysis.max_concurrent = 5
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
+        service = AnalysisService(openai_client, Mock(spec=StashService), settings)
+        service.cost_tracker = AnalysisCostTracker()
+        service._cache["studios"] = ["Brazzers", "Vixen"]
+        service._cache["performers"] = [{"name": "Jane Doe", "aliases": []}]
+        service._cache["tags"] = ["Outdoor", "Pool", "HD"]
+        return service
+
+    @pytest.mark.asyncio
+    async def test_one_request_yields_all_fields(self, service):
+        """Test that one call fills studio, performers and tags with confidences."""
+        response = CombinedAnalysisResponse(
+            studio=EntitySuggestion(name="Vixen", confidence=0.9),
+            performers=[
+                EntitySuggestion(name="Jane Doe", confidence=0.95),
+                EntitySuggestion(name="Nobody", confidence=0.4),
+            ],
+            tags=[
+                TagSuggestion(name="pool", confidence=0.85),
+                TagSuggestion(name="Outdoor", confidence=0.9),
+            ],
+        )
+        ai_client = service.ai_client
+        ai_client.analyze_scene_with_cost = AsyncMock(
+            return_value=(response, COST_INFO)
+        )
+        scene = {
+            "id": "1",
+            "file_path": "/media/scene.mp4",
+            "title": "Jane Doe by the pool",
+            "tags": [{"name": "Outdoor"}],
+        }
+
+        changes = await service._perform_standard_analysis(
+            scene, AnalysisOptions(**OPTIONS)
+        )
+
+        ai_client.analyze_scene_with_cost.assert_awaited_once()
+        prompt_data = ai_client.analyze_scene_with_cost.await_args.kwargs["scene_data"]
+        assert prompt_data["requested_fields"] == ["studio", "performers", "tags"]
+        assert {(c.field, c.proposed_value, c.confidence) for c in changes} == {
+            ("studio", "Vixen", 0.9),
+            ("performers", "Jane Doe", 0.95),
+            ("tags", "Pool", 0.85),
+        }
+        summary = service.cost_tracker.get_summary()
+        assert summary["total_cost"] == pytest.approx(0.002)
+        assert summary["cost_breakdown"]["combined_detection"] == pytest.approx(0.002)
+
+    @pytest.mark.asyncio
+    async def test_confident_local_studio_is_not_requested(self, service):
+        """Test that a path-matched studio is kept and left out of the request."""
+        ai_client = service.ai_client
+        ai_client.analyze_scene_with_cost = AsyncMock(
+            return_value=(CombinedAnalysisResponse(), COST_INFO)
+        )
+        scene = {"id": "2", "file_path": "/media/Brazzers/scene.mp4", "title": ""}
+        options = AnalysisOptions(**{**OPTIONS, "detect_tags": False})
+
+        changes = await service._perform_standard_analysis(scene, options)
+
+        prompt_data = ai_client.analyze_scene_with_cost.await_args.kwargs["scene_data"]
+        assert prompt_data["requested_fields"] == ["performers"]
+        assert prompt_data["available_studios"] == []
+        assert [(c.field, c.proposed_value) for c in changes] == [
+            ("studio", "Brazzers")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_request_keeps_local_results(self, service):
+        """Test that an AI error still returns the local detections."""
+        service.ai_client.analyze_scene_with_cost = AsyncMock(
+            side_effect=RuntimeError("rate limited")
+        )
+        scene = {"id": "3", "file_path": "/media/scene.mp4", "height": 1080}
+
+        changes = await service._perform_standard_analysis(
+            scene, AnalysisOptions(**OPTIONS)
+        )
+
+        assert all(c.field == "tags" for c in changes)
+        assert service.cost_tracker.get_summary()["total_cost"] == 0
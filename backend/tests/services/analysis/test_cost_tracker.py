@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from app.services.analysis.cost_tracker import AnalysisCostTracker
 
 
@@ -191,6 +193,41 @@ class TestAnalysisCostTracker:
         # Verify token breakdown exists
         assert "token_breakdown" in summary
 
+    def test_track_prompt_savings(self):
+        """Test reporting tokens saved by shortlisting prompt entities."""
+        tracker = AnalysisCostTracker()
+
+        tracker.track_prompt_savings("performer_detection", 1200)
+        tracker.track_prompt_savings("tag_detection", 300)
+        tracker.track_prompt_savings("performer_detection", 800)
+
+        summary = tracker.get_summary()
+        assert summary["prompt_tokens_saved"] == 2300
+        assert summary["savings_breakdown"]["performer_detection"] == 2000
+
+        tracker.reset()
+        assert tracker.get_summary()["prompt_tokens_saved"] == 0
+
+    def test_track_cache_hits(self):
+        """Test that cached responses are free and counted as cache hits."""
+        tracker = AnalysisCostTracker()
+
+        tracker.track_operation("tag_detection", 0.004, 300, 40, "gpt-4")
+        tracker.track_operation("tag_detection", 0.004, 300, 40, "gpt-4", cached=True)
+        tracker.track_operation("studio_detection", 0.0, 0, 0, "gpt-4", cached=True)
+        tracker.track_operation("performer_detection", 0.003, 200, 60)
+
+        summary = tracker.get_summary()
+        assert summary["total_cost"] == pytest.approx(0.007)
+        assert summary["total_tokens"] == 600
+        assert summary["ai_requests"] == 4
+        assert summary["cache_hits"] == 2
+        assert summary["cache_hit_rate"] == 0.5
+        assert summary["cache_hit_breakdown"]["tag_detection"] == 1
+
+        tracker.reset()
+        assert tracker.get_cache_hit_rate() == 0.0
+
     def test_reset(self):
         """Test resetting the tracker."""
         tracker = AnalysisCostTracker()
@@ -1,5 +1,6 @@
 """Tests for incremental plan creation during analysis."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -29,6 +30,10 @@ class TestIncrementalPlanCreation:
         settings.analysis = Mock()
         settings.analysis.batch_size = 5
         settings.analysis.max_concurrent = 2
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
         settings.analysis.confidence_threshold = 0.8
 
         service = AnalysisService(openai_client, stash_service, settings)
@@ -36,7 +41,8 @@ class TestIncrementalPlanCreation:
         # Mock plan manager properly
         service.plan_manager = Mock(spec=PlanManager)
         service.plan_manager.create_or_update_plan = AsyncMock()
-        service.plan_manager.add_changes_to_plan = AsyncMock()
+        service.plan_manager.insert_scene_changes = AsyncMock(return_value=1)
+        service.plan_manager.get_plan = AsyncMock(return_value=None)
         service.plan_manager.finalize_plan = AsyncMock()
         # Initialize internal state
         service._current_plan_id = None
@@ -97,8 +103,14 @@ class TestIncrementalPlanCreation:
             scene_data, AnalysisOptions(), db, "test-job-123"
         )
 
+        # Results are buffered until the writer flushes
+        mock_service.plan_manager.create_or_update_plan.assert_not_called()
+        await mock_service._flush_plan_writer()
+
         # Verify plan was created
         mock_service.plan_manager.create_or_update_plan.assert_called_once()
+        assert mock_service._current_plan_id == 1
+        db.commit.assert_awaited_once()
         # Check the call was made with correct arguments
         call_args = mock_service.plan_manager.create_or_update_plan.call_args
         if call_args:
@@ -113,6 +125,7 @@ class TestIncrementalPlanCreation:
         db = Mock(spec=AsyncSession)
         db.execute = AsyncMock()
         db.flush = AsyncMock()
+        db.commit = AsyncMock()
 
         # Scene without changes
 
@@ -127,23 +140,22 @@ class TestIncrementalPlanCreation:
         await mock_service._analyze_single_scene_with_plan(
             scene_data, AnalysisOptions(), db, "test-job-123"
         )
+        await mock_service._flush_plan_writer()
 
         # Verify plan was NOT created
         mock_service.plan_manager.create_or_update_plan.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_plan_updated_on_subsequent_scenes(self, mock_service):
-        """Test that existing plan is updated for subsequent scenes."""
+        """Test that changes are bulk inserted into an existing plan."""
         db = Mock(spec=AsyncSession)
         db.execute = AsyncMock()
         db.flush = AsyncMock()
+        db.commit = AsyncMock()
 
         # Set up existing plan ID
         mock_service._current_plan_id = 1
 
-        # Mock is already set up in the fixture, just ensure it's there
-        assert hasattr(mock_service.plan_manager, "add_changes_to_plan")
-
         # Create scene with changes
         scene_changes = SceneChanges(
             scene_id="scene2",
@@ -174,29 +186,21 @@ class TestIncrementalPlanCreation:
         await mock_service._analyze_single_scene_with_plan(
             scene_data, AnalysisOptions(), db, "test-job-123"
         )
+        await mock_service._flush_plan_writer()
 
         # Verify plan was updated, not created
         mock_service.plan_manager.create_or_update_plan.assert_not_called()
-        mock_service.plan_manager.add_changes_to_plan.assert_called_once_with(
-            1, scene_changes, db
+        mock_service.plan_manager.insert_scene_changes.assert_called_once_with(
+            1, [scene_changes], db
         )
 
     @pytest.mark.asyncio
-    async def test_scene_marked_analyzed_immediately(self, mock_service):
-        """Test that scene is marked as analyzed immediately after processing."""
+    async def test_scenes_marked_analyzed_on_flush(self, mock_service):
+        """Test that analyzed flags are written in one statement per flush."""
         db = Mock(spec=AsyncSession)
         db.execute = AsyncMock()
         db.flush = AsyncMock()
-
-        # Mock _mark_single_scene_analyzed
-        mock_service._mark_single_scene_analyzed = AsyncMock()
-
-        # Create scene
-        scene_data = {
-            "id": "scene1",
-            "title": "Scene 1",
-            "file_path": "/path/to/scene1.mp4",
-        }
+        db.commit = AsyncMock()
         mock_service.analyze_single_scene = AsyncMock(return_value=[])
 
         options = AnalysisOptions(
@@ -204,14 +208,55 @@ class TestIncrementalPlanCreation:
         )
 
         # Execute
-        await mock_service._analyze_single_scene_with_plan(
-            scene_data, options, db, "test-job-123"
-        )
+        for scene_id in ("scene1", "scene2"):
+            scene_data = {"id": scene_id, "title": scene_id, "file_path": ""}
+            await mock_service._analyze_single_scene_with_plan(
+                scene_data, options, db, "test-job-123"
+            )
+        db.execute.assert_not_called()
+        await mock_service._flush_plan_writer()
+
+        # Verify both scenes were marked in a single UPDATE
+        db.execute.assert_awaited_once()
+        statement = db.execute.await_args.args[0]
+        params = statement.compile().params
+        assert params["analyzed"] is True
+        assert params["video_analyzed"] is True
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_scenes_analyzed_concurrently(self, mock_service):
+        """Test that a batch runs scene_workers scenes at once, in batch order."""
+        mock_service.settings.analysis.scene_workers = 2
+        db = Mock(spec=AsyncSession)
+        db.execute = AsyncMock()
+        db.commit = AsyncMock()
+        running = 0
+        peak = 0
+
+        async def analyze(scene, options):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 if scene.id == "scene0" else 0)
+            running -= 1
+            return []
+
+        mock_service.analyze_single_scene = AsyncMock(side_effect=analyze)
+        batch = [
+            {"id": f"scene{i}", "title": f"Scene {i}", "file_path": ""}
+            for i in range(5)
+        ]
 
-        # Verify scene was marked as analyzed
-        mock_service._mark_single_scene_analyzed.assert_called_once_with(
-            "scene1", db, options
+        results = await mock_service._analyze_batch_with_plan(
+            batch, AnalysisOptions(detect_tags=True), db, "test-job-123"
         )
+        await mock_service._flush_plan_writer()
+
+        assert [sc.scene_id for sc in results] == [s["id"] for s in batch]
+        assert peak == 2
+        # All scenes were marked by the writer task in a single UPDATE
+        db.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_plan_finalized_after_all_scenes(self, mock_service):
@@ -239,7 +284,6 @@ class TestIncrementalPlanCreation:
         )
         mock_service.plan_manager.finalize_plan = AsyncMock()
         mock_service.plan_manager.get_plan = AsyncMock(return_value=mock_plan)
-        mock_service._mark_single_scene_analyzed = AsyncMock()
 
         # Mock batch processor
         mock_service.batch_processor.process_scenes = AsyncMock(
@@ -508,6 +552,10 @@ class TestSceneAnalysisOrder:
         settings.analysis = Mock()
         settings.analysis.batch_size = 1  # Process one scene at a time
         settings.analysis.max_concurrent = 1
+        settings.analysis.prompt_candidate_limit = 200
+        settings.analysis.plan_flush_scenes = 25
+        settings.analysis.plan_flush_interval = 5.0
+        settings.analysis.scene_workers = 4
         settings.analysis.confidence_threshold = 0.8
 
         service = AnalysisService(openai_client, stash_service, settings)
@@ -0,0 +1,155 @@
+"""Tests for buffered plan writes during analysis."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import AnalysisPlan, PlanChange, Scene
+from app.services.analysis.models import ProposedChange, SceneChanges
+from app.services.analysis.plan_manager import PlanManager
+from app.services.analysis.plan_writer import PlanWriter
+
+
+def _scene(scene_id):
+    return Scene(
+        id=scene_id,
+        title=f"Scene {scene_id}",
+        stash_created_at=datetime(2024, 1, 1),
+        last_synced=datetime(2024, 1, 1),
+    )
+
+
+def _changes(scene_id, count=1):
+    return SceneChanges(
+        scene_id=scene_id,
+        scene_title=f"Scene {scene_id}",
+        scene_path=f"/{scene_id}.mp4",
+        changes=[
+            ProposedChange(
+                field="tags",
+                action="add",
+                current_value=[],
+                proposed_value=[f"tag{i}"],
+                confidence=0.9,
+            )
+            for i in range(count)
+        ],
+    )
+
+
+class TestPlanWriter:
+    """Test writing buffered scene results to a plan."""
+
+    @pytest.fixture
+    async def db(self, test_async_session):
+        test_async_session.add_all([_scene(i) for i in ("1", "2", "3", "4")])
+        await test_async_session.commit()
+        return test_async_session
+
+    def _writer(self, db, **kwargs):
+        return PlanWriter(
+            PlanManager(),
+            db,
+            name="Test Plan",
+            metadata={"settings": {}},
+            analyzed_flags={"analyzed": True},
+            **kwargs,
+        )
+
+    async def _count(self, db, query):
+        return (await db.execute(query)).scalar_one()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_plan_changes_and_flags(self, db):
+        """Test that one flush creates the plan and writes every buffered scene."""
+        on_created = AsyncMock()
+        writer = self._writer(db, flush_scenes=3, on_plan_created=on_created)
+
+        await writer.add(_changes("1", 2))
+        await writer.add(SceneChanges("2", "Scene 2", "/2.mp4", []))
+        assert writer.pending == 2
+        await writer.add(_changes("3", 3))
+
+        assert writer.pending == 0
+        on_created.assert_awaited_once_with(writer.plan_id)
+        changes = select(func.count()).select_from(PlanChange)
+        assert await self._count(db, changes) == 5
+        analyzed = select(func.count()).where(Scene.analyzed.is_(True))
+        assert await self._count(db, analyzed) == 3
+
+        plan = await db.get(AnalysisPlan, writer.plan_id)
+        await db.refresh(plan)
+        assert plan.plan_metadata["total_changes"] == 5
+        assert plan.plan_metadata["scenes_analyzed"] == 3
+        assert plan.plan_metadata["settings"] == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_after_interval(self, db):
+        """Test that a slow trickle of scenes is flushed by time."""
+        writer = self._writer(db, flush_scenes=100, flush_interval=5.0)
+
+        with patch("app.services.analysis.plan_writer.time.monotonic") as clock:
+            clock.return_value = writer._last_flush + 1
+            await writer.add(_changes("1"))
+            assert writer.pending == 1
+            clock.return_value = writer._last_flush + 6
+            await writer.add(_changes("2"))
+
+        assert writer.pending == 0
+        assert writer.total_changes == 2
+
+    @pytest.mark.asyncio
+    async def test_no_plan_without_changes(self, db):
+        """Test that scenes without changes are marked but create no plan."""
+        writer = self._writer(db)
+
+        await writer.add(SceneChanges("1", "Scene 1", "/1.mp4", []))
+        await writer.flush()
+
+        assert writer.plan_id is None
+        plans = select(func.count()).select_from(AnalysisPlan)
+        assert await self._count(db, plans) == 0
+        assert (await db.get(Scene, "1")).analyzed is True
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_rolls_back(self, db):
+        """Test that a failed write leaves no partial plan behind."""
+        writer = self._writer(db)
+        writer.plan_manager.insert_scene_changes = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+
+        await writer.add(_changes("1"))
+        await writer.add(_changes("2"))
+        with pytest.raises(RuntimeError):
+            await writer.flush()
+
+        assert writer.plan_id is None
+        assert writer.pending == 0
+        plans = select(func.count()).select_from(AnalysisPlan)
+        assert await self._count(db, plans) == 0
+
+    @pytest.mark.asyncio
+    async def test_submitted_results_written_by_task(self, db):
+        """Test that the writer task writes results submitted concurrently."""
+        writer = self._writer(db, flush_scenes=2)
+        writer.plan_manager.insert_scene_changes = AsyncMock(
+            side_effect=[RuntimeError("boom"), 1]
+        )
+
+        async def produce(scene_id):
+            await asyncio.sleep(0)
+            writer.submit(_changes(scene_id))
+
+        await asyncio.gather(*(produce(i) for i in ("1", "2", "3", "4")))
+        await writer.close()
+
+        # The failed first flush is rolled back; later scenes still go in
+        assert writer.pending == 0
+        assert writer.scenes_written == 2
+        analyzed = select(func.count()).where(Scene.analyzed.is_(True))
+        assert await self._count(db, analyzed) == 2
+        await writer.close()  # Closing again is a no-op
@@ -0,0 +1,110 @@
+"""Tests for checkpointed, resumable full scene syncs."""
+
+from datetime import datetime
+from types import MethodType
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.stash_service import StashService
+from app.services.sync.checkpoint import SceneSyncCheckpoint
+from app.services.sync.models import SyncResult
+from app.services.sync.strategies import FullSyncStrategy
+from app.services.sync.sync_service import SyncService
+
+
+def _page(*ids):
+    return [{"id": str(scene_id)} for scene_id in ids]
+
+
+class TestSceneSyncCheckpoint:
+    """Test the compact checkpoint format."""
+
+    def test_synced_ids_are_stored_as_runs(self):
+        """Test that consecutive IDs collapse into runs across pages."""
+        result = SyncResult(job_id="job", started_at=datetime.utcnow())
+        result.processed_items = 5
+        checkpoint = SceneSyncCheckpoint(sync_history_id=7)
+
+        checkpoint.advance(["1", "2", "3"], {"1", "2", "3"}, result)
+        # Scene 5 failed, so it must stay out of the synced set
+        checkpoint.advance(["4", "5", "6"], {"1", "2", "3", "4", "6"}, result)
+
+        data = checkpoint.to_dict()
+        assert data["scene_cursor"] == 6
+        assert data["synced_ranges"] == [[1, 4], [6, 6]]
+        assert data["counters"]["processed_items"] == 5
+
+        loaded = SceneSyncCheckpoint.from_dict(data)
+        assert loaded.synced_scene_ids() == {"1", "2", "3", "4", "6"}
+        assert loaded.sync_history_id == 7
+
+    def test_from_dict_ignores_other_checkpoints(self):
+        """Test that only scene sync checkpoints are loaded."""
+        assert SceneSyncCheckpoint.from_dict(None) is None
+        assert SceneSyncCheckpoint.from_dict({"page": 3}) is None
+
+
+class TestResumableSceneSync:
+    """Test resuming an interrupted full scene sync."""
+
+    @pytest.fixture
+    def sync_service(self):
+        db = AsyncMock(spec=AsyncSession)
+        db.execute = AsyncMock(return_value=Mock())
+        stash_service = AsyncMock()
+        stash_service.iter_scenes = MethodType(StashService.iter_scenes, stash_service)
+        stash_service.get_stats = AsyncMock(return_value={"scene_count": 5})
+        service = SyncService(stash_service, db, strategy=FullSyncStrategy())
+        service._sync_single_scene = AsyncMock(
+            return_value={
+                "had_changes": True,
+                "change_type": "updated",
+                "error_message": None,
+            }
+        )
+        service._create_sync_log = AsyncMock()
+        service._create_scene_sync_history = AsyncMock(return_value=11)
+        service._process_orphaned_scenes = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_resume_continues_after_cursor(self, sync_service):
+        """Test that a resumed sync skips finished pages and keeps their IDs."""
+        stash = sync_service.stash_service
+        stash.get_scenes = AsyncMock(
+            side_effect=[
+                (_page(1, 2), 5),
+                (_page(3, 4), 5),
+                ConnectionError("Stash restarted"),
+            ]
+        )
+        checkpoints = []
+
+        async def save(checkpoint):
+            checkpoints.append(checkpoint)
+
+        with pytest.raises(ConnectionError):
+            await sync_service.sync_scenes(
+                job_id="job-1", batch_size=2, checkpoint_callback=save
+            )
+
+        assert [c["scene_cursor"] for c in checkpoints] == [2, 4]
+        stash.get_scenes = AsyncMock(return_value=(_page(5), 5))
+
+        result = await sync_service.sync_scenes(
+            job_id="job-2",
+            batch_size=2,
+            resume_checkpoint=checkpoints[-1],
+            checkpoint_callback=save,
+        )
+
+        scene_filter = stash.get_scenes.await_args.kwargs["filter"]
+        assert scene_filter["id"] == {"value": 4, "modifier": "GREATER_THAN"}
+        assert result.processed_items == 5
+        assert sync_service._sync_single_scene.await_count == 5
+        sync_service._create_scene_sync_history.assert_awaited_once()
+        orphan_ids = sync_service._process_orphaned_scenes.await_args.args[0]
+        assert orphan_ids == {"1", "2", "3", "4", "5"}
+        assert checkpoints[-1]["synced_ranges"] == [[1, 5]]
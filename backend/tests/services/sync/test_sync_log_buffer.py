@@ -0,0 +1,141 @@
+"""Tests for the buffered sync log writer."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import SyncLog
+from app.models.sync_history import SyncHistory
+from app.services.sync.sync_log_buffer import SyncLogBuffer
+from app.services.sync.sync_service import SyncService
+
+
+def _row(entity_id: str) -> dict:
+    return {
+        "sync_history_id": 1,
+        "entity_type": "scene",
+        "entity_id": entity_id,
+        "sync_type": "full",
+        "had_changes": True,
+        "change_type": "created",
+    }
+
+
+def _mock_session_factory():
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory, session
+
+
+class TestSyncLogBuffer:
+    """Test cases for SyncLogBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_buffered_until_threshold(self):
+        factory, session = _mock_session_factory()
+        buffer = SyncLogBuffer(max_rows=3, flush_interval=60)
+
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            await buffer.add(**_row("1"))
+            await buffer.add(**_row("2"))
+            assert len(buffer) == 2
+            session.execute.assert_not_awaited()
+
+            await buffer.add(**_row("3"))
+
+        assert len(buffer) == 0
+        session.execute.assert_awaited_once()
+        rows = session.execute.await_args[0][1]
+        assert [row["entity_id"] for row in rows] == ["1", "2", "3"]
+        assert all("created_at" in row for row in rows)
+        session.commit.assert_awaited_once()
+        assert buffer.rows_written == 3
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self):
+        factory, session = _mock_session_factory()
+        buffer = SyncLogBuffer(max_rows=100, flush_interval=0)
+
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            await buffer.add(**_row("1"))
+
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_flush_skips_database(self):
+        factory, _ = _mock_session_factory()
+        buffer = SyncLogBuffer()
+
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            assert await buffer.flush() == 0
+
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_logged_not_raised(self):
+        factory, session = _mock_session_factory()
+        session.execute.side_effect = RuntimeError("db down")
+        buffer = SyncLogBuffer(max_rows=100, flush_interval=60)
+
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            await buffer.add(**_row("1"))
+            assert await buffer.flush() == 0
+
+        assert len(buffer) == 0
+        assert buffer.rows_written == 0
+
+    @pytest.mark.asyncio
+    async def test_writes_rows_in_one_insert(self, test_async_session):
+        history = SyncHistory(
+            entity_type="scene", status="running", started_at=datetime.utcnow()
+        )
+        test_async_session.add(history)
+        await test_async_session.commit()
+
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=test_async_session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        buffer = SyncLogBuffer(max_rows=100, flush_interval=60)
+
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            for i in range(5):
+                await buffer.add(**{**_row(str(i)), "sync_history_id": history.id})
+            assert await buffer.flush() == 5
+
+        count = await test_async_session.scalar(select(func.count(SyncLog.id)))
+        assert count == 5
+
+
+class TestSyncServiceLogBuffering:
+    """Test SyncService routing of sync logs through the buffer."""
+
+    @pytest.fixture
+    def sync_service(self):
+        return SyncService(AsyncMock(), AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_create_sync_log_uses_active_buffer(self, sync_service):
+        sync_service._sync_log_buffer = SyncLogBuffer(max_rows=100, flush_interval=60)
+
+        with patch("app.core.database.AsyncSessionLocal") as session_local:
+            await sync_service._create_sync_log(
+                1, "scene", "42", "full", True, "updated"
+            )
+
+        session_local.assert_not_called()
+        assert len(sync_service._sync_log_buffer) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_sync_logs_stops_buffering(self, sync_service):
+        buffer = AsyncMock()
+        buffer.rows_written = 0
+        sync_service._sync_log_buffer = buffer
+
+        await sync_service._flush_sync_logs()
+
+        buffer.flush.assert_awaited_once()
+        assert sync_service._sync_log_buffer is None
@@ -0,0 +1,87 @@
+"""Tests for compact synced-ID tracking and orphan detection."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models import Scene
+from app.services.sync.models import SyncResult
+from app.services.sync.scene_ids import SceneIdSet
+from app.services.sync.sync_service import SyncService
+
+
+def _scene(scene_id):
+    return Scene(
+        id=scene_id,
+        title=f"Scene {scene_id}",
+        stash_created_at=datetime(2024, 1, 1),
+        last_synced=datetime(2024, 1, 1),
+    )
+
+
+class TestSceneIdSet:
+    """Test the array-backed scene ID set."""
+
+    def test_behaves_like_a_set(self):
+        """Test membership, iteration and out-of-order additions."""
+        ids = SceneIdSet(["3", "1", "2", "2", "abc", "007"])
+        ids.add_range(10, 12)
+
+        assert len(ids) == 8
+        assert "2" in ids and "11" in ids and "abc" in ids and "007" in ids
+        assert "7" not in ids and 2 not in ids
+        assert list(ids)[:6] == ["1", "2", "3", "10", "11", "12"]
+        assert ids == {"1", "2", "3", "10", "11", "12", "abc", "007"}
+
+        ids.discard("11")
+        assert "11" not in ids
+        assert list(ids.numbers()) == [1, 2, 3, 10, 12]
+
+
+class TestOrphanDetection:
+    """Test finding and verifying scenes no longer seen in Stash."""
+
+    @pytest.fixture
+    async def sync_service(self, test_async_session):
+        test_async_session.add_all([_scene(i) for i in ("1", "2", "3", "10")])
+        await test_async_session.commit()
+        service = SyncService(AsyncMock(), test_async_session)
+        service._create_sync_log = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_orphans_found_with_anti_join(self, sync_service):
+        """Test that scenes missing from the synced IDs are returned."""
+        orphans = await sync_service._get_orphaned_scene_ids(SceneIdSet(["1", "3"]))
+
+        assert orphans == ["10", "2"]
+        # The temporary table is gone and can be created again
+        assert await sync_service._get_orphaned_scene_ids(SceneIdSet()) == [
+            "1",
+            "10",
+            "2",
+            "3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_orphans_verified_in_one_batch(self, sync_service):
+        """Test that orphans are checked with one batched Stash lookup."""
+        stash = sync_service.stash_service
+        stash.get_scenes_by_ids = AsyncMock(return_value={"2": {"id": "2"}})
+        sync_service._process_single_scene = AsyncMock()
+        result = SyncResult(job_id="job", started_at=datetime.utcnow())
+
+        await sync_service._process_orphaned_scenes(
+            SceneIdSet(["1", "3"]), result, None, sync_history_id=5
+        )
+
+        stash.get_scenes_by_ids.assert_awaited_once_with(
+            ["10", "2"], batch_size=2, use_cache=False
+        )
+        stash.get_scene_raw.assert_not_called()
+        sync_service._process_single_scene.assert_awaited_once_with(
+            {"id": "2"}, result, None, 5, "full"
+        )
+        assert result.processed_items == 1
+        assert sync_service._create_sync_log.await_args.kwargs["entity_id"] == "10"
@@ -0,0 +1,211 @@
+"""Tests for the pipelined scene sync engine."""
+
+import asyncio
+from datetime import datetime
+from types import MethodType
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.stash_service import StashService
+from app.services.sync.models import SyncResult
+from app.services.sync.pipeline import PipelineTimings, ScenePagePrefetcher
+from app.services.sync.strategies import FullSyncStrategy, SmartSyncStrategy
+from app.services.sync.sync_service import SyncService
+
+
+def _make_pages(total: int, page_size: int):
+    scenes = [{"id": str(i)} for i in range(1, total + 1)]
+    return [scenes[i : i + page_size] for i in range(0, total, page_size)]
+
+
+async def _iter_pages(pages, fetched=None):
+    for page in pages:
+        if fetched is not None:
+            fetched.append(page)
+        yield page
+
+
+class TestScenePagePrefetcher:
+    """Test cases for ScenePagePrefetcher."""
+
+    @pytest.mark.asyncio
+    async def test_yields_pages_in_order(self):
+        pages = _make_pages(7, 3)
+
+        collected = []
+        async with ScenePagePrefetcher(_iter_pages(pages), depth=2) as prefetcher:
+            async for page_number, scenes in prefetcher:
+                collected.append((page_number, [s["id"] for s in scenes]))
+
+        assert collected == [
+            (1, ["1", "2", "3"]),
+            (2, ["4", "5", "6"]),
+            (3, ["7"]),
+        ]
+        assert prefetcher.timings.pipeline_depth == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_while_consuming(self):
+        pages = _make_pages(6, 2)
+        fetched = []
+
+        async with ScenePagePrefetcher(
+            _iter_pages(pages, fetched), depth=1
+        ) as prefetcher:
+            page_number, _ = await prefetcher.__anext__()
+            # Let the producer run while the "consumer" is busy
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert page_number == 1
+            assert len(fetched) >= 2
+
+    @pytest.mark.asyncio
+    async def test_stops_when_pages_run_out(self):
+        async with ScenePagePrefetcher(_iter_pages([]), depth=2) as prefetcher:
+            collected = [page async for page in prefetcher]
+
+        assert collected == []
+
+    @pytest.mark.asyncio
+    async def test_propagates_fetch_errors(self):
+        async def failing_pages():
+            yield [{"id": "1"}, {"id": "2"}]
+            raise ConnectionError("Stash went away")
+
+        with pytest.raises(ConnectionError, match="Stash went away"):
+            async with ScenePagePrefetcher(failing_pages(), depth=2) as prefetcher:
+                async for _ in prefetcher:
+                    pass
+
+    def test_rejects_invalid_depth(self):
+        with pytest.raises(ValueError):
+            ScenePagePrefetcher(_iter_pages([]), depth=0)
+
+    def test_timings_to_dict(self):
+        timings = PipelineTimings(pipeline_depth=3, pages=2, fetch_seconds=1.23456)
+        data = timings.to_dict()
+        assert data["pipeline_depth"] == 3
+        assert data["pages"] == 2
+        assert data["fetch_seconds"] == 1.235
+
+
+class TestPipelinedSceneSync:
+    """Test cases for SyncService pipelined scene sync."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock(spec=AsyncSession)
+        db.commit = AsyncMock()
+        db.rollback = AsyncMock()
+        return db
+
+    @pytest.fixture
+    def sync_service(self, mock_db):
+        stash_service = AsyncMock()
+        stash_service.iter_scenes = MethodType(StashService.iter_scenes, stash_service)
+        service = SyncService(stash_service, mock_db, strategy=FullSyncStrategy())
+        service.scene_handler = Mock()
+        service.scene_handler._fetch_existing_scenes = AsyncMock(
+            return_value={"1": Mock(id="1")}
+        )
+        service.scene_handler.sync_scene_batch = AsyncMock(return_value=[])
+        service._create_sync_log = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_pipelined_sync_commits_once_per_page(self, sync_service, mock_db):
+        pages = _make_pages(5, 2)
+        sync_service.stash_service.get_scenes = AsyncMock(
+            side_effect=[(page, 5) for page in pages]
+        )
+        result = SyncResult(job_id="job", started_at=datetime.utcnow(), total_items=5)
+        synced_ids = set()
+        progress_callback = AsyncMock()
+
+        await sync_service._pipelined_sync_scenes(
+            None,
+            2,
+            2,
+            result,
+            progress_callback,
+            sync_history_id=1,
+            synced_scene_ids=synced_ids,
+        )
+
+        assert sync_service.scene_handler.sync_scene_batch.await_count == 3
+        assert mock_db.commit.await_count == 3
+        assert result.processed_items == 5
+        assert result.updated_items == 1
+        assert result.created_items == 4
+        assert synced_ids == {"1", "2", "3", "4", "5"}
+        assert sync_service._create_sync_log.await_count == 5
+        # Progress is reported once per page
+        assert progress_callback.await_count == 3
+        assert result.metadata["pipeline"]["pages"] == 3
+        assert result.metadata["pipeline"]["scenes"] == 5
+
+    @pytest.mark.asyncio
+    async def test_page_failure_falls_back_to_single_scenes(
+        self, sync_service, mock_db
+    ):
+        sync_service.scene_handler.sync_scene_batch = AsyncMock(
+            side_effect=RuntimeError("bad page")
+        )
+        sync_service._process_single_scene = AsyncMock()
+        result = SyncResult(job_id="job", started_at=datetime.utcnow(), total_items=2)
+
+        await sync_service._apply_scene_page(
+            [{"id": "1"}, {"id": "2"}], result, None, PipelineTimings()
+        )
+
+        mock_db.rollback.assert_awaited_once()
+        mock_db.commit.assert_not_awaited()
+        assert sync_service._process_single_scene.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skipped_scenes_are_not_merged(self, sync_service):
+        sync_service.strategy.should_sync = AsyncMock(side_effect=[False, True])
+        result = SyncResult(job_id="job", started_at=datetime.utcnow(), total_items=2)
+
+        await sync_service._apply_scene_page(
+            [{"id": "1"}, {"id": "2"}], result, None, PipelineTimings()
+        )
+
+        synced = sync_service.scene_handler.sync_scene_batch.await_args[0][0]
+        assert [s["id"] for s in synced] == ["2"]
+        assert result.skipped_items == 1
+        assert result.created_items == 1
+        assert result.processed_items == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_scenes_skip_merge(self, sync_service):
+        sync_service.strategy = SmartSyncStrategy()
+        sync_service.scene_handler.find_unchanged_scenes = AsyncMock(
+            return_value={"1", "2"}
+        )
+        sync_service.scene_handler.mark_unchanged_scenes_synced = AsyncMock()
+        result = SyncResult(job_id="job", started_at=datetime.utcnow(), total_items=3)
+        page = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+
+        await sync_service._apply_scene_page(page, result, None, PipelineTimings())
+
+        # Only the changed scene is loaded and merged
+        fetched = sync_service.scene_handler._fetch_existing_scenes.await_args[0][0]
+        assert [s["id"] for s in fetched] == ["3"]
+        synced = sync_service.scene_handler.sync_scene_batch.await_args[0][0]
+        assert [s["id"] for s in synced] == ["3"]
+        assert result.skipped_items == 2
+        assert result.processed_items == 3
+        # Their sync timestamps are refreshed before the page commits
+        sync_service.scene_handler.mark_unchanged_scenes_synced.assert_awaited_once_with(
+            page, {"1", "2"}, sync_service.db
+        )
+
+    @pytest.mark.asyncio
+    async def test_forced_sync_does_not_skip_unchanged(self, sync_service):
+        sync_service.scene_handler.find_unchanged_scenes = AsyncMock(return_value={"1"})
+
+        assert await sync_service._find_unchanged_scenes([{"id": "1"}]) == set()
+        sync_service.scene_handler.find_unchanged_scenes.assert_not_awaited()
@@ -9,6 +9,7 @@ from app.services.sync.strategies import (
     FullSyncStrategy,
     IncrementalSyncStrategy,
     SmartSyncStrategy,
+    calculate_scene_digest,
 )
 from tests.helpers import create_test_scene
 
@@ -834,3 +835,66 @@ class TestMergeStrategies:
         assert result.name == "Updated Tag"
         assert result.updated_at == datetime(2023, 8, 1, 12, 0, 0)
         # The strategy should handle missing attributes gracefully
+
+
+class TestCalculateSceneDigest:
+    """Test the scene content digest used by the sync fast path"""
+
+    @pytest.fixture
+    def scene_payload(self):
+        return {
+            "id": "1",
+            "title": "Scene",
+            "organized": True,
+            "updated_at": "2023-06-01T12:00:00Z",
+            "studio": {"id": "s1", "name": "Studio"},
+            "performers": [{"id": "p2", "name": "B"}, {"id": "p1", "name": "A"}],
+            "tags": [{"id": "t1", "name": "Tag"}],
+            "scene_markers": [
+                {"id": "m1", "seconds": 10.0, "primary_tag": {"id": "t1"}, "tags": []}
+            ],
+            "files": [
+                {
+                    "id": "f1",
+                    "path": "/a.mp4",
+                    "size": 100,
+                    "fingerprints": [{"type": "phash", "value": "abc"}],
+                }
+            ],
+        }
+
+    def test_digest_ignores_order_names_and_timestamps(self, scene_payload):
+        reordered = dict(scene_payload)
+        reordered["performers"] = [
+            {"id": "p1", "name": "Renamed"},
+            {"id": "p2", "name": "B"},
+        ]
+        reordered["updated_at"] = "2024-01-01T00:00:00Z"
+
+        assert calculate_scene_digest(scene_payload) == calculate_scene_digest(
+            reordered
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"title": "Other"},
+            {"studio": {"id": "s2"}},
+            {"tags": [{"id": "t1"}, {"id": "t2"}]},
+            {"scene_markers": []},
+            {
+                "files": [
+                    {
+                        "id": "f1",
+                        "path": "/a.mp4",
+                        "size": 100,
+                        "fingerprints": [{"type": "phash", "value": "def"}],
+                    }
+                ]
+            },
+        ],
+    )
+    def test_digest_changes_with_stored_content(self, scene_payload, change):
+        assert calculate_scene_digest(scene_payload) != calculate_scene_digest(
+            {**scene_payload, **change}
+        )
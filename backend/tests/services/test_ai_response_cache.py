@@ -0,0 +1,126 @@
+"""Tests for the persistent AI response cache."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.ai_response_cache import AIResponseCacheEntry
+from app.services.ai_response_cache import AIResponseCache, request_fingerprint
+from app.services.openai_client import OpenAIClient
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+
+
+@pytest.fixture
+def session_factory(test_async_engine, test_async_session):
+    # test_async_session creates the tables
+    return async_sessionmaker(
+        test_async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+class TestAIResponseCache:
+    """Test storing, expiring and evicting cached responses."""
+
+    def test_fingerprint_covers_request(self):
+        """Test that every request parameter changes the key."""
+        messages = [{"role": "user", "content": "Tag this scene"}]
+        key = request_fingerprint("gpt-4", 0.3, None, messages)
+
+        assert key == request_fingerprint("gpt-4", 0.3, None, list(messages))
+        assert key != request_fingerprint("gpt-4o", 0.3, None, messages)
+        assert key != request_fingerprint("gpt-4", 0.5, None, messages)
+        assert key != request_fingerprint(
+            "gpt-4", 0.3, {"type": "json_object"}, messages
+        )
+        assert key != request_fingerprint(
+            "gpt-4", 0.3, None, [{"role": "user", "content": "Tag this"}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_hits_and_ttl(self, session_factory):
+        """Test that stored responses are returned until they expire."""
+        cache = AIResponseCache(ttl_hours=1, session_factory=session_factory)
+        await cache.set("a", "gpt-4", '{"tags": []}', USAGE)
+
+        cached = await cache.get("a")
+        assert cached.content == '{"tags": []}'
+        assert cached.prompt_tokens == 10
+        assert await cache.get("b") is None
+
+        later = datetime.utcnow() + timedelta(hours=2)
+        with patch("app.services.ai_response_cache.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = later
+            assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, session_factory):
+        """Test that the size bound drops the entries used longest ago."""
+        cache = AIResponseCache(max_entries=2, session_factory=session_factory)
+        await cache.set("a", "gpt-4", "first", USAGE)
+        await cache.set("b", "gpt-4", "second", USAGE)
+        await cache.get("a")
+        await cache.set("c", "gpt-4", "third", USAGE)
+
+        async with session_factory() as db:
+            entries = (await db.execute(select(AIResponseCacheEntry))).scalars()
+            hits = {entry.key: entry.hits for entry in entries}
+        assert hits == {"a": 1, "c": 0}
+
+
+class TestOpenAIClientCache:
+    """Test the response cache in front of OpenAI completions."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self, session_factory):
+        """Test cache hits, the per-request opt-out and non-JSON responses."""
+        client = OpenAIClient(
+            api_key="cache-test-key", model="gpt-4", response_cache_max_entries=10
+        )
+        client.response_cache._session_factory = session_factory
+        client._create_completion = AsyncMock()
+        response = client._create_completion.return_value
+        response.choices[0].message.content = '{"tags": []}'
+        response.usage.prompt_tokens = 10
+        response.usage.completion_tokens = 5
+        response.usage.total_tokens = 15
+        json_format = {"type": "json_object"}
+
+        first = await client.generate_completion_with_usage(
+            prompt="Tag this", response_format=json_format
+        )
+        second = await client.generate_completion_with_usage(
+            prompt="Tag this", response_format=json_format
+        )
+        await client.generate_completion_with_usage(
+            prompt="Tag this", response_format=json_format, use_cache=False
+        )
+
+        assert first == ('{"tags": []}', USAGE)
+        assert second == (
+            '{"tags": []}',
+            {
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0,
+                "cached": 1,
+            },
+        )
+        assert client._create_completion.await_count == 2
+
+        # Responses that are not valid JSON are not kept
+        response.choices[0].message.content = "not json"
+        await client.generate_completion_with_usage(
+            prompt="Other", response_format=json_format
+        )
+        await client.generate_completion_with_usage(
+            prompt="Other", response_format=json_format
+        )
+        assert client._create_completion.await_count == 4
+
+    def test_cache_disabled_by_default(self):
+        """Test that clients without a size bound have no cache."""
+        assert OpenAIClient(api_key="cache-test-key").response_cache is None
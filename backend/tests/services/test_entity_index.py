@@ -0,0 +1,148 @@
+"""Tests for the in-process entity index."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import delete
+
+from app.models import Performer, Studio, Tag
+from app.services.analysis.plan_manager import PlanManager
+from app.services.entity_index import EntityIndex
+from app.services.stash_service import StashService
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _tag(tag_id, name, minutes=0, aliases=None):
+    return Tag(
+        id=tag_id,
+        name=name,
+        aliases=aliases,
+        last_synced=BASE_TIME,
+        updated_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+class TestEntityIndex:
+    """Test loading, lookups and incremental refresh."""
+
+    @pytest.fixture
+    async def db(self, test_async_session):
+        test_async_session.add_all(
+            [
+                _tag("t1", "Outdoor"),
+                _tag("t2", "Big  Dick", minutes=-1, aliases=["BD"]),
+                Performer(
+                    id="p1",
+                    name="Jane Doe",
+                    aliases=["JD"],
+                    last_synced=BASE_TIME,
+                ),
+                Studio(id="s1", name="Acme", last_synced=BASE_TIME),
+            ]
+        )
+        await test_async_session.commit()
+        return test_async_session
+
+    @pytest.mark.asyncio
+    async def test_lookups_by_id_name_and_alias(self, db):
+        """Test O(1) lookups after the initial load."""
+        index = EntityIndex()
+        await index.refresh(db)
+
+        assert index.get("tags", "t1").name == "Outdoor"
+        assert index.find_by_name("tags", "  big dick ").id == "t2"
+        assert index.find_by_name("tags", "bd") is None
+        assert index.find_by_name("tags", "bd", include_aliases=True).id == "t2"
+        assert index.find_by_name("studios", "ACME").id == "s1"
+        assert index.performer_aliases() == [{"name": "Jane Doe", "aliases": ["JD"]}]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_refresh_keeps_views(self, db):
+        """Test that views stay the same objects while nothing changes."""
+        index = EntityIndex(min_refresh_interval=0)
+        await index.refresh(db)
+        names = index.names("tags")
+        version = index.version("tags")
+
+        await index.refresh(db)
+
+        assert index.names("tags") is names
+        assert index.version("tags") == version
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_reads_only_newer_rows(self, db):
+        """Test that refresh after sync only reads rows past the watermark."""
+        index = EntityIndex()
+        await index.refresh(db)
+
+        tag = await db.get(Tag, "t1")
+        tag.name = "Outdoors"
+        tag.updated_at = BASE_TIME + timedelta(minutes=5)
+        db.add(_tag("t3", "Pool", minutes=5))
+        await db.commit()
+
+        assert await index.refresh(db) == {}
+        index.mark_changed("tags")
+        rows_read = await index.refresh(db)
+
+        assert rows_read == {"tags": 2}
+        assert index.find_by_name("tags", "outdoor") is None
+        assert index.find_by_name("tags", "outdoors").id == "t1"
+        assert sorted(index.names("tags")) == ["Big  Dick", "Outdoors", "Pool"]
+
+    @pytest.mark.asyncio
+    async def test_deleted_entities_are_dropped(self, db):
+        """Test that deletions are detected through the row count."""
+        index = EntityIndex()
+        await index.refresh(db)
+
+        await db.execute(delete(Tag).where(Tag.id == "t1"))
+        await db.commit()
+        await index.refresh(db, force=True)
+
+        assert index.get("tags", "t1") is None
+        assert index.find_by_name("tags", "outdoor") is None
+        assert index.stats()["tags"]["entities"] == 1
+
+    @pytest.mark.asyncio
+    async def test_plan_manager_confirms_index_hits_with_stash(self, db):
+        """Test that indexed names are looked up in Stash for current IDs."""
+        index = EntityIndex()
+        await index.refresh(db)
+        stash_tags = {
+            "Big  Dick": {"id": "t7", "name": "Big  Dick"},
+            "outdoor": {"id": "t1", "name": "Outdoor"},
+            "New": {"id": "t9", "name": "New"},
+        }
+        stash_service = Mock(spec=StashService)
+        stash_service.find_tag = AsyncMock(
+            side_effect=lambda name, use_cache=True: stash_tags.get(name)
+        )
+
+        manager = PlanManager(entity_index=index)
+        ids = await manager._add_tags(["big dick", "outdoor", "New"], [], stash_service)
+
+        # The stale indexed ID t2 is replaced by the one Stash returns
+        assert ids == ["t7", "t1", "t9"]
+        stash_service.find_tag.assert_any_call("Big  Dick", use_cache=False)
+
+    @pytest.mark.asyncio
+    async def test_plan_manager_falls_back_when_indexed_entity_is_gone(self, db):
+        """Test that the requested name is searched when the hint is stale."""
+        index = EntityIndex()
+        await index.refresh(db)
+        stash_service = Mock(spec=StashService)
+        stash_service.find_tag = AsyncMock(
+            side_effect=[None, {"id": "t8", "name": "big dick"}]
+        )
+
+        manager = PlanManager(entity_index=index)
+        ids = await manager._add_tags(["big dick"], [], stash_service)
+
+        assert ids == ["t8"]
+        assert [c.args[0] for c in stash_service.find_tag.call_args_list] == [
+            "Big  Dick",
+            "big dick",
+        ]
@@ -2,13 +2,18 @@
 Tests for OpenAI client service.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
+import openai
 import pytest
 from openai.types import Model
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
 from openai.types.completion_usage import CompletionUsage
+from tenacity import wait_none
 
 from app.services.openai_client import OpenAIClient
 
@@ -136,7 +141,10 @@ class TestOpenAIClient:
     async def test_test_connection_success(self, openai_client, mock_models_list):
         """Test successful connection test."""
         with patch.object(
-            openai_client.client.models, "list", return_value=mock_models_list
+            openai_client.client.models,
+            "list",
+            new_callable=AsyncMock,
+            return_value=mock_models_list,
         ):
             result = await openai_client.test_connection()
             assert result is True
@@ -145,7 +153,10 @@ class TestOpenAIClient:
     async def test_test_connection_failure(self, openai_client):
         """Test failed connection test."""
         with patch.object(
-            openai_client.client.models, "list", side_effect=Exception("API error")
+            openai_client.client.models,
+            "list",
+            new_callable=AsyncMock,
+            side_effect=Exception("API error"),
         ):
             result = await openai_client.test_connection()
             assert result is False
@@ -154,7 +165,10 @@ class TestOpenAIClient:
     async def test_test_connection_empty_models(self, openai_client):
         """Test connection test with empty models list."""
         with patch.object(
-            openai_client.client.models, "list", return_value=Mock(data=[])
+            openai_client.client.models,
+            "list",
+            new_callable=AsyncMock,
+            return_value=Mock(data=[]),
         ):
             result = await openai_client.test_connection()
             assert result is False
@@ -167,6 +181,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             result = await openai_client.generate_completion(prompt="Test prompt")
@@ -193,6 +208,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             result = await openai_client.generate_completion(messages=messages)
@@ -216,6 +232,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             result = await openai_client.generate_completion(
@@ -240,6 +257,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             result = await openai_client.generate_completion(
@@ -263,6 +281,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion_with_no_content,
         ):
             result = await openai_client.generate_completion(prompt="Test prompt")
@@ -283,6 +302,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("API connection error"),
         ):
             with pytest.raises(
@@ -298,6 +318,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             content, usage = await openai_client.generate_completion_with_usage(
@@ -324,6 +345,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             content, usage = await openai_client.generate_completion_with_usage(
@@ -360,7 +382,10 @@ class TestOpenAIClient:
         )
 
         with patch.object(
-            openai_client.client.chat.completions, "create", return_value=mock_response
+            openai_client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            return_value=mock_response,
         ):
             content, usage = await openai_client.generate_completion_with_usage(
                 prompt="Test prompt"
@@ -383,6 +408,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             content, usage = await openai_client.generate_completion_with_usage(
@@ -422,6 +448,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Rate limit exceeded"),
         ):
             with pytest.raises(
@@ -437,6 +464,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=mock_chat_completion,
         ):
             # First call
@@ -456,6 +484,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Rate limit exceeded: Too many requests"),
         ):
             with pytest.raises(
@@ -469,6 +498,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Invalid API key provided"),
         ):
             with pytest.raises(Exception, match="OpenAI API error: Invalid API key"):
@@ -480,6 +510,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("The model 'gpt-5' does not exist"),
         ):
             with pytest.raises(
@@ -493,6 +524,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Request timed out"),
         ):
             with pytest.raises(Exception, match="OpenAI API error: Request timed out"):
@@ -504,6 +536,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Network error: Unable to connect to OpenAI API"),
         ):
             with pytest.raises(Exception, match="OpenAI API error: Network error"):
@@ -515,6 +548,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception(
                 "Invalid request: Temperature must be between 0 and 2"
             ),
@@ -530,6 +564,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("This model's maximum context length is 4096 tokens"),
         ):
             with pytest.raises(
@@ -545,6 +580,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Service temporarily unavailable"),
         ):
             with pytest.raises(
@@ -558,6 +594,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             side_effect=Exception("Request timed out after 60 seconds"),
         ):
             with pytest.raises(Exception, match="OpenAI API error: Request timed out"):
@@ -580,7 +617,10 @@ class TestOpenAIClient:
         )
 
         with patch.object(
-            openai_client.client.chat.completions, "create", return_value=mock_response
+            openai_client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            return_value=mock_response,
         ):
             # This should raise an IndexError wrapped in an Exception
             with pytest.raises(Exception, match="OpenAI API error:"):
@@ -593,6 +633,7 @@ class TestOpenAIClient:
         with patch.object(
             openai_client.client.chat.completions,
             "create",
+            new_callable=AsyncMock,
             return_value=Mock(choices=None),  # Missing choices attribute
         ):
             with pytest.raises(Exception, match="OpenAI API error:"):
@@ -618,7 +659,10 @@ class TestOpenAIClient:
                 )
 
         with patch.object(
-            openai_client.client.chat.completions, "create", side_effect=side_effect
+            openai_client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            side_effect=side_effect,
         ):
             # First call should fail
             with pytest.raises(
@@ -635,3 +679,107 @@ class TestOpenAIClient:
             # Third call should succeed
             result = await openai_client.generate_completion(prompt="Third prompt")
             assert result == "Success after retries"
+
+
+def _rate_limit_error(retry_after=None):
+    """Create a 429 error as raised by the OpenAI SDK."""
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = httpx.Response(
+        429,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+    )
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class TestOpenAIClientConcurrency:
+    """Test async requests, retries and rate limiting."""
+
+    @pytest.fixture
+    def client(self):
+        client = OpenAIClient(
+            api_key="concurrency-test-key", max_concurrent=2, max_retries=3
+        )
+        client.retry_wait = wait_none()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_errors(self, client, mock_chat_completion):
+        """Test that 429 responses are retried until the request succeeds."""
+        with patch.object(
+            client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            side_effect=[_rate_limit_error(), mock_chat_completion],
+        ) as mock_create:
+            result = await client.generate_completion(prompt="Test prompt")
+
+        assert result == "This is a test response"
+        assert mock_create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, client):
+        """Test that persistent 429s surface as an API error."""
+        with patch.object(
+            client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            side_effect=_rate_limit_error(),
+        ) as mock_create:
+            with pytest.raises(Exception, match="OpenAI API error: Rate limit"):
+                await client.generate_completion(prompt="Test prompt")
+
+        assert mock_create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_shared_limiter(self):
+        """Test that a retry-after header holds back other requests."""
+        client = OpenAIClient(api_key="retry-after-test-key", max_retries=1)
+        with patch.object(
+            client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            side_effect=_rate_limit_error(retry_after="30"),
+        ):
+            with pytest.raises(Exception):
+                await client.generate_completion(prompt="Test prompt")
+
+        assert client.rate_limiter._paused_until > time.monotonic() + 25
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_overlap(self, mock_chat_completion):
+        """Test that requests run in parallel up to the concurrency limit."""
+        client = OpenAIClient(api_key="overlap-test-key", max_concurrent=3)
+        in_flight = 0
+        peak = 0
+
+        async def slow_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return mock_chat_completion
+
+        with patch.object(
+            client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            side_effect=slow_create,
+        ):
+            results = await asyncio.gather(
+                *(client.generate_completion(prompt=f"Prompt {i}") for i in range(6))
+            )
+
+        assert len(results) == 6
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_clients_for_same_key_share_limiter(self):
+        """Test that jobs creating their own clients share one budget."""
+        first = OpenAIClient(api_key="shared-key", max_concurrent=2)
+        second = OpenAIClient(api_key="shared-key", max_concurrent=2)
+        other = OpenAIClient(api_key="other-key", max_concurrent=2)
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not other.rate_limiter
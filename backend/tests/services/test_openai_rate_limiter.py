@@ -0,0 +1,69 @@
+"""Tests for OpenAI request rate limiting."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services import openai_rate_limiter
+from app.services.openai_rate_limiter import OpenAIRateLimiter
+
+
+class TestOpenAIRateLimiter:
+    """Test concurrency and per-minute limits."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_requests(self):
+        """Test that no more than max_concurrent requests run at once."""
+        limiter = OpenAIRateLimiter(max_concurrent=2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter.acquire():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(5)))
+
+        assert peak == 2
+
+    def test_requests_per_minute_limit(self):
+        """Test that requests beyond the per-minute budget have to wait."""
+        limiter = OpenAIRateLimiter(requests_per_minute=2)
+        limiter._window.extend([[100.0, 0.0], [110.0, 0.0]])
+
+        assert limiter._wait_time(120.0, 0) == pytest.approx(40.0)
+        assert limiter._wait_time(161.0, 0) == 0.0
+
+    def test_tokens_per_minute_limit(self):
+        """Test that the token budget holds back large requests."""
+        limiter = OpenAIRateLimiter(tokens_per_minute=1000)
+        limiter._window.append([100.0, 800.0])
+
+        assert limiter._wait_time(100.0, 100) == 0.0
+        assert limiter._wait_time(100.0, 300) == pytest.approx(60.0)
+
+    @pytest.mark.asyncio
+    async def test_record_usage_replaces_estimate(self):
+        """Test that actual usage corrects the reserved estimate."""
+        limiter = OpenAIRateLimiter(tokens_per_minute=1000)
+
+        async with limiter.acquire(900) as reservation:
+            reservation.record_usage(150)
+
+        assert reservation.tokens == 150
+        assert limiter.stats()["tokens_last_minute"] == 150
+
+    def test_pause_delays_new_requests(self):
+        """Test that a pause after a 429 delays new requests."""
+        limiter = OpenAIRateLimiter()
+
+        with patch.object(openai_rate_limiter.time, "monotonic", return_value=50.0):
+            limiter.pause(10)
+            assert limiter._wait_time(50.0, 0) == pytest.approx(10.0)
+
+        assert limiter._wait_time(61.0, 0) == 0.0
@@ -34,6 +34,20 @@ class TestStashCache:
         """Test getting a key that doesn't exist."""
         assert cache.get("nonexistent") is None
 
+    def test_stats_track_hits_and_misses(self, cache):
+        """Test that stats count cache hits and misses."""
+        cache.set("key1", "value1")
+        cache.get("key1")
+        cache.get("key1")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["max_size"] == 5
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.667
+
     def test_ttl_expiration(self, cache):
         """Test that items expire after TTL."""
         cache.set("key1", "value1", ttl=0.1)  # 100ms TTL
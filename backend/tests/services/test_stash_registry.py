@@ -0,0 +1,178 @@
+"""Tests for the shared Stash service registry."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.stash_registry import StashServiceRegistry
+
+
+def _settings(url="http://stash:9999", api_key="key", timeout=30, max_retries=3):
+    settings = MagicMock()
+    settings.stash.url = url
+    settings.stash.api_key = api_key
+    settings.stash.timeout = timeout
+    settings.stash.max_retries = max_retries
+    return settings
+
+
+class TestStashServiceRegistry:
+    """Test sharing, reloading and closing of Stash services."""
+
+    @pytest.fixture
+    async def registry(self):
+        registry = StashServiceRegistry()
+        yield registry
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_same_server_shares_service(self, registry):
+        """Test that the same url and api key return one shared service."""
+        first = registry.for_settings(_settings())
+        second = registry.get("http://stash:9999/", "key")
+
+        assert first is second
+        assert first._cache is second._cache
+
+    @pytest.mark.asyncio
+    async def test_different_api_key_gets_own_service(self, registry):
+        """Test that services are keyed by url and api key."""
+        first = registry.get("http://stash:9999", "key")
+        second = registry.get("http://stash:9999", "other-key")
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_closed_service_is_replaced(self, registry):
+        """Test that a service closed by a caller is not handed out again."""
+        first = registry.get("http://stash:9999", "key")
+        await first.close()
+
+        second = registry.get("http://stash:9999", "key")
+
+        assert second is not first
+        assert not second._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_reload_switches_server_and_retires_old_service(self, registry):
+        """Test that reload hands out the new server and keeps old one open."""
+        old = registry.for_settings(_settings())
+
+        new = await registry.reload(_settings(url="http://new-stash:9999"))
+
+        assert new is not old
+        assert new.base_url == "http://new-stash:9999"
+        assert registry.for_settings(_settings(url="http://new-stash:9999")) is new
+        # In-flight users of the old service keep a working client
+        assert not old._client.is_closed
+        assert [s["url"] for s in registry.stats()] == ["http://new-stash:9999"]
+
+        await registry.close_all()
+        assert old._client.is_closed
+        assert new._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_retired_service_is_closed_once_idle(self):
+        """Test that a reload closes the old client after its requests finish."""
+        registry = StashServiceRegistry(retire_grace=0.02)
+        old = registry.for_settings(_settings())
+        old.active_requests = 1
+
+        new = await registry.reload(_settings(url="http://new-stash:9999"))
+        await asyncio.sleep(0.05)
+        # Still busy, so the client stays open
+        assert not old._client.is_closed
+
+        old.active_requests = 0
+        for _ in range(100):
+            if old._client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        assert old._client.is_closed
+        assert not new._client.is_closed
+        await registry.close_all()
+        assert new._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_uncached_entity_list_reaches_stash(self, registry):
+        """Test that use_cache=False skips the entity list cached by another user."""
+        service = registry.for_settings(_settings())
+        service.execute_graphql = AsyncMock(
+            side_effect=[
+                {"allPerformers": [{"id": "1", "name": "Old"}]},
+                {
+                    "allPerformers": [
+                        {"id": "1", "name": "Old"},
+                        {"id": "2", "name": "New"},
+                    ]
+                },
+            ]
+        )
+        await registry.for_settings(_settings()).get_all_performers()
+
+        cached = await service.get_all_performers()
+        fresh = await registry.for_settings(_settings()).get_all_performers(
+            use_cache=False
+        )
+
+        assert [p["id"] for p in cached] == ["1"]
+        assert [p["id"] for p in fresh] == ["1", "2"]
+        assert service.execute_graphql.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stats_report_pool_and_cache(self, registry):
+        """Test that stats expose pool limits and cache counters."""
+        service = registry.for_settings(_settings(api_key=None))
+        service._cache.set("key", "value")
+        service._cache.get("key")
+
+        stats = registry.stats()
+
+        assert len(stats) == 1
+        assert stats[0]["url"] == "http://stash:9999"
+        assert stats[0]["authenticated"] is False
+        assert stats[0]["pool"]["closed"] is False
+        assert stats[0]["pool"]["max_connections"] == 10
+        assert stats[0]["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_service_of_closed_loop_is_closed_when_replaced(self, registry):
+        """Test that replacing a service bound to a closed loop closes it."""
+        old = registry.get("http://stash:9999", "key")
+        dead_loop = asyncio.new_event_loop()
+        dead_loop.close()
+        registry._entries[registry._key("http://stash:9999", "key")].loop = dead_loop
+
+        new = registry.get("http://stash:9999", "key")
+        await asyncio.sleep(0)
+
+        assert new is not old
+        assert old._client.is_closed
+        assert registry._retired == []
+
+    @pytest.mark.asyncio
+    async def test_service_of_other_loop_is_closed_on_its_loop(self, registry):
+        """Test that close_all closes a service bound to another running loop."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            old = registry.get("http://stash:9999", "key")
+            entry = registry._entries[registry._key("http://stash:9999", "key")]
+            entry.loop = other_loop
+
+            new = registry.get("http://stash:9999", "key")
+            assert new is not old
+            # Users on the other loop may still hold it
+            assert not old._client.is_closed
+
+            await registry.close_all()
+            assert old._client.is_closed
+            assert new._client.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
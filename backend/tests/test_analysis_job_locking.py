@@ -116,7 +116,7 @@ class TestAnalysisJobLocking:
         # Setup task queue to capture and allow manual execution
         captured_tasks = []
 
-        async def capture_task(func, name):
+        async def capture_task(func, name, lane=None):
             task_id = f"task_{len(captured_tasks)}"
             captured_tasks.append((task_id, func))
             return task_id
@@ -277,7 +277,7 @@ class TestAnalysisJobLocking:
         # Capture tasks
         captured_tasks = []
 
-        async def capture_task(func, name):
+        async def capture_task(func, name, lane=None):
             task_id = f"task_{len(captured_tasks)}"
             captured_tasks.append(func)
             return task_id
@@ -81,14 +81,14 @@ class TestAnalysisJobs:
     @patch("app.jobs.analysis_jobs.load_settings_with_db_overrides")
     @patch("app.jobs.analysis_jobs.AnalysisService")
     @patch("app.jobs.analysis_jobs.OpenAIClient")
-    @patch("app.jobs.analysis_jobs.StashService")
+    @patch("app.jobs.analysis_jobs.get_shared_stash_service")
     @patch("app.core.database.AsyncSessionLocal")
     @patch("app.jobs.analysis_jobs.logger")
     async def test_analyze_scenes_job_success(
         self,
         mock_logger,
         mock_async_session,
-        mock_stash_service_cls,
+        mock_get_stash_service,
         mock_openai_client_cls,
         mock_analysis_service_cls,
         mock_get_settings,
@@ -108,7 +108,7 @@ class TestAnalysisJobs:
 
         # Mock service instances
         mock_stash_service = Mock()
-        mock_stash_service_cls.return_value = mock_stash_service
+        mock_get_stash_service.return_value = mock_stash_service
 
         mock_openai_client = Mock()
         mock_openai_client_cls.return_value = mock_openai_client
@@ -173,12 +173,7 @@ class TestAnalysisJobs:
         assert "summary" in result
 
         # Verify service creation
-        mock_stash_service_cls.assert_called_once_with(
-            stash_url=mock_settings.stash.url,
-            api_key=mock_settings.stash.api_key,
-            timeout=mock_settings.stash.timeout,
-            max_retries=mock_settings.stash.max_retries,
-        )
+        mock_get_stash_service.assert_called_once_with(mock_settings)
 
         mock_openai_client_cls.assert_called_once_with(
             api_key=mock_settings.openai.api_key,
@@ -187,6 +182,12 @@ class TestAnalysisJobs:
             max_tokens=mock_settings.openai.max_tokens,
             temperature=mock_settings.openai.temperature,
             timeout=mock_settings.openai.timeout,
+            max_concurrent=mock_settings.openai.max_concurrent_requests,
+            requests_per_minute=mock_settings.openai.requests_per_minute,
+            tokens_per_minute=mock_settings.openai.tokens_per_minute,
+            max_retries=mock_settings.openai.max_retries,
+            response_cache_ttl_hours=mock_settings.openai.response_cache_ttl_hours,
+            response_cache_max_entries=mock_settings.openai.response_cache_max_entries,
         )
 
         # Verify analysis service call
@@ -238,7 +239,7 @@ class TestAnalysisJobs:
 
     @pytest.mark.asyncio
     @patch("app.core.database.AsyncSessionLocal")
-    @patch("app.jobs.analysis_jobs.StashService")
+    @patch("app.jobs.analysis_jobs.get_shared_stash_service")
     @patch("app.jobs.analysis_jobs.OpenAIClient")
     @patch("app.jobs.analysis_jobs.AnalysisService")
     @patch("app.jobs.analysis_jobs.load_settings_with_db_overrides")
@@ -247,7 +248,7 @@ class TestAnalysisJobs:
         mock_get_settings,
         mock_analysis_service_cls,
         mock_openai_client_cls,
-        mock_stash_service_cls,
+        mock_get_stash_service,
         mock_async_session,
         mock_settings,
         mock_progress_callback,
@@ -305,11 +306,12 @@ class TestAnalysisJobs:
             job_id=job_id,
             progress_callback=mock_progress_callback,
             change_ids=None,
+            concurrency=None,
         )
 
     @pytest.mark.asyncio
     @patch("app.core.database.AsyncSessionLocal")
-    @patch("app.jobs.analysis_jobs.StashService")
+    @patch("app.jobs.analysis_jobs.get_shared_stash_service")
     @patch("app.jobs.analysis_jobs.OpenAIClient")
     @patch("app.jobs.analysis_jobs.AnalysisService")
     @patch("app.jobs.analysis_jobs.load_settings_with_db_overrides")
@@ -318,7 +320,7 @@ class TestAnalysisJobs:
         mock_get_settings,
         mock_analysis_service_cls,
         mock_openai_client_cls,
-        mock_stash_service_cls,
+        mock_get_stash_service,
         mock_async_session_local,
         mock_settings,
         mock_progress_callback,
@@ -359,7 +361,7 @@ class TestAnalysisJobs:
 
         # Mock stash service
         mock_stash_service = Mock()
-        mock_stash_service_cls.return_value = mock_stash_service
+        mock_get_stash_service.return_value = mock_stash_service
 
         # Mock analysis service
         mock_analysis_service = Mock()
@@ -549,12 +551,12 @@ class TestAnalysisJobsExtended:
     @patch("app.jobs.analysis_jobs.load_settings_with_db_overrides")
     @patch("app.jobs.analysis_jobs.AnalysisService")
     @patch("app.jobs.analysis_jobs.OpenAIClient")
-    @patch("app.jobs.analysis_jobs.StashService")
+    @patch("app.jobs.analysis_jobs.get_shared_stash_service")
     @patch("app.core.database.AsyncSessionLocal")
     async def test_analyze_scenes_job_with_exception_in_summary(
         self,
         mock_async_session,
-        mock_stash_service_cls,
+        mock_get_stash_service,
         mock_openai_client_cls,
         mock_analysis_service_cls,
         mock_get_settings,
@@ -611,7 +613,7 @@ class TestAnalysisJobsExtended:
 
     @pytest.mark.asyncio
     @patch("app.core.database.AsyncSessionLocal")
-    @patch("app.jobs.analysis_jobs.StashService")
+    @patch("app.jobs.analysis_jobs.get_shared_stash_service")
     @patch("app.jobs.analysis_jobs.OpenAIClient")
     @patch("app.jobs.analysis_jobs.AnalysisService")
     @patch("app.jobs.analysis_jobs.load_settings_with_db_overrides")
@@ -620,7 +622,7 @@ class TestAnalysisJobsExtended:
         mock_get_settings,
         mock_analysis_service_cls,
         mock_openai_client_cls,
-        mock_stash_service_cls,
+        mock_get_stash_service,
         mock_async_session_local,
         mock_settings,
         mock_progress_callback,
@@ -663,7 +665,7 @@ class TestAnalysisJobsExtended:
 
         # Mock stash service
         mock_stash_service = Mock()
-        mock_stash_service_cls.return_value = mock_stash_service
+        mock_get_stash_service.return_value = mock_stash_service
 
         # Mock analysis service
         mock_analysis_service = Mock()
@@ -91,6 +91,10 @@ class TestAnalysisService:
         analysis_settings = Mock()
         analysis_settings.batch_size = 15
         analysis_settings.max_concurrent = 3
+        analysis_settings.prompt_candidate_limit = 200
+        analysis_settings.plan_flush_scenes = 25
+        analysis_settings.plan_flush_interval = 5.0
+        analysis_settings.scene_workers = 4
         analysis_settings.confidence_threshold = 0.7
         analysis_settings.enable_ai = True
         analysis_settings.create_missing = False
@@ -301,18 +305,16 @@ class TestAnalysisService:
         mock_plan_incremental.name = "Test Analysis"
         mock_plan_incremental.status = PlanStatus.PENDING
         mock_plan_incremental.job_id = "test-job-123"
+        mock_plan.plan_metadata = {}
 
         # Mock create_or_update_plan and finalize_plan
         analysis_service.plan_manager.create_or_update_plan = AsyncMock(
             return_value=mock_plan_incremental
         )
-        analysis_service.plan_manager.add_changes_to_plan = AsyncMock()
+        analysis_service.plan_manager.insert_scene_changes = AsyncMock(return_value=0)
         analysis_service.plan_manager.finalize_plan = AsyncMock()
         analysis_service.plan_manager.get_plan = AsyncMock(return_value=mock_plan)
 
-        # Mock _mark_single_scene_analyzed
-        analysis_service._mark_single_scene_analyzed = AsyncMock()
-
         # Create a simple progress callback
         async def progress_cb(current, message):
             pass
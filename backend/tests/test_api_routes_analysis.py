@@ -914,6 +914,9 @@ class TestAnalysisRoutes:
                 "scene_1": {"prompt": 1500, "completion": 1000},
                 "scene_2": {"prompt": 1500, "completion": 1000},
             },
+            "prompt_tokens_saved": 12000,
+            "cache_hits": 3,
+            "cache_hit_rate": 0.25,
             "model": "gpt-4",
             "scenes_analyzed": 2,
             "average_cost_per_scene": 0.075,
@@ -932,6 +935,8 @@ class TestAnalysisRoutes:
         assert data["total_tokens"] == 5000
         assert data["prompt_tokens"] == 3000
         assert data["completion_tokens"] == 2000
+        assert data["prompt_tokens_saved"] == 12000
+        assert data["cache_hit_rate"] == 0.25
         assert data["model"] == "gpt-4"
         assert data["scenes_analyzed"] == 2
         assert data["average_cost_per_scene"] == 0.075
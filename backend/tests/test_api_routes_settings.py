@@ -498,7 +498,7 @@ class TestSettingsRoutes:
             app.dependency_overrides.pop(get_settings_with_overrides, None)
             app.dependency_overrides.pop(get_stash_service, None)
 
-    @patch("openai.OpenAI")
+    @patch("openai.AsyncOpenAI")
     def test_test_openai_connection_success(
         self, mock_openai_class, client, mock_overridden_settings
     ):
@@ -509,7 +509,7 @@ class TestSettingsRoutes:
         mock_model.id = "gpt-4"
         mock_models_response = Mock()
         mock_models_response.data = [mock_model]
-        mock_openai_instance.models.list.return_value = mock_models_response
+        mock_openai_instance.models.list = AsyncMock(return_value=mock_models_response)
         mock_openai_class.return_value = mock_openai_instance
 
         # Mock dependencies
@@ -537,7 +537,7 @@ class TestSettingsRoutes:
         finally:
             app.dependency_overrides.pop(get_settings_with_overrides, None)
 
-    @patch("openai.OpenAI")
+    @patch("openai.AsyncOpenAI")
     def test_test_openai_connection_with_base_url(
         self, mock_openai_class, client, mock_overridden_settings
     ):
@@ -548,7 +548,7 @@ class TestSettingsRoutes:
         mock_model.id = "custom-model"
         mock_models_response = Mock()
         mock_models_response.data = [mock_model]
-        mock_openai_instance.models.list.return_value = mock_models_response
+        mock_openai_instance.models.list = AsyncMock(return_value=mock_models_response)
         mock_openai_class.return_value = mock_openai_instance
 
         # Mock dependencies
@@ -579,7 +579,7 @@ class TestSettingsRoutes:
         finally:
             app.dependency_overrides.pop(get_settings_with_overrides, None)
 
-    @patch("openai.OpenAI")
+    @patch("openai.AsyncOpenAI")
     def test_test_openai_connection_model_not_available(
         self, mock_openai_class, client, mock_overridden_settings
     ):
@@ -590,7 +590,7 @@ class TestSettingsRoutes:
         mock_model.id = "gpt-3.5-turbo"
         mock_models_response = Mock()
         mock_models_response.data = [mock_model]
-        mock_openai_instance.models.list.return_value = mock_models_response
+        mock_openai_instance.models.list = AsyncMock(return_value=mock_models_response)
         mock_openai_class.return_value = mock_openai_instance
 
         # Mock dependencies
@@ -637,7 +637,7 @@ class TestSettingsRoutes:
         finally:
             app.dependency_overrides.pop(get_settings_with_overrides, None)
 
-    @patch("openai.OpenAI")
+    @patch("openai.AsyncOpenAI")
     def test_test_openai_connection_api_error(
         self, mock_openai_class, client, mock_overridden_settings
     ):
@@ -80,6 +80,7 @@ def mock_stash_service():
     """Mock Stash service."""
     service = Mock(spec=StashService)
     service.get_scenes = AsyncMock(return_value=([], 0))
+    service.count_scenes = AsyncMock(return_value=0)
     return service
 
 
@@ -659,7 +660,7 @@ class TestSyncStatsEndpoint:
         mock_db.execute.side_effect = mock_execute
 
         # Mock Stash service to return pending scenes
-        mock_stash_service.get_scenes.return_value = ([], 25)
+        mock_stash_service.count_scenes.return_value = 25
 
         response = client.get("/api/sync/stats")
 
@@ -738,7 +739,7 @@ class TestSyncStatsEndpoint:
         mock_db.execute.side_effect = mock_execute
 
         # Mock Stash service to return 0 pending scenes (not needed for this test)
-        mock_stash_service.get_scenes.return_value = ([], 0)
+        mock_stash_service.count_scenes.return_value = 0
 
         response = client.get("/api/sync/stats")
 
@@ -808,7 +809,7 @@ class TestSyncStatsEndpoint:
         mock_db.execute.side_effect = mock_execute
 
         # Make Stash service raise an exception
-        mock_stash_service.get_scenes.side_effect = Exception("Connection failed")
+        mock_stash_service.count_scenes.side_effect = Exception("Connection failed")
 
         response = client.get("/api/sync/stats")
 
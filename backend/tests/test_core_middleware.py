@@ -9,6 +9,7 @@ from unittest.mock import patch
 import pytest
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
 
 from app.core.middleware import (
     CORSMiddleware,
@@ -176,6 +177,35 @@ class TestTimingMiddleware:
         # Should take at least 0.1 seconds
         assert process_time >= 0.1
 
+    def test_records_latency_by_route_template(self):
+        """Test that request latency is labelled with the route template."""
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            return {"id": item_id}
+
+        app.add_middleware(TimingMiddleware)
+        client = TestClient(app)
+
+        def requests(route, status):
+            return (
+                REGISTRY.get_sample_value(
+                    "stashhog_http_request_duration_seconds_count",
+                    {"method": "GET", "route": route, "status": status},
+                )
+                or 0
+            )
+
+        before = requests("/items/{item_id}", "200")
+
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+
+        assert requests("/items/{item_id}", "200") - before == 2
+        assert requests("unmatched", "404") >= 1
+
     def test_multiple_middleware_timing(self, test_app):
         """Test timing with multiple middleware."""
         test_app.add_middleware(TimingMiddleware)
@@ -5,7 +5,14 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from app.core.tasks import Task, TaskQueue, TaskStatus, background_task, get_task_queue
+from app.core.tasks import (
+    INTERACTIVE_LANE,
+    Task,
+    TaskQueue,
+    TaskStatus,
+    background_task,
+    get_task_queue,
+)
 
 
 class TestTaskModel:
@@ -664,3 +671,145 @@ class TestEdgeCases:
 
         # Most tasks should still be pending since we stopped quickly
         assert pending_count >= 3
+
+
+async def _wait_until(condition, attempts=100):
+    for _ in range(attempts):
+        if condition():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+class TestTaskRetention:
+    """Test eviction of finished tasks."""
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_beyond_limit_are_evicted(self):
+        """Test that only the newest finished tasks are kept."""
+        queue = TaskQueue(max_workers=1, max_finished_tasks=3)
+
+        async def quick_task(n):
+            return n
+
+        await queue.start()
+        try:
+            task_ids = [await queue.submit(quick_task, i) for i in range(10)]
+            assert await _wait_until(lambda: task_ids[-1] in queue._finished)
+
+            assert set(queue.tasks) == set(task_ids[-3:])
+            assert queue.get_task(task_ids[0]) is None
+            assert queue.get_task(task_ids[-1]).result == 9
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_old_finished_tasks_are_evicted_on_submit(self):
+        """Test that finished tasks past the age limit are dropped."""
+        queue = TaskQueue(max_workers=1, finished_task_ttl=0.0)
+        callback = Mock()
+
+        async def quick_task():
+            return "done"
+
+        await queue.start()
+        try:
+            first_id = await queue.submit(quick_task)
+            queue.add_task_callback(first_id, callback)
+            assert await _wait_until(lambda: first_id not in queue.tasks)
+
+            second_id = await queue.submit(quick_task)
+
+            assert first_id not in queue.tasks
+            assert second_id in queue.tasks
+            assert queue._task_callbacks == {}
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_running_tasks_are_never_evicted(self):
+        """Test that eviction only touches finished tasks."""
+        queue = TaskQueue(max_workers=1, max_finished_tasks=0)
+        release = asyncio.Event()
+
+        async def blocking_task():
+            await release.wait()
+
+        await queue.start()
+        try:
+            task_id = await queue.submit(blocking_task)
+            assert await _wait_until(
+                lambda: queue.get_task(task_id).status == TaskStatus.RUNNING
+            )
+            queue._evict_finished_tasks()
+            assert queue.get_task(task_id) is not None
+
+            release.set()
+            assert await _wait_until(lambda: queue.get_task(task_id) is None)
+        finally:
+            await queue.stop()
+
+
+class TestTaskLanes:
+    """Test priority lanes."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_lane_skips_busy_default_lane(self):
+        """Test that interactive tasks run while default workers are busy."""
+        queue = TaskQueue(max_workers=1, lane_workers={INTERACTIVE_LANE: 1})
+        release = asyncio.Event()
+
+        async def long_task():
+            await release.wait()
+            return "long"
+
+        async def short_task():
+            return "short"
+
+        await queue.start()
+        try:
+            assert len(queue.workers) == 2
+            long_id = await queue.submit(long_task)
+            queued_id = await queue.submit(short_task)
+            interactive_id = await queue.submit(short_task, lane=INTERACTIVE_LANE)
+
+            assert await _wait_until(
+                lambda: queue.get_task(interactive_id).status == TaskStatus.COMPLETED
+            )
+            assert queue.get_task(long_id).status == TaskStatus.RUNNING
+            assert queue.get_task(queued_id).status == TaskStatus.PENDING
+            release.set()
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_lane_without_workers_uses_default_lane(self):
+        """Test that unknown lanes fall back to the default lane."""
+        queue = TaskQueue(max_workers=1)
+
+        async def short_task():
+            return "short"
+
+        task_id = await queue.submit(short_task, lane=INTERACTIVE_LANE)
+
+        assert queue.get_task(task_id).lane == "default"
+        assert queue.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_task_is_not_run(self):
+        """Test that workers skip tasks cancelled while queued."""
+        queue = TaskQueue(max_workers=1)
+        ran = Mock()
+
+        async def task():
+            ran()
+
+        task_id = await queue.submit(task)
+        await queue.cancel_task(task_id)
+        await queue.start()
+        try:
+            await asyncio.sleep(0.05)
+            ran.assert_not_called()
+            assert queue.queue.empty()
+        finally:
+            await queue.stop()
@@ -0,0 +1,66 @@
+"""Tests for coalesced job progress reporting."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.cancellation import CancellationToken
+from app.services.job_progress import JobProgressReporter
+
+
+class TestJobProgressReporter:
+    """Test batching of progress writes."""
+
+    @pytest.mark.asyncio
+    async def test_writes_on_percentage_change_only(self):
+        """Test that per-item reports within one percentage are held back."""
+        write = AsyncMock()
+        reporter = JobProgressReporter("job-1", write, flush_interval=60)
+
+        for processed in range(1, 1001):
+            await reporter.report(
+                processed * 100 // 1000, f"Processed {processed}/1000 scenes"
+            )
+        await reporter.close()
+
+        assert reporter.reports == 1000
+        # One write per percentage point plus the held-back final message
+        assert write.await_count == 101
+        write.assert_awaited_with(100, "Processed 1000/1000 scenes")
+
+    @pytest.mark.asyncio
+    async def test_held_back_report_is_written_after_interval(self):
+        """Test that a pending message is flushed without further reports."""
+        write = AsyncMock()
+        # A frozen clock, so only the flush timer can make the report due
+        reporter = JobProgressReporter(
+            "job-1", write, flush_interval=0.01, clock=lambda: 0.0
+        )
+
+        await reporter.report(10, "Processed 1/10 scenes")
+        await reporter.report(None, "Fetching more scenes")
+        assert write.await_count == 1
+
+        timer = reporter._timer
+        assert timer is not None
+        await timer
+
+        assert write.await_count == 2
+        write.assert_awaited_with(None, "Fetching more scenes")
+        await reporter.close()
+        assert write.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_token_drops_reports(self):
+        """Test that reports after cancellation never reach the database."""
+        write = AsyncMock()
+        token = CancellationToken()
+        reporter = JobProgressReporter("job-1", write, token, flush_interval=60)
+
+        await reporter.report(10, "Processed 1/10 scenes")
+        await reporter.report(10, "Processed 2/10 scenes")
+        token.cancel()
+        await reporter.report(50, "Processed 5/10 scenes")
+        await reporter.close()
+
+        write.assert_awaited_once_with(10, "Processed 1/10 scenes")
@@ -0,0 +1,261 @@
+"""Tests for the durable database job queue."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.job import Job, JobStatus, JobType
+from app.repositories.job_repository import job_repository
+from app.services.job_queue import DatabaseJobQueue
+from app.services.job_service import JobService
+
+JOB_TYPES = [JobType.SYNC.value, JobType.ANALYSIS.value]
+
+
+def _job(job_id, minutes=0, **fields):
+    fields.setdefault("status", JobStatus.PENDING.value)
+    return Job(
+        id=job_id,
+        type=fields.pop("type", JobType.ANALYSIS.value),
+        progress=0,
+        job_metadata={},
+        created_at=datetime.utcnow() + timedelta(minutes=minutes),
+        **fields,
+    )
+
+
+class TestJobClaims:
+    """Test leasing jobs from the job table."""
+
+    @pytest.mark.asyncio
+    async def test_claims_oldest_pending_job_once(self, test_async_session):
+        """Test that each pending job is leased to exactly one claim."""
+        db = test_async_session
+        db.add_all([_job("second", minutes=1), _job("first")])
+        await db.commit()
+
+        claims = [
+            await job_repository.claim_next_job(db, "worker-a", 60, JOB_TYPES, 3)
+            for _ in range(3)
+        ]
+
+        assert [job.id if job else None for job in claims] == [
+            "first",
+            "second",
+            None,
+        ]
+        assert claims[0].lease_owner == "worker-a"
+        assert claims[0].attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed_until_max_attempts(
+        self, test_async_session
+    ):
+        """Test that jobs of dead workers are re-dispatched a limited number of times."""
+        db = test_async_session
+        expired = datetime.utcnow() - timedelta(seconds=5)
+        db.add_all(
+            [
+                _job(
+                    "orphaned",
+                    status=JobStatus.RUNNING.value,
+                    lease_owner="dead-worker",
+                    lease_expires_at=expired,
+                    attempts=1,
+                ),
+                _job(
+                    "exhausted",
+                    status=JobStatus.RUNNING.value,
+                    lease_owner="dead-worker",
+                    lease_expires_at=expired,
+                    attempts=3,
+                ),
+                _job(
+                    "alive",
+                    status=JobStatus.RUNNING.value,
+                    lease_owner="other-worker",
+                    lease_expires_at=datetime.utcnow() + timedelta(minutes=1),
+                    attempts=1,
+                ),
+                _job("unhandled", type=JobType.EXPORT.value),
+            ]
+        )
+        await db.commit()
+
+        job = await job_repository.claim_next_job(db, "worker-a", 60, JOB_TYPES, 3)
+
+        assert job.id == "orphaned"
+        assert job.attempts == 2
+        again = await job_repository.claim_next_job(db, "worker-a", 60, JOB_TYPES, 3)
+        assert again is None
+
+    @pytest.mark.asyncio
+    async def test_lease_renewal_and_release(self, test_async_session):
+        """Test that only the lease owner can renew or release it."""
+        db = test_async_session
+        db.add(_job("job-1"))
+        await db.commit()
+        await job_repository.claim_next_job(db, "worker-a", 60, JOB_TYPES, 3)
+
+        status = await job_repository.renew_job_lease("job-1", "worker-a", 60, db)
+        stolen = await job_repository.renew_job_lease("job-1", "worker-b", 60, db)
+        await job_repository.release_job_lease("job-1", "worker-a", db)
+        job = await job_repository.get_job("job-1", db)
+
+        assert status == JobStatus.PENDING.value
+        assert stolen is None
+        assert job.lease_owner is None
+        assert job.lease_expires_at is None
+
+    @pytest.mark.asyncio
+    async def test_exclusive_type_waits_for_live_lease(self, test_async_session):
+        """Test that a sync job is not claimed while another sync job is leased."""
+        db = test_async_session
+        live = datetime.utcnow() + timedelta(seconds=60)
+        db.add_all(
+            [
+                _job(
+                    "running",
+                    type=JobType.SYNC.value,
+                    status=JobStatus.RUNNING.value,
+                    lease_owner="worker-b",
+                    lease_expires_at=live,
+                ),
+                _job("sync", type=JobType.SYNC.value),
+                _job("analysis", minutes=1),
+            ]
+        )
+        await db.commit()
+        exclusive = {JobType.SYNC.value}
+
+        async def claim():
+            return await job_repository.claim_next_job(
+                db, "worker-a", 60, JOB_TYPES, 3, exclusive_types=exclusive
+            )
+
+        assert (await claim()).id == "analysis"
+        assert await claim() is None
+
+        await job_repository.release_job_lease("running", "worker-b", db)
+        assert (await claim()).id == "sync"
+
+
+class TestDatabaseJobQueue:
+    """Test dispatching jobs from the database queue."""
+
+    @pytest.fixture
+    def session_factory(self, test_async_engine, test_async_session):
+        factory = async_sessionmaker(
+            test_async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            yield factory
+
+    @pytest.fixture
+    def job_service(self):
+        service = JobService()
+        with (
+            patch.object(service, "_durable_queue_enabled", return_value=True),
+            patch("app.services.job_service.websocket_manager") as websocket,
+        ):
+            websocket.broadcast_job_update = AsyncMock()
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_created_job_is_run_by_queue_worker(
+        self, session_factory, job_service
+    ):
+        """Test that create_job only queues and a worker runs the handler."""
+        handler = AsyncMock(return_value={"status": "completed"})
+        job_service.register_handler(JobType.ANALYSIS, handler)
+        queue = DatabaseJobQueue(worker_id="worker-a")
+        queue._job_service = job_service
+
+        with patch("app.services.job_service.get_task_queue") as get_task_queue:
+            async with session_factory() as db:
+                job = await job_service.create_job(
+                    JobType.ANALYSIS, db, metadata={"scene_ids": ["s1"]}
+                )
+            get_task_queue.assert_not_called()
+
+        claimed = await queue.claim_next()
+        await queue.run(claimed)
+
+        assert handler.await_args.kwargs["scene_ids"] == ["s1"]
+        assert "resume_checkpoint" not in handler.await_args.kwargs
+        async with session_factory() as db:
+            finished = await job_repository.get_job(job.id, db)
+        assert finished.status == JobStatus.COMPLETED.value
+        assert finished.lease_owner is None
+        assert queue.running_job_ids == []
+
+    @pytest.mark.asyncio
+    async def test_redispatched_job_gets_checkpoint(self, session_factory, job_service):
+        """Test that a job whose worker died resumes from its checkpoint."""
+        handler = AsyncMock(return_value={"status": "completed"})
+        job_service.register_handler(JobType.SYNC, handler)
+        async with session_factory() as db:
+            db.add(
+                _job(
+                    "interrupted",
+                    type=JobType.SYNC.value,
+                    status=JobStatus.RUNNING.value,
+                    payload={"full_resync": True},
+                    lease_owner="dead-worker",
+                    lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+                    attempts=1,
+                )
+            )
+            await db.commit()
+        await job_service.save_checkpoint("interrupted", {"page": 7})
+
+        queue = DatabaseJobQueue(worker_id="worker-a")
+        queue._job_service = job_service
+        await queue.run(await queue.claim_next())
+
+        kwargs = handler.await_args.kwargs
+        assert kwargs["full_resync"] is True
+        assert kwargs["resume_checkpoint"] == {"page": 7}
+
+    @pytest.mark.asyncio
+    async def test_stopped_job_keeps_lease_and_is_reclaimed(
+        self, session_factory, job_service
+    ):
+        """Test that stopping the queue leaves its running job to be re-claimed."""
+        started = asyncio.Event()
+
+        async def handler(**kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        job_service.register_handler(JobType.ANALYSIS, handler)
+        async with session_factory() as db:
+            db.add(_job("long"))
+            await db.commit()
+
+        queue = DatabaseJobQueue(max_workers=1, poll_interval=0.05, worker_id="a")
+        await queue.start(job_service)
+        await asyncio.wait_for(started.wait(), timeout=5)
+        await queue.stop()
+
+        async with session_factory() as db:
+            job = await job_repository.get_job("long", db)
+        assert job.status == JobStatus.RUNNING.value
+        assert job.lease_owner == "a"
+        assert job.lease_expires_at is not None
+
+        # Another worker takes over once the lease expires
+        other = DatabaseJobQueue(worker_id="b")
+        other._job_service = job_service
+        assert await other.claim_next() is None
+        async with session_factory() as db:
+            job = await job_repository.get_job("long", db)
+            job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+            await db.commit()
+        reclaimed = await other.claim_next()
+        assert reclaimed.id == "long"
+        assert reclaimed.lease_owner == "b"
+        assert reclaimed.attempts == 2
@@ -1,5 +1,6 @@
 """Tests for job service."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
@@ -96,6 +97,37 @@ class TestJobService:
         assert call_args.kwargs["status"] == JobStatus.FAILED
         assert "No handler registered" in call_args.kwargs["error"]
 
+    def test_task_lane(self, job_service):
+        """Test that short user-triggered jobs go to the interactive lane."""
+        few = {"scene_ids": ["1"]}
+        many = {"scene_ids": [str(i) for i in range(50)]}
+        assert job_service._task_lane(JobType.LOCAL_GENERATE, None) == "interactive"
+        assert job_service._task_lane(JobType.SYNC_SCENES, few) == "interactive"
+        assert job_service._task_lane(JobType.SYNC_SCENES, many) == "default"
+        assert job_service._task_lane(JobType.SYNC_SCENES, {}) == "default"
+        assert job_service._task_lane(JobType.ANALYSIS, few) == "default"
+
+    @pytest.mark.asyncio
+    async def test_small_scene_sync_skips_job_type_lock(self, job_service):
+        """Test that a single-scene resync does not wait for a running sync."""
+        few = {"scene_ids": ["1"]}
+        lock = job_service._get_job_type_lock(JobType.SYNC_SCENES, {})
+        await lock.acquire()
+        job_service._execute_job_with_lock = AsyncMock(return_value="done")
+
+        try:
+            result = await asyncio.wait_for(
+                job_service._run_job(
+                    "job-1", JobType.SYNC_SCENES, AsyncMock(), few, {}
+                ),
+                timeout=5,
+            )
+        finally:
+            lock.release()
+
+        assert result == "done"
+        assert job_service._get_job_type_lock(JobType.SYNC_SCENES, few) is None
+
     @pytest.mark.asyncio
     async def test_update_job_progress(self, job_service):
         """Test updating job progress through handler callback."""
@@ -442,7 +474,7 @@ class TestJobService:
         # Mock task queue
         captured_tasks = []
 
-        async def capture_task(func, name):
+        async def capture_task(func, name, lane=None):
             captured_tasks.append(func)
             return f"task_{len(captured_tasks)}"
 
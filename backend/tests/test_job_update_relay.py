@@ -0,0 +1,137 @@
+"""Tests for relaying job updates from worker processes and the worker entry point."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app import worker
+from app.models.job import Job, JobStatus, JobType
+from app.services.job_update_relay import JobUpdateRelay
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _job(job_id, seconds, lease_owner=None):
+    return Job(
+        id=job_id,
+        type=JobType.ANALYSIS.value,
+        status=JobStatus.RUNNING.value,
+        progress=10,
+        job_metadata={"message": "Processed 1/10 scenes"},
+        lease_owner=lease_owner,
+        updated_at=BASE_TIME + timedelta(seconds=seconds),
+    )
+
+
+class TestJobUpdateRelay:
+    """Test broadcasting job rows changed by other processes."""
+
+    @pytest.fixture
+    def session_factory(self, test_async_engine, test_async_session):
+        factory = async_sessionmaker(
+            test_async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        with patch("app.core.database.AsyncSessionLocal", factory):
+            yield factory
+
+    @pytest.fixture
+    def send_job_update(self):
+        with patch(
+            "app.services.job_service.job_service._send_job_update",
+            new_callable=AsyncMock,
+        ) as send:
+            yield send
+
+    @pytest.mark.asyncio
+    async def test_relays_each_change_once(self, session_factory, send_job_update):
+        """Test that only changes after the first poll are broadcast, once each."""
+        async with session_factory() as db:
+            db.add(_job("old", 0))
+            await db.commit()
+
+        relay = JobUpdateRelay(local_worker_id="api")
+        assert await relay.poll() == 0
+
+        async with session_factory() as db:
+            db.add_all(
+                [
+                    _job("remote", 1, lease_owner="worker-1"),
+                    _job("local", 1, lease_owner="api"),
+                ]
+            )
+            await db.commit()
+
+        assert await relay.poll() == 1
+        assert await relay.poll() == 0
+
+        send_job_update.assert_awaited_once()
+        args, kwargs = send_job_update.await_args
+        assert args == (
+            "remote",
+            {
+                "message": "Processed 1/10 scenes",
+                "error": None,
+                "result": None,
+            },
+        )
+        assert kwargs["job"].id == "remote"
+
+    @pytest.mark.asyncio
+    async def test_relays_new_progress_of_known_job(
+        self, session_factory, send_job_update
+    ):
+        """Test that a later write to the same job is broadcast again."""
+        relay = JobUpdateRelay()
+        await relay.poll()
+        async with session_factory() as db:
+            db.add(_job("remote", 1, lease_owner="worker-1"))
+            await db.commit()
+        await relay.poll()
+
+        async with session_factory() as db:
+            job = await db.get(Job, "remote")
+            job.progress = 50
+            job.updated_at = BASE_TIME + timedelta(seconds=2)
+            await db.commit()
+
+        assert await relay.poll() == 1
+        assert send_job_update.await_args.kwargs["job"].progress == 50
+
+
+class TestWorkerEntryPoint:
+    """Test the standalone worker process entry point."""
+
+    def test_requires_database_queue(self):
+        """Test that workers refuse to start without the durable queue."""
+        settings = MagicMock(job_queue_mode="memory", job_worker_processes=2)
+        with (
+            patch("app.worker.get_settings", return_value=settings),
+            patch("app.worker.WorkerPool") as pool,
+        ):
+            assert worker.main([]) == 2
+        pool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_worker_starts_and_stops_queue(self):
+        """Test that a worker process runs the queue until asked to stop."""
+        queue = MagicMock(worker_id="worker-1", start=AsyncMock(), stop=AsyncMock())
+        stop = asyncio.Event()
+        stop.set()
+
+        with (
+            patch("app.worker._init_stash_services", new_callable=AsyncMock),
+            patch("app.jobs.register_all_jobs") as register_all_jobs,
+            patch("app.services.job_queue.get_job_queue", return_value=queue),
+            patch("app.services.stash_registry.get_stash_registry") as registry,
+            patch("app.core.database.close_db", new_callable=AsyncMock) as close_db,
+        ):
+            registry.return_value.close_all = AsyncMock()
+            await worker.run_worker(stop)
+
+        register_all_jobs.assert_called_once()
+        queue.start.assert_awaited_once()
+        queue.stop.assert_awaited_once()
+        close_db.assert_awaited_once()
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from app.core.config import Settings
 from app.main import (
@@ -91,6 +92,20 @@ class TestMainApp:
         assert "debug" in data
         assert data["name"] == "StashHog"
 
+    def test_metrics_endpoint(self, client):
+        """Test the Prometheus metrics endpoint."""
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE_LATEST
+        assert (
+            'stashhog_http_request_duration_seconds_count{method="GET",'
+            'route="/health",status="200"}' in response.text
+        )
+
+        with patch("app.main.settings.metrics_enabled", False):
+            assert client.get("/metrics").status_code == 404
+
     def test_ready_check_endpoint(self, client):
         """Test the ready check endpoint."""
         response = client.get("/ready")
@@ -35,7 +35,7 @@ async def test_apply_single_change_with_missing_scene():
     assert result == "skipped"
     assert change.status == ChangeStatus.APPLIED  # Verify change is marked as applied
     assert change.applied_at is not None  # Verify applied_at is set
-    stash_service_mock.get_scene.assert_called_once_with("30960")
+    stash_service_mock.get_scene.assert_called_once_with("30960", use_cache=False)
     db_mock.flush.assert_called()  # Verify database flush was called
 
 
@@ -50,11 +50,10 @@ async def test_process_plan_changes_with_missing_scenes():
     # Mock stash service
     stash_service_mock = AsyncMock()
     # First scene exists, second doesn't, third exists
-    stash_service_mock.get_scene.side_effect = [
-        {"id": "1", "tags": []},  # Scene 1 exists
-        None,  # Scene 2 is missing
-        {"id": "3", "tags": []},  # Scene 3 exists
-    ]
+    stash_service_mock.get_scenes_by_ids.return_value = {
+        "1": {"id": "1", "tags": []},
+        "3": {"id": "3", "tags": []},
+    }
     stash_service_mock.find_tag.return_value = {"id": "tag1", "name": "test_tag"}
     stash_service_mock.update_scene.return_value = True
 
@@ -103,6 +102,16 @@ async def test_process_plan_changes_with_missing_scenes():
     assert result["failed_changes"] == 0  # No actual failures
     assert len(result["modified_scene_ids"]) == 2  # Only 2 scenes modified
 
+    # All affected scenes are fetched at once, and the identical tag addition
+    # for scenes 1 and 3 is sent as one bulk update
+    stash_service_mock.get_scenes_by_ids.assert_called_once_with(
+        ["1", "2", "3"], use_cache=False
+    )
+    stash_service_mock.bulk_add_scene_relations.assert_called_once_with(
+        ["1", "3"], tag_ids=["tag1"], performer_ids=None
+    )
+    stash_service_mock.update_scene.assert_not_called()
+
 
 @pytest.mark.asyncio
 async def test_apply_plan_with_all_scenes_missing():
@@ -121,7 +130,7 @@ async def test_apply_plan_with_all_scenes_missing():
 
     # Mock stash service - all scenes are missing
     stash_service_mock = AsyncMock()
-    stash_service_mock.get_scene.return_value = None
+    stash_service_mock.get_scenes_by_ids.return_value = {}
 
     with patch.object(plan_manager, "get_plan", return_value=plan_mock):
         with patch.object(
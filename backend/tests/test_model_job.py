@@ -315,13 +315,14 @@ class TestJob:
         """Test that proper indexes are defined."""
         # Check that the table args define the expected indexes
         table_args = Job.__table_args__
-        assert len(table_args) == 3
+        assert len(table_args) == 4
 
         # Check index names
         index_names = [idx.name for idx in table_args]
         assert "idx_job_type_status" in index_names
         assert "idx_job_status_created" in index_names
         assert "idx_job_completed" in index_names
+        assert "idx_job_status_lease" in index_names
 
 
 class TestJobEdgeCases:
@@ -0,0 +1,227 @@
+"""
+Tests for the performer name/alias index.
+
+This module checks that indexed matching returns the same results as the
+linear scan it replaces, and that the index follows performer list updates.
+"""
+
+import random
+import string
+
+import pytest
+
+from app.services.analysis.performer_detector import PerformerDetector
+from app.services.analysis.performer_index import PerformerIndex
+
+
+def linear_find_full_name(detector, partial, known_performers):
+    """Reference implementation: scan every performer."""
+    partial_lower = partial.lower().strip()
+    for performer in known_performers:
+        name = performer.get("name", "")
+        if partial_lower == name.lower():
+            return (name, 1.0)
+        aliases = performer.get("aliases", [])
+        if isinstance(aliases, str):
+            aliases = [a.strip() for a in aliases.split(",") if a.strip()]
+        for alias in aliases:
+            if partial_lower == alias.lower():
+                return (name, 0.95)
+
+    best_match = None
+    best_score = 0.0
+    for performer in known_performers:
+        name = performer.get("name", "")
+        score = detector._score_name_match(partial, partial_lower, name)
+        if score > best_score and score >= 0.6:
+            best_score = score
+            best_match = name
+    return (best_match, best_score) if best_match else None
+
+
+class TestPerformerIndexLookup:
+    """Test exact and fuzzy lookups."""
+
+    @pytest.fixture
+    def performers(self):
+        return [
+            {"name": "Christopher Williams", "aliases": ["Chris W"]},
+            {"name": "Chris Anderson", "aliases": "CA, Andy"},
+            {"name": "Jane Doe", "aliases": []},
+            {"name": "Andy", "aliases": []},
+        ]
+
+    def test_exact_name_and_alias(self, performers):
+        """Test that names score 1.0 and aliases 0.95."""
+        index = PerformerIndex()
+        index.update(performers)
+
+        assert index.find_exact("jane doe") == ("Jane Doe", 1.0)
+        assert index.find_exact("chris w") == ("Christopher Williams", 0.95)
+        assert index.find_exact("ca") == ("Chris Anderson", 0.95)
+
+    def test_earlier_alias_wins_over_later_name(self, performers):
+        """Test that precedence follows performer order like a linear scan."""
+        index = PerformerIndex()
+        index.update(performers)
+
+        assert index.find_exact("andy") == ("Chris Anderson", 0.95)
+
+    def test_fuzzy_match_scores_few_candidates(self, performers):
+        """Test that unrelated performers are never scored."""
+        detector = PerformerDetector()
+        scored = []
+
+        def score(partial, partial_lower, name):
+            scored.append(name)
+            return detector._score_name_match(partial, partial_lower, name)
+
+        index = PerformerIndex()
+        index.update(performers + [{"name": f"Zed {i}"} for i in range(500)])
+
+        result = index.find_partial("Chris Williams", "chris williams", score)
+
+        assert result[0] == "Christopher Williams"
+        assert len(scored) < 5
+
+    def test_matches_linear_scan(self):
+        """Test that indexed results equal the linear scan on random names."""
+        rng = random.Random(42)
+        syllables = ["an", "na", "jo", "el", "ri", "ka", "mi", "ch", "ris", "son"]
+
+        def make_name():
+            words = rng.randint(1, 3)
+            return " ".join(
+                "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+                for _ in range(words)
+            ).title()
+
+        performers = [
+            {
+                "name": make_name(),
+                "aliases": [make_name()] if rng.random() < 0.3 else [],
+            }
+            for _ in range(300)
+        ]
+        queries = [make_name() for _ in range(200)]
+        queries += ["".join(rng.choice(string.ascii_lowercase) for _ in range(5))]
+
+        detector = PerformerDetector()
+        for query in queries:
+            assert detector.find_full_name(query, performers) == (
+                linear_find_full_name(detector, query, performers)
+            ), query
+
+    def test_matches_linear_scan_without_shared_trigrams(self):
+        """Test matches found by SequenceMatcher alone, with no shared trigram."""
+        detector = PerformerDetector()
+        pair = [{"name": "wabvcdueft", "aliases": []}]
+        assert detector.find_full_name("xabycdzefq", pair) == ("wabvcdueft", 0.6)
+
+        rng = random.Random(7)
+
+        def make_text():
+            letters = [rng.choice("aeilouvx ") for _ in range(rng.randint(2, 9))]
+            return "".join(letters).strip() or "a"
+
+        performers = [{"name": make_text().title(), "aliases": []} for _ in range(60)]
+        for _ in range(1500):
+            query = make_text()
+            if rng.random() < 0.5:
+                query = query.upper()
+            assert detector.find_full_name(query, performers) == (
+                linear_find_full_name(detector, query, performers)
+            ), query
+
+    def test_misspelled_name_looks_at_few_performers(self):
+        """Test that near-miss lookups skip most performers (benchmark guard)."""
+        firsts = (
+            "Anna Laura Grace Olivia Felix Victor Kyle Jack Emma Ruby Sofia Chloe "
+            "Lily Nina Mark Paul Ryan Sean Owen Hugo"
+        ).split()
+        lasts = (
+            "Smith Hill Harrison Mitchell Robinson Anderson Moore Baker Clark "
+            "Turner Walker Wright Cooper Morris Watson Parker Foster Bennett "
+            "Hughes Edwards Green Lewis Jackson Scott Taylor Wilson Evans Young "
+            "Allen King"
+        ).split()
+        performers = [
+            {"name": f"{a} {b}", "aliases": []} for a in firsts for b in lasts
+        ]
+        index = PerformerIndex()
+        index.update(performers)
+        detector = PerformerDetector()
+        considered = 0
+        consider = index._consider
+
+        def counting_consider(*args):
+            nonlocal considered
+            considered += 1
+            consider(*args)
+
+        index._consider = counting_consider
+        for query, expected in [
+            ("Grace Hil", "Grace Hill"),
+            ("Felix Harrisson", "Felix Harrison"),
+            ("Olivia Robinsen", "Olivia Robinson"),
+        ]:
+            considered = 0
+            result = index.find_partial(
+                query, query.lower(), detector._score_name_match
+            )
+
+            assert result[0] == expected
+            assert considered < len(performers) // 10, query
+
+
+class TestPerformerIndexUpdate:
+    """Test incremental updates."""
+
+    def test_update_adds_and_removes(self):
+        """Test that removed performers stop matching and new ones match."""
+        index = PerformerIndex()
+        index.update([{"name": "Jane Doe"}, {"name": "John Smith"}])
+        index.update([{"name": "John Smith"}, {"name": "Mary Major"}])
+
+        assert len(index) == 2
+        assert index.find_exact("jane doe") is None
+        assert index.find_exact("mary major") == ("Mary Major", 1.0)
+        assert index._postings.get("doe") is None
+
+    def test_detector_reuses_index_for_same_list(self):
+        """Test that the index is only rebuilt when the list changes."""
+        detector = PerformerDetector()
+        performers = [{"name": "Jane Doe", "aliases": []}]
+        detector.update_index(performers)
+        index = detector._index
+
+        assert detector._get_index(performers) is index
+        assert index.is_built_from(performers)
+        assert not index.is_built_from(list(performers))
+
+    def test_grown_index_matches_linear_scan(self):
+        """Test that recounting token rarity as the index grows keeps results."""
+        rng = random.Random(11)
+        syllables = ["ka", "ri", "na", "zo", "el", "mi", "qu", "ox", "lee", "son"]
+
+        def make_name():
+            return " ".join(
+                "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+                for _ in range(rng.randint(1, 3))
+            ).title()
+
+        detector = PerformerDetector()
+        performers = [{"name": make_name(), "aliases": []} for _ in range(5)]
+        detector.update_index(performers)
+        counted = detector._index._counted_size
+        performers = performers + [
+            {"name": make_name(), "aliases": []} for _ in range(200)
+        ]
+        detector.update_index(performers)
+
+        assert detector._index._counted_size > counted
+        for _ in range(100):
+            query = make_name()
+            assert detector.find_full_name(query, performers) == (
+                linear_find_full_name(detector, query, performers)
+            ), query
@@ -4,8 +4,10 @@ Tests for analysis plan manager.
 This module tests plan CRUD operations, plan execution, and change management.
 """
 
+import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock, call
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from sqlalchemy import select
@@ -13,8 +15,10 @@ from sqlalchemy import select
 from app.models.analysis_plan import AnalysisPlan, PlanStatus
 from app.models.plan_change import ChangeAction, ChangeStatus, PlanChange
 from app.models.scene import Scene
+from app.services.analysis.apply_limiter import AdaptiveApplyLimiter
 from app.services.analysis.models import ProposedChange, SceneChanges
 from app.services.analysis.plan_manager import PlanManager
+from app.services.stash import StashRateLimitError
 from app.services.stash_service import StashService
 from tests.helpers import create_test_scene
 
@@ -366,11 +370,13 @@ class TestPlanApplication:
         # Create mock stash service
         stash_service = Mock(spec=StashService)
         stash_service.update_scene = AsyncMock(return_value=True)
-        stash_service.get_scene = AsyncMock(
+        stash_service.get_scenes_by_ids = AsyncMock(
             return_value={
-                "id": "scene1",
-                "title": "Old Title",
-                "details": "Old details",
+                "scene1": {
+                    "id": "scene1",
+                    "title": "Old Title",
+                    "details": "Old details",
+                }
             }
         )
 
@@ -412,8 +418,10 @@ class TestPlanApplication:
         assert result.failed_changes == 0
         assert result.errors == []
 
-        # Verify stash service called
-        assert stash_service.update_scene.call_count == 2
+        # Both changes are merged into a single scene update
+        stash_service.update_scene.assert_called_once_with(
+            "scene1", {"title": "New Title", "details": "Scene details"}
+        )
 
     @pytest.mark.asyncio
     async def test_apply_plan_with_filters(self, test_async_session):
@@ -423,14 +431,20 @@ class TestPlanApplication:
         # Create mock stash service
         stash_service = Mock(spec=StashService)
         stash_service.update_scene = AsyncMock(return_value=True)
-        stash_service.get_scene = AsyncMock(
+        stash_service.get_scenes_by_ids = AsyncMock(
             return_value={
-                "id": "scene1",
-                "title": "Old Title",
-                "details": "Old details",
-                "rating": 3,
+                "scene1": {
+                    "id": "scene1",
+                    "title": "Old Title",
+                    "details": "Old details",
+                    "rating": 3,
+                }
             }
         )
+        stash_service.find_performer = AsyncMock(
+            return_value={"id": "p1", "name": "performer1"}
+        )
+        stash_service.find_tag = AsyncMock(return_value={"id": "t1", "name": "tag1"})
 
         # Create a plan
         plan = AnalysisPlan(name="Test Plan", status=PlanStatus.DRAFT, plan_metadata={})
@@ -484,7 +498,9 @@ class TestPlanApplication:
         # Should only apply 2 changes (performers and tags)
         assert result.total_changes == 2
         assert result.applied_changes == 2
-        assert stash_service.update_scene.call_count == 2
+        stash_service.update_scene.assert_called_once_with(
+            "scene1", {"performer_ids": ["p1"], "tag_ids": ["t1"]}
+        )
 
     @pytest.mark.asyncio
     async def test_apply_plan_partial_failure(self, test_async_session):
@@ -496,12 +512,10 @@ class TestPlanApplication:
         stash_service.update_scene = AsyncMock(
             side_effect=[True, Exception("Update failed"), True]
         )
-        stash_service.get_scene = AsyncMock(
-            side_effect=[
-                {"id": "scene0", "title": "Old 0"},
-                {"id": "scene1", "title": "Old 1"},
-                {"id": "scene2", "title": "Old 2"},
-            ]
+        stash_service.get_scenes_by_ids = AsyncMock(
+            return_value={
+                f"scene{i}": {"id": f"scene{i}", "title": f"Old {i}"} for i in range(3)
+            }
         )
 
         # Create a plan with changes
@@ -782,7 +796,7 @@ class TestPlanExecution:
         update_data = await manager._prepare_studio_update(change, stash_service)
 
         assert update_data == {"studio_id": "studio123"}
-        stash_service.find_studio.assert_called_once_with("New Studio")
+        stash_service.find_studio.assert_called_once_with("New Studio", use_cache=False)
         stash_service.create_studio.assert_called_once_with("New Studio")
 
     @pytest.mark.asyncio
@@ -807,7 +821,9 @@ class TestPlanExecution:
         update_data = await manager._prepare_studio_update(change, stash_service)
 
         assert update_data == {"studio_id": "existing_studio"}
-        stash_service.find_studio.assert_called_once_with("Existing Studio")
+        stash_service.find_studio.assert_called_once_with(
+            "Existing Studio", use_cache=False
+        )
 
     @pytest.mark.asyncio
     async def test_prepare_performers_update_add(self, test_async_session):
@@ -1006,10 +1022,11 @@ class TestBulkOperations:
         # Create mock stash service
         stash_service = Mock(spec=StashService)
         stash_service.update_scene = AsyncMock(return_value=True)
-        stash_service.get_scene = AsyncMock(
-            side_effect=[
-                {"id": f"scene{i}", "title": f"Old Title {i}"} for i in range(20)
-            ]
+        stash_service.get_scenes_by_ids = AsyncMock(
+            return_value={
+                f"scene{i}": {"id": f"scene{i}", "title": f"Old Title {i}"}
+                for i in range(20)
+            }
         )
 
         # Create a plan
@@ -1042,6 +1059,9 @@ class TestBulkOperations:
         assert result.applied_changes == 20
         assert result.failed_changes == 0
         assert stash_service.update_scene.call_count == 20
+        stash_service.get_scenes_by_ids.assert_called_once()
+        # Replacement tag and performer lists must not be built from stale scenes
+        assert stash_service.get_scenes_by_ids.call_args.kwargs["use_cache"] is False
 
     @pytest.mark.asyncio
     async def test_prepare_update_data_unknown_field(self, test_async_session):
@@ -1118,12 +1138,14 @@ class TestBulkOperations:
         # Create mock stash service
         stash_service = Mock(spec=StashService)
         stash_service.update_scene = AsyncMock(return_value=True)
-        stash_service.get_scene = AsyncMock(
+        stash_service.get_scenes_by_ids = AsyncMock(
             return_value={
-                "id": "scene1",
-                "title": "Old Title",
-                "rating": 3,
-                "details": "Old details",
+                "scene1": {
+                    "id": "scene1",
+                    "title": "Old Title",
+                    "rating": 3,
+                    "details": "Old details",
+                }
             }
         )
 
@@ -1178,13 +1200,11 @@ class TestBulkOperations:
         assert result.applied_changes == 3
         assert result.failed_changes == 0
 
-        # Verify the correct update data was sent
-        expected_calls = [
-            call("scene1", {"title": "New Title"}),
-            call("scene1", {"rating": 5}),
-            call("scene1", {"details": "New detailed description"}),
-        ]
-        stash_service.update_scene.assert_has_calls(expected_calls, any_order=True)
+        # Verify all fields were sent in one update
+        stash_service.update_scene.assert_called_once_with(
+            "scene1",
+            {"title": "New Title", "rating": 5, "details": "New detailed description"},
+        )
 
     @pytest.mark.asyncio
     async def test_serialize_value_edge_cases(self, test_async_session):
@@ -1245,3 +1265,300 @@ class TestBulkOperations:
         )
 
         assert remaining_ids == ["perf1"]
+
+
+class TestCoalescedApply:
+    """Test that plan changes are merged per scene before hitting Stash."""
+
+    @staticmethod
+    def _change(scene_id, field, action, proposed=None, current=None):
+        return PlanChange(
+            plan_id=1,
+            scene_id=scene_id,
+            field=field,
+            action=action,
+            current_value=current,
+            proposed_value=proposed,
+            confidence=0.9,
+            status=ChangeStatus.APPROVED,
+        )
+
+    @staticmethod
+    def _stash_service(scenes):
+        stash_service = Mock(spec=StashService)
+        stash_service.get_scenes_by_ids = AsyncMock(return_value=scenes)
+        stash_service.update_scene = AsyncMock(return_value={})
+        stash_service.bulk_add_scene_relations = AsyncMock(return_value=[])
+        stash_service.find_tag = AsyncMock(
+            side_effect=lambda name, use_cache=True: {"id": f"t-{name}", "name": name}
+        )
+        return stash_service
+
+    @pytest.mark.asyncio
+    async def test_identical_additions_use_bulk_update(self):
+        """Test that scenes getting the same tags share one bulk mutation."""
+        manager = PlanManager()
+        scenes = {
+            str(i): {"id": str(i), "tags": [{"id": "t-old", "name": "old"}]}
+            for i in range(1, 5)
+        }
+        stash_service = self._stash_service(scenes)
+        changes = [
+            self._change(str(i), "tags", ChangeAction.ADD, ["a", "b"])
+            for i in range(1, 4)
+        ]
+        changes.append(self._change("4", "tags", ChangeAction.ADD, ["c"]))
+
+        result = await manager._process_plan_changes(
+            changes, {"tags": True}, AsyncMock(), stash_service
+        )
+
+        assert result["applied_changes"] == 4
+        stash_service.bulk_add_scene_relations.assert_called_once_with(
+            ["1", "2", "3"], tag_ids=["t-a", "t-b"], performer_ids=None
+        )
+        stash_service.update_scene.assert_called_once_with(
+            "4", {"tag_ids": ["t-old", "t-c"]}
+        )
+        assert all(c.status == ChangeStatus.APPLIED for c in changes)
+
+    @pytest.mark.asyncio
+    async def test_changes_merge_in_order(self):
+        """Test that later changes build on earlier ones for the same scene."""
+        manager = PlanManager()
+        stash_service = self._stash_service(
+            {"1": {"id": "1", "tags": [{"id": "t-x", "name": "x"}]}}
+        )
+        changes = [
+            self._change("1", "tags", ChangeAction.ADD, ["y"]),
+            self._change("1", "tags", ChangeAction.REMOVE, current=["x"]),
+            self._change("1", "title", ChangeAction.UPDATE, "New title"),
+        ]
+
+        result = await manager._process_plan_changes(
+            changes, {}, AsyncMock(), stash_service
+        )
+
+        assert result["applied_changes"] == 3
+        stash_service.update_scene.assert_called_once_with(
+            "1", {"tag_ids": ["t-y"], "title": "New title"}
+        )
+        stash_service.bulk_add_scene_relations.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_scene_skips_mutation(self):
+        """Test that additions already present in Stash send no mutation."""
+        manager = PlanManager()
+        stash_service = self._stash_service(
+            {"1": {"id": "1", "tags": [{"id": "t-a", "name": "a"}]}}
+        )
+        change = self._change("1", "tags", ChangeAction.ADD, ["a"])
+
+        result = await manager._process_plan_changes(
+            [change], {}, AsyncMock(), stash_service
+        )
+
+        assert result["applied_changes"] == 1
+        stash_service.update_scene.assert_not_called()
+        assert change.status == ChangeStatus.APPLIED
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_update_fails_each_change(self):
+        """Test that a failed bulk mutation reports every affected change."""
+        manager = PlanManager()
+        stash_service = self._stash_service(
+            {"1": {"id": "1", "tags": []}, "2": {"id": "2", "tags": []}}
+        )
+        stash_service.bulk_add_scene_relations.side_effect = Exception("boom")
+        changes = [
+            self._change("1", "tags", ChangeAction.ADD, ["a"]),
+            self._change("2", "tags", ChangeAction.ADD, ["a"]),
+        ]
+
+        result = await manager._process_plan_changes(
+            changes, {}, AsyncMock(), stash_service
+        )
+
+        assert result["applied_changes"] == 0
+        assert result["failed_changes"] == 2
+        assert [e["scene_id"] for e in result["errors"]] == ["1", "2"]
+        assert all(c.status == ChangeStatus.APPROVED for c in changes)
+
+
+class TestConcurrentApply:
+    """Test bounded-concurrency plan application."""
+
+    @staticmethod
+    def _stash_service(scene_count):
+        stash_service = Mock(spec=StashService)
+        stash_service.get_scenes_by_ids = AsyncMock(
+            return_value={
+                str(i): {"id": str(i), "title": "", "tags": []}
+                for i in range(1, scene_count + 1)
+            }
+        )
+        stash_service.bulk_add_scene_relations = AsyncMock(return_value=[])
+        return stash_service
+
+    @staticmethod
+    def _title_change(scene_id, title):
+        return TestCoalescedApply._change(scene_id, "title", ChangeAction.UPDATE, title)
+
+    @pytest.mark.asyncio
+    async def test_updates_run_concurrently_up_to_limit(self):
+        """Test that scene updates overlap but never exceed the concurrency."""
+        manager = PlanManager()
+        stash_service = self._stash_service(10)
+        in_flight = 0
+        peak = 0
+
+        async def update_scene(scene_id, update):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        stash_service.update_scene = AsyncMock(side_effect=update_scene)
+        changes = [self._title_change(str(i), f"T{i}") for i in range(1, 11)]
+
+        result = await manager._process_plan_changes(
+            changes, {}, AsyncMock(), stash_service, concurrency=3
+        )
+
+        assert result["applied_changes"] == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_same_scene_changes_stay_ordered(self):
+        """Test that concurrent apply still merges a scene's changes in order."""
+        manager = PlanManager()
+        stash_service = self._stash_service(2)
+        stash_service.update_scene = AsyncMock(return_value={})
+        changes = [
+            self._title_change("1", "first"),
+            self._title_change("2", "other"),
+            self._title_change("1", "second"),
+        ]
+
+        await manager._process_plan_changes(
+            changes, {}, AsyncMock(), stash_service, concurrency=4
+        )
+
+        calls = {
+            c.args[0]: c.args[1] for c in stash_service.update_scene.call_args_list
+        }
+        assert stash_service.update_scene.call_count == 2
+        assert calls["1"] == {"title": "second"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_update_is_retried(self):
+        """Test that a rate-limited update backs off and is retried."""
+        manager = PlanManager()
+        stash_service = self._stash_service(1)
+        stash_service.update_scene = AsyncMock(
+            side_effect=[StashRateLimitError("slow down"), {}]
+        )
+
+        with patch(
+            "app.services.analysis.plan_manager.AdaptiveApplyLimiter",
+            partial(AdaptiveApplyLimiter, base_delay=0.01),
+        ):
+            result = await manager._process_plan_changes(
+                [self._title_change("1", "New")],
+                {},
+                AsyncMock(),
+                stash_service,
+                concurrency=2,
+            )
+
+        assert result["applied_changes"] == 1
+        assert stash_service.update_scene.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_persisted_statuses_written_in_one_update(self, test_async_session):
+        """Test that applied changes are marked with a batched UPDATE."""
+        manager = PlanManager()
+        plan = AnalysisPlan(name="Batched", status=PlanStatus.DRAFT)
+        test_async_session.add(plan)
+        await test_async_session.flush()
+        changes = [self._title_change(str(i), f"T{i}") for i in range(1, 4)]
+        for change in changes:
+            change.plan_id = plan.id
+        test_async_session.add_all(changes)
+        await test_async_session.flush()
+
+        stash_service = self._stash_service(3)
+        stash_service.update_scene = AsyncMock(return_value={})
+
+        result = await manager._process_plan_changes(
+            changes, {}, test_async_session, stash_service, concurrency=2
+        )
+
+        assert result["applied_changes"] == 3
+        assert not test_async_session.dirty
+        assert all(c.status == ChangeStatus.APPLIED for c in changes)
+        applied = await test_async_session.execute(
+            select(PlanChange).where(PlanChange.status == ChangeStatus.APPLIED)
+        )
+        assert len(applied.scalars().all()) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_worker_stops_other_updates(self, test_async_session):
+        """Test that a failing worker cancels the rest and keeps finished work."""
+        manager = PlanManager()
+        plan = AnalysisPlan(name="Failing", status=PlanStatus.DRAFT)
+        test_async_session.add(plan)
+        await test_async_session.flush()
+        changes = [self._title_change(str(i), f"T{i}") for i in range(1, 7)]
+        for change in changes:
+            change.plan_id = plan.id
+        test_async_session.add_all(changes)
+        await test_async_session.flush()
+
+        async def update_scene(scene_id, update):
+            if scene_id != "1":
+                await asyncio.sleep(0.05)
+            return {}
+
+        stash_service = self._stash_service(6)
+        stash_service.update_scene = AsyncMock(side_effect=update_scene)
+        manager._report_apply_progress = AsyncMock(
+            side_effect=[RuntimeError("job cancelled")] + [None] * 10
+        )
+
+        with pytest.raises(RuntimeError, match="job cancelled"):
+            await manager._process_plan_changes(
+                changes, {}, test_async_session, stash_service, concurrency=2
+            )
+
+        # The in-flight update was cancelled and no further scenes were sent
+        await asyncio.sleep(0.2)
+        assert stash_service.update_scene.call_count == 2
+        await test_async_session.rollback()
+        applied = await test_async_session.execute(
+            select(PlanChange.scene_id).where(PlanChange.status == ChangeStatus.APPLIED)
+        )
+        assert applied.scalars().all() == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_progress_callbacks_are_throttled(self):
+        """Test that progress is reported at the start, end and not per scene."""
+        manager = PlanManager()
+        stash_service = self._stash_service(20)
+        stash_service.update_scene = AsyncMock(return_value={})
+        progress_callback = AsyncMock()
+        changes = [self._title_change(str(i), f"T{i}") for i in range(1, 21)]
+
+        await manager._process_plan_changes(
+            changes,
+            {},
+            AsyncMock(),
+            stash_service,
+            progress_callback=progress_callback,
+            concurrency=4,
+        )
+
+        assert progress_callback.call_count < 20
+        progress_callback.assert_called_with(95, "Applied 20/20 changes")
@@ -9,13 +9,14 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models import Performer, SceneFile, SceneMarker, Studio, Tag
+from app.models import Performer, Scene, SceneFile, SceneMarker, Studio, Tag
 from app.services.stash_service import StashService
 from app.services.sync.scene_sync import SceneSyncHandler
-from app.services.sync.strategies import SyncStrategy
+from app.services.sync.strategies import SyncStrategy, calculate_scene_digest
 from tests.helpers import create_test_scene
 
 
@@ -331,7 +332,10 @@ class TestBatchSync:
         assert len(result) == 2
         assert result[0].id == "scene123"
         assert result[1].id == "scene456"
-        mock_async_session.flush.assert_called_once()
+        # Missing performers, tags and studio are created and flushed once,
+        # followed by the final flush of the batch
+        assert mock_async_session.add.call_count == 5
+        assert mock_async_session.flush.call_count == 2
 
     @pytest.mark.asyncio
     async def test_fetch_existing_scenes(self, sync_handler, mock_async_session):
@@ -395,6 +399,85 @@ class TestBatchSync:
         assert len(result["studios"]) == 1
 
 
+class TestUnchangedSceneDetection:
+    """Test the content digest fast path."""
+
+    @pytest.mark.asyncio
+    async def test_find_unchanged_scenes(self, sync_handler, test_async_session):
+        unchanged = {"id": "s1", "title": "Same"}
+        changed = {"id": "s2", "title": "New title"}
+        test_async_session.add_all(
+            [
+                create_test_scene(
+                    id="s1",
+                    title="Same",
+                    content_checksum=calculate_scene_digest(unchanged),
+                ),
+                create_test_scene(
+                    id="s2",
+                    title="Old title",
+                    content_checksum=calculate_scene_digest({"id": "s2"}),
+                ),
+                create_test_scene(id="s3", title="No checksum"),
+            ]
+        )
+        await test_async_session.commit()
+
+        result = await sync_handler.find_unchanged_scenes(
+            [unchanged, changed, {"id": "s3"}, {"id": "s4"}], test_async_session
+        )
+
+        assert result == {"s1"}
+
+    @pytest.mark.asyncio
+    async def test_mark_unchanged_scenes_synced(self, sync_handler, test_async_session):
+        old = datetime(2020, 1, 1)
+        test_async_session.add_all(
+            [
+                create_test_scene(id="s1", title="Same", last_synced=old),
+                create_test_scene(id="s2", title="Other", last_synced=old),
+            ]
+        )
+        await test_async_session.commit()
+
+        await sync_handler.mark_unchanged_scenes_synced(
+            [
+                {"id": "s1", "updated_at": "2024-06-01T12:00:00"},
+                {"id": "s2", "updated_at": "2024-06-01T12:00:00"},
+            ],
+            {"s1"},
+            test_async_session,
+        )
+        await test_async_session.commit()
+        test_async_session.expire_all()
+
+        rows = {
+            scene.id: scene
+            for scene in (await test_async_session.execute(select(Scene)))
+            .scalars()
+            .all()
+        }
+        assert rows["s1"].last_synced > old
+        assert rows["s1"].stash_updated_at == datetime(2024, 6, 1, 12, 0)
+        assert rows["s2"].last_synced == old
+        assert rows["s2"].stash_updated_at is None
+
+    @pytest.mark.asyncio
+    async def test_batch_sync_records_digest(
+        self, sync_handler, mock_async_session, sample_stash_scene
+    ):
+        sync_handler._prefetch_all_entities = AsyncMock(
+            return_value={"performers": {}, "tags": {}, "studios": {}}
+        )
+        sync_handler._sync_scene_relationships_batch = AsyncMock()
+
+        scenes = await sync_handler.sync_scene_batch(
+            [sample_stash_scene], mock_async_session, existing_scenes={}
+        )
+
+        assert scenes[0].content_checksum == calculate_scene_digest(sample_stash_scene)
+
+
 class TestRelationshipSync:
     """Test cases for syncing scene relationships."""
 
@@ -435,6 +518,30 @@ class TestRelationshipSync:
                     scene, sample_stash_scene, mock_async_session, "scene123"
                 )
 
+    @pytest.mark.asyncio
+    async def test_batch_relationships_clear_removed_studio(
+        self, sync_handler, mock_async_session
+    ):
+        """Test that batch relationship sync clears a studio removed in Stash."""
+        scene = create_test_scene(id="scene123", title="Test Scene")
+        studio = Studio(id="studio1", name="Old Studio")
+        scene.studio = studio
+        scene.studio_id = studio.id
+        sync_handler._sync_scene_markers = AsyncMock()
+        sync_handler._sync_scene_files = AsyncMock()
+
+        await sync_handler._sync_scene_relationships_batch(
+            scene,
+            {"id": "scene123", "studio": None, "performers": [], "tags": []},
+            mock_async_session,
+            {},
+            {},
+            {"studio1": studio},
+        )
+
+        assert scene.studio is None
+        assert scene.studio_id is None
+
 
 class TestMetadataUpdate:
     """Test cases for metadata updates."""
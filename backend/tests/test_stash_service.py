@@ -150,6 +150,107 @@ class TestStashService:
             assert len(result["scenes"]) == 2
             assert result["scenes"][0]["title"] == "Scene 1"
 
+    @pytest.mark.asyncio
+    async def test_count_scenes_fetches_no_scene_fields(self, stash_service):
+        """Test counting scenes with the count projection."""
+        with patch.object(stash_service, "execute_graphql") as mock_execute:
+            mock_execute.return_value = {"findScenes": {"count": 42}}
+
+            count = await stash_service.count_scenes(filter={"organized": False})
+
+        assert count == 42
+        query, variables = mock_execute.call_args.args
+        assert "scenes" not in query.split("findScenes", 1)[1]
+        assert "SceneData" not in query
+        assert variables["scene_filter"] == {"organized": False}
+
+    @pytest.mark.asyncio
+    async def test_find_scenes_projected_summary(self, stash_service):
+        """Test fetching the summary projection."""
+        scenes = [{"id": "1", "title": "A", "created_at": None, "updated_at": None}]
+
+        with patch.object(stash_service, "execute_graphql") as mock_execute:
+            mock_execute.return_value = {"findScenes": {"count": 1, "scenes": scenes}}
+
+            result, count = await stash_service.find_scenes_projected(
+                "summary", per_page=5, sort="updated_at"
+            )
+
+        assert result == scenes
+        assert count == 1
+        query, variables = mock_execute.call_args.args
+        assert "files" not in query
+        assert variables["filter"] == {
+            "page": 1,
+            "per_page": 5,
+            "sort": "updated_at",
+            "direction": "DESC",
+        }
+
+    def test_scene_projection_queries_are_cached(self):
+        """Test projection query building."""
+        from app.services.stash import queries
+
+        assert queries.scene_projection_query("ids") is queries.scene_projection_query(
+            "ids"
+        )
+        assert "...SceneData" in queries.scene_projection_query("full")
+        assert "fragment SceneData" in queries.scene_projection_query("full")
+        with pytest.raises(ValueError):
+            queries.scene_projection_query("everything")
+
+    @pytest.mark.asyncio
+    async def test_iter_scenes_uses_id_cursor(self, stash_service):
+        """Test keyset pagination over scenes."""
+        pages = [
+            [{"id": "1"}, {"id": "5"}],
+            [{"id": "7"}, {"id": "9"}],
+            [{"id": "12"}],
+        ]
+
+        with patch.object(stash_service, "execute_graphql") as mock_execute:
+            mock_execute.side_effect = [
+                {"findScenes": {"count": 5, "scenes": page}} for page in pages
+            ]
+
+            collected = [
+                [s["id"] for s in page]
+                async for page in stash_service.iter_scenes(
+                    filter={"organized": True}, fields="ids", page_size=2
+                )
+            ]
+
+        assert collected == [["1", "5"], ["7", "9"], ["12"]]
+        assert mock_execute.call_count == 3
+        variables = [call.args[1] for call in mock_execute.call_args_list]
+        # Always the first page, sorted by ID, with the cursor in the scene filter
+        assert all(v["filter"]["page"] == 1 for v in variables)
+        assert all(v["filter"]["sort"] == "id" for v in variables)
+        assert all(v["filter"]["direction"] == "ASC" for v in variables)
+        assert variables[0]["scene_filter"] == {"organized": True}
+        assert variables[1]["scene_filter"]["id"] == {
+            "value": 5,
+            "modifier": "GREATER_THAN",
+        }
+        assert variables[2]["scene_filter"]["id"]["value"] == 9
+        assert variables[2]["scene_filter"]["organized"] is True
+
+    @pytest.mark.asyncio
+    async def test_iter_scenes_full_pages_stop_on_empty(self, stash_service):
+        """Test that full scenes are transformed and an empty page ends iteration."""
+        with patch.object(stash_service, "get_scenes") as mock_get_scenes:
+            mock_get_scenes.side_effect = [
+                ([{"id": "1"}, {"id": "2"}], 2),
+                ([], 2),
+            ]
+
+            pages = [page async for page in stash_service.iter_scenes(page_size=2)]
+
+        assert pages == [[{"id": "1"}, {"id": "2"}]]
+        assert mock_get_scenes.call_args_list[1].kwargs["filter"] == {
+            "id": {"value": 2, "modifier": "GREATER_THAN"}
+        }
+
     @pytest.mark.asyncio
     async def test_get_scene(self, stash_service):
         """Test getting a single scene."""
@@ -996,6 +1097,48 @@ class TestStashService:
             assert results[1]["id"] == "2"
             assert results[2]["id"] == "3"
 
+    @pytest.mark.asyncio
+    async def test_get_scenes_by_ids_batches_and_uses_cache(self, stash_service):
+        """Test fetching several scenes with one findScenes call per batch."""
+        stash_service._cache.set("scene:1", {"id": "1", "title": "Cached"})
+
+        with (
+            patch.object(stash_service, "execute_graphql") as mock_execute,
+            patch("app.services.stash.transformers.transform_scene", side_effect=dict),
+        ):
+            mock_execute.side_effect = [
+                {"findScenes": {"scenes": [{"id": "2"}, {"id": "3"}]}},
+                {"findScenes": {"scenes": []}},
+            ]
+
+            scenes = await stash_service.get_scenes_by_ids(
+                ["1", "2", "3", "4"], batch_size=2
+            )
+
+        assert set(scenes) == {"1", "2", "3"}
+        assert scenes["1"]["title"] == "Cached"
+        assert mock_execute.call_count == 2
+        first_variables = mock_execute.call_args_list[0].args[1]
+        assert first_variables["scene_ids"] == [2, 3]
+        assert first_variables["filter"] == {"per_page": 2}
+        assert stash_service._cache.get("scene:2") == {"id": "2"}
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_scene_relations(self, stash_service):
+        """Test adding the same tags to several scenes in ADD mode."""
+        stash_service._cache.set("scene:1", {"id": "1"})
+
+        with patch.object(stash_service, "execute_graphql") as mock_execute:
+            mock_execute.return_value = {"bulkSceneUpdate": []}
+
+            await stash_service.bulk_add_scene_relations(["1", "2"], tag_ids=["t1"])
+
+        variables = mock_execute.call_args.args[1]
+        assert variables == {
+            "input": {"ids": ["1", "2"], "tag_ids": {"ids": ["t1"], "mode": "ADD"}}
+        }
+        assert stash_service._cache.get("scene:1") is None
+
     @pytest.mark.asyncio
     async def test_scene_transformation_error(self, stash_service):
         """Test error handling when scene transformation fails."""
@@ -5,11 +5,13 @@ This module tests studio detection from paths, patterns, and AI analysis.
 """
 
 import re
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from app.services.analysis.studio_detector import StudioDetector
+from app.services.analysis.aho_corasick import AhoCorasick
+from app.services.analysis.studio_detector import StudioDetector, _required_literals
 
 
 class TestStudioDetectorInit:
@@ -467,3 +469,133 @@ class TestEdgeCases:
 
         assert result is not None
         assert result.value == "Citebeur"
+
+
+class TestPathScanner:
+    """Test the precompiled studio/pattern scanner."""
+
+    @staticmethod
+    async def linear_detect(detector, file_path, known_studios):
+        """Reference implementation: run every regex and substring check."""
+        path = Path(file_path)
+        for studio, pattern in detector.patterns.items():
+            if pattern.search(path.stem):
+                return studio, 0.9 if studio in known_studios else 0.8
+            for part in path.parts[:-1]:
+                if pattern.search(part):
+                    return studio, 0.85 if studio in known_studios else 0.75
+        path_lower = file_path.lower()
+        for studio in known_studios:
+            studio_lower = studio.lower()
+            if studio_lower in path_lower:
+                if f"/{studio_lower}/" in path_lower:
+                    return studio, 0.95
+                if studio_lower in path.stem.lower():
+                    return studio, 0.85
+                return studio, 0.75
+        return None
+
+    def test_required_literals(self):
+        """Test literal extraction from studio regexes."""
+        assert _required_literals(r"sean[\s_-]?cody|sc\d{4}") == ["sean", "sc"]
+        assert _required_literals(r"men\.com|^\s*men\s+") == ["men.com", "men"]
+        assert _required_literals(r"a?b?") is None
+        assert _required_literals(r"(foo|bar)baz") is None
+        assert _required_literals(r"\Afoo\b") == ["foo"]
+        assert _required_literals(r"foo[^]]bar") == ["foo"]
+        assert _required_literals(r"foo[]x]bar") == ["foo"]
+        assert _required_literals(r"foo[^a]bar") == ["foo"]
+        for pattern in (
+            r"\x46oo",
+            r"\u0046oo",
+            r"\U00000046oo",
+            r"\N{LATIN CAPITAL LETTER F}oo",
+            r"\106oo",
+            r"\0foo",
+            r"foo\Ebar",
+        ):
+            assert _required_literals(pattern) is None, pattern
+
+    @pytest.mark.asyncio
+    async def test_matches_linear_scan(self):
+        """Test that scanned detection equals running every pattern."""
+        detector = StudioDetector()
+        detector.add_custom_pattern("Grouped", r"(gr|gp)\d+")
+        detector.add_custom_pattern("Hex", r"\x46oobar")
+        detector.add_custom_pattern("Unicode", r"ba\u007a\d+")
+        detector.add_custom_pattern("Named", r"\N{LATIN SMALL LETTER Q}uux")
+        detector.add_custom_pattern("Octal", r"\167ombat")
+        detector.add_custom_pattern("Bracket", r"kit[^]]kat")
+        known_studios = ["Studio X", "Hot House", "Acme", "acme", "Men", "Falcon"]
+        paths = [
+            "/data/Sean Cody/SC1234 - Scene.mp4",
+            "/data/misc/men - scene.mp4",
+            "/data/acme/clip.mp4",
+            "/data/x/Acme presents.mp4",
+            "/data/studio x/other/file.mp4",
+            "/data/gr42/file.mp4",
+            "/data/falcon-studio/file.mp4",
+            "/data/nothing/here.mp4",
+            "/data/RS-12/hot_house.mp4",
+            "/data/x/Foobar clip.mp4",
+            "/data/uz/baz42.mp4",
+            "/data/Quux/file.mp4",
+            "/data/wombat/scene.mp4",
+            "/data/kitxkat/scene.mp4",
+            "",
+        ]
+
+        for file_path in paths:
+            result = await detector.detect_from_path(file_path, known_studios)
+            expected = await self.linear_detect(detector, file_path, known_studios)
+            actual = (result.value, result.confidence) if result else None
+            assert actual == expected, file_path
+
+    @pytest.mark.asyncio
+    async def test_scanner_shared_until_studios_change(self):
+        """Test that the automaton is built once per known studio list."""
+        detector = StudioDetector()
+        known_studios = ["Acme"]
+        detector.update_known_studios(known_studios)
+        scanner = detector._scanner
+
+        await detector.detect_from_path("/data/acme/a.mp4", known_studios)
+        assert detector._scanner is scanner
+
+        result = await detector.detect_from_path("/data/beta/b.mp4", ["Beta"])
+        assert detector._scanner is not scanner
+        assert result.value == "Beta"
+
+    @pytest.mark.asyncio
+    async def test_custom_pattern_invalidates_scanner(self):
+        """Test that a new pattern is picked up by an existing scanner."""
+        detector = StudioDetector()
+        known_studios = []
+        detector.update_known_studios(known_studios)
+
+        detector.add_custom_pattern("Zeta", r"zeta[\s_-]?films")
+        result = await detector.detect_from_path("/v/zeta_films.mp4", known_studios)
+
+        assert result.value == "Zeta"
+
+
+class TestAhoCorasick:
+    """Test the multi-keyword automaton."""
+
+    def test_finds_overlapping_keywords(self):
+        """Test that keywords inside other keywords are all reported."""
+        automaton = AhoCorasick()
+        for keyword in ["he", "she", "his", "hers"]:
+            automaton.add(keyword, keyword)
+        automaton.build()
+
+        assert automaton.find_all("ushers") == {"she", "he", "hers"}
+        assert automaton.find_all("nothing") == set()
+
+    def test_requires_build(self):
+        """Test that searching before build() fails loudly."""
+        automaton = AhoCorasick()
+        automaton.add("a", 1)
+
+        with pytest.raises(RuntimeError):
+            automaton.find_all("a")
@@ -1,7 +1,7 @@
 """Tests for sync job functions."""
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,6 +25,8 @@ class TestSyncJobs:
         settings = Mock()
         settings.stash.url = "http://test.stash"
         settings.stash.api_key = "test-api-key"
+        settings.sync.batch_size = 100
+        settings.sync.pipeline_depth = 2
         return settings
 
     @pytest.fixture
@@ -62,7 +64,9 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService") as mock_stash_service_class:
+            with patch(
+                "app.jobs.sync_jobs.get_shared_stash_service"
+            ) as mock_get_stash_service:
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -87,11 +91,9 @@ class TestSyncJobs:
         assert result["success_rate"] == 1.0
 
         # Verify service calls
-        mock_stash_service_class.assert_called_once_with(
-            stash_url="http://test.stash", api_key="test-api-key"
-        )
+        mock_get_stash_service.assert_called_once_with(mock_settings)
         mock_sync_service_class.assert_called_once_with(
-            mock_stash_service_class.return_value, mock_db
+            mock_get_stash_service.return_value, mock_db
         )
         mock_sync_service.sync_all.assert_called_once_with(
             job_id="test-job-123",
@@ -102,7 +104,54 @@ class TestSyncJobs:
             include_performers=True,
             include_tags=True,
             include_studios=True,
+            batch_size=100,
+            pipeline_depth=2,
+            resume_checkpoint=None,
+            checkpoint_callback=ANY,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sync_all_job_resume(
+        self, mock_settings, mock_sync_result, mock_progress_callback
+    ):
+        """Test that resume continues from the last interrupted sync's checkpoint."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_sync_service = AsyncMock()
+        mock_sync_service.sync_all.return_value = mock_sync_result
+        checkpoint = {"stage": "scenes", "scene_cursor": 90000}
+
+        with (
+            patch(
+                "app.jobs.sync_jobs.load_settings_with_db_overrides",
+                return_value=mock_settings,
+            ),
+            patch("app.jobs.sync_jobs.get_shared_stash_service"),
+            patch("app.jobs.sync_jobs.SyncService", return_value=mock_sync_service),
+            patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session,
+            patch(
+                "app.jobs.sync_jobs.job_repository.get_resumable_checkpoint",
+                new_callable=AsyncMock,
+                return_value=checkpoint,
+            ) as get_checkpoint,
+            patch(
+                "app.services.job_service.job_service.save_checkpoint",
+                new_callable=AsyncMock,
+            ) as save_checkpoint,
+        ):
+            mock_session.return_value.__aenter__.return_value = mock_db
+            await sync_all_job(
+                job_id="test-job-123",
+                progress_callback=mock_progress_callback,
+                resume=True,
+            )
+            kwargs = mock_sync_service.sync_all.call_args.kwargs
+            await kwargs["checkpoint_callback"]({"scene_cursor": 1})
+
+        get_checkpoint.assert_awaited_once_with(
+            JobType.SYNC, mock_db, exclude_job_id="test-job-123"
         )
+        assert kwargs["resume_checkpoint"] == checkpoint
+        save_checkpoint.assert_awaited_once_with("test-job-123", {"scene_cursor": 1})
 
     @pytest.mark.asyncio
     async def test_sync_all_job_failure(self, mock_settings, mock_progress_callback):
@@ -116,7 +165,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -146,7 +195,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -189,7 +238,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -240,7 +289,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -302,7 +351,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -332,7 +381,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -371,6 +420,9 @@ class TestSyncJobs:
             include_performers=True,
             include_tags=True,
             include_studios=True,
+            batch_size=100,
+            pipeline_depth=0,
+            **kwargs,
         ):
             # Simulate progress updates
             progress_callback(10, "Starting sync...")
@@ -396,7 +448,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -427,7 +479,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                     # Simulate database connection error
                     mock_session.return_value.__aenter__.side_effect = Exception(
@@ -472,7 +524,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -504,9 +556,11 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService") as mock_stash_service_class:
-                # Simulate Stash service initialization error
-                mock_stash_service_class.side_effect = Exception(
+            with patch(
+                "app.jobs.sync_jobs.get_shared_stash_service"
+            ) as mock_get_stash_service:
+                # Simulate shared Stash service lookup error
+                mock_get_stash_service.side_effect = Exception(
                     "Failed to connect to Stash"
                 )
 
@@ -543,7 +597,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
@@ -590,7 +644,7 @@ class TestSyncJobs:
             "app.jobs.sync_jobs.load_settings_with_db_overrides",
             return_value=mock_settings,
         ):
-            with patch("app.jobs.sync_jobs.StashService"):
+            with patch("app.jobs.sync_jobs.get_shared_stash_service"):
                 with patch("app.jobs.sync_jobs.SyncService") as mock_sync_service_class:
                     with patch("app.jobs.sync_jobs.AsyncSessionLocal") as mock_session:
                         # Setup mocks
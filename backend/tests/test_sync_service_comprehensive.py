@@ -1,6 +1,7 @@
 """Comprehensive tests for sync service to improve coverage from 55%."""
 
 from datetime import datetime, timedelta
+from types import MethodType
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import JobStatus
 from app.models.sync_history import SyncHistory
+from app.services.stash_service import StashService
 from app.services.sync.models import SyncResult, SyncStatus
 from app.services.sync.strategies import SmartSyncStrategy
 from app.services.sync.sync_service import SyncService
@@ -93,6 +95,8 @@ class TestSyncServiceComprehensive:
         mock.get_performers_since = AsyncMock(return_value=[])
         mock.get_tags_since = AsyncMock(return_value=[])
         mock.get_studios_since = AsyncMock(return_value=[])
+        # Page through the mocked get_scenes with the real ID cursor
+        mock.iter_scenes = MethodType(StashService.iter_scenes, mock)
         return mock
 
     @pytest.fixture
@@ -671,16 +675,11 @@ class TestSyncServiceComprehensive:
         )
 
         # Mock scene data
-        mock_stash_service.get_scenes = AsyncMock(
-            return_value=(
-                [
-                    {"id": "scene1"},
-                    {"id": "scene2"},
-                    {"id": "scene3"},  # This one will trigger cancellation
-                ],
-                3,
-            )
-        )
+        batch_scenes = [
+            {"id": "scene1"},
+            {"id": "scene2"},
+            {"id": "scene3"},  # This one will trigger cancellation
+        ]
 
         # Create result object
         result = SyncResult(job_id="cancel_test", started_at=datetime.utcnow())
@@ -689,9 +688,7 @@ class TestSyncServiceComprehensive:
         # Run batch processing
         with pytest.raises(Exception) as exc_info:
             await sync_service._process_scene_batch(
-                since=None,
-                batch_size=10,
-                offset=0,
+                batch_scenes,
                 result=result,
                 progress_callback=None,
                 cancellation_token=cancellation_token,
@@ -747,15 +744,10 @@ class TestSyncServiceComprehensive:
         """Test batch scene sync with incremental mode."""
         since = datetime.utcnow() - timedelta(hours=1)
 
-        # Mock incremental scene fetch
-        # First call is to get the count, second call is to get the actual scenes
+        # Mock incremental scene count and fetch
+        mock_stash_service.count_scenes = AsyncMock(return_value=1)
         mock_stash_service.get_scenes.side_effect = [
-            # First call to determine count (small page size)
-            ([{"id": "updated1", "updated_at": since.isoformat()}], 1),
-            # Second call to get actual batch
             ([{"id": "updated1", "updated_at": since.isoformat()}], 1),
-            # Third call returns empty to end loop
-            ([], 0),
         ]
 
         # Mock database - use the mock_db parameter
@@ -786,16 +778,18 @@ class TestSyncServiceComprehensive:
         assert result.total_items == 1
         assert result.processed_items == 1
 
-        # Verify filter was used
+        # Verify filter was used for both the count and the scene fetch
+        count_call = mock_stash_service.count_scenes.call_args
+        assert count_call.kwargs["filter"]["updated_at"]["modifier"] == "GREATER_THAN"
         filter_call = mock_stash_service.get_scenes.call_args_list[0]
         assert "filter" in filter_call.kwargs
         assert filter_call.kwargs["filter"]["updated_at"]["modifier"] == "GREATER_THAN"
 
     @pytest.mark.asyncio
-    async def test_fetch_scene_batch_error_handling(
+    async def test_iter_scene_pages_error_handling(
         self, sync_service, mock_stash_service, mock_async_session_local
     ):
-        """Test error handling in _fetch_scene_batch."""
+        """Test error handling in _iter_scene_pages."""
         # Make get_scenes fail
         mock_stash_service.get_scenes = AsyncMock(
             side_effect=Exception("Network timeout")
@@ -803,7 +797,8 @@ class TestSyncServiceComprehensive:
 
         # Try to fetch batch
         with pytest.raises(Exception) as exc_info:
-            await sync_service._fetch_scene_batch(since=None, batch_size=100, offset=0)
+            async for _ in sync_service._iter_scene_pages(since=None, batch_size=100):
+                pass
 
         assert "Network timeout" in str(exc_info.value)
 
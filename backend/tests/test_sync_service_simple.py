@@ -95,7 +95,9 @@ class TestSyncService:
         result = await sync_service.sync_single_scene(scene_id, db)
 
         assert result is True
-        sync_service.stash_service.get_scene.assert_called_once_with(scene_id)
+        sync_service.stash_service.get_scene.assert_called_once_with(
+            scene_id, use_cache=False
+        )
         sync_service.scene_syncer.sync_scene.assert_called_once()
 
     @pytest.mark.asyncio
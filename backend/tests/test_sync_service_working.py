@@ -1,11 +1,13 @@
 """Working tests for sync service that match actual implementation."""
 
 from datetime import datetime
+from types import MethodType
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from app.models import Job, JobStatus, Scene
+from app.services.stash_service import StashService
 from app.services.sync.models import SyncResult, SyncStats, SyncStatus
 from app.services.sync.strategies import SmartSyncStrategy
 from app.services.sync.sync_service import SyncService
@@ -93,6 +95,8 @@ class TestSyncService:
         mock.find_performers = AsyncMock(return_value={"performers": []})
         mock.find_tags = AsyncMock(return_value={"tags": []})
         mock.find_studios = AsyncMock(return_value={"studios": []})
+        # Page through the mocked get_scenes with the real ID cursor
+        mock.iter_scenes = MethodType(StashService.iter_scenes, mock)
         return mock
 
     @pytest.fixture
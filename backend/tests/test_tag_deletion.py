@@ -29,13 +29,13 @@ async def test_delete_tag_success(test_async_session: AsyncSession):
     mock_settings.stash.url = "http://localhost:9999"
     mock_settings.stash.api_key = "test-key"
 
-    # Mock StashService
-    with patch("app.api.routes.entities.StashService") as MockStashService:
+    # Mock the shared StashService
+    with patch("app.api.routes.entities.get_shared_stash_service") as mock_get_stash:
         mock_stash_instance = AsyncMock()
         mock_stash_instance.delete_tag = AsyncMock(return_value=True)
         mock_stash_instance.__aenter__ = AsyncMock(return_value=mock_stash_instance)
         mock_stash_instance.__aexit__ = AsyncMock()
-        MockStashService.return_value = mock_stash_instance
+        mock_get_stash.return_value = mock_stash_instance
 
         # Call the delete endpoint
         result = await delete_tag(
@@ -47,8 +47,8 @@ async def test_delete_tag_success(test_async_session: AsyncSession):
         assert "Test Tag" in result["message"]
         assert result["deleted_tag_id"] == "test-tag-123"
 
-        # Verify StashService was called correctly
-        MockStashService.assert_called_once_with("http://localhost:9999", "test-key")
+        # Verify the shared StashService was used
+        mock_get_stash.assert_called_once_with(mock_settings)
         mock_stash_instance.delete_tag.assert_called_once_with("test-tag-123")
 
         # Verify tag was deleted from database
@@ -97,12 +97,12 @@ async def test_delete_tag_stash_failure(test_async_session: AsyncSession):
     mock_settings.stash.api_key = None
 
     # Mock StashService to return False (deletion failed)
-    with patch("app.api.routes.entities.StashService") as MockStashService:
+    with patch("app.api.routes.entities.get_shared_stash_service") as mock_get_stash:
         mock_stash_instance = AsyncMock()
         mock_stash_instance.delete_tag = AsyncMock(return_value=False)
         mock_stash_instance.__aenter__ = AsyncMock(return_value=mock_stash_instance)
         mock_stash_instance.__aexit__ = AsyncMock(return_value=None)
-        MockStashService.return_value = mock_stash_instance
+        mock_get_stash.return_value = mock_stash_instance
 
         # Use a try-except block instead of pytest.raises
         exception_raised = False
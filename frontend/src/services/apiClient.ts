@@ -143,6 +143,8 @@ class ApiClient {
       detect_details: boolean;
       detect_video_tags: boolean;
       confidence_threshold: number;
+      combined_ai?: boolean;
+      use_ai_cache?: boolean;
     };
     plan_name?: string;
     background?: boolean;